@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Chad server process used by the streaming benchmarks.
+
+Runs the normal FastAPI app under uvicorn and, when asked, injects
+``tool_call_started`` events into every running task's EventLog at a fixed
+rate so the structured-event path is loaded alongside PTY output. Each
+injected event carries its send time as ``t=<epoch>`` in the command field,
+the same marker the mock agent writes into its terminal lines.
+
+Started by ``benchmarks/streaming.py``; not meant to be run by hand.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+import uvicorn  # noqa: E402
+
+from chad.server.main import create_app  # noqa: E402
+from chad.server.services import get_session_manager, get_task_executor  # noqa: E402
+from chad.util.event_log import ToolCallStartedEvent  # noqa: E402
+
+
+def emit_tool_events(rate: float, stop: threading.Event) -> None:
+    """Log one tool_call_started event per running task every 1/rate seconds."""
+    interval = 1.0 / rate
+    next_at = time.monotonic()
+    while not stop.is_set():
+        executor = get_task_executor()
+        for session in get_session_manager().list_sessions():
+            task = executor.get_running_task_for_session(session.id)
+            if task is None or task.event_log is None:
+                continue
+            task.event_log.log(ToolCallStartedEvent(tool="bash", command=f"bench t={time.time():.6f}"))
+        next_at += interval
+        stop.wait(max(0.0, next_at - time.monotonic()))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--port", type=int, required=True)
+    parser.add_argument("--tool-events-per-sec", type=float, default=0.0)
+    args = parser.parse_args()
+
+    stop = threading.Event()
+    if args.tool_events_per_sec > 0:
+        threading.Thread(
+            target=emit_tool_events,
+            args=(args.tool_events_per_sec, stop),
+            name="bench-tool-events",
+            daemon=True,
+        ).start()
+
+    config = uvicorn.Config(create_app(), host="127.0.0.1", port=args.port, log_level="warning")
+    try:
+        uvicorn.Server(config).run()
+    finally:
+        stop.set()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
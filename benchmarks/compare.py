@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Compare two streaming benchmark results and flag regressions.
+
+Usage:
+    python benchmarks/compare.py baseline.json candidate.json
+    python benchmarks/compare.py baseline.json candidate.json --threshold 0.2
+
+Exits with status 1 when any tracked metric got worse by more than the
+threshold (a fraction of the baseline value).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# (label, path into the result document, True if higher is better)
+METRICS: list[tuple[str, tuple[str, ...], bool]] = [
+    ("terminal p50 ms", ("latency", "terminal", "p50_ms"), False),
+    ("terminal p90 ms", ("latency", "terminal", "p90_ms"), False),
+    ("terminal p99 ms", ("latency", "terminal", "p99_ms"), False),
+    ("tool event p50 ms", ("latency", "tool_event", "p50_ms"), False),
+    ("tool event p99 ms", ("latency", "tool_event", "p99_ms"), False),
+    ("delivered MB/s", ("throughput", "mb_per_sec"), True),
+    ("server CPU s/MB", ("server", "cpu_seconds_per_mb"), False),
+    ("RSS growth bytes", ("server", "rss_growth_bytes"), False),
+    ("event log bytes", ("event_log_bytes",), False),
+]
+
+
+def _lookup(document: dict, path: tuple[str, ...]):
+    value = document
+    for key in path:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def compare(baseline: dict, candidate: dict, threshold: float) -> tuple[list[str], list[str]]:
+    """Return (report lines, labels of regressed metrics)."""
+    lines = [f"{'metric':<20} {'baseline':>14} {'candidate':>14} {'change':>9}"]
+    regressions: list[str] = []
+    for label, path, higher_is_better in METRICS:
+        before = _lookup(baseline, path)
+        after = _lookup(candidate, path)
+        if before is None or after is None:
+            continue
+        change = (after - before) / before if before else 0.0
+        worse = -change if higher_is_better else change
+        flag = ""
+        if worse > threshold:
+            regressions.append(label)
+            flag = "  REGRESSION"
+        lines.append(f"{label:<20} {before:>14} {after:>14} {change:>+8.1%}{flag}")
+    return lines, regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare two streaming benchmark results")
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("candidate", type=Path)
+    parser.add_argument("--threshold", type=float, default=0.1, help="Allowed relative slowdown (default 0.1)")
+    args = parser.parse_args()
+
+    baseline = json.loads(args.baseline.read_text())
+    candidate = json.loads(args.candidate.read_text())
+    if baseline.get("config") != candidate.get("config"):
+        print("warning: results were produced with different configurations", file=sys.stderr)
+
+    print(f"baseline  {baseline.get('commit')}")
+    print(f"candidate {candidate.get('commit')}")
+    lines, regressions = compare(baseline, candidate, args.threshold)
+    print("\n".join(lines))
+    if regressions:
+        print(f"\n{len(regressions)} metric(s) regressed by more than {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,421 @@
+#!/usr/bin/env python3
+"""Throughput and latency benchmark for the streaming hot path.
+
+Drives PTY output -> EventLog -> EventMultiplexer -> SSE/WebSocket end to end
+against a real server process. N sessions run the mock agent, which writes
+rate-paced terminal lines stamped with their send time; M subscribers per
+session read the stream and record how long each stamped line took to
+arrive. Optionally the server also logs tool events at a fixed rate.
+
+Reported: end-to-end latency percentiles for terminal chunks and tool
+events, server CPU seconds per MB delivered, RSS growth, and the bytes the
+event logs grew by. Results are written as JSON so runs on different commits
+can be diffed with ``benchmarks/compare.py``.
+
+Usage:
+    python benchmarks/streaming.py --sessions 4 --subscribers 2 --rate-kbps 64
+    python benchmarks/streaming.py --transport ws --tool-events-per-sec 20 --output ws.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import json
+import math
+import os
+import re
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+
+import httpx
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from chad.server.services.task_executor import MOCK_STREAM_RATE_ENV  # noqa: E402
+
+SERVER_SCRIPT = Path(__file__).resolve().parent / "_server.py"
+
+# Send-time stamp written by the mock agent and the tool-event generator
+_MARKER_RE = re.compile(rb"t=(\d+\.\d+)")
+
+# Slack added to the mock run so tasks outlive the measurement window
+_RUN_SLACK_SECONDS = 3
+
+
+@dataclass
+class SubscriberStats:
+    """What one subscriber observed inside the measurement window."""
+
+    terminal_latencies: list[float] = field(default_factory=list)
+    tool_latencies: list[float] = field(default_factory=list)
+    bytes_received: int = 0
+    messages: int = 0
+    error: str | None = None
+    _carry: bytes = b""
+
+    def on_terminal(self, chunk: bytes, measure_from: float) -> None:
+        now = time.time()
+        # Markers can straddle chunks; only complete lines are scanned
+        data = self._carry + chunk
+        cut = data.rfind(b"\n") + 1
+        self._carry = data[cut:][-1024:]
+        for match in _MARKER_RE.finditer(data, 0, cut):
+            sent = float(match.group(1))
+            if sent >= measure_from:
+                self.terminal_latencies.append(now - sent)
+
+    def on_event(self, event: dict, measure_from: float) -> None:
+        if event.get("type") != "tool_call_started":
+            return
+        match = _MARKER_RE.search((event.get("command") or "").encode())
+        if match and float(match.group(1)) >= measure_from:
+            self.tool_latencies.append(time.time() - float(match.group(1)))
+
+
+def percentiles(values: list[float]) -> dict:
+    """Summarize latencies (seconds) as millisecond percentiles."""
+    if not values:
+        return {"count": 0}
+    ordered = sorted(values)
+
+    def pick(p: float) -> float:
+        index = min(len(ordered) - 1, max(0, math.ceil(p / 100 * len(ordered)) - 1))
+        return round(ordered[index] * 1000, 3)
+
+    return {
+        "count": len(ordered),
+        "p50_ms": pick(50),
+        "p90_ms": pick(90),
+        "p99_ms": pick(99),
+        "max_ms": round(ordered[-1] * 1000, 3),
+    }
+
+
+def process_usage(pid: int) -> tuple[float, int]:
+    """Return (CPU seconds, RSS bytes) for a process."""
+    if psutil is not None:
+        proc = psutil.Process(pid)
+        times = proc.cpu_times()
+        return times.user + times.system, proc.memory_info().rss
+    # /proc fallback (Linux)
+    stat = Path(f"/proc/{pid}/stat").read_text()
+    fields = stat[stat.rindex(")") + 2:].split()
+    ticks = os.sysconf("SC_CLK_TCK")
+    cpu = (int(fields[11]) + int(fields[12])) / ticks
+    rss = int(fields[21]) * os.sysconf("SC_PAGE_SIZE")
+    return cpu, rss
+
+
+def _dir_bytes(path: Path) -> int:
+    return sum(p.stat().st_size for p in path.rglob("*") if p.is_file())
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _git_commit() -> str | None:
+    result = subprocess.run(["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True, text=True)
+    return result.stdout.strip() or None
+
+
+def _make_repo(path: Path) -> Path:
+    path.mkdir()
+    (path / "BUGS.md").write_text("# Bugs\n")
+    for cmd in (
+        ["git", "init", "-q"],
+        ["git", "config", "user.email", "bench@example.com"],
+        ["git", "config", "user.name", "Bench"],
+        ["git", "add", "."],
+        ["git", "commit", "-q", "-m", "init"],
+    ):
+        subprocess.run(cmd, cwd=path, check=True, capture_output=True)
+    return path
+
+
+async def _sse_subscriber(
+    base_url: str, session_id: str, stats: SubscriberStats, measure_from: float, stop_at: float
+) -> None:
+    url = f"{base_url}/api/v1/sessions/{session_id}/stream"
+    async with httpx.AsyncClient(timeout=None) as client:
+        async with client.stream("GET", url) as response:
+            kind = None
+            async for line in response.aiter_lines():
+                if time.time() >= stop_at:
+                    return
+                if line.startswith("event: "):
+                    kind = line[7:]
+                elif line.startswith("data: "):
+                    _dispatch(stats, kind, line[6:], measure_from)
+                    if kind in ("complete", "error"):
+                        return
+
+
+async def _ws_subscriber(
+    base_url: str, session_id: str, stats: SubscriberStats, measure_from: float, stop_at: float
+) -> None:
+    import websockets
+
+    url = base_url.replace("http://", "ws://") + f"/api/v1/ws/{session_id}"
+    async with websockets.connect(url, max_size=None) as ws:
+        while True:
+            remaining = stop_at - time.time()
+            if remaining <= 0:
+                return
+            try:
+                raw = await asyncio.wait_for(ws.recv(), timeout=remaining)
+            except asyncio.TimeoutError:
+                return
+            message = json.loads(raw)
+            _dispatch(stats, message.get("type"), json.dumps(message.get("data") or {}), measure_from, raw)
+
+
+def _dispatch(stats: SubscriberStats, kind: str | None, payload: str, measure_from: float, raw=None) -> None:
+    now = time.time()
+    if now >= measure_from:
+        stats.messages += 1
+        stats.bytes_received += len(raw if raw is not None else payload)
+    if kind == "terminal":
+        data = json.loads(payload)
+        if data.get("text"):
+            chunk = str(data.get("data") or "").encode("utf-8", errors="replace")
+        else:
+            chunk = base64.b64decode(data.get("data") or "")
+        stats.on_terminal(chunk, measure_from)
+    elif kind == "event":
+        stats.on_event(json.loads(payload), measure_from)
+
+
+async def _run_subscribers(
+    base_url: str, session_ids: list[str], subscribers: int, transport: str, measure_from: float, stop_at: float
+) -> list[SubscriberStats]:
+    subscriber = _sse_subscriber if transport == "sse" else _ws_subscriber
+    all_stats: list[SubscriberStats] = []
+    jobs = []
+    for session_id in session_ids:
+        for _ in range(subscribers):
+            stats = SubscriberStats()
+            all_stats.append(stats)
+            jobs.append(_guarded(subscriber(base_url, session_id, stats, measure_from, stop_at), stats))
+    await asyncio.gather(*jobs)
+    return all_stats
+
+
+async def _guarded(job, stats: SubscriberStats) -> None:
+    try:
+        await job
+    except Exception as exc:
+        stats.error = f"{type(exc).__name__}: {exc}"
+
+
+def _wait_ready(base_url: str, proc: subprocess.Popen, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"Benchmark server exited with code {proc.returncode}")
+        try:
+            if httpx.get(f"{base_url}/status", timeout=1.0).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.1)
+    raise RuntimeError("Benchmark server did not become ready")
+
+
+def run_benchmark(args: argparse.Namespace) -> dict:
+    """Run one benchmark configuration and return the result document."""
+    with tempfile.TemporaryDirectory(prefix="chad-bench-") as tmp_name:
+        tmp = Path(tmp_name)
+        repo = _make_repo(tmp / "repo")
+        log_dir = tmp / "logs"
+        config_path = tmp / "chad.conf"
+        config_path.write_text(
+            json.dumps({"encryption_salt": "dGVzdHNhbHQ=", "password_hash": "", "accounts": {}})
+        )
+        env = {
+            **os.environ,
+            "CHAD_CONFIG": str(config_path),
+            "CHAD_LOG_DIR": str(log_dir),
+            "CHAD_SESSION_LOG_DIR": str(tmp / "session-logs"),
+            "CHAD_CACHE_DIR": str(tmp / "cache"),
+            MOCK_STREAM_RATE_ENV: str(int(args.rate_kbps * 1024)),
+        }
+        port = _free_port()
+        base_url = f"http://127.0.0.1:{port}"
+        server_log = tmp / "server.log"
+        with open(server_log, "wb") as log_file:
+            proc = subprocess.Popen(
+                [
+                    sys.executable,
+                    str(SERVER_SCRIPT),
+                    "--port",
+                    str(port),
+                    "--tool-events-per-sec",
+                    str(args.tool_events_per_sec),
+                ],
+                env=env,
+                stdout=log_file,
+                stderr=subprocess.STDOUT,
+            )
+        try:
+            _wait_ready(base_url, proc)
+            result = _measure(args, base_url, repo, proc.pid, log_dir)
+        except Exception:
+            sys.stderr.write(server_log.read_text(errors="replace")[-4000:])
+            raise
+        finally:
+            proc.terminate()
+            try:
+                proc.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+        return result
+
+
+def _measure(args: argparse.Namespace, base_url: str, repo: Path, pid: int, log_dir: Path) -> dict:
+    run_seconds = math.ceil(args.warmup + args.duration) + _RUN_SLACK_SECONDS
+    session_ids: list[str] = []
+    with httpx.Client(base_url=base_url, timeout=30.0) as client:
+        client.post("/api/v1/accounts", json={"name": "bench", "provider": "mock"}).raise_for_status()
+        client.put(
+            "/api/v1/config/mock-run-duration", json={"account_name": "bench", "seconds": run_seconds}
+        ).raise_for_status()
+        for index in range(args.sessions):
+            response = client.post("/api/v1/sessions", json={"name": f"bench-{index}"})
+            response.raise_for_status()
+            session_id = response.json()["id"]
+            client.post(
+                f"/api/v1/sessions/{session_id}/tasks",
+                json={"project_path": str(repo), "task_description": "benchmark", "coding_agent": "bench"},
+            ).raise_for_status()
+            session_ids.append(session_id)
+
+        start = time.time()
+        measure_from = start + args.warmup
+        stop_at = measure_from + args.duration
+
+        # Baselines are taken when the warmup ends so start-up cost is excluded
+        usage: dict[str, float] = {}
+        rss_peak = [0]
+        sampler_stop = threading.Event()
+
+        def sample() -> None:
+            if sampler_stop.wait(max(0.0, measure_from - time.time())):
+                return
+            usage["cpu_start"], usage["rss_start"] = process_usage(pid)
+            usage["log_bytes_start"] = _dir_bytes(log_dir)
+            while not sampler_stop.wait(0.2):
+                rss_peak[0] = max(rss_peak[0], process_usage(pid)[1])
+
+        sampler = threading.Thread(target=sample, daemon=True)
+        sampler.start()
+        stats = asyncio.run(
+            _run_subscribers(base_url, session_ids, args.subscribers, args.transport, measure_from, stop_at)
+        )
+        cpu_end, rss_end = process_usage(pid)
+        sampler_stop.set()
+        sampler.join()
+        log_bytes = _dir_bytes(log_dir) - usage.get("log_bytes_start", 0)
+
+        for session_id in session_ids:
+            client.post(f"/api/v1/sessions/{session_id}/cancel")
+
+    received = sum(s.bytes_received for s in stats)
+    megabytes = received / (1024 * 1024)
+    cpu_seconds = cpu_end - usage.get("cpu_start", cpu_end)
+    rss_start = int(usage.get("rss_start", rss_end))
+    return {
+        "benchmark": "streaming",
+        "commit": _git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "config": {
+            "sessions": args.sessions,
+            "subscribers": args.subscribers,
+            "transport": args.transport,
+            "rate_kbps": args.rate_kbps,
+            "tool_events_per_sec": args.tool_events_per_sec,
+            "duration": args.duration,
+            "warmup": args.warmup,
+        },
+        "latency": {
+            "terminal": percentiles([v for s in stats for v in s.terminal_latencies]),
+            "tool_event": percentiles([v for s in stats for v in s.tool_latencies]),
+        },
+        "throughput": {
+            "bytes_received": received,
+            "mb_per_sec": round(megabytes / args.duration, 4),
+            "messages": sum(s.messages for s in stats),
+        },
+        "server": {
+            "cpu_seconds": round(cpu_seconds, 3),
+            "cpu_seconds_per_mb": round(cpu_seconds / megabytes, 4) if megabytes else None,
+            "rss_start_bytes": rss_start,
+            "rss_end_bytes": rss_end,
+            "rss_peak_bytes": max(rss_peak[0], rss_end),
+            "rss_growth_bytes": rss_end - rss_start,
+        },
+        "event_log_bytes": log_bytes,
+        "errors": [s.error for s in stats if s.error],
+    }
+
+
+def _summary(result: dict) -> str:
+    lines = [f"commit {result['commit']}  config {json.dumps(result['config'])}"]
+    for name, stats in result["latency"].items():
+        if stats["count"]:
+            lines.append(
+                f"  {name:<10} n={stats['count']:<7} p50={stats['p50_ms']}ms "
+                f"p90={stats['p90_ms']}ms p99={stats['p99_ms']}ms max={stats['max_ms']}ms"
+            )
+    server = result["server"]
+    lines.append(
+        f"  delivered {result['throughput']['mb_per_sec']} MB/s, server CPU {server['cpu_seconds']}s "
+        f"({server['cpu_seconds_per_mb']} s/MB), RSS +{server['rss_growth_bytes'] // 1024} KiB, "
+        f"event logs +{result['event_log_bytes'] // 1024} KiB"
+    )
+    for error in result["errors"]:
+        lines.append(f"  subscriber error: {error}")
+    return "\n".join(lines)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the PTY -> EventLog -> SSE/WS streaming path")
+    parser.add_argument("--sessions", type=int, default=2, help="Parallel sessions running the mock agent")
+    parser.add_argument("--subscribers", type=int, default=1, help="Stream subscribers per session")
+    parser.add_argument("--transport", choices=("sse", "ws"), default="sse")
+    parser.add_argument("--rate-kbps", type=float, default=32.0, help="Terminal output per session (KiB/s)")
+    parser.add_argument("--tool-events-per-sec", type=float, default=0.0, help="Tool events per session per second")
+    parser.add_argument("--duration", type=float, default=10.0, help="Measured seconds")
+    parser.add_argument("--warmup", type=float, default=2.0, help="Seconds discarded before measuring")
+    parser.add_argument("--output", type=Path, help="Write the JSON result here instead of stdout")
+    args = parser.parse_args()
+
+    result = run_benchmark(args)
+    document = json.dumps(result, indent=2)
+    if args.output:
+        args.output.write_text(document + "\n")
+    else:
+        print(document)
+    print(_summary(result), file=sys.stderr)
+    return 1 if result["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -23,6 +23,8 @@ import type {
   SessionList,
   SessionResume,
   TaskCreate,
+  TaskQueue,
+  TaskSchedulingSettings,
   TaskStatus,
   UserPreferences,
   VerificationSettings,
@@ -150,6 +152,10 @@ export class ChadAPI {
     return this.get(`/api/v1/sessions/${sessionId}/tasks/${taskId}`);
   }
 
+  getTaskQueue(): Promise<TaskQueue> {
+    return this.get("/api/v1/tasks/queue");
+  }
+
   // ── Messages & Input ──
 
   sendMessage(
@@ -261,6 +267,48 @@ export class ChadAPI {
     );
   }
 
+  /**
+   * Fetch usage for every account in one request. Each account's usage is
+   * passed to `onUsage` as soon as its probe finishes (NDJSON stream), so a
+   * slow provider does not delay the others. Resolves once all have arrived.
+   */
+  async streamAccountUsage(
+    onUsage: (usage: AccountUsage) => void,
+    options: { timeout?: number; signal?: AbortSignal } = {},
+  ): Promise<void> {
+    const params = new URLSearchParams({ stream: "true" });
+    if (options.timeout != null) params.set("timeout", String(options.timeout));
+
+    const headers: Record<string, string> = {};
+    if (this.token) {
+      headers["Authorization"] = `Bearer ${this.token}`;
+    }
+
+    const res = await fetch(`${this.baseUrl}/api/v1/accounts/usage?${params}`, {
+      headers,
+      signal: options.signal,
+    });
+    if (!res.ok || !res.body) {
+      const body = await res.text().catch(() => null);
+      throw new ChadAPIError(res.status, body);
+    }
+
+    const reader = res.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = "";
+    for (;;) {
+      const { done, value } = await reader.read();
+      buffer += done ? decoder.decode() : decoder.decode(value, { stream: true });
+      let newline: number;
+      while ((newline = buffer.indexOf("\n")) >= 0) {
+        const line = buffer.slice(0, newline).trim();
+        buffer = buffer.slice(newline + 1);
+        if (line) onUsage(JSON.parse(line) as AccountUsage);
+      }
+      if (done) break;
+    }
+  }
+
   // ── Providers ──
 
   listProviders(): Promise<ProviderList> {
@@ -391,6 +439,18 @@ export class ChadAPI {
     return this.put("/api/v1/config/cleanup", settings);
   }
 
+  // ── Config: Task scheduling ──
+
+  getTaskScheduling(): Promise<TaskSchedulingSettings> {
+    return this.get("/api/v1/config/task-scheduling");
+  }
+
+  setTaskScheduling(
+    settings: Partial<TaskSchedulingSettings>,
+  ): Promise<TaskSchedulingSettings> {
+    return this.put("/api/v1/config/task-scheduling", settings);
+  }
+
   // ── Config: Preferences ──
 
   getPreferences(): Promise<UserPreferences> {
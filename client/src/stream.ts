@@ -6,6 +6,8 @@ export interface ChadStreamOptions {
   sinceSeq?: number;
   includeTerminal?: boolean;
   includeEvents?: boolean;
+  /** Catch up with one `snapshot` event instead of replaying the log. */
+  snapshot?: boolean;
 }
 
 /**
@@ -36,6 +38,9 @@ export class ChadStream {
     if (options.includeEvents === false) {
       params.set("include_events", "false");
     }
+    if (options.snapshot) {
+      params.set("snapshot", "true");
+    }
 
     const qs = params.toString();
     const url = `${this.baseUrl}/api/v1/sessions/${sessionId}/stream${qs ? `?${qs}` : ""}`;
@@ -45,6 +50,7 @@ export class ChadStream {
     const eventTypes: StreamEventType[] = [
       "terminal",
       "event",
+      "snapshot",
       "ping",
       "complete",
       "error",
@@ -81,6 +87,11 @@ export class ChadStream {
     return this.on("event", cb);
   }
 
+  /** Register a callback for the catch-up snapshot (see `snapshot` option). */
+  onSnapshot(cb: StreamCallback): this {
+    return this.on("snapshot", cb);
+  }
+
   /** Register a callback for task completion. */
   onComplete(cb: StreamCallback): this {
     return this.on("complete", cb);
@@ -62,6 +62,8 @@ export interface TaskCreate {
   screenshots?: string[] | null;
   override_prompt?: string | null;
   is_followup?: boolean;
+  /** Admission priority when all task slots are busy (higher first). */
+  priority?: number;
 }
 
 export interface TaskStatus {
@@ -74,6 +76,30 @@ export interface TaskStatus {
   completed_at: string | null;
 }
 
+export interface RunningTaskEntry {
+  task_id: string;
+  account: string;
+  provider: string;
+}
+
+export interface QueuedTaskEntry {
+  task_id: string;
+  session_id: string;
+  account: string;
+  provider: string;
+  priority: number;
+  position: number;
+  enqueued_at: string;
+}
+
+export interface TaskQueue {
+  max_concurrent_tasks: number;
+  max_tasks_per_account: number;
+  max_tasks_per_provider: number;
+  running: RunningTaskEntry[];
+  queued: QueuedTaskEntry[];
+}
+
 export interface TaskFollowup {
   message: string;
 }
@@ -141,6 +167,8 @@ export interface AccountUsage {
   weekly_usage_pct: number | null;
   session_reset_eta: string | null;
   weekly_reset_eta: string | null;
+  /** Set when usage could not be fetched (e.g. the probe timed out). */
+  error?: string | null;
 }
 
 // ── Config types ──
@@ -152,6 +180,19 @@ export interface VerificationSettings {
 export interface CleanupSettings {
   cleanup_days: number;
   auto_cleanup: boolean;
+  /** Disk budget for session logs, artifacts and uploads in MB (0 = unlimited). */
+  log_quota_mb?: number | null;
+  /** Prune session logs idle longer than this many days (0 = never). */
+  log_retention_days?: number | null;
+}
+
+export interface TaskSchedulingSettings {
+  max_concurrent_tasks: number;
+  /** 0 = unlimited. */
+  max_tasks_per_account: number;
+  /** 0 = unlimited. */
+  max_tasks_per_provider: number;
+  balance_accounts: boolean;
 }
 
 export interface UserPreferences {
@@ -262,6 +303,7 @@ export interface BranchesResponse {
 export type StreamEventType =
   | "terminal"
   | "event"
+  | "snapshot"
   | "ping"
   | "complete"
   | "error";
@@ -306,12 +348,26 @@ export interface ConversationResponse {
   latest_seq: number;
 }
 
+/** Catch-up state sent once to a stream opened with `snapshot`. */
+export interface SessionSnapshot {
+  /** Current terminal screen (plain text). */
+  screen: string;
+  task: ConversationTask | null;
+  /** Latest task's timeline, same shape as GET /conversation items. */
+  conversation: ConversationItem[];
+  milestones: Array<{ seq: number; milestone_type: string; title: string; summary: string }>;
+  ended: boolean;
+  latest_seq: number;
+  seq: number;
+}
+
 // ── WebSocket types ──
 
 export type WSClientMessageType = "input" | "resize" | "cancel" | "ping";
 export type WSServerMessageType =
   | "terminal"
   | "event"
+  | "snapshot"
   | "complete"
   | "error"
   | "pong"
@@ -349,6 +405,8 @@ export interface ProjectSettings {
   preview_command: string | null;
   preferred_coding_agent: string | null;
   autoconfigure_agent: string | null;
+  verification_fail_fast?: boolean;
+  verification_run_tests?: boolean;
 }
 
 export interface AutoconfigureStart {
@@ -372,6 +430,8 @@ export interface ProjectSettingsUpdate {
   preview_command?: string | null;
   preferred_coding_agent?: string | null;
   autoconfigure_agent?: string | null;
+  verification_fail_fast?: boolean;
+  verification_run_tests?: boolean;
 }
 
 export interface PromptPreviews {
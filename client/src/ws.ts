@@ -6,7 +6,7 @@ export type WSCallback = (message: WSMessage) => void;
  * WebSocket client for bidirectional communication with Chad PTY sessions.
  *
  * Sends: input (base64), resize, cancel, ping
- * Receives: terminal, event, complete, error, pong, status
+ * Receives: terminal, event, snapshot, complete, error, pong, status
  */
 export class ChadWebSocket {
   private ws: WebSocket | null = null;
@@ -21,7 +21,7 @@ export class ChadWebSocket {
   }
 
   /** Connect to a session's WebSocket endpoint. */
-  connect(sessionId: string, options?: { sinceSeq?: number; ticket?: string }): void {
+  connect(sessionId: string, options?: { sinceSeq?: number; ticket?: string; snapshot?: boolean }): void {
     this.disconnect();
 
     const params = new URLSearchParams();
@@ -29,6 +29,7 @@ export class ChadWebSocket {
       params.set("ticket", options.ticket);
     }
     if (options?.sinceSeq) params.set("since_seq", String(options.sinceSeq));
+    if (options?.snapshot) params.set("snapshot", "true");
     const qs = params.toString();
     const ws = new WebSocket(
       `${this.baseUrl}/api/v1/ws/${sessionId}${qs ? `?${qs}` : ""}`,
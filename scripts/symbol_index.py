@@ -10,189 +10,39 @@ Usage:
     python scripts/symbol_index.py --define TaskExecutor  # find definitions only
     python scripts/symbol_index.py --callers verify       # find files that import/call
     python scripts/symbol_index.py --impact src/chad/util/providers.py  # show impact of changing a file
+    python scripts/symbol_index.py --serve               # keep a query server running
+
+The index is kept in .chad/symbol_index.sqlite and only files whose content
+changed are re-parsed. With a --serve process running, lookups are answered
+over a local socket without re-indexing start-up cost.
 """
 
 from __future__ import annotations
 
 import argparse
-import ast
-import re
 import sys
-from collections import defaultdict
-from dataclasses import dataclass, field
+import time
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[1]
-SRC_DIR = ROOT / "src"
-UI_DIR = ROOT / "ui" / "src"
-CLIENT_DIR = ROOT / "client" / "src"
-TEST_DIR = ROOT / "tests"
-
-
-@dataclass
-class SymbolRef:
-    file: str  # Relative to ROOT
-    line: int
-    kind: str  # "def", "class", "import", "use"
-    context: str  # The line of code
-
+sys.path.insert(0, str(ROOT / "src"))
 
-@dataclass
-class SymbolIndex:
-    definitions: dict[str, list[SymbolRef]] = field(
-        default_factory=lambda: defaultdict(list))
-    references: dict[str, list[SymbolRef]] = field(
-        default_factory=lambda: defaultdict(list))
-    file_exports: dict[str, set[str]] = field(
-        default_factory=lambda: defaultdict(set))
+from chad.util.symbol_index import (  # noqa: E402,F401
+    SymbolIndex,
+    SymbolRef,
+    _index_python_file,
+    _index_ts_file,
+    find_symbol,
+)
+from chad.util import symbol_index as _lib  # noqa: E402
 
-    def all_symbols(self) -> set[str]:
-        return set(self.definitions.keys()) | set(self.references.keys())
-
-
-def _index_python_file(path: Path, rel: str, index: SymbolIndex) -> None:
-    """Index a Python file using AST parsing."""
-    try:
-        source = path.read_text(encoding="utf-8", errors="replace")
-        tree = ast.parse(source, filename=str(path))
-    except (SyntaxError, ValueError):
-        return
-
-    lines = source.splitlines()
-
-    for node in ast.walk(tree):
-        if isinstance(node, ast.FunctionDef) or isinstance(node, ast.AsyncFunctionDef):
-            name = node.name
-            ctx = lines[node.lineno - 1].strip() if node.lineno <= len(lines) else ""
-            ref = SymbolRef(file=rel, line=node.lineno, kind="def", context=ctx)
-            index.definitions[name].append(ref)
-            index.file_exports[rel].add(name)
-
-        elif isinstance(node, ast.ClassDef):
-            name = node.name
-            ctx = lines[node.lineno - 1].strip() if node.lineno <= len(lines) else ""
-            ref = SymbolRef(file=rel, line=node.lineno, kind="class", context=ctx)
-            index.definitions[name].append(ref)
-            index.file_exports[rel].add(name)
-
-        elif isinstance(node, ast.ImportFrom):
-            if node.names:
-                for alias in node.names:
-                    name = alias.name
-                    if name == "*":
-                        continue
-                    lineno = node.lineno
-                    ctx = lines[lineno - 1].strip() if lineno <= len(lines) else ""
-                    ref = SymbolRef(file=rel, line=lineno, kind="import", context=ctx)
-                    index.references[name].append(ref)
-
-        elif isinstance(node, ast.Import):
-            for alias in node.names:
-                # For "import foo.bar", index "bar" as the short name
-                name = alias.asname or alias.name.split(".")[-1]
-                lineno = node.lineno
-                ctx = lines[lineno - 1].strip() if lineno <= len(lines) else ""
-                ref = SymbolRef(file=rel, line=lineno, kind="import", context=ctx)
-                index.references[name].append(ref)
-
-
-def _index_ts_file(path: Path, rel: str, index: SymbolIndex) -> None:
-    """Index a TypeScript/TSX file using regex (no full TS parser needed)."""
-    try:
-        source = path.read_text(encoding="utf-8", errors="replace")
-    except OSError:
-        return
-
-    lines = source.splitlines()
-
-    for i, line in enumerate(lines, 1):
-        stripped = line.strip()
-
-        # Function/const definitions
-        for m in re.finditer(
-            r'(?:export\s+)?(?:function|const|let|var)\s+(\w+)', stripped
-        ):
-            name = m.group(1)
-            # Skip common noise words
-            if name in ("if", "for", "while", "return", "true", "false", "null"):
-                continue
-            index.definitions[name].append(
-                SymbolRef(file=rel, line=i, kind="def", context=stripped))
-            index.file_exports[rel].add(name)
-
-        # Interface/type/class definitions
-        for m in re.finditer(
-            r'(?:export\s+)?(?:interface|type|class|enum)\s+(\w+)', stripped
-        ):
-            name = m.group(1)
-            index.definitions[name].append(
-                SymbolRef(file=rel, line=i, kind="class", context=stripped))
-            index.file_exports[rel].add(name)
-
-        # Imports
-        for m in re.finditer(
-            r'import\s+\{([^}]+)\}\s+from', stripped
-        ):
-            for name in m.group(1).split(","):
-                name = name.strip().split(" as ")[0].strip()
-                if name:
-                    index.references[name].append(
-                        SymbolRef(file=rel, line=i, kind="import",
-                                  context=stripped))
-
-        # Default imports
-        for m in re.finditer(
-            r'import\s+(\w+)\s+from', stripped
-        ):
-            name = m.group(1)
-            if name not in ("type", "from"):
-                index.references[name].append(
-                    SymbolRef(file=rel, line=i, kind="import",
-                              context=stripped))
+# The query server rescans the tree for changed files at most this often
+SERVE_UPDATE_INTERVAL_SECONDS = 2.0
 
 
 def build_index() -> SymbolIndex:
     """Build a symbol index for the entire codebase."""
-    index = SymbolIndex()
-
-    # Index Python files
-    for base_dir in [SRC_DIR, TEST_DIR]:
-        if not base_dir.exists():
-            continue
-        for path in base_dir.rglob("*.py"):
-            if "__pycache__" in str(path):
-                continue
-            rel = str(path.relative_to(ROOT))
-            _index_python_file(path, rel, index)
-
-    # Index TypeScript files
-    for base_dir in [UI_DIR, CLIENT_DIR]:
-        if not base_dir.exists():
-            continue
-        for ext in ("*.ts", "*.tsx"):
-            for path in base_dir.rglob(ext):
-                if "node_modules" in str(path):
-                    continue
-                rel = str(path.relative_to(ROOT))
-                _index_ts_file(path, rel, index)
-
-    return index
-
-
-def find_symbol(index: SymbolIndex, name: str,
-                mode: str = "all") -> list[SymbolRef]:
-    """Find references to a symbol.
-
-    Args:
-        name: Symbol name (case-sensitive)
-        mode: "all", "define", or "callers"
-    """
-    results = []
-    if mode in ("all", "define"):
-        results.extend(index.definitions.get(name, []))
-    if mode in ("all", "callers"):
-        results.extend(index.references.get(name, []))
-    return results
+    return _lib.build_index(ROOT)
 
 
 def find_impact(index: SymbolIndex, file_path: str) -> dict[str, list[SymbolRef]]:
@@ -200,25 +50,91 @@ def find_impact(index: SymbolIndex, file_path: str) -> dict[str, list[SymbolRef]
 
     Returns a dict of symbol_name → list of files that reference it.
     """
-    # Normalize path
-    rel = str(Path(file_path).relative_to(ROOT)) if Path(file_path).is_absolute() else file_path
-    rel = rel.replace("\\", "/")
+    return _lib.find_impact(index, file_path, root=ROOT)
 
-    exported = index.file_exports.get(rel, set())
-    impact: dict[str, list[SymbolRef]] = {}
 
-    for symbol in exported:
-        refs = index.references.get(symbol, [])
-        # Exclude self-references
-        external = [r for r in refs if r.file != rel]
-        if external:
-            impact[symbol] = external
+def _format_ref(ref: SymbolRef) -> str:
+    return f"  {ref.file}:{ref.line}  [{ref.kind}]  {ref.context}"
 
-    return impact
 
+def run_query(store: _lib.SymbolStore, request: dict) -> tuple[str, int]:
+    """Answer a lookup against the store.
 
-def _format_ref(ref: SymbolRef) -> str:
-    return f"  {ref.file}:{ref.line}  [{ref.kind}]  {ref.context}"
+    Returns:
+        Tuple of (output text, exit code)
+    """
+    out: list[str] = []
+
+    if request.get("impact"):
+        impact = store.find_impact(request["impact"])
+        if not impact:
+            return f"No external references found for exports of {request['impact']}", 0
+
+        total_files = set()
+        for symbol, refs in sorted(impact.items()):
+            out.append(f"\n{symbol}:")
+            for ref in refs:
+                out.append(_format_ref(ref))
+                total_files.add(ref.file)
+
+        out.append(f"\n--- {len(total_files)} files affected, "
+                   f"{len(impact)} exported symbols referenced ---")
+        return "\n".join(out), 0
+
+    symbol = request["symbol"]
+    mode = request.get("mode", "all")
+
+    if request.get("fuzzy"):
+        # Find all matching symbol names
+        pattern = symbol.lower()
+        matches = [s for s in store.all_symbols() if pattern in s.lower()]
+        if not matches:
+            return f"No symbols matching '{symbol}'", 1
+        for name in sorted(matches):
+            refs = store.find_symbol(name, mode)
+            if refs:
+                out.append(f"\n{name} ({len(refs)} references):")
+                out.extend(_format_ref(ref) for ref in refs)
+        return "\n".join(out), 0
+
+    refs = store.find_symbol(symbol, mode)
+    if not refs:
+        out.append(f"No references found for '{symbol}'")
+        # Suggest fuzzy matches
+        pattern = symbol.lower()
+        close = [s for s in store.all_symbols()
+                 if pattern in s.lower()][:10]
+        if close:
+            out.append(f"Did you mean: {', '.join(sorted(close))}")
+        return "\n".join(out), 1
+
+    out.append(f"\n{symbol} ({len(refs)} references):\n")
+    out.extend(_format_ref(ref) for ref in refs)
+    return "\n".join(out), 0
+
+
+def serve_forever(socket_path: Path) -> None:
+    """Keep the index warm and answer lookups until interrupted."""
+    store = _lib.SymbolStore(ROOT)
+    reindexed, _ = store.update()
+    print(f"Indexed {reindexed} changed files; serving on {socket_path}", flush=True)
+    last_update = time.monotonic()
+
+    def handle(request: dict) -> dict:
+        # Rescanning stats every file, so bursts of lookups share one scan
+        nonlocal last_update
+        if time.monotonic() - last_update >= SERVE_UPDATE_INTERVAL_SECONDS:
+            store.update()
+            last_update = time.monotonic()
+        output, code = run_query(store, request)
+        return {"output": output, "code": code}
+
+    try:
+        _lib.serve(socket_path, handle)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        store.close()
 
 
 def main() -> None:
@@ -235,61 +151,40 @@ def main() -> None:
                         help="Show all files affected by changes to FILE")
     parser.add_argument("--fuzzy", action="store_true",
                         help="Case-insensitive substring match")
+    parser.add_argument("--serve", action="store_true",
+                        help="Run a query server for fast repeated lookups")
+    parser.add_argument("--no-server", action="store_true",
+                        help="Query the on-disk index directly, even if a server is running")
     args = parser.parse_args()
 
+    socket_path = _lib.default_socket_path(ROOT)
+    if args.serve:
+        serve_forever(socket_path)
+        return
+
     if not args.symbol and not args.impact:
         parser.error("Provide a symbol name or --impact FILE")
 
-    index = build_index()
-
-    if args.impact:
-        impact = find_impact(index, args.impact)
-        if not impact:
-            print(f"No external references found for exports of {args.impact}")
-            sys.exit(0)
-
-        total_files = set()
-        for symbol, refs in sorted(impact.items()):
-            print(f"\n{symbol}:")
-            for ref in refs:
-                print(_format_ref(ref))
-                total_files.add(ref.file)
-
-        print(f"\n--- {len(total_files)} files affected, "
-              f"{len(impact)} exported symbols referenced ---")
-        sys.exit(0)
+    request = {
+        "symbol": args.symbol,
+        "impact": args.impact,
+        "fuzzy": args.fuzzy,
+        "mode": "define" if args.define else ("callers" if args.callers else "all"),
+    }
 
-    symbol = args.symbol
-    mode = "define" if args.define else ("callers" if args.callers else "all")
-
-    if args.fuzzy:
-        # Find all matching symbol names
-        pattern = symbol.lower()
-        matches = [s for s in index.all_symbols() if pattern in s.lower()]
-        if not matches:
-            print(f"No symbols matching '{symbol}'")
-            sys.exit(1)
-        for name in sorted(matches):
-            refs = find_symbol(index, name, mode)
-            if refs:
-                print(f"\n{name} ({len(refs)} references):")
-                for ref in refs:
-                    print(_format_ref(ref))
+    response = None if args.no_server else _lib.query_server(socket_path, request)
+    if response is not None and "output" in response:
+        output, code = response["output"], response["code"]
     else:
-        refs = find_symbol(index, symbol, mode)
-        if not refs:
-            print(f"No references found for '{symbol}'")
-            # Suggest fuzzy matches
-            pattern = symbol.lower()
-            close = [s for s in index.all_symbols()
-                     if pattern in s.lower()][:10]
-            if close:
-                print(f"Did you mean: {', '.join(sorted(close))}")
-            sys.exit(1)
-
-        print(f"\n{symbol} ({len(refs)} references):\n")
-        for ref in refs:
-            print(_format_ref(ref))
+        store = _lib.SymbolStore(ROOT)
+        try:
+            store.update()
+            output, code = run_query(store, request)
+        finally:
+            store.close()
+
+    print(output)
+    sys.exit(code)
 
 
 if __name__ == "__main__":
@@ -1,5 +1,5 @@
 """API routes."""
 
-from . import health, sessions, providers, worktree, config, ws, preview_tunnel
+from . import health, sessions, providers, worktree, config, ws, preview_tunnel, search, metrics, tasks
 
-__all__ = ["health", "sessions", "providers", "worktree", "config", "ws", "preview_tunnel"]
+__all__ = ["health", "sessions", "providers", "worktree", "config", "ws", "preview_tunnel", "search", "metrics", "tasks"]
@@ -11,6 +11,7 @@ from pydantic import BaseModel, Field
 from chad.server.api.schemas import (
     VerificationSettings,
     CleanupSettings,
+    TaskSchedulingSettings,
     UserPreferences,
     SlackSettingsResponse,
     SlackSettingsUpdate,
@@ -141,6 +142,8 @@ async def get_cleanup_settings() -> CleanupSettings:
     return CleanupSettings(
         cleanup_days=cleanup_days,
         auto_cleanup=True,  # Always enabled on startup
+        log_quota_mb=config_mgr.get_log_quota_mb(),
+        log_retention_days=config_mgr.get_log_retention_days(),
     )
 
 
@@ -149,15 +152,58 @@ async def update_cleanup_settings(request: CleanupSettings) -> CleanupSettings:
     """Update cleanup settings."""
     config_mgr = get_config_manager()
 
-    if request.cleanup_days >= 1:
+    # Only fields present in the request are updated
+    if "cleanup_days" in request.model_fields_set:
         config_mgr.set_cleanup_days(request.cleanup_days)
+    if request.log_quota_mb is not None:
+        config_mgr.set_log_quota_mb(request.log_quota_mb)
+    if request.log_retention_days is not None:
+        config_mgr.set_log_retention_days(request.log_retention_days)
 
     return CleanupSettings(
         cleanup_days=config_mgr.get_cleanup_days(),
         auto_cleanup=request.auto_cleanup,
+        log_quota_mb=config_mgr.get_log_quota_mb(),
+        log_retention_days=config_mgr.get_log_retention_days(),
     )
 
 
+def _task_scheduling_settings(config_mgr) -> TaskSchedulingSettings:
+    return TaskSchedulingSettings(
+        max_concurrent_tasks=config_mgr.get_max_concurrent_tasks(),
+        max_tasks_per_account=config_mgr.get_max_tasks_per_account(),
+        max_tasks_per_provider=config_mgr.get_max_tasks_per_provider(),
+        balance_accounts=config_mgr.get_balance_task_accounts(),
+    )
+
+
+@router.get("/task-scheduling", response_model=TaskSchedulingSettings)
+async def get_task_scheduling() -> TaskSchedulingSettings:
+    """Get the task admission limits.
+
+    Tasks beyond these limits wait in the queue shown by GET /tasks/queue.
+    """
+    return _task_scheduling_settings(get_config_manager())
+
+
+@router.put("/task-scheduling", response_model=TaskSchedulingSettings)
+async def update_task_scheduling(request: TaskSchedulingSettings) -> TaskSchedulingSettings:
+    """Update the task admission limits; unspecified fields keep their values.
+
+    New limits apply the next time a task is admitted or finishes.
+    """
+    config_mgr = get_config_manager()
+    if request.max_concurrent_tasks is not None:
+        config_mgr.set_max_concurrent_tasks(request.max_concurrent_tasks)
+    if request.max_tasks_per_account is not None:
+        config_mgr.set_max_tasks_per_account(request.max_tasks_per_account)
+    if request.max_tasks_per_provider is not None:
+        config_mgr.set_max_tasks_per_provider(request.max_tasks_per_provider)
+    if request.balance_accounts is not None:
+        config_mgr.set_balance_task_accounts(request.balance_accounts)
+    return _task_scheduling_settings(config_mgr)
+
+
 @router.get("/preferences", response_model=UserPreferences)
 async def get_preferences() -> UserPreferences:
     """Get user preferences."""
@@ -402,6 +448,12 @@ class ProjectSettingsResponse(BaseModel):
     preview_command: str | None = Field(default=None, description="Command to start the app for preview")
     preferred_coding_agent: str | None = Field(default=None, description="Default coding agent for this project")
     autoconfigure_agent: str | None = Field(default=None, description="Agent used for autoconfigure")
+    verification_fail_fast: bool = Field(
+        default=False, description="Stop automated verification on the first failing phase"
+    )
+    verification_run_tests: bool = Field(
+        default=False, description="Run affected tests during automated verification (lint only otherwise)"
+    )
 
 
 class ProjectSettingsUpdate(BaseModel):
@@ -416,6 +468,12 @@ class ProjectSettingsUpdate(BaseModel):
     preview_command: str | None = Field(default=None, description="Command to start the app for preview")
     preferred_coding_agent: str | None = Field(default=None, description="Default coding agent for this project")
     autoconfigure_agent: str | None = Field(default=None, description="Agent used for autoconfigure")
+    verification_fail_fast: bool | None = Field(
+        default=None, description="Stop automated verification on the first failing phase"
+    )
+    verification_run_tests: bool | None = Field(
+        default=None, description="Run affected tests during automated verification (lint only otherwise)"
+    )
 
 
 @router.get("/projects")
@@ -445,6 +503,8 @@ async def list_projects() -> list[ProjectSettingsResponse]:
                 preview_command=config.preview_command,
                 preferred_coding_agent=config.preferred_coding_agent,
                 autoconfigure_agent=config.autoconfigure_agent,
+                verification_fail_fast=config.verification.fail_fast,
+                verification_run_tests=config.verification.run_tests,
             ))
         else:
             results.append(ProjectSettingsResponse(
@@ -499,6 +559,8 @@ async def get_project_settings(
             preview_command=config.preview_command,
             preferred_coding_agent=config.preferred_coding_agent,
             autoconfigure_agent=config.autoconfigure_agent,
+            verification_fail_fast=config.verification.fail_fast,
+            verification_run_tests=config.verification.run_tests,
         )
 
     # Return defaults for new project
@@ -540,6 +602,16 @@ async def set_project_settings(request: ProjectSettingsUpdate) -> ProjectSetting
         preview_command=request.preview_command if "preview_command" in fields_set else ...,
         preferred_coding_agent=request.preferred_coding_agent if "preferred_coding_agent" in fields_set else ...,
         autoconfigure_agent=request.autoconfigure_agent if "autoconfigure_agent" in fields_set else ...,
+        verification_fail_fast=(
+            request.verification_fail_fast
+            if "verification_fail_fast" in fields_set and request.verification_fail_fast is not None
+            else ...
+        ),
+        verification_run_tests=(
+            request.verification_run_tests
+            if "verification_run_tests" in fields_set and request.verification_run_tests is not None
+            else ...
+        ),
     )
 
     return ProjectSettingsResponse(
@@ -553,6 +625,8 @@ async def set_project_settings(request: ProjectSettingsUpdate) -> ProjectSetting
         preview_command=config.preview_command,
         preferred_coding_agent=config.preferred_coding_agent,
         autoconfigure_agent=config.autoconfigure_agent,
+        verification_fail_fast=config.verification.fail_fast,
+        verification_run_tests=config.verification.run_tests,
     )
 
 
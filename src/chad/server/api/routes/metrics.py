@@ -0,0 +1,48 @@
+"""Metrics and profiling endpoints."""
+
+import asyncio
+import os
+
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import PlainTextResponse
+
+from chad.util.metrics import get_metrics_registry
+from chad.util.profiler import format_collapsed, sample_stacks
+
+router = APIRouter()
+
+# Setting this (or running the app with debug=True) enables /debug/profile
+PROFILER_ENV = "CHAD_ENABLE_PROFILER"
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_profile_lock = asyncio.Lock()
+
+
+def profiler_enabled(request: Request) -> bool:
+    """Whether the sampling profiler endpoint is switched on."""
+    return bool(request.app.debug) or os.environ.get(PROFILER_ENV, "").strip().lower() in ("1", "true", "yes")
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics() -> PlainTextResponse:
+    """Hot-path counters, gauges and histograms in Prometheus text format."""
+    return PlainTextResponse(get_metrics_registry().render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
+@router.get("/debug/profile", response_class=PlainTextResponse)
+async def profile(
+    request: Request,
+    seconds: float = Query(default=5.0, gt=0, le=60, description="How long to sample"),
+) -> PlainTextResponse:
+    """Sample every thread's stack and return collapsed stacks (flame graph input).
+
+    Disabled unless the server runs in debug mode or CHAD_ENABLE_PROFILER is set.
+    """
+    if not profiler_enabled(request):
+        raise HTTPException(status_code=404, detail="Profiler disabled; set CHAD_ENABLE_PROFILER=1")
+    if _profile_lock.locked():
+        raise HTTPException(status_code=409, detail="A profile is already being captured")
+    async with _profile_lock:
+        stacks = await asyncio.to_thread(sample_stacks, seconds)
+    return PlainTextResponse(format_collapsed(stacks))
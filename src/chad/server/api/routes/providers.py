@@ -1,6 +1,11 @@
 """Provider and account management endpoints."""
 
-from fastapi import APIRouter, HTTPException
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 
 from chad.server.api.schemas import (
     ProviderListResponse,
@@ -9,6 +14,7 @@ from chad.server.api.schemas import (
     AccountResponse,
     AccountListResponse,
     AccountUsage,
+    AccountUsageListResponse,
     AccountModelUpdate,
     AccountReasoningUpdate,
     AccountRoleUpdate,
@@ -16,10 +22,101 @@ from chad.server.api.schemas import (
     AccountDeleteResponse,
     RoleType,
 )
+from chad.server.services import get_task_executor
 from chad.server.state import get_config_manager, get_model_catalog
 
 router = APIRouter()
 
+# Default per-account budget for GET /accounts/usage; slower probes report an error instead
+USAGE_PROBE_TIMEOUT_SECONDS = 20.0
+
+# Usage probes block on CLI subprocesses and HTTP calls, so they run on a shared thread pool
+USAGE_PROBE_WORKERS = 8
+
+_usage_executor: ThreadPoolExecutor | None = None
+_usage_executor_lock = threading.Lock()
+
+# Unfinished probe per account. A probe that outlives its caller's timeout keeps
+# its worker thread, so later requests wait on it instead of starting another.
+_inflight_probes: dict[str, Future] = {}
+
+
+def _get_usage_executor() -> ThreadPoolExecutor:
+    """Get the thread pool shared by account usage probes."""
+    global _usage_executor
+    with _usage_executor_lock:
+        if _usage_executor is None:
+            _usage_executor = ThreadPoolExecutor(
+                max_workers=USAGE_PROBE_WORKERS, thread_name_prefix="chad-usage",
+            )
+        return _usage_executor
+
+
+def _probe_account_usage(name: str, provider_type: str, model: str) -> AccountUsage:
+    """Build a provider for an account and run its (blocking) usage probes."""
+    from chad.util.providers import create_provider, ModelConfig
+
+    provider = create_provider(ModelConfig(
+        provider=provider_type,
+        model_name=model,
+        account_name=name,
+    ))
+
+    session_pct = provider.get_session_usage_percentage()
+    weekly_pct = provider.get_weekly_usage_percentage()
+    # Keep the admission scheduler's balancing figures fresh
+    get_task_executor().scheduler.record_usage(name, session_pct)
+    session_eta = provider.get_session_reset_eta() if hasattr(provider, "get_session_reset_eta") else None
+    weekly_eta = provider.get_weekly_reset_eta() if hasattr(provider, "get_weekly_reset_eta") else None
+
+    return AccountUsage(
+        account_name=name,
+        provider=provider_type,
+        session_usage_pct=session_pct,
+        weekly_usage_pct=weekly_pct,
+        session_reset_eta=session_eta,
+        weekly_reset_eta=weekly_eta,
+    )
+
+
+def _submit_usage_probe(name: str, provider_type: str, model: str) -> Future:
+    """Start a usage probe for an account, or return the one still running for it."""
+    executor = _get_usage_executor()
+    with _usage_executor_lock:
+        probe = _inflight_probes.get(name)
+        if probe is not None:
+            return probe
+        probe = executor.submit(_probe_account_usage, name, provider_type, model)
+        _inflight_probes[name] = probe
+    # Outside the lock: the callback runs at once if the probe already finished
+    probe.add_done_callback(lambda done: _forget_usage_probe(name, done))
+    return probe
+
+
+def _forget_usage_probe(name: str, probe: Future) -> None:
+    with _usage_executor_lock:
+        if _inflight_probes.get(name) is probe:
+            del _inflight_probes[name]
+
+
+def reset_usage_probes() -> None:
+    """Forget unfinished usage probes so the next request starts fresh ones (for testing)."""
+    with _usage_executor_lock:
+        _inflight_probes.clear()
+
+
+async def _fetch_account_usage(name: str, provider_type: str, model: str, timeout: float) -> AccountUsage:
+    """Probe one account's usage off the event loop, reporting failures instead of raising."""
+    probe = asyncio.wrap_future(_submit_usage_probe(name, provider_type, model))
+    try:
+        # Shielded: a timed-out caller must not cancel a probe other requests share
+        return await asyncio.wait_for(asyncio.shield(probe), timeout)
+    except asyncio.TimeoutError:
+        error = f"Usage probe timed out after {timeout:g}s"
+    except Exception as e:
+        error = str(e) or type(e).__name__
+    return AccountUsage(account_name=name, provider=provider_type, error=error)
+
 
 def _get_account_role(config_mgr, account_name: str) -> RoleType | None:
     """Get the role assigned to an account, if any."""
@@ -143,6 +240,45 @@ async def create_account(request: AccountCreate) -> AccountResponse:
     return _account_to_response(request.name, request.provider, config_mgr)
 
 
+@router.get("/accounts/usage", response_model=AccountUsageListResponse)
+async def get_all_account_usage(
+    request: Request,
+    timeout: float = Query(
+        default=USAGE_PROBE_TIMEOUT_SECONDS, gt=0, le=120, description="Per-account probe budget in seconds",
+    ),
+    stream: bool = Query(default=False, description="Stream NDJSON, one AccountUsage per line as each finishes"),
+):
+    """Get usage statistics for every account, probing all accounts concurrently.
+
+    Accounts whose probes fail or exceed the timeout are still returned, with
+    ``error`` set and no usage figures. With ``stream=true`` (or an
+    ``Accept: application/x-ndjson`` header) results are written as
+    newline-delimited JSON in completion order, so one slow provider does not
+    hold back the others.
+    """
+    config_mgr = get_config_manager()
+    accounts = [
+        (name, provider_type, config_mgr.get_account_model(name) or "default")
+        for name, provider_type in config_mgr.list_accounts().items()
+    ]
+    probes = [_fetch_account_usage(name, provider_type, model, timeout) for name, provider_type, model in accounts]
+
+    if stream or "application/x-ndjson" in request.headers.get("accept", ""):
+        async def ndjson():
+            for next_done in asyncio.as_completed(probes):
+                usage = await next_done
+                yield usage.model_dump_json() + "\n"
+
+        return StreamingResponse(
+            ndjson(),
+            media_type="application/x-ndjson",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    results = await asyncio.gather(*probes)
+    return AccountUsageListResponse(accounts=list(results), total=len(results))
+
+
 @router.get("/accounts/{name}", response_model=AccountResponse)
 async def get_account(name: str) -> AccountResponse:
     """Get details of a specific account."""
@@ -236,30 +372,9 @@ async def get_account_usage(name: str) -> AccountUsage:
 
     accounts_dict = config_mgr.list_accounts()
     provider_type = accounts_dict.get(name)
-
-    # Create a provider instance to query usage
-    from chad.util.providers import create_provider, ModelConfig
-
     model = config_mgr.get_account_model(name) or "default"
-    provider = create_provider(ModelConfig(
-        provider=provider_type,
-        model_name=model,
-        account_name=name,
-    ))
-
-    session_pct = provider.get_session_usage_percentage()
-    weekly_pct = provider.get_weekly_usage_percentage()
-    session_eta = provider.get_session_reset_eta() if hasattr(provider, "get_session_reset_eta") else None
-    weekly_eta = provider.get_weekly_reset_eta() if hasattr(provider, "get_weekly_reset_eta") else None
 
-    return AccountUsage(
-        account_name=name,
-        provider=provider_type,
-        session_usage_pct=session_pct,
-        weekly_usage_pct=weekly_pct,
-        session_reset_eta=session_eta,
-        weekly_reset_eta=weekly_eta,
-    )
+    return await asyncio.wrap_future(_submit_usage_probe(name, provider_type, model))
 
 
 @router.get("/accounts/{name}/models", response_model=AccountModelsResponse)
@@ -0,0 +1,67 @@
+"""Cross-session search endpoints backed by the SQLite session index.
+
+The routes are plain functions so FastAPI runs their blocking SQLite queries
+in its threadpool instead of on the event loop.
+"""
+
+from fastapi import APIRouter, HTTPException, Query
+
+from chad.server.api.schemas import (
+    SearchHitResponse,
+    SearchResponse,
+    FileTouchResponse,
+    FileTouchListResponse,
+)
+from chad.util.session_index import get_session_index
+
+router = APIRouter()
+
+
+@router.get("/search", response_model=SearchResponse)
+def search_sessions(
+    q: str = Query(description="Search terms (all must match; trailing * for prefix)"),
+    session_id: str | None = Query(default=None, description="Restrict to one session"),
+    kind: str | None = Query(
+        default=None,
+        description="Comma-separated document kinds: task, user, assistant, tool, milestone",
+    ),
+    limit: int = Query(default=50, ge=1, le=500),
+    offset: int = Query(default=0, ge=0),
+) -> SearchResponse:
+    """Full-text search over task descriptions, messages, tool calls and milestones."""
+    index = get_session_index()
+    if not index.available:
+        raise HTTPException(status_code=503, detail="Search index unavailable")
+
+    kinds = [k.strip() for k in kind.split(",") if k.strip()] if kind else None
+    hits, total = index.search(q, session_id=session_id, kinds=kinds, limit=limit, offset=offset)
+    next_offset = offset + len(hits) if offset + len(hits) < total else None
+    return SearchResponse(
+        hits=[SearchHitResponse(**vars(h)) for h in hits],
+        total=total,
+        limit=limit,
+        offset=offset,
+        next_offset=next_offset,
+    )
+
+
+@router.get("/search/files", response_model=FileTouchListResponse)
+def search_file_touches(
+    path: str = Query(description="File path, absolute or a trailing part such as src/app.py"),
+    limit: int = Query(default=50, ge=1, le=500),
+    offset: int = Query(default=0, ge=0),
+) -> FileTouchListResponse:
+    """List sessions whose tool calls touched a file, most recent first."""
+    index = get_session_index()
+    if not index.available:
+        raise HTTPException(status_code=503, detail="Search index unavailable")
+
+    # Fetch one extra row to know whether another page exists
+    touches = index.sessions_touching(path, limit=limit + 1, offset=offset)
+    next_offset = offset + limit if len(touches) > limit else None
+    return FileTouchListResponse(
+        touches=[FileTouchResponse(**vars(t)) for t in touches[:limit]],
+        limit=limit,
+        offset=offset,
+        next_offset=next_offset,
+    )
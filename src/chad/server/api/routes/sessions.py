@@ -2,14 +2,18 @@
 
 import asyncio
 import base64
+import json
+from datetime import datetime
+from typing import Literal
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Header, HTTPException, Query, Request, Response
 from fastapi.responses import StreamingResponse
 
 from chad.server.api.schemas import (
     SessionCreate,
     SessionResponse,
     SessionListResponse,
+    SessionChangesResponse,
     SessionCancelResponse,
     SessionResumeResponse,
     TaskCreate,
@@ -24,8 +28,16 @@ from chad.server.api.schemas.events import (
 )
 from chad.server.services import Session, get_session_manager, get_task_executor, TaskState
 from chad.server.services.pty_stream import get_pty_stream_service
-from chad.server.services.event_mux import EventMultiplexer, format_sse_event
+from chad.server.services.event_mux import (
+    EventMultiplexer,
+    conversation_items,
+    conversation_task,
+    format_sse_event,
+    parse_stream_types,
+)
 from chad.util.event_log import EventLog
+from chad.util.session_index import get_session_index
+from chad.util.stream_encoding import encode_stream, negotiate_encoding
 
 router = APIRouter()
 
@@ -78,67 +90,11 @@ def _build_conversation(event_log: EventLog, since_seq: int = 0) -> Conversation
         event_types=["user_message", "assistant_message", "milestone"],
     )
 
-    items: list[dict] = []
-    latest_seq = event_log.get_latest_seq()
-
-    for event in convo_events:
-        seq = int(event.get("seq", 0))
-        ts = event.get("ts")
-        etype = event.get("type")
-
-        if etype == "user_message":
-            content = str(event.get("content", ""))
-            items.append({
-                "seq": seq,
-                "ts": ts,
-                "type": "user",
-                "content": content,
-            })
-
-        elif etype == "assistant_message":
-            blocks = event.get("blocks", [])
-            # Derive a plain-text summary for quick display
-            text_parts = []
-            for block in blocks:
-                if block.get("kind") in ("text", "thinking", "error"):
-                    part = str(block.get("content", ""))
-                    if part:
-                        text_parts.append(part)
-            content = "\n".join(text_parts).strip() if text_parts else None
-            items.append({
-                "seq": seq,
-                "ts": ts,
-                "type": "assistant",
-                "content": content,
-                "blocks": blocks,
-            })
-
-        elif etype == "milestone":
-            items.append({
-                "seq": seq,
-                "ts": ts,
-                "type": "milestone",
-                "milestone_type": event.get("milestone_type", ""),
-                "title": event.get("title", ""),
-                "summary": event.get("summary", ""),
-            })
-
-    task_meta = {
-        "seq": start_seq,
-        "task_description": latest_start.get("task_description", ""),
-        "project_path": latest_start.get("project_path", ""),
-        "coding_provider": latest_start.get("coding_provider", ""),
-        "coding_account": latest_start.get("coding_account", ""),
-        "coding_model": latest_start.get("coding_model", None),
-        "verification_account": latest_start.get("verification_account", None),
-        "screenshots": latest_start.get("screenshots", []),
-    }
-
     return ConversationResponseSchema(
         session_id=event_log.session_id,
-        task=task_meta,
-        items=items,
-        latest_seq=latest_seq,
+        task=conversation_task(latest_start),
+        items=conversation_items(convo_events),
+        latest_seq=event_log.get_latest_seq(),
     )
 
 
@@ -157,20 +113,107 @@ async def create_session(request: SessionCreate) -> SessionResponse:
     return _session_to_response(session)
 
 
+def _encode_cursor(sort: str, session: Session) -> str:
+    """Encode a keyset cursor pointing just past a session."""
+    key = session.last_activity if sort == "activity" else session.created_at
+    raw = json.dumps({"sort": sort, "key": key.isoformat(), "id": session.id})
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str, sort: str) -> tuple[datetime, str]:
+    """Decode a keyset cursor into its (sort key, session id) position."""
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        position = (datetime.fromisoformat(data["key"]), str(data["id"]))
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if data.get("sort") != sort:
+        raise HTTPException(status_code=400, detail="Cursor was issued for a different sort order")
+    return position
+
+
 @router.get("", response_model=SessionListResponse)
 async def list_sessions(
+    request: Request,
+    response: Response,
     project_path: str | None = Query(default=None, description="Filter sessions by project path"),
-) -> SessionListResponse:
-    """List all sessions, optionally filtered by project path."""
+    status: str | None = Query(default=None, description="Filter by status: active, completed, or interrupted"),
+    filter: str | None = Query(
+        default=None,
+        description="Full-text filter over task, messages, tool calls and milestones (uses the search index)",
+    ),
+    sort: Literal["created", "activity"] = Query(
+        default="created", description="Newest first by creation time or by last activity",
+    ),
+    cursor: str | None = Query(default=None, description="Keyset cursor from a previous page's next_cursor"),
+    limit: int | None = Query(default=None, ge=1, le=1000, description="Maximum sessions to return"),
+    offset: int = Query(default=0, ge=0, description="Number of sessions to skip"),
+):
+    """List sessions, optionally filtered, sorted and paginated.
+
+    Responses carry an ETag derived from the session list version; send it back
+    in If-None-Match to get 304 Not Modified while nothing has changed.
+    Full-text filtered listings are not cached this way since the search index
+    changes independently of session state.
+    """
     manager = get_session_manager()
-    sessions = manager.list_sessions()
-    if project_path:
-        from pathlib import Path
-        norm = str(Path(project_path).expanduser().resolve())
-        sessions = [s for s in sessions if s.project_path and str(Path(s.project_path).expanduser().resolve()) == norm]
+    version = manager.version
+    etag = None
+    if not filter:
+        etag = f'W/"{manager.epoch}-{version}"'
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+
+    sessions = manager.list_sessions(project_path=project_path, status=status, sort=sort)
+    if filter:
+        # The index query blocks on SQLite, so keep it off the event loop
+        matching = set(await asyncio.to_thread(get_session_index().matching_session_ids, filter))
+        sessions = [s for s in sessions if s.id in matching]
+    total = len(sessions)
+
+    if cursor:
+        position = _decode_cursor(cursor, sort)
+        if sort == "activity":
+            sessions = [s for s in sessions if (s.last_activity, s.id) < position]
+        else:
+            sessions = [s for s in sessions if (s.created_at, s.id) < position]
+
+    end = offset + limit if limit is not None else None
+    page = sessions[offset:end]
+    next_cursor = _encode_cursor(sort, page[-1]) if end is not None and len(sessions) > end and page else None
+
+    if etag:
+        response.headers["ETag"] = etag
     return SessionListResponse(
-        sessions=[_session_to_response(s) for s in sessions],
-        total=len(sessions),
+        sessions=[_session_to_response(s) for s in page],
+        total=total,
+        next_cursor=next_cursor,
+        version=version,
+        epoch=manager.epoch,
+    )
+
+
+@router.get("/changes", response_model=SessionChangesResponse)
+async def list_session_changes(
+    since_version: int = Query(default=0, ge=0, description="Return changes after this list version"),
+    epoch: str | None = Query(default=None, description="Epoch the version was issued in"),
+) -> SessionChangesResponse:
+    """Delta feed: sessions added, changed or deleted since a list version.
+
+    If the version is from another server epoch or older than the retained
+    change log, reset is true and the full session list is returned.
+    """
+    manager = get_session_manager()
+    if epoch is not None and epoch != manager.epoch:
+        changes = manager.changes_since(-1)
+    else:
+        changes = manager.changes_since(since_version)
+    return SessionChangesResponse(
+        version=changes.version,
+        epoch=manager.epoch,
+        reset=changes.reset,
+        sessions=[_session_to_response(s) for s in changes.sessions],
+        deleted=changes.deleted,
     )
 
 
@@ -319,6 +362,7 @@ async def start_task(session_id: str, request: TaskCreate) -> TaskStatusResponse
             verification_model=request.verification_model,
             verification_reasoning=request.verification_reasoning,
             is_followup=request.is_followup,
+            priority=request.priority,
         )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -368,15 +412,39 @@ async def stream_session(
     since_seq: int = Query(default=0, description="Return events after this sequence"),
     include_terminal: bool = Query(default=True, description="Include raw PTY output"),
     include_events: bool = Query(default=True, description="Include structured events from EventLog"),
+    types: str | None = Query(
+        default=None,
+        description="Comma-separated subscription filter, e.g. 'milestone,terminal' (overrides include_*)",
+    ),
+    snapshot: bool = Query(
+        default=False,
+        description="Catch up with one snapshot event (screen, conversation, milestones) instead of a replay",
+    ),
+    last_event_id: str | None = Header(default=None, alias="Last-Event-ID"),
+    accept_encoding: str | None = Header(default=None, alias="Accept-Encoding"),
 ):
     """SSE endpoint for real-time session events.
 
     Uses EventMultiplexer to unify PTY and EventLog events into a single
-    ordered stream with consistent sequence numbers.
+    ordered stream with consistent sequence numbers. Reconnecting clients
+    resume with ``since_seq`` or the standard ``Last-Event-ID`` header
+    (whichever is later).
+
+    ``types`` narrows the stream server-side: ``terminal`` selects PTY
+    output, ``event`` all structured events, and any other name structured
+    events of that EventLog type (e.g. ``milestone``).
+
+    With ``snapshot`` a late joiner gets one ``snapshot`` event holding the
+    current screen, the latest task's conversation and the milestones instead
+    of every logged event since ``since_seq``, then live events.
+
+    Clients that send ``Accept-Encoding: gzip`` (or ``br`` when brotli is
+    installed) get a compressed stream that is flushed after every event.
 
     Event types:
     - terminal: Raw PTY output (base64 encoded)
     - event: Structured event from event log
+    - snapshot: Compact catch-up state (only with ``snapshot``)
     - ping: Keepalive every 15s
     - complete: Task completed
     - error: Error occurred
@@ -386,6 +454,16 @@ async def stream_session(
     if session is None:
         raise HTTPException(status_code=404, detail=f"Session {session_id} not found")
 
+    if last_event_id:
+        try:
+            since_seq = max(since_seq, int(last_event_id))
+        except ValueError:
+            pass
+
+    event_types = None
+    if types is not None:
+        include_terminal, include_events, event_types = parse_stream_types(types)
+
     async def event_generator():
         """Generate SSE events using EventMultiplexer."""
         pty_service = get_pty_stream_service()
@@ -395,7 +473,7 @@ async def stream_session(
 
         # Create multiplexer with task's EventLog
         event_log = task.event_log if task else None
-        mux = EventMultiplexer(session_id, event_log)
+        mux = EventMultiplexer(session_id, event_log, event_types=event_types)
 
         # Stream events through the multiplexer
         async for event in mux.stream_with_since(
@@ -403,18 +481,23 @@ async def stream_session(
             since_seq=since_seq,
             include_terminal=include_terminal,
             include_events=include_events,
+            snapshot=snapshot,
         ):
             yield format_sse_event(event)
 
-    return StreamingResponse(
-        event_generator(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",
-        },
-    )
+    headers = {
+        "Cache-Control": "no-cache",
+        "Connection": "keep-alive",
+        "X-Accel-Buffering": "no",
+        "Vary": "Accept-Encoding",
+    }
+    body = event_generator()
+    encoding = negotiate_encoding(accept_encoding)
+    if encoding:
+        headers["Content-Encoding"] = encoding
+        body = encode_stream(body, encoding)
+
+    return StreamingResponse(body, media_type="text/event-stream", headers=headers)
 
 
 @router.post("/{session_id}/input")
@@ -580,6 +663,41 @@ async def get_session_events(
     }
 
 
+@router.get("/{session_id}/artifact")
+async def get_session_artifact(
+    session_id: str,
+    path: str = Query(description="Artifact path from an event's stdout_ref/stderr_ref/patch_ref"),
+):
+    """Stream a large tool output stored outside the EventLog.
+
+    Blob store artifacts are decompressed while they are sent, so a 10 MB
+    output is never held in memory. Only artifacts referenced by this session
+    (or legacy files under ``artifacts/<session_id>/``) can be read.
+    """
+    manager = get_session_manager()
+    session = manager.get_session(session_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail=f"Session {session_id} not found")
+
+    event_log = EventLog(session_id)
+    parts = path.split("/")
+    if len(parts) == 3 and parts[0] == "blobs" and parts[2].endswith(".gz"):
+        sha256 = parts[2][: -len(".gz")]
+        owned = (event_log.artifact_store.root / parts[1] / f"{sha256}.refs" / session_id).exists()
+    else:
+        owned = len(parts) == 3 and parts[:2] == ["artifacts", session_id]
+    f = event_log.open_artifact({"path": path}) if owned else None
+    if f is None:
+        raise HTTPException(status_code=404, detail=f"Artifact {path} not found")
+
+    def chunks():
+        with f:
+            while chunk := f.read(64 * 1024):
+                yield chunk
+
+    return StreamingResponse(chunks(), media_type="text/plain; charset=utf-8")
+
+
 @router.get("/{session_id}/conversation", response_model=ConversationResponseSchema)
 async def get_conversation(
     session_id: str,
@@ -612,9 +730,9 @@ async def get_session_log(session_id: str) -> dict:
     if session is None:
         raise HTTPException(status_code=404, detail=f"Session {session_id} not found")
 
-    # Get the log path from EventLog
+    # Get the log path from EventLog (compacted sessions live in the cold tier)
     log = EventLog(session_id)
-    log_path = log.log_path
+    log_path = log.log_path if log.log_path.exists() else log.cold_path
 
     return {
         "session_id": session_id,
@@ -0,0 +1,14 @@
+"""Cross-session task endpoints."""
+
+from fastapi import APIRouter
+
+from chad.server.api.schemas import TaskQueueResponse
+from chad.server.services import get_task_executor
+
+router = APIRouter()
+
+
+@router.get("/queue", response_model=TaskQueueResponse)
+async def get_task_queue() -> TaskQueueResponse:
+    """Get admission limits, the tasks holding slots and the queue in admission order."""
+    return TaskQueueResponse(**get_task_executor().scheduler.snapshot())
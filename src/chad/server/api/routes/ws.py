@@ -10,7 +10,7 @@ from pydantic import BaseModel, Field
 
 from chad.server.services import get_session_manager, get_task_executor
 from chad.server.services.pty_stream import get_pty_stream_service
-from chad.server.services.event_mux import EventMultiplexer
+from chad.server.services.event_mux import EventMultiplexer, format_ws_message
 
 router = APIRouter()
 
@@ -44,14 +44,17 @@ class ConnectionManager:
             if not self.active_connections[session_id]:
                 del self.active_connections[session_id]
 
-    async def send_to_session(self, session_id: str, message: dict[str, Any]):
-        """Send a message to all connections for a session."""
+    async def send_to_session(self, session_id: str, message: dict[str, Any] | str):
+        """Send a message (a dict, or already-encoded JSON text) to all connections for a session."""
         if session_id not in self.active_connections:
             return
         dead_connections = []
         for websocket in self.active_connections[session_id]:
             try:
-                await websocket.send_json(message)
+                if isinstance(message, str):
+                    await websocket.send_text(message)
+                else:
+                    await websocket.send_json(message)
             except Exception:
                 dead_connections.append(websocket)
         # Clean up dead connections
@@ -93,6 +96,8 @@ async def websocket_endpoint(
     session_id: str,
     since_seq: int = 0,
     ticket: str | None = None,
+    stream: bool = True,
+    snapshot: bool = False,
 ):
     """WebSocket endpoint for streaming task updates.
 
@@ -101,15 +106,19 @@ async def websocket_endpoint(
     Query params:
     - since_seq: Resume from this sequence number (for reconnection)
     - ticket: Short-lived browser ticket for authenticated connections
+    - stream: Set to false for an input-only channel that receives no events
+    - snapshot: Catch up with one snapshot message instead of replaying the log
 
     Server -> Client message types:
     - terminal: Raw PTY output (base64 encoded)
     - event: Structured event
+    - snapshot: Compact catch-up state (screen, conversation, milestones)
     - complete: Task/PTY exited
     - error: Error occurred
     - pong: Response to ping
 
     Client -> Server message types:
+    - binary frame: Raw bytes sent to the PTY as-is
     - input: Send bytes to PTY (base64 encoded data field)
     - resize: Resize terminal (rows, cols fields)
     - cancel: Cancel/terminate PTY
@@ -130,13 +139,38 @@ async def websocket_endpoint(
         await websocket.close(code=4004, reason=f"Session {session_id} not found")
         return
 
-    await manager.connect(websocket, session_id)
+    if stream:
+        await manager.connect(websocket, session_id)
+    else:
+        await websocket.accept()
     print(f"WebSocket client connected to session {session_id}")
 
     try:
         pty_service = get_pty_stream_service()
         executor = get_task_executor()
 
+        async def send_input(input_data: bytes):
+            """Forward bytes to the session's active PTY.
+
+            Input-only channels read nothing back, so failures are only
+            reported on streaming connections.
+            """
+            error = None
+            pty_session = pty_service.get_session_by_session_id(session_id)
+            if pty_session and pty_session.active:
+                try:
+                    pty_service.send_input(pty_session.stream_id, input_data)
+                except Exception as e:
+                    error = f"Failed to send input: {e}"
+            else:
+                error = "No active PTY session"
+            if error and stream:
+                await websocket.send_json({
+                    "type": "error",
+                    "session_id": session_id,
+                    "data": {"error": error},
+                })
+
         async def stream_events():
             """Stream events to WebSocket using EventMultiplexer.
 
@@ -144,6 +178,7 @@ async def websocket_endpoint(
             session are streamed without requiring a WebSocket reconnect.
             """
             current_since_seq = since_seq
+            use_snapshot = snapshot
 
             while True:
                 task = executor.get_latest_task_for_session(session_id)
@@ -159,13 +194,9 @@ async def websocket_endpoint(
                     since_seq=current_since_seq,
                     include_terminal=True,
                     include_events=True,
+                    snapshot=use_snapshot,
                 ):
-                    message = {
-                        "type": event.type,
-                        "session_id": session_id,
-                        "data": {**event.data, "seq": event.seq},
-                    }
-                    await manager.send_to_session(session_id, message)
+                    await manager.send_to_session(session_id, format_ws_message(event, session_id))
 
                     if event.type in ("complete", "error"):
                         break
@@ -178,15 +209,23 @@ async def websocket_endpoint(
                     if new_task and new_task.id != completed_task_id:
                         # New task started — stream from where we left off
                         current_since_seq = mux._seq
+                        use_snapshot = False
                         break
 
         # Start background task for streaming
-        stream_task = asyncio.create_task(stream_events())
+        stream_task = asyncio.create_task(stream_events()) if stream else None
 
         try:
             # Handle incoming messages
             while True:
-                data = await websocket.receive_text()
+                frame = await websocket.receive()
+                if frame["type"] == "websocket.disconnect":
+                    raise WebSocketDisconnect(frame.get("code", 1000))
+                if frame.get("bytes") is not None:
+                    # Binary frames carry raw keystrokes without JSON/base64 framing
+                    await send_input(frame["bytes"])
+                    continue
+                data = frame.get("text") or ""
                 try:
                     msg = json.loads(data)
                     msg_type = msg.get("type")
@@ -195,24 +234,16 @@ async def websocket_endpoint(
                         await websocket.send_json({"type": "pong", "session_id": session_id})
 
                     elif msg_type == "input":
-                        # Send input to PTY
-                        pty_session = pty_service.get_session_by_session_id(session_id)
-                        if pty_session and pty_session.active:
-                            try:
-                                input_data = base64.b64decode(msg.get("data", ""))
-                                pty_service.send_input(pty_session.stream_id, input_data)
-                            except Exception as e:
-                                await websocket.send_json({
-                                    "type": "error",
-                                    "session_id": session_id,
-                                    "data": {"error": f"Failed to send input: {e}"},
-                                })
-                        else:
+                        try:
+                            input_data = base64.b64decode(msg.get("data", ""))
+                        except Exception as e:
                             await websocket.send_json({
                                 "type": "error",
                                 "session_id": session_id,
-                                "data": {"error": "No active PTY session"},
+                                "data": {"error": f"Failed to send input: {e}"},
                             })
+                        else:
+                            await send_input(input_data)
 
                     elif msg_type == "resize":
                         # Resize PTY terminal
@@ -255,11 +286,12 @@ async def websocket_endpoint(
                     })
 
         finally:
-            stream_task.cancel()
-            try:
-                await stream_task
-            except asyncio.CancelledError:
-                pass
+            if stream_task is not None:
+                stream_task.cancel()
+                try:
+                    await stream_task
+                except asyncio.CancelledError:
+                    pass
 
     except WebSocketDisconnect:
         pass
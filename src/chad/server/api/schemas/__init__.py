@@ -4,6 +4,7 @@ from .session import (
     SessionCreate,
     SessionResponse,
     SessionListResponse,
+    SessionChangesResponse,
     SessionCancelResponse,
     SessionResumeResponse,
 )
@@ -13,6 +14,9 @@ from .task import (
     TaskFollowupRequest,
     TaskFollowupResponse,
     TaskStatus,
+    RunningTaskEntry,
+    QueuedTaskEntry,
+    TaskQueueResponse,
 )
 from .provider import (
     ProviderInfo,
@@ -23,6 +27,7 @@ from .provider import (
     AccountResponse,
     AccountListResponse,
     AccountUsage,
+    AccountUsageListResponse,
     AccountModelUpdate,
     AccountReasoningUpdate,
     AccountRoleUpdate,
@@ -48,10 +53,17 @@ from .worktree import (
 from .config import (
     VerificationSettings,
     CleanupSettings,
+    TaskSchedulingSettings,
     UserPreferences,
     SlackSettingsResponse,
     SlackSettingsUpdate,
 )
+from .search import (
+    SearchHitResponse,
+    SearchResponse,
+    FileTouchResponse,
+    FileTouchListResponse,
+)
 from .streaming import (
     StreamMessage,
     StreamMessageType,
@@ -74,6 +86,7 @@ __all__ = [
     "SessionCreate",
     "SessionResponse",
     "SessionListResponse",
+    "SessionChangesResponse",
     "SessionCancelResponse",
     "SessionResumeResponse",
     # Task
@@ -82,6 +95,9 @@ __all__ = [
     "TaskFollowupRequest",
     "TaskFollowupResponse",
     "TaskStatus",
+    "RunningTaskEntry",
+    "QueuedTaskEntry",
+    "TaskQueueResponse",
     # Provider
     "ProviderInfo",
     "ProviderListResponse",
@@ -91,6 +107,7 @@ __all__ = [
     "AccountResponse",
     "AccountListResponse",
     "AccountUsage",
+    "AccountUsageListResponse",
     "AccountModelUpdate",
     "AccountReasoningUpdate",
     "AccountRoleUpdate",
@@ -114,9 +131,15 @@ __all__ = [
     # Config
     "VerificationSettings",
     "CleanupSettings",
+    "TaskSchedulingSettings",
     "UserPreferences",
     "SlackSettingsResponse",
     "SlackSettingsUpdate",
+    # Search
+    "SearchHitResponse",
+    "SearchResponse",
+    "FileTouchResponse",
+    "FileTouchListResponse",
     # Streaming
     "StreamMessage",
     "StreamMessageType",
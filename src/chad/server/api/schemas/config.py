@@ -14,6 +14,29 @@ class CleanupSettings(BaseModel):
 
     cleanup_days: int = Field(default=7, ge=1, description="Days to keep old sessions/logs")
     auto_cleanup: bool = Field(default=True, description="Whether to auto-cleanup on startup")
+    log_quota_mb: int | None = Field(
+        default=None, ge=0, description="Disk budget for session logs, artifacts and uploads in MB (0 = unlimited)"
+    )
+    log_retention_days: int | None = Field(
+        default=None, ge=0, description="Prune session logs idle longer than this many days (0 = never)"
+    )
+
+
+class TaskSchedulingSettings(BaseModel):
+    """Limits for the task admission scheduler."""
+
+    max_concurrent_tasks: int | None = Field(
+        default=None, ge=1, le=64, description="Tasks admitted at once across all sessions"
+    )
+    max_tasks_per_account: int | None = Field(
+        default=None, ge=0, description="Concurrent tasks per coding account (0 = unlimited)"
+    )
+    max_tasks_per_provider: int | None = Field(
+        default=None, ge=0, description="Concurrent tasks per provider type (0 = unlimited)"
+    )
+    balance_accounts: bool | None = Field(
+        default=None, description="Run tasks on the least-used free account of their provider"
+    )
 
 
 class UserPreferences(BaseModel):
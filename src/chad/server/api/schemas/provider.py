@@ -68,6 +68,16 @@ class AccountUsage(BaseModel):
     weekly_reset_eta: str | None = Field(
         default=None, description="Human-readable time until weekly reset"
     )
+    error: str | None = Field(
+        default=None, description="Why usage could not be fetched (e.g. probe timed out), None on success"
+    )
+
+
+class AccountUsageListResponse(BaseModel):
+    """Response model for usage across all accounts."""
+
+    accounts: list[AccountUsage] = Field(default_factory=list)
+    total: int = Field(description="Total number of accounts")
 
 
 class AccountModelUpdate(BaseModel):
@@ -0,0 +1,42 @@
+"""Cross-session search Pydantic schemas."""
+
+from pydantic import BaseModel, Field
+
+
+class SearchHitResponse(BaseModel):
+    """A single full-text match within a session log."""
+
+    session_id: str = Field(description="Session containing the match")
+    seq: int = Field(description="Sequence number of the matching event")
+    ts: str | None = Field(default=None, description="Timestamp of the matching event")
+    kind: str = Field(description="Matched document kind: task, user, assistant, tool, or milestone")
+    snippet: str = Field(description="Excerpt with matched terms wrapped in [brackets]")
+
+
+class SearchResponse(BaseModel):
+    """Paginated full-text search results."""
+
+    hits: list[SearchHitResponse] = Field(default_factory=list)
+    total: int = Field(description="Total number of matches")
+    limit: int
+    offset: int
+    next_offset: int | None = Field(default=None, description="Offset of the next page, if any")
+
+
+class FileTouchResponse(BaseModel):
+    """The most recent touch of a file by one session."""
+
+    session_id: str
+    path: str = Field(description="Path as logged by the tool call")
+    tool: str | None = None
+    seq: int
+    ts: str | None = None
+
+
+class FileTouchListResponse(BaseModel):
+    """Sessions that touched a file, most recent first."""
+
+    touches: list[FileTouchResponse] = Field(default_factory=list)
+    limit: int
+    offset: int
+    next_offset: int | None = None
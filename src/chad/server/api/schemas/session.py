@@ -38,6 +38,22 @@ class SessionListResponse(BaseModel):
 
     sessions: list[SessionResponse] = Field(default_factory=list)
     total: int = Field(description="Total number of sessions")
+    next_cursor: str | None = Field(default=None, description="Cursor for the next page, if any")
+    version: int = Field(default=0, description="Session list version (for GET /sessions/changes)")
+    epoch: str = Field(default="", description="Server instance ID; versions are only comparable within an epoch")
+
+
+class SessionChangesResponse(BaseModel):
+    """Response model for the session list delta feed."""
+
+    version: int = Field(description="Current session list version")
+    epoch: str = Field(description="Server instance ID")
+    reset: bool = Field(
+        default=False,
+        description="True if the requested version is unknown or too old; sessions is then the full list",
+    )
+    sessions: list[SessionResponse] = Field(default_factory=list, description="Sessions added or changed")
+    deleted: list[str] = Field(default_factory=list, description="IDs of deleted sessions")
 
 
 class SessionCancelResponse(BaseModel):
@@ -29,6 +29,8 @@ class TaskCreate(BaseModel):
     override_prompt: str | None = Field(default=None, description="Override for the coding prompt")
     # Follow-up mode: reuse existing worktree instead of creating a new one
     is_followup: bool = Field(default=False, description="Whether this is a follow-up task reusing an existing worktree")
+    # Admission priority when all task slots are busy
+    priority: int = Field(default=0, ge=-100, le=100, description="Queue priority (higher is admitted first)")
     # Legacy fields for backwards compatibility
     override_exploration_prompt: str | None = Field(default=None, description="Legacy: alias for override_prompt")
     override_implementation_prompt: str | None = Field(default=None, description="Legacy: ignored")
@@ -46,6 +48,36 @@ class TaskStatusResponse(BaseModel):
     completed_at: datetime | None = Field(default=None, description="When the task completed")
 
 
+class RunningTaskEntry(BaseModel):
+    """A task holding an admission slot."""
+
+    task_id: str
+    account: str = Field(description="Account the task was admitted on")
+    provider: str
+
+
+class QueuedTaskEntry(BaseModel):
+    """A task waiting for an admission slot."""
+
+    task_id: str
+    session_id: str
+    account: str = Field(description="Requested coding account")
+    provider: str
+    priority: int
+    position: int = Field(description="1-based position in admission order")
+    enqueued_at: datetime
+
+
+class TaskQueueResponse(BaseModel):
+    """Response model for the task admission queue."""
+
+    max_concurrent_tasks: int = Field(description="Tasks admitted at once across all sessions")
+    max_tasks_per_account: int = Field(description="Concurrent tasks per account (0 = unlimited)")
+    max_tasks_per_provider: int = Field(description="Concurrent tasks per provider (0 = unlimited)")
+    running: list[RunningTaskEntry]
+    queued: list[QueuedTaskEntry]
+
+
 class TaskFollowupRequest(BaseModel):
     """Request model for sending a follow-up message."""
 
@@ -11,6 +11,7 @@ from chad.util.providers import (
     MockProvider,
     ModelConfig,
     create_provider,
+    CodexOutputParser,
     parse_codex_output,
 )
 
@@ -90,6 +91,7 @@ __all__ = [
     "MockProvider",
     "ModelConfig",
     "create_provider",
+    "CodexOutputParser",
     "parse_codex_output",
     # Git worktree
     "GitWorktreeManager",
@@ -13,7 +13,9 @@ from starlette.middleware.base import BaseHTTPMiddleware
 
 from . import __version__
 from .state import init_start_time
-from .api.routes import health, sessions, providers, worktree, config, ws, slack, tunnel, uploads, preview_tunnel
+from .api.routes import (
+    health, sessions, providers, worktree, config, ws, slack, tunnel, uploads, preview_tunnel, search, metrics, tasks,
+)
 
 
 class SecurityHeadersMiddleware(BaseHTTPMiddleware):
@@ -117,8 +119,26 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     if restored:
         print(f"Restored {restored} previous session(s)")
 
+    # Compact finished session logs into the cold tier in the background
+    from .services.log_compactor import get_log_compactor
+    compactor = get_log_compactor()
+    compactor.start()
+
+    # Prune old session bundles and enforce the log disk budget
+    from .services.retention import get_retention_manager
+    retention = get_retention_manager()
+    retention.start()
+
+    # Catch the search index up with logs written while the server was down
+    import threading
+    from chad.util.session_index import get_session_index
+    threading.Thread(target=get_session_index().backfill, name="chad-index-backfill", daemon=True).start()
+
     yield
 
+    compactor.stop()
+    retention.stop()
+
     # Shutdown: cleanup resources
     # TODO: Cleanup sessions, stop providers, etc.
 
@@ -173,6 +193,7 @@ def create_app(
     # Include routers
     app.include_router(health.router, tags=["Health"])
     app.include_router(sessions.router, prefix="/api/v1/sessions", tags=["Sessions"])
+    app.include_router(tasks.router, prefix="/api/v1/tasks", tags=["Tasks"])
     app.include_router(providers.router, prefix="/api/v1", tags=["Providers"])
     app.include_router(worktree.router, prefix="/api/v1/sessions", tags=["Worktree"])
     app.include_router(config.router, prefix="/api/v1/config", tags=["Config"])
@@ -181,6 +202,8 @@ def create_app(
     app.include_router(tunnel.router, prefix="/api/v1", tags=["Tunnel"])
     app.include_router(uploads.router, prefix="/api/v1/uploads", tags=["Uploads"])
     app.include_router(preview_tunnel.router, prefix="/api/v1", tags=["Preview Tunnel"])
+    app.include_router(search.router, prefix="/api/v1", tags=["Search"])
+    app.include_router(metrics.router, prefix="/api/v1", tags=["Metrics"])
 
     # Serve the single-file React UI if available (packaged or repo build).
     ui_index, ui_assets = _resolve_ui_paths()
@@ -7,13 +7,13 @@ No PTY, no worktree, no continuation logic — just a one-shot query.
 import json
 import logging
 import os
-import re
 import subprocess
 import threading
 from datetime import datetime
 from pathlib import Path
 
 from chad.util.installer import AIToolInstaller
+from chad.util.json_scan import iter_json_objects
 
 logger = logging.getLogger(__name__)
 
@@ -119,27 +119,22 @@ def _extract_json(text: str) -> dict | None:
     Uses the LAST match to skip prompt echoes from providers like Codex
     that repeat the input before responding.
     """
-    # Try code blocks first (last one wins)
-    matches = list(re.finditer(r'```(?:json)?\s*(\{.+?\})\s*```', text, re.DOTALL))
-    for match in reversed(matches):
+    # Last object wins; fenced and bare JSON are both found by the scanner.
+    # Prefer objects carrying our expected keys over any other JSON.
+    fallback = None
+    for candidate in iter_json_objects(text):
         try:
-            return json.loads(match.group(1))
+            data = json.loads(candidate)
         except json.JSONDecodeError:
             continue
+        if not isinstance(data, dict):
+            continue
+        if "lint_command" in data or "test_command" in data:
+            return data
+        if fallback is None:
+            fallback = data
 
-    # Try to find a JSON object containing our expected keys (last match wins)
-    for pattern in [
-        r'\{[^{}]*"lint_command"[^{}]*\}',
-        r'\{[^{}]*"test_command"[^{}]*\}',
-    ]:
-        all_matches = list(re.finditer(pattern, text, re.DOTALL))
-        for match in reversed(all_matches):
-            try:
-                return json.loads(match.group(0))
-            except json.JSONDecodeError:
-                continue
-
-    return None
+    return fallback
 
 
 def _write_debug_log(job_id: str, output: str, project_path: Path) -> None:
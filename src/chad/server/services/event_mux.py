@@ -8,22 +8,157 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
-from dataclasses import dataclass
+import json
+import time
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, AsyncIterator
 
+from chad.util.metrics import counter, histogram
+
 if TYPE_CHECKING:
     from chad.util.event_log import EventLog
     from chad.server.services.pty_stream import PTYStreamService
 
+MUX_DRAIN_SECONDS = histogram("chad_mux_drain_seconds", "Time to drain new EventLog events into a stream")
+MUX_EVENTS_DRAINED = counter("chad_mux_events_drained_total", "EventLog events read by stream multiplexers")
+
+# EventLog types always delivered, since they end the stream
+_ALWAYS_DELIVERED = frozenset({"session_ended"})
+
+
+def parse_stream_types(types: str | None) -> tuple[bool, bool, frozenset[str] | None]:
+    """Parse a stream subscription filter such as ``"milestone,terminal"``.
+
+    ``terminal`` selects raw PTY output, ``event`` selects every structured
+    event, and any other name selects EventLog events of that type.
+
+    Returns:
+        (include_terminal, include_events, event_types) where event_types is
+        None when all structured events are wanted
+    """
+    if types is None:
+        return True, True, None
+    names = {name.strip() for name in types.split(",") if name.strip()}
+    include_terminal = "terminal" in names
+    names.discard("terminal")
+    if "event" in names:
+        return include_terminal, True, None
+    return include_terminal, bool(names), frozenset(names)
+
+
+def conversation_items(events: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Timeline items (user, assistant, milestone) for GET /conversation and snapshots."""
+    items: list[dict[str, Any]] = []
+    for event in events:
+        seq = int(event.get("seq", 0))
+        ts = event.get("ts")
+        etype = event.get("type")
+
+        if etype == "user_message":
+            items.append({
+                "seq": seq,
+                "ts": ts,
+                "type": "user",
+                "content": str(event.get("content", "")),
+            })
+
+        elif etype == "assistant_message":
+            blocks = event.get("blocks", [])
+            # Derive a plain-text summary for quick display
+            text_parts = []
+            for block in blocks:
+                if block.get("kind") in ("text", "thinking", "error"):
+                    part = str(block.get("content", ""))
+                    if part:
+                        text_parts.append(part)
+            content = "\n".join(text_parts).strip() if text_parts else None
+            items.append({
+                "seq": seq,
+                "ts": ts,
+                "type": "assistant",
+                "content": content,
+                "blocks": blocks,
+            })
+
+        elif etype == "milestone":
+            items.append({
+                "seq": seq,
+                "ts": ts,
+                "type": "milestone",
+                "milestone_type": event.get("milestone_type", ""),
+                "title": event.get("title", ""),
+                "summary": event.get("summary", ""),
+            })
+    return items
+
+
+def conversation_task(start: dict[str, Any]) -> dict[str, Any]:
+    """Task metadata from a session_started event."""
+    return {
+        "seq": int(start.get("seq", 0)),
+        "task_description": start.get("task_description", ""),
+        "project_path": start.get("project_path", ""),
+        "coding_provider": start.get("coding_provider", ""),
+        "coding_account": start.get("coding_account", ""),
+        "coding_model": start.get("coding_model", None),
+        "verification_account": start.get("verification_account", None),
+        "screenshots": start.get("screenshots", []),
+    }
+
+
+def build_snapshot(events: list[dict[str, Any]]) -> dict[str, Any]:
+    """Collapse catch-up EventLog events into the state a late joiner needs.
+
+    terminal_output events are full screens rendered by the task's
+    TerminalEmulator, so only the latest one matters. The conversation and
+    screen cover the latest task in ``events``; milestones cover all of them.
+    """
+    start_index = -1
+    for index, event in enumerate(events):
+        if event.get("type") == "session_started":
+            start_index = index
+    task_events = events[start_index + 1:]
+
+    screen = ""
+    ended = False
+    for event in task_events:
+        event_type = event.get("type")
+        if event_type == "terminal_output":
+            screen = event.get("data", "")
+        elif event_type == "session_ended":
+            ended = True
+
+    milestones = [
+        {
+            "seq": event.get("seq", 0),
+            "milestone_type": event.get("milestone_type", ""),
+            "title": event.get("title", ""),
+            "summary": event.get("summary", ""),
+        }
+        for event in events
+        if event.get("type") == "milestone"
+    ]
+
+    return {
+        "screen": screen,
+        "task": conversation_task(events[start_index]) if start_index >= 0 else None,
+        "conversation": conversation_items(task_events),
+        "milestones": milestones,
+        "ended": ended,
+        "latest_seq": max((int(event.get("seq", 0)) for event in events), default=0),
+    }
+
 
 @dataclass
 class MuxEvent:
     """A unified event from the multiplexer."""
 
-    type: str  # "terminal", "event", "complete", "error", "ping"
+    type: str  # "terminal", "event", "snapshot", "complete", "error", "ping"
     data: dict[str, Any]
     seq: int
+    # JSON text ``data`` was logged as; set only when it already carries ``seq``
+    raw: str | None = field(default=None, repr=False, compare=False)
 
 
 class EventMultiplexer:
@@ -40,6 +175,7 @@ class EventMultiplexer:
         session_id: str,
         event_log: "EventLog | None" = None,
         ping_interval: float = 15.0,
+        event_types: frozenset[str] | None = None,
     ):
         """Initialize the multiplexer.
 
@@ -47,10 +183,13 @@ class EventMultiplexer:
             session_id: The session to stream events for
             event_log: Optional EventLog for structured events
             ping_interval: Seconds between keepalive pings
+            event_types: Only yield structured events of these types
+                (None = all); session_ended is always yielded
         """
         self.session_id = session_id
         self.event_log = event_log
         self.ping_interval = ping_interval
+        self.event_types = event_types
         self._seq = 0
         self._event_log_seq = 0
         self._last_ping = datetime.now(timezone.utc)
@@ -70,6 +209,13 @@ class EventMultiplexer:
             self._seq = latest
         return self._seq
 
+    def _wants(self, log_event: dict[str, Any]) -> bool:
+        """Whether a structured event passes the subscription filter."""
+        if self.event_types is None:
+            return True
+        event_type = log_event.get("type")
+        return event_type in self.event_types or event_type in _ALWAYS_DELIVERED
+
     def _drain_event_log(self, skip_terminal: bool = True) -> list[MuxEvent]:
         """Get all new EventLog events since last check.
 
@@ -82,10 +228,12 @@ class EventMultiplexer:
         if not self.event_log:
             return []
 
+        started = time.perf_counter()
         events = []
-        new_log_events = self.event_log.get_events(since_seq=self._event_log_seq)
+        new_log_events = self.event_log.get_raw_events(since_seq=self._event_log_seq)
+        MUX_EVENTS_DRAINED.inc(len(new_log_events))
 
-        for log_event in new_log_events:
+        for log_event, raw in new_log_events:
             log_seq = log_event.get("seq", 0)
             self._event_log_seq = max(self._event_log_seq, log_seq)
 
@@ -111,14 +259,18 @@ class EventMultiplexer:
                 continue
 
             self._seq = max(self._seq, log_seq)
+            if not self._wants(log_event):
+                continue
             events.append(
                 MuxEvent(
                     type="event",
                     data=log_event,
                     seq=log_seq or self._next_seq(),
+                    raw=raw if log_seq else None,
                 )
             )
 
+        MUX_DRAIN_SECONDS.observe(time.perf_counter() - started)
         return events
 
     def _should_ping(self) -> bool:
@@ -130,11 +282,15 @@ class EventMultiplexer:
         return False
 
     def _create_ping(self) -> MuxEvent:
-        """Create a ping event."""
+        """Create a ping event.
+
+        Pings reuse the current seq rather than taking a new one, so a client
+        resuming from the last id it saw never skips EventLog events.
+        """
         return MuxEvent(
             type="ping",
             data={"ts": datetime.now(timezone.utc).isoformat()},
-            seq=self._next_seq(),
+            seq=self._seq,
         )
 
     async def stream_events(
@@ -193,7 +349,7 @@ class EventMultiplexer:
             # Primary path: Stream PTY events with interspersed EventLog events
             # Use async iteration with ping support to keep SSE connection alive
             try:
-                subscriber = pty_service.subscribe(pty_session.stream_id)
+                subscriber = pty_service.subscribe(pty_session.stream_id, coalesce=True)
                 pty_iter = subscriber.__aiter__()
                 pty_next_task: asyncio.Task | None = None
                 try:
@@ -356,7 +512,7 @@ class EventMultiplexer:
                     pty_session = new_pty_session
                     old_stream_id = pty_session.stream_id
                     try:
-                        subscriber = pty_service.subscribe(pty_session.stream_id)
+                        subscriber = pty_service.subscribe(pty_session.stream_id, coalesce=True)
                         pty_iter = subscriber.__aiter__()
                         continuation_next_task: asyncio.Task | None = None
                         try:
@@ -507,6 +663,7 @@ class EventMultiplexer:
         since_seq: int = 0,
         include_terminal: bool = True,
         include_events: bool = True,
+        snapshot: bool = False,
     ) -> AsyncIterator[MuxEvent]:
         """Stream events, optionally resuming from a sequence number.
 
@@ -518,14 +675,37 @@ class EventMultiplexer:
             since_seq: Only return events after this sequence
             include_terminal: Include raw PTY output events
             include_events: Include structured EventLog events
+            snapshot: Replace the catch-up replay with one ``snapshot`` event
+                (see :func:`build_snapshot`) before going live
 
         Yields:
             MuxEvent objects after since_seq
         """
-        # Catch up on missed EventLog events (structured + terminal when requested)
-        if self.event_log and (include_events or include_terminal):
+        if snapshot and self.event_log and (include_events or include_terminal):
             catchup_events = self.event_log.get_events(since_seq=since_seq)
-            for log_event in catchup_events:
+            if catchup_events:
+                state = build_snapshot(catchup_events)
+                if not include_terminal:
+                    state["screen"] = ""
+                if not include_events:
+                    state["conversation"] = []
+                    state["milestones"] = []
+                latest_seq = state["latest_seq"]
+                self._event_log_seq = max(self._event_log_seq, latest_seq)
+                self._seq = max(self._seq, latest_seq)
+                yield MuxEvent(type="snapshot", data=state, seq=latest_seq)
+                if state["ended"]:
+                    yield MuxEvent(
+                        type="complete",
+                        data={"exit_code": None},
+                        seq=self._next_seq(),
+                    )
+                    return
+
+        # Catch up on missed EventLog events (structured + terminal when requested)
+        elif self.event_log and (include_events or include_terminal):
+            catchup_events = self.event_log.get_raw_events(since_seq=since_seq)
+            for log_event, raw in catchup_events:
                 log_seq = log_event.get("seq", 0)
                 if log_seq <= since_seq:
                     continue
@@ -547,11 +727,12 @@ class EventMultiplexer:
                         )
                     continue
 
-                if include_events:
+                if include_events and self._wants(log_event):
                     yield MuxEvent(
                         type="event",
                         data=log_event,
                         seq=log_seq,
+                        raw=raw,
                     )
                     # If session already ended during catchup, emit complete and stop
                     if log_event.get("type") == "session_ended":
@@ -574,13 +755,32 @@ class EventMultiplexer:
 def format_sse_event(event: MuxEvent) -> str:
     """Format a MuxEvent as an SSE event string.
 
+    EventLog events are sent as the JSON they were logged as, without
+    re-serializing.
+
     Args:
         event: The event to format
 
     Returns:
         SSE-formatted string ready to yield
     """
-    import json
+    data = event.raw
+    if data is None:
+        data = json.dumps({**event.data, "seq": event.seq})
+    return f"event: {event.type}\ndata: {data}\nid: {event.seq}\n\n"
+
+
+def format_ws_message(event: MuxEvent, session_id: str) -> str:
+    """Format a MuxEvent as the JSON text of a WebSocket message.
+
+    Args:
+        event: The event to format
+        session_id: Session the socket belongs to
 
-    data = {**event.data, "seq": event.seq}
-    return f"event: {event.type}\ndata: {json.dumps(data)}\nid: {event.seq}\n\n"
+    Returns:
+        JSON text ready for ``send_text``
+    """
+    raw = event.raw
+    if raw is None:
+        return json.dumps({"type": event.type, "session_id": session_id, "data": {**event.data, "seq": event.seq}})
+    return f'{{"type": {json.dumps(event.type)}, "session_id": {json.dumps(session_id)}, "data": {raw}}}'
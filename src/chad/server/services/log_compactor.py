@@ -0,0 +1,127 @@
+"""Background compaction of finished session logs into the cold storage tier."""
+
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Iterable
+
+from chad.util.event_log import LOG_SUFFIX, EventLog, compact_session_log
+
+logger = logging.getLogger(__name__)
+
+# How often the compactor scans the log directory
+COMPACT_INTERVAL_SECONDS = 15 * 60
+
+# Logs modified more recently than this are left hot (a follow-up may still come)
+COMPACT_MIN_IDLE_SECONDS = 30 * 60
+
+
+def compact_finished_logs(
+    log_dir: Path | None = None,
+    min_idle_seconds: float = COMPACT_MIN_IDLE_SECONDS,
+    skip_sessions: Iterable[str] = (),
+) -> list[str]:
+    """Compact every idle, finished session log in the log directory.
+
+    Args:
+        log_dir: Override log directory (defaults to EventLog.get_log_dir())
+        min_idle_seconds: Only compact logs untouched for at least this long
+        skip_sessions: Session IDs to leave hot (e.g. sessions with running tasks)
+
+    Returns:
+        List of compacted session IDs
+    """
+    log_dir = EventLog.get_log_dir(log_dir)
+    if not log_dir.exists():
+        return []
+
+    skip = set(skip_sessions)
+    cutoff = time.time() - min_idle_seconds
+    compacted = []
+
+    try:
+        entries = list(os.scandir(log_dir))
+    except OSError:
+        return []
+
+    for entry in entries:
+        try:
+            if not entry.name.endswith(LOG_SUFFIX):
+                continue
+            session_id = entry.name[: -len(LOG_SUFFIX)]
+            if session_id in skip or entry.stat().st_mtime > cutoff:
+                continue
+            if compact_session_log(Path(entry.path)):
+                compacted.append(session_id)
+        except Exception:
+            logger.warning("Failed to compact session log %s", entry.name, exc_info=True)
+
+    return compacted
+
+
+class LogCompactor:
+    """Periodically compacts finished session logs on a daemon thread."""
+
+    def __init__(
+        self,
+        interval: float = COMPACT_INTERVAL_SECONDS,
+        active_sessions: Callable[[], Iterable[str]] | None = None,
+    ) -> None:
+        self.interval = interval
+        self._active_sessions = active_sessions or (lambda: ())
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start the compaction thread (no-op if already running)."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="chad-log-compactor", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Signal the compaction thread to exit and wait briefly for it."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def run_once(self) -> list[str]:
+        """Run a single compaction pass."""
+        return compact_finished_logs(skip_sessions=self._active_sessions())
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                compacted = self.run_once()
+                if compacted:
+                    logger.info("Compacted %d finished session log(s)", len(compacted))
+            except Exception:
+                logger.warning("Log compaction pass failed", exc_info=True)
+
+
+# Global compactor instance
+_log_compactor: LogCompactor | None = None
+
+
+def get_log_compactor() -> LogCompactor:
+    """Get the global LogCompactor instance."""
+    global _log_compactor
+    if _log_compactor is None:
+        from .session_manager import get_session_manager
+
+        _log_compactor = LogCompactor(
+            active_sessions=lambda: [s.id for s in get_session_manager().get_active_sessions()],
+        )
+    return _log_compactor
+
+
+def reset_log_compactor() -> None:
+    """Stop and reset the global log compactor (for testing)."""
+    global _log_compactor
+    if _log_compactor is not None:
+        _log_compactor.stop()
+    _log_compactor = None
@@ -0,0 +1,117 @@
+"""Adaptive coalescing of PTY output for stream subscribers.
+
+The PTY reader dispatches one event per ``os.read`` (at most 4 KB), so a
+burst of build or test output turns into thousands of tiny SSE/WS frames,
+each with its own JSON encode and EventLog drain. ``OutputCoalescer`` merges
+consecutive output events waiting in a subscriber's queue into one event:
+
+- interactive output (a lone chunk) is passed through with no added delay;
+- once a batch has merged several chunks the stream is treated as a burst,
+  and the next batch waits up to ``COALESCE_WINDOW_SECONDS`` for more;
+- the byte budget grows from ``COALESCE_MIN_BYTES`` to ``COALESCE_MAX_BYTES``
+  when the subscriber lags ``LAG_EVENTS`` or more events behind.
+
+Exit and error events are never merged and keep their position.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import dataclasses
+import queue
+import time
+from typing import Any
+
+from chad.util.metrics import counter
+
+# Longest a burst batch waits for more output before it is sent
+COALESCE_WINDOW_SECONDS = 0.015
+COALESCE_POLL_SECONDS = 0.005
+
+# Byte budget per merged event, and the larger budget for lagging subscribers
+COALESCE_MIN_BYTES = 16 * 1024
+COALESCE_MAX_BYTES = 256 * 1024
+LAG_EVENTS = 32
+
+PTY_CHUNKS_COALESCED = counter(
+    "chad_pty_chunks_coalesced_total", "PTY output chunks merged into a preceding stream event"
+)
+
+
+def _payload_len(event: Any) -> int:
+    if event.text:
+        return len(event.data)
+    return len(event.data) * 3 // 4
+
+
+def merge_output_events(events: list[Any]) -> Any:
+    """Merge consecutive output events of the same encoding into one."""
+    first = events[0]
+    if len(events) == 1:
+        return first
+    if first.text:
+        data = "".join(event.data for event in events)
+    else:
+        data = base64.b64encode(b"".join(base64.b64decode(event.data) for event in events)).decode("ascii")
+    return dataclasses.replace(first, data=data, has_ansi=any(event.has_ansi for event in events))
+
+
+def coalesce_events(events: list[Any], max_bytes: int = COALESCE_MAX_BYTES) -> list[Any]:
+    """Merge runs of output events in an already-buffered list (late-joiner replay)."""
+    merged: list[Any] = []
+    run: list[Any] = []
+    size = 0
+    for event in events:
+        if run and (event.type != "output" or event.text != run[0].text or size >= max_bytes):
+            merged.append(merge_output_events(run))
+            run, size = [], 0
+        if event.type == "output":
+            run.append(event)
+            size += _payload_len(event)
+        else:
+            merged.append(event)
+    if run:
+        merged.append(merge_output_events(run))
+    return merged
+
+
+class OutputCoalescer:
+    """Reads a subscriber queue, merging runs of output events."""
+
+    def __init__(self, q: queue.Queue):
+        self._q = q
+        self._held: Any = None
+        self._burst = False
+
+    async def get(self) -> Any:
+        """Next (possibly merged) event; raises ``queue.Empty`` when none is waiting."""
+        if self._held is not None:
+            event, self._held = self._held, None
+        else:
+            event = self._q.get_nowait()
+        if event.type != "output":
+            return event
+
+        chunks = [event]
+        size = _payload_len(event)
+        budget = COALESCE_MAX_BYTES if self._q.qsize() >= LAG_EVENTS else COALESCE_MIN_BYTES
+        deadline = time.monotonic() + COALESCE_WINDOW_SECONDS if self._burst else None
+        while size < budget:
+            try:
+                following = self._q.get_nowait()
+            except queue.Empty:
+                if deadline is None or time.monotonic() >= deadline:
+                    break
+                await asyncio.sleep(COALESCE_POLL_SECONDS)
+                continue
+            if following.type != "output" or following.text != event.text:
+                self._held = following
+                break
+            chunks.append(following)
+            size += _payload_len(following)
+
+        self._burst = len(chunks) > 1
+        if self._burst:
+            PTY_CHUNKS_COALESCED.inc(len(chunks) - 1)
+        return merge_output_events(chunks)
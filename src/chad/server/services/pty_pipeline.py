@@ -0,0 +1,74 @@
+"""Hand-off between a PTY reader thread and its dispatch worker.
+
+The reader thread only reads the PTY (and answers cursor position requests)
+and puts the raw bytes into a bounded ring. A per-session dispatch worker
+takes them out in order, one event per read, and runs the expensive part:
+base64 encoding, the logging callback (stream-json parsing, prompt-echo
+filtering, event emission) and subscriber fan-out. A slow
+callback therefore delays dispatch, not reading, so the agent never stalls
+on a full PTY buffer. The reader only waits when the ring itself is full,
+which bounds memory if the worker falls far behind.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+from typing import Callable
+
+from chad.util.metrics import counter
+
+logger = logging.getLogger(__name__)
+
+# Raw reads buffered between the reader and the dispatch worker
+PIPELINE_MAX_CHUNKS = 1024
+
+PTY_READER_STALLS = counter(
+    "chad_pty_reader_stalls_total", "Times a PTY reader waited on a full dispatch ring", ("session_id",)
+)
+
+_CLOSE = object()
+
+
+class ReadPipeline:
+    """Bounded ring of raw PTY reads drained by a dispatch worker thread."""
+
+    def __init__(
+        self,
+        session_id: str,
+        dispatch: Callable[[bytes], None],
+        maxsize: int = PIPELINE_MAX_CHUNKS,
+    ):
+        self.session_id = session_id
+        self._dispatch = dispatch
+        self._ring: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._worker = threading.Thread(
+            target=self._run,
+            name=f"pty-dispatch-{session_id}",
+            daemon=True,
+        )
+        self._worker.start()
+
+    def put(self, data: bytes) -> None:
+        """Queue a read; waits only while the ring is full."""
+        try:
+            self._ring.put_nowait(data)
+        except queue.Full:
+            PTY_READER_STALLS.labels(session_id=self.session_id).inc()
+            self._ring.put(data)
+
+    def close(self, timeout: float | None = None) -> None:
+        """Dispatch everything queued so far, then stop the worker."""
+        self._ring.put(_CLOSE)
+        self._worker.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            item = self._ring.get()
+            if item is _CLOSE:
+                return
+            try:
+                self._dispatch(item)
+            except Exception:
+                logger.exception("PTY dispatch failed for session %s", self.session_id)
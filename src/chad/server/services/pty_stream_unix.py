@@ -18,12 +18,30 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import AsyncIterator, Callable
 
+from chad.server.services.pty_coalesce import OutputCoalescer, coalesce_events
+from chad.server.services.pty_pipeline import PTY_READER_STALLS, ReadPipeline
+from chad.util.metrics import counter, gauge
+
 try:
     import pty
 except ImportError:
     pty = None
 
 
+PTY_BYTES_READ = counter("chad_pty_bytes_read_total", "Bytes read from agent PTYs", ("session_id",))
+PTY_EVENTS_DROPPED = counter(
+    "chad_pty_events_dropped_total", "PTY events dropped because a subscriber queue was full", ("session_id",)
+)
+PTY_QUEUE_DEPTH = gauge(
+    "chad_pty_subscriber_queue_depth", "Deepest subscriber queue after the last PTY dispatch", ("session_id",)
+)
+
+
+def _decoded_len(data: str) -> int:
+    """Byte length of a base64 payload without decoding it."""
+    return len(data) * 3 // 4 - data.endswith("=") - data.endswith("==")
+
+
 @dataclass
 class PTYSession:
     """Represents an active PTY session."""
@@ -187,6 +205,7 @@ class PTYStreamService:
         thread = threading.Thread(
             target=self._read_output_loop,
             args=(session,),
+            name=f"pty-read-{session_id}",
             daemon=True,
         )
         session._output_thread = thread
@@ -199,7 +218,13 @@ class PTYStreamService:
         fcntl.ioctl(fd, termios.TIOCSWINSZ, winsize)
 
     def _read_output_loop(self, session: PTYSession) -> None:
-        """Read output from PTY and dispatch to subscribers."""
+        """Read output from PTY and hand it to the dispatch worker.
+
+        Output events are built and dispatched on the session's
+        :class:`ReadPipeline` worker; the exit event is dispatched here once
+        the worker has drained, so it always follows the last output.
+        """
+        pipeline = ReadPipeline(session.session_id, lambda data: self._dispatch_output(session, data))
         while session.active:
             try:
                 # Wait for data with timeout
@@ -213,16 +238,7 @@ class PTYStreamService:
                             data = self._handle_cpr_request(session, data)
                             if not data:
                                 continue
-                            # Check for ANSI codes
-                            has_ansi = b"\x1b[" in data or b"\x1b]" in data
-
-                            event = PTYEvent(
-                                type="output",
-                                stream_id=session.stream_id,
-                                data=base64.b64encode(data).decode("ascii"),
-                                has_ansi=has_ansi,
-                            )
-                            self._dispatch_event(session, event)
+                            pipeline.put(data)
                         else:
                             # EOF - process exited
                             break
@@ -234,6 +250,8 @@ class PTYStreamService:
                 # fd closed or invalid
                 break
 
+        pipeline.close()
+
         # Process exited - get exit code
         if session._proc is not None:
             try:
@@ -272,6 +290,16 @@ class PTYStreamService:
         except OSError:
             pass
 
+    def _dispatch_output(self, session: PTYSession, data: bytes) -> None:
+        """Build an output event from raw PTY bytes and dispatch it."""
+        event = PTYEvent(
+            type="output",
+            stream_id=session.stream_id,
+            data=base64.b64encode(data).decode("ascii"),
+            has_ansi=b"\x1b[" in data or b"\x1b]" in data,
+        )
+        self._dispatch_event(session, event)
+
     def _dispatch_event(self, session: PTYSession, event: PTYEvent) -> None:
         """Send event to logging callback and all subscribers.
 
@@ -282,6 +310,9 @@ class PTYStreamService:
         Events are also buffered for replay to late subscribers who connect
         after events have been dispatched.
         """
+        if event.type == "output":
+            PTY_BYTES_READ.labels(session_id=session.session_id).inc(_decoded_len(event.data))
+
         # Call logging callback first - this is synchronous and never drops events
         if session._log_callback:
             try:
@@ -297,12 +328,15 @@ class PTYStreamService:
 
             # Then broadcast to subscriber queues (thread-safe)
             # Using queue.Queue which is inherently thread-safe
+            depth = 0
             for q in session._subscribers:
                 try:
                     q.put_nowait(event)
                 except queue.Full:
                     # Drop if queue is full
-                    pass
+                    PTY_EVENTS_DROPPED.labels(session_id=session.session_id).inc()
+                depth = max(depth, q.qsize())
+            PTY_QUEUE_DEPTH.labels(session_id=session.session_id).set(depth)
 
     def send_input(self, stream_id: str, data: bytes, close_stdin: bool = False) -> bool:
         """Send input to PTY or stdin pipe.
@@ -361,7 +395,7 @@ class PTYStreamService:
         except (OSError, ProcessLookupError):
             return False
 
-    async def subscribe(self, stream_id: str) -> AsyncIterator[PTYEvent]:
+    async def subscribe(self, stream_id: str, coalesce: bool = False) -> AsyncIterator[PTYEvent]:
         """Subscribe to PTY output events.
 
         Late subscribers receive buffered events first, then live events.
@@ -370,6 +404,8 @@ class PTYStreamService:
 
         Args:
             stream_id: The PTY stream ID
+            coalesce: Merge runs of queued output events into single events
+                (see :mod:`chad.server.services.pty_coalesce`)
 
         Yields:
             PTYEvent objects as they occur
@@ -388,6 +424,9 @@ class PTYStreamService:
         with session._lock:
             session._subscribers.append(q)
             buffered_events = list(session._event_buffer)
+        if coalesce:
+            buffered_events = coalesce_events(buffered_events)
+        coalescer = OutputCoalescer(q) if coalesce else None
 
         # Replay buffered events first (handles late subscriber race condition)
         for event in buffered_events:
@@ -404,7 +443,7 @@ class PTYStreamService:
                 # Poll the thread-safe queue with non-blocking get + async sleep
                 # This allows yielding to the event loop while waiting for events
                 try:
-                    event = q.get_nowait()
+                    event = await coalescer.get() if coalescer else q.get_nowait()
                     yield event
 
                     if event.type == "exit":
@@ -416,7 +455,7 @@ class PTYStreamService:
                         # Session ended - drain any remaining events
                         while True:
                             try:
-                                event = q.get_nowait()
+                                event = await coalescer.get() if coalescer else q.get_nowait()
                                 yield event
                                 if event.type == "exit":
                                     break
@@ -533,10 +572,13 @@ class PTYStreamService:
             return [s.stream_id for s in self._sessions.values() if s.active]
 
     def cleanup_session(self, stream_id: str) -> None:
-        """Remove a session from tracking."""
+        """Remove a session from tracking and drop its metric series."""
         with self._lock:
-            if stream_id in self._sessions:
-                del self._sessions[stream_id]
+            session = self._sessions.pop(stream_id, None)
+        if session is None:
+            return
+        for metric in (PTY_BYTES_READ, PTY_EVENTS_DROPPED, PTY_QUEUE_DEPTH, PTY_READER_STALLS):
+            metric.remove(session_id=session.session_id)
 
     def set_log_callback(
         self,
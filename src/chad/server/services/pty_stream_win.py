@@ -17,12 +17,30 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import AsyncIterator, Callable
 
+from chad.server.services.pty_coalesce import OutputCoalescer, coalesce_events
+from chad.server.services.pty_pipeline import PTY_READER_STALLS, ReadPipeline
+from chad.util.metrics import counter, gauge
+
 try:
     from winpty import PTY
 except ImportError:  # pragma: no cover - exercised in Windows compat tests
     PTY = None  # type: ignore[assignment]
 
 
+PTY_BYTES_READ = counter("chad_pty_bytes_read_total", "Bytes read from agent PTYs", ("session_id",))
+PTY_EVENTS_DROPPED = counter(
+    "chad_pty_events_dropped_total", "PTY events dropped because a subscriber queue was full", ("session_id",)
+)
+PTY_QUEUE_DEPTH = gauge(
+    "chad_pty_subscriber_queue_depth", "Deepest subscriber queue after the last PTY dispatch", ("session_id",)
+)
+
+
+def _decoded_len(data: str) -> int:
+    """Byte length of a base64 payload without decoding it."""
+    return len(data) * 3 // 4 - data.endswith("=") - data.endswith("==")
+
+
 @dataclass
 class PTYSession:
     """Represents an active ConPTY session on Windows."""
@@ -160,6 +178,7 @@ class PTYStreamService:
         thread = threading.Thread(
             target=self._read_output_loop,
             args=(session,),
+            name=f"pty-read-{session_id}",
             daemon=True,
         )
         session._output_thread = thread
@@ -167,7 +186,11 @@ class PTYStreamService:
         return stream_id
 
     def _read_output_loop(self, session: PTYSession) -> None:
-        """Read output from ConPTY and dispatch to subscribers."""
+        """Read output from ConPTY and hand it to the dispatch worker.
+
+        Output is dispatched on the session's :class:`ReadPipeline` worker;
+        the exit event is dispatched here after the worker has drained.
+        """
         import time
 
         pty = session._pty
@@ -175,24 +198,20 @@ class PTYStreamService:
         if not pty and not proc:
             return
 
+        pipeline = ReadPipeline(session.session_id, lambda data: self._dispatch_output(session, data))
         if proc is not None:
             try:
                 assert proc.stdout is not None
                 while session.active:
                     chunk = proc.stdout.readline()
                     if chunk:
-                        event = PTYEvent(
-                            type="output",
-                            stream_id=session.stream_id,
-                            data=base64.b64encode(chunk).decode("ascii"),
-                            has_ansi=b"\x1b[" in chunk or b"\x1b]" in chunk,
-                        )
-                        self._dispatch_event(session, event)
+                        pipeline.put(chunk)
                     elif proc.poll() is not None:
                         break
                     else:
                         time.sleep(0.01)
             finally:
+                pipeline.close()
                 session.exit_code = proc.poll()
                 event = PTYEvent(
                     type="exit",
@@ -211,14 +230,7 @@ class PTYStreamService:
                     data_bytes = self._handle_cpr_request(session, data_bytes)
                     if not data_bytes:
                         continue
-                    has_ansi = b"\x1b[" in data_bytes or b"\x1b]" in data_bytes
-                    event = PTYEvent(
-                        type="output",
-                        stream_id=session.stream_id,
-                        data=base64.b64encode(data_bytes).decode("ascii"),
-                        has_ansi=has_ansi,
-                    )
-                    self._dispatch_event(session, event)
+                    pipeline.put(data_bytes)
                 else:
                     # No data available — avoid busy-looping
                     time.sleep(0.01)
@@ -234,22 +246,7 @@ class PTYStreamService:
                         try:
                             remaining = pty.read()
                             if remaining:
-                                data_bytes = remaining.encode(
-                                    "utf-8", errors="replace"
-                                )
-                                has_ansi = (
-                                    b"\x1b[" in data_bytes
-                                    or b"\x1b]" in data_bytes
-                                )
-                                event = PTYEvent(
-                                    type="output",
-                                    stream_id=session.stream_id,
-                                    data=base64.b64encode(
-                                        data_bytes
-                                    ).decode("ascii"),
-                                    has_ansi=has_ansi,
-                                )
-                                self._dispatch_event(session, event)
+                                pipeline.put(remaining.encode("utf-8", errors="replace"))
                             else:
                                 time.sleep(0.05)
                         except Exception:
@@ -258,6 +255,8 @@ class PTYStreamService:
             except Exception:
                 break
 
+        pipeline.close()
+
         # Get exit code
         if pty is not None:
             try:
@@ -273,8 +272,21 @@ class PTYStreamService:
         self._dispatch_event(session, event)
         session.active = False
 
+    def _dispatch_output(self, session: PTYSession, data: bytes) -> None:
+        """Build an output event from raw ConPTY bytes and dispatch it."""
+        event = PTYEvent(
+            type="output",
+            stream_id=session.stream_id,
+            data=base64.b64encode(data).decode("ascii"),
+            has_ansi=b"\x1b[" in data or b"\x1b]" in data,
+        )
+        self._dispatch_event(session, event)
+
     def _dispatch_event(self, session: PTYSession, event: PTYEvent) -> None:
         """Send event to logging callback and all subscribers."""
+        if event.type == "output":
+            PTY_BYTES_READ.labels(session_id=session.session_id).inc(_decoded_len(event.data))
+
         if session._log_callback:
             try:
                 session._log_callback(event)
@@ -286,11 +298,14 @@ class PTYStreamService:
             if len(session._event_buffer) > 1000:
                 session._event_buffer = session._event_buffer[-1000:]
 
+            depth = 0
             for q in session._subscribers:
                 try:
                     q.put_nowait(event)
                 except queue.Full:
-                    pass
+                    PTY_EVENTS_DROPPED.labels(session_id=session.session_id).inc()
+                depth = max(depth, q.qsize())
+            PTY_QUEUE_DEPTH.labels(session_id=session.session_id).set(depth)
 
     def send_input(self, stream_id: str, data: bytes, close_stdin: bool = False) -> bool:
         """Send input to process via ConPTY.
@@ -330,8 +345,8 @@ class PTYStreamService:
         except Exception:
             return False
 
-    async def subscribe(self, stream_id: str) -> AsyncIterator[PTYEvent]:
-        """Subscribe to output events."""
+    async def subscribe(self, stream_id: str, coalesce: bool = False) -> AsyncIterator[PTYEvent]:
+        """Subscribe to output events; ``coalesce`` merges runs of queued output."""
         with self._lock:
             session = self._sessions.get(stream_id)
 
@@ -343,6 +358,9 @@ class PTYStreamService:
         with session._lock:
             session._subscribers.append(q)
             buffered_events = list(session._event_buffer)
+        if coalesce:
+            buffered_events = coalesce_events(buffered_events)
+        coalescer = OutputCoalescer(q) if coalesce else None
 
         for event in buffered_events:
             yield event
@@ -355,7 +373,7 @@ class PTYStreamService:
         try:
             while True:
                 try:
-                    event = q.get_nowait()
+                    event = await coalescer.get() if coalescer else q.get_nowait()
                     yield event
                     if event.type == "exit":
                         break
@@ -363,7 +381,7 @@ class PTYStreamService:
                     if not session.active:
                         while True:
                             try:
-                                event = q.get_nowait()
+                                event = await coalescer.get() if coalescer else q.get_nowait()
                                 yield event
                                 if event.type == "exit":
                                     break
@@ -442,10 +460,13 @@ class PTYStreamService:
             return [s.stream_id for s in self._sessions.values() if s.active]
 
     def cleanup_session(self, stream_id: str) -> None:
-        """Remove a session from tracking."""
+        """Remove a session from tracking and drop its metric series."""
         with self._lock:
-            if stream_id in self._sessions:
-                del self._sessions[stream_id]
+            session = self._sessions.pop(stream_id, None)
+        if session is None:
+            return
+        for metric in (PTY_BYTES_READ, PTY_EVENTS_DROPPED, PTY_QUEUE_DEPTH, PTY_READER_STALLS):
+            metric.remove(session_id=session.session_id)
 
     def set_log_callback(
         self,
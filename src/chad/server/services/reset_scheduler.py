@@ -0,0 +1,229 @@
+"""Central wake-up scheduler for sessions paused until a usage limit resets.
+
+A session that hits its usage limit with the ``await_reset`` action parks on
+a :class:`ResetWait`. One scheduler thread sleeps until shortly before the
+provider's reported reset time, confirms the reset with a single usage probe,
+and backs off exponentially if usage is still above the threshold. Sessions
+waiting on the same account and limit share probe results, so several paused
+sessions cost one usage call per check instead of one each every few seconds.
+"""
+
+import heapq
+import itertools
+import logging
+import re
+import threading
+import time
+from typing import Callable, Hashable
+
+logger = logging.getLogger(__name__)
+
+# Wake this long before the reported reset time
+RESET_WAKE_LEAD_SECONDS = 30
+
+# First re-check delay when no ETA is known or usage has not reset yet;
+# doubled after every probe that still shows usage above the threshold
+RESET_BACKOFF_INITIAL_SECONDS = 60
+
+# Upper bound on the delay between probes
+RESET_BACKOFF_MAX_SECONDS = 10 * 60
+
+# Probe results are shared by waits on the same key for this long
+RESET_PROBE_CACHE_SECONDS = 30
+
+_ETA_PART_RE = re.compile(r"(\d+)\s*([dhms])")
+_ETA_UNIT_SECONDS = {"d": 86400, "h": 3600, "m": 60, "s": 1}
+
+
+def eta_to_seconds(eta: str | None) -> int | None:
+    """Convert a provider ETA like ``"2h 15m"`` to seconds (None if unparsable)."""
+    if not eta:
+        return None
+    parts = _ETA_PART_RE.findall(eta)
+    if not parts:
+        return None
+    return sum(int(value) * _ETA_UNIT_SECONDS[unit] for value, unit in parts)
+
+
+class ResetWait:
+    """One paused session's wait for a usage reset."""
+
+    def __init__(self, key: Hashable, probe: Callable[[], float | None], threshold: float, due: float):
+        self.key = key
+        self.probe = probe
+        self.threshold = threshold
+        self.due = due
+        self.attempts = 0
+        self.reason: str | None = None
+        self._event = threading.Event()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until the wait is resolved; returns False on timeout."""
+        return self._event.wait(timeout)
+
+    @property
+    def done(self) -> bool:
+        return self._event.is_set()
+
+    def _resolve(self, reason: str) -> None:
+        self.reason = reason
+        self._event.set()
+
+
+class ResetScheduler:
+    """Wakes paused sessions when their usage limit has reset."""
+
+    def __init__(
+        self,
+        lead_seconds: float = RESET_WAKE_LEAD_SECONDS,
+        initial_backoff: float = RESET_BACKOFF_INITIAL_SECONDS,
+        max_backoff: float = RESET_BACKOFF_MAX_SECONDS,
+        probe_cache_seconds: float = RESET_PROBE_CACHE_SECONDS,
+    ) -> None:
+        self.lead_seconds = lead_seconds
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.probe_cache_seconds = probe_cache_seconds
+        self._heap: list[tuple[float, int, ResetWait]] = []
+        self._counter = itertools.count()
+        self._probe_cache: dict[Hashable, tuple[float, float | None]] = {}
+        self._cond = threading.Condition()
+        self._stopped = False
+        self._thread: threading.Thread | None = None
+
+    def schedule(
+        self,
+        key: Hashable,
+        probe: Callable[[], float | None],
+        threshold: float,
+        eta_seconds: float | None = None,
+    ) -> ResetWait:
+        """Register a paused session and return the handle it waits on.
+
+        Args:
+            key: Waits with equal keys (e.g. account and limit) share probes
+            probe: Returns the current usage percentage, or None if unknown
+            threshold: Usage below this counts as reset
+            eta_seconds: Seconds until the provider expects the reset, if known
+        """
+        if eta_seconds is not None:
+            delay = max(0.0, eta_seconds - self.lead_seconds)
+        else:
+            delay = self.initial_backoff
+        wait = ResetWait(key, probe, threshold, time.monotonic() + delay)
+        with self._cond:
+            self._push(wait)
+            self._ensure_thread()
+            self._cond.notify()
+        return wait
+
+    def wake(self, wait: ResetWait, reason: str) -> None:
+        """Resolve a wait immediately (e.g. the user asked to resume)."""
+        with self._cond:
+            wait._resolve(reason)
+            self._cond.notify()
+
+    def cancel(self, wait: ResetWait) -> None:
+        """Stop tracking a wait; its heap entry is dropped when it comes due."""
+        with self._cond:
+            if not wait.done:
+                wait._resolve("cancelled")
+            self._cond.notify()
+
+    def pending_count(self) -> int:
+        """Number of unresolved waits."""
+        with self._cond:
+            return sum(1 for _, _, wait in self._heap if not wait.done)
+
+    def stop(self) -> None:
+        """Stop the scheduler thread; unresolved waits stay unresolved."""
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _push(self, wait: ResetWait) -> None:
+        heapq.heappush(self._heap, (wait.due, next(self._counter), wait))
+
+    def _ensure_thread(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="chad-reset-scheduler", daemon=True)
+        self._thread.start()
+
+    def _next_due(self) -> list[ResetWait] | None:
+        """Block until waits come due and pop them (None when stopping)."""
+        with self._cond:
+            while not self._stopped:
+                while self._heap and self._heap[0][2].done:
+                    heapq.heappop(self._heap)
+                if not self._heap:
+                    self._cond.wait()
+                    continue
+                delay = self._heap[0][0] - time.monotonic()
+                if delay > 0:
+                    self._cond.wait(delay)
+                    continue
+                now = time.monotonic()
+                due = []
+                while self._heap and self._heap[0][0] <= now:
+                    wait = heapq.heappop(self._heap)[2]
+                    if not wait.done:
+                        due.append(wait)
+                if due:
+                    return due
+            return None
+
+    def _probe(self, wait: ResetWait) -> float | None:
+        now = time.monotonic()
+        cached = self._probe_cache.get(wait.key)
+        if cached is not None and now - cached[0] < self.probe_cache_seconds:
+            return cached[1]
+        try:
+            value = wait.probe()
+        except Exception:
+            logger.debug("Usage probe failed for %s", wait.key, exc_info=True)
+            value = None
+        self._probe_cache[wait.key] = (time.monotonic(), value)
+        return value
+
+    def _run(self) -> None:
+        while True:
+            due = self._next_due()
+            if due is None:
+                return
+            for wait in due:
+                current = self._probe(wait)
+                with self._cond:
+                    if wait.done:
+                        continue
+                    if current is not None and current < wait.threshold:
+                        wait._resolve("reset")
+                        continue
+                    delay = min(self.max_backoff, self.initial_backoff * (2 ** wait.attempts))
+                    wait.attempts += 1
+                    wait.due = time.monotonic() + delay
+                    self._push(wait)
+
+
+# Global scheduler instance
+_reset_scheduler: ResetScheduler | None = None
+
+
+def get_reset_scheduler() -> ResetScheduler:
+    """Get the global ResetScheduler instance."""
+    global _reset_scheduler
+    if _reset_scheduler is None:
+        _reset_scheduler = ResetScheduler()
+    return _reset_scheduler
+
+
+def reset_reset_scheduler() -> None:
+    """Stop and reset the global reset scheduler (for testing)."""
+    global _reset_scheduler
+    if _reset_scheduler is not None:
+        _reset_scheduler.stop()
+    _reset_scheduler = None
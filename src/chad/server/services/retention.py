@@ -0,0 +1,406 @@
+"""Age- and size-bounded retention of session logs, artifacts and uploads."""
+
+import json
+import logging
+import os
+import shutil
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterable
+
+from chad.util.event_log import (
+    COLD_INDEX_SUFFIX,
+    COLD_LOG_SUFFIX,
+    LOG_SUFFIX,
+    ArtifactStore,
+    EventLog,
+)
+
+logger = logging.getLogger(__name__)
+
+# How often the retention manager runs, and how long after startup the first pass waits
+RETENTION_INTERVAL_SECONDS = 60 * 60
+RETENTION_STARTUP_DELAY_SECONDS = 60
+
+# Default disk budget for the log directory (0 disables the quota)
+DEFAULT_LOG_QUOTA_MB = 5 * 1024
+
+# Logs touched more recently than this are never pruned for quota reasons
+RETENTION_MIN_IDLE_SECONDS = 10 * 60
+
+MANIFEST_NAME = "retention.json"
+MANIFEST_VERSION = 1
+
+
+@dataclass
+class RetentionResult:
+    """Outcome of a retention pass."""
+
+    sessions: list[str] = field(default_factory=list)
+    uploads: list[str] = field(default_factory=list)
+    blobs: list[str] = field(default_factory=list)
+    bytes_freed: int = 0
+
+
+def _lower_io_priority() -> None:
+    """Drop the calling thread to the lowest scheduling priority.
+
+    On Linux the nice value applies to the thread and, without an explicit
+    ioprio, the kernel derives the best-effort IO priority from it.
+    """
+    if sys.platform != "linux":
+        return
+    try:
+        os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 19)
+    except (AttributeError, OSError):
+        pass
+
+
+def _tree_size(path: Path) -> int:
+    total = 0
+    for root, _dirs, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_size
+            except OSError:
+                pass
+    return total
+
+
+class RetentionManager:
+    """Prunes whole session bundles by a disk quota and, optionally, by age.
+
+    A session bundle is its event log (hot ``.jsonl`` or compacted
+    ``.jsonl.gz`` + ``.jsonl.idx``), legacy per-session artifact directory,
+    the uploads referenced by its ``session_started`` event, its search index
+    rows and its references in the shared blob store.
+
+    Per-session sizes, mtimes and upload references are kept in an on-disk
+    manifest (``retention.json`` in the log directory), so each pass lists the
+    directory once and only reads the first line of logs it has not seen
+    before. Blob store usage is remeasured only after blobs were collected.
+    """
+
+    def __init__(
+        self,
+        log_dir: Path | None = None,
+        max_age_days: Callable[[], float] | None = None,
+        quota_bytes: Callable[[], int] | None = None,
+        protected_sessions: Callable[[], Iterable[str]] | None = None,
+        on_removed: Callable[[list[str]], None] | None = None,
+        interval: float = RETENTION_INTERVAL_SECONDS,
+        startup_delay: float = RETENTION_STARTUP_DELAY_SECONDS,
+    ) -> None:
+        self._log_dir = log_dir
+        self._max_age_days = max_age_days or (lambda: 0)
+        self._quota_bytes = quota_bytes or (lambda: DEFAULT_LOG_QUOTA_MB * 1024 * 1024)
+        self._protected_sessions = protected_sessions or (lambda: ())
+        self._on_removed = on_removed
+        self.interval = interval
+        self.startup_delay = startup_delay
+        self._run_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def log_dir(self) -> Path:
+        return EventLog.get_log_dir(self._log_dir)
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.log_dir / MANIFEST_NAME
+
+    @property
+    def upload_dir(self) -> Path:
+        return self.log_dir / "uploads"
+
+    # ── manifest ──
+
+    def _load_manifest(self) -> dict:
+        try:
+            manifest = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+            if manifest.get("version") == MANIFEST_VERSION:
+                return manifest
+        except (OSError, ValueError):
+            pass
+        return {"version": MANIFEST_VERSION, "sessions": {}, "blob_bytes": None}
+
+    def _save_manifest(self, manifest: dict) -> None:
+        tmp_path = self.manifest_path.with_name(f".{MANIFEST_NAME}.{os.getpid()}.tmp")
+        try:
+            tmp_path.write_text(json.dumps(manifest, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp_path, self.manifest_path)
+        except OSError:
+            logger.warning("Failed to write retention manifest", exc_info=True)
+            tmp_path.unlink(missing_ok=True)
+
+    def _read_uploads(self, log_path: str) -> list[str]:
+        """Upload file names referenced by a session's session_started event."""
+        from .session_manager import SessionManager
+
+        first_line, _ = SessionManager._read_first_last_lines(log_path)
+        try:
+            first_event = json.loads(first_line) if first_line else {}
+        except ValueError:
+            return []
+        upload_dir = str(self.upload_dir)
+        return [
+            os.path.basename(p) for p in first_event.get("screenshots") or []
+            if isinstance(p, str) and os.path.dirname(p) == upload_dir
+        ]
+
+    def refresh_manifest(self) -> dict:
+        """Bring the manifest up to date with one listing of the log directory."""
+        manifest = self._load_manifest()
+        known: dict[str, dict] = manifest["sessions"]
+        found: dict[str, dict] = {}
+
+        try:
+            entries = list(os.scandir(self.log_dir))
+        except OSError:
+            entries = []
+
+        for entry in entries:
+            name = entry.name
+            if name.endswith(LOG_SUFFIX):
+                session_id, cold = name[: -len(LOG_SUFFIX)], False
+            elif name.endswith(COLD_LOG_SUFFIX):
+                session_id, cold = name[: -len(COLD_LOG_SUFFIX)], True
+            elif name.endswith(COLD_INDEX_SUFFIX):
+                session_id = name[: -len(COLD_INDEX_SUFFIX)]
+                try:
+                    size = entry.stat().st_size
+                except OSError:
+                    continue
+                found.setdefault(session_id, {"bytes": 0, "mtime": 0.0})["bytes"] += size
+                continue
+            else:
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+
+            record = found.setdefault(session_id, {"bytes": 0, "mtime": 0.0})
+            record["bytes"] += stat.st_size
+            record["mtime"] = max(record["mtime"], stat.st_mtime)
+            if not cold or "log" not in record:
+                record["log"] = name
+
+        for session_id, record in found.items():
+            if "log" not in record:
+                continue  # Stray index without a log
+            previous = known.get(session_id)
+            if previous is not None and "uploads" in previous:
+                record["uploads"] = previous["uploads"]
+            else:
+                record["uploads"] = self._read_uploads(str(self.log_dir / record["log"]))
+            if record["uploads"]:
+                record["bytes"] += sum(self._file_size(self.upload_dir / u) for u in record["uploads"])
+
+        manifest["sessions"] = {sid: rec for sid, rec in found.items() if "log" in rec}
+        if manifest.get("blob_bytes") is None:
+            manifest["blob_bytes"] = _tree_size(self.log_dir / "blobs")
+        return manifest
+
+    @staticmethod
+    def _file_size(path: Path) -> int:
+        try:
+            return path.stat().st_size
+        except OSError:
+            return 0
+
+    # ── pruning ──
+
+    def _remove_bundle(self, session_id: str, record: dict, keep_uploads: set[str]) -> tuple[int, list[str]]:
+        """Delete one session's files; returns (bytes freed, removed uploads)."""
+        from chad.util.session_index import get_session_index
+
+        freed = 0
+        for suffix in (LOG_SUFFIX, COLD_LOG_SUFFIX, COLD_INDEX_SUFFIX):
+            path = self.log_dir / f"{session_id}{suffix}"
+            size = self._file_size(path)
+            try:
+                path.unlink()
+                freed += size
+            except FileNotFoundError:
+                pass
+            except OSError:
+                logger.warning("Failed to remove %s", path, exc_info=True)
+
+        legacy_dir = self.log_dir / "artifacts" / session_id
+        if legacy_dir.is_dir():
+            freed += _tree_size(legacy_dir)
+            shutil.rmtree(legacy_dir, ignore_errors=True)
+
+        removed_uploads = []
+        for name in record.get("uploads", []):
+            if name in keep_uploads:
+                continue
+            path = self.upload_dir / name
+            size = self._file_size(path)
+            try:
+                path.unlink()
+                freed += size
+                removed_uploads.append(name)
+            except OSError:
+                pass
+
+        try:
+            get_session_index(self.log_dir).remove_session(session_id)
+        except Exception:
+            logger.debug("Failed to drop search index rows for %s", session_id, exc_info=True)
+
+        return freed, removed_uploads
+
+    def _prune_orphan_uploads(self, referenced: set[str], cutoff: float) -> list[str]:
+        removed = []
+        try:
+            entries = list(os.scandir(self.upload_dir))
+        except OSError:
+            return removed
+        for entry in entries:
+            try:
+                if entry.name in referenced or not entry.is_file() or entry.stat().st_mtime >= cutoff:
+                    continue
+                os.unlink(entry.path)
+                removed.append(entry.name)
+            except OSError:
+                pass
+        return removed
+
+    def run_once(self) -> RetentionResult:
+        """Run a single retention pass."""
+        with self._run_lock:
+            return self._run_pass()
+
+    def _run_pass(self) -> RetentionResult:
+        result = RetentionResult()
+        if not self.log_dir.exists():
+            return result
+
+        manifest = self.refresh_manifest()
+        sessions: dict[str, dict] = manifest["sessions"]
+        protected = set(self._protected_sessions())
+        now = time.time()
+        max_age_days = self._max_age_days()
+        # Age-based pruning is opt-in; without it only the quota removes sessions
+        age_cutoff = now - max_age_days * 86400 if max_age_days > 0 else 0.0
+        idle_cutoff = now - RETENTION_MIN_IDLE_SECONDS
+        quota = self._quota_bytes()
+
+        doomed = [sid for sid, rec in sessions.items() if sid not in protected and rec["mtime"] < age_cutoff]
+        usage = sum(rec["bytes"] for rec in sessions.values()) + (manifest["blob_bytes"] or 0)
+        usage -= sum(sessions[sid]["bytes"] for sid in doomed)
+        if quota > 0 and usage > quota:
+            survivors = sorted(
+                (rec["mtime"], sid) for sid, rec in sessions.items()
+                if sid not in protected and sid not in doomed and rec["mtime"] < idle_cutoff
+            )
+            for _mtime, sid in survivors:
+                if usage <= quota:
+                    break
+                doomed.append(sid)
+                usage -= sessions[sid]["bytes"]
+
+        doomed_set = set(doomed)
+        keep_uploads = {
+            name for sid, rec in sessions.items() if sid not in doomed_set for name in rec.get("uploads", [])
+        }
+        for sid in sorted(doomed, key=lambda s: sessions[s]["mtime"]):
+            if self._stop.is_set():
+                break
+            freed, uploads = self._remove_bundle(sid, sessions.pop(sid), keep_uploads)
+            result.sessions.append(sid)
+            result.uploads.extend(uploads)
+            result.bytes_freed += freed
+
+        result.uploads.extend(self._prune_orphan_uploads(keep_uploads, age_cutoff))
+
+        if result.sessions:
+            blob_store = ArtifactStore(self.log_dir / "blobs")
+            blob_store.release_sessions(result.sessions)
+            result.blobs = blob_store.collect_garbage(EventLog.list_sessions(self.log_dir))
+            if result.blobs:
+                blob_bytes = _tree_size(self.log_dir / "blobs")
+                result.bytes_freed += max(0, (manifest["blob_bytes"] or 0) - blob_bytes)
+                manifest["blob_bytes"] = blob_bytes
+            if self._on_removed:
+                self._on_removed(result.sessions)
+
+        self._save_manifest(manifest)
+        return result
+
+    # ── background thread ──
+
+    def start(self) -> None:
+        """Start the retention thread (no-op if already running)."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="chad-retention", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Signal the retention thread to exit and wait briefly for it."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _run(self) -> None:
+        _lower_io_priority()
+        delay = self.startup_delay
+        while not self._stop.wait(delay):
+            delay = self.interval
+            try:
+                result = self.run_once()
+                if result.sessions or result.uploads:
+                    logger.info(
+                        "Retention removed %d session(s), %d upload(s), freed %d bytes",
+                        len(result.sessions), len(result.uploads), result.bytes_freed,
+                    )
+            except Exception:
+                logger.warning("Retention pass failed", exc_info=True)
+
+
+# Global retention manager instance
+_retention_manager: RetentionManager | None = None
+
+
+def get_retention_manager() -> RetentionManager:
+    """Get the global RetentionManager instance."""
+    global _retention_manager
+    if _retention_manager is None:
+        from chad.util.config_manager import ConfigManager
+        from .session_manager import get_session_manager
+
+        def protected_sessions() -> list[str]:
+            return [
+                s.id for s in get_session_manager().list_sessions()
+                if s.active or s.has_worktree_changes
+            ]
+
+        def forget_sessions(session_ids: list[str]) -> None:
+            manager = get_session_manager()
+            for session_id in session_ids:
+                manager.delete_session(session_id)
+
+        _retention_manager = RetentionManager(
+            max_age_days=lambda: ConfigManager().get_log_retention_days(),
+            quota_bytes=lambda: ConfigManager().get_log_quota_mb() * 1024 * 1024,
+            protected_sessions=protected_sessions,
+            on_removed=forget_sessions,
+        )
+    return _retention_manager
+
+
+def reset_retention_manager() -> None:
+    """Stop and reset the global retention manager (for testing)."""
+    global _retention_manager
+    if _retention_manager is not None:
+        _retention_manager.stop()
+    _retention_manager = None
@@ -12,7 +12,15 @@ from typing import Any, Callable
 
 from chad.util.event_log import EventLog, MilestoneEvent, ProviderSwitchedEvent, UserMessageEvent
 from chad.server.services.pty_stream import get_pty_stream_service
+from chad.server.services.reset_scheduler import eta_to_seconds, get_reset_scheduler
 from chad.util.prompts import extract_coding_summary, CodingSummary
+from chad.util.metrics import counter, histogram
+
+EVENT_LOOP_TICK_SECONDS = histogram(
+    "chad_session_event_loop_tick_seconds", "Time spent in one milestone/message tick", ("session_id",)
+)
+USAGE_PROBE_SECONDS = histogram("chad_provider_usage_probe_seconds", "Provider usage probe latency", ("probe",))
+USAGE_PROBE_FAILURES = counter("chad_provider_usage_probe_failures_total", "Provider usage probes that raised", ("probe",))
 
 
 class SessionEventLoop:
@@ -99,6 +107,9 @@ class SessionEventLoop:
         # Accumulated output from all phases
         self.accumulated_output = ""
 
+    # How often a paused session re-checks its resume/cancel flags
+    RESET_FLAG_CHECK_SECONDS = 1.0
+
     # Map event types to (usage_fn_attr, display_label)
     _EVENT_USAGE_MAP = {
         "session_usage": ("_get_session_usage_fn", "session"),
@@ -256,9 +267,11 @@ class SessionEventLoop:
 
     def _loop(self) -> None:
         """Background tick loop for milestone detection and message processing."""
+        tick_seconds = EVENT_LOOP_TICK_SECONDS.labels(session_id=self.session_id)
         while self._running:
-            self._process_messages()
-            self._analyze_output()
+            with tick_seconds.time():
+                self._process_messages()
+                self._analyze_output()
             self._usage_check_counter += 1
             if self._usage_check_counter >= 20:  # 20 * 0.5s = 10 seconds
                 self._usage_check_counter = 0
@@ -447,8 +460,10 @@ class SessionEventLoop:
                     current_cache[event_type] = None
                 else:
                     try:
-                        current_cache[event_type] = fn()
+                        with USAGE_PROBE_SECONDS.labels(probe=event_type).time():
+                            current_cache[event_type] = fn()
                     except Exception:
+                        USAGE_PROBE_FAILURES.labels(probe=event_type).inc()
                         current_cache[event_type] = None
             current = current_cache[event_type]
             if current is None:
@@ -557,7 +572,9 @@ class SessionEventLoop:
         """
         self._running = True
         self._state = "coding"
-        self._tick_thread = threading.Thread(target=self._loop, daemon=True)
+        self._tick_thread = threading.Thread(
+            target=self._loop, name=f"session-loop-{self.session_id}", daemon=True
+        )
         self._tick_thread.start()
 
         try:
@@ -600,6 +617,7 @@ class SessionEventLoop:
             self._running = False
             if self._tick_thread:
                 self._tick_thread.join(timeout=2.0)
+            EVENT_LOOP_TICK_SECONDS.remove(session_id=self.session_id)
 
     def _run_coding_phase(
         self,
@@ -860,14 +878,13 @@ class SessionEventLoop:
             elif event_type == "weekly_usage":
                 eta_fn = self._get_weekly_reset_eta_fn
 
-            eta_str = ""
+            eta = None
             if eta_fn:
                 try:
                     eta = eta_fn()
-                    if eta:
-                        eta_str = f" (ETA: {eta})"
                 except Exception:
                     pass
+            eta_str = f" (ETA: {eta})" if eta else ""
 
             self._emit_milestone(
                 "usage_threshold",
@@ -878,22 +895,25 @@ class SessionEventLoop:
             if session is not None:
                 session.paused = True
 
-            # Poll until usage drops below threshold or resume is requested
+            # The shared scheduler probes usage around the ETA; this thread only
+            # watches its wait handle and the resume/cancel flags
+            scheduler = get_reset_scheduler()
+            wait = scheduler.schedule(
+                (coding_account, event_type), usage_fn, threshold, eta_seconds=eta_to_seconds(eta)
+            )
             resume_reason = None
-            while self._running and not getattr(self.task, "cancel_requested", False):
-                # Check if user requested resume
-                if session is not None and getattr(session, "resume_requested", False):
-                    session.resume_requested = False  # Clear the flag
-                    resume_reason = "user requested resume"
-                    break
-                time.sleep(10)
-                try:
-                    current = usage_fn()
-                except Exception:
-                    continue
-                if current is not None and current < threshold:
-                    resume_reason = f"{label.title()} reset detected"
-                    break
+            try:
+                while self._running and not getattr(self.task, "cancel_requested", False):
+                    # Check if user requested resume
+                    if session is not None and getattr(session, "resume_requested", False):
+                        session.resume_requested = False  # Clear the flag
+                        resume_reason = "user requested resume"
+                        break
+                    if wait.wait(self.RESET_FLAG_CHECK_SECONDS):
+                        resume_reason = f"{label.title()} reset detected"
+                        break
+            finally:
+                scheduler.cancel(wait)
 
             # Clear paused flag
             if session is not None:
@@ -3,6 +3,7 @@
 import json
 import threading
 import uuid
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
@@ -14,6 +15,24 @@ from chad.util.config_manager import ConfigManager
 
 SessionStatus = Literal["active", "completed", "interrupted"]
 
+# Session fields exposed by the session list API; assigning one bumps the list version
+LISTED_FIELDS = frozenset({
+    "name",
+    "project_path",
+    "active",
+    "paused",
+    "worktree_path",
+    "has_worktree_changes",
+    "coding_account",
+    "task_description",
+    "status",
+    "created_at",
+    "last_activity",
+})
+
+# Number of session changes retained for the "changes since version N" feed
+CHANGE_LOG_SIZE = 1024
+
 
 @dataclass
 class Session:
@@ -47,13 +66,94 @@ class Session:
     created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     last_activity: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in LISTED_FIELDS:
+            listener = self.__dict__.get("_listener")
+            if listener is not None:
+                listener(self, name)
+
+
+@dataclass
+class SessionChanges:
+    """Sessions changed or deleted since a given list version."""
+
+    version: int
+    reset: bool  # True when the requested version is too old; sessions is then the full list
+    sessions: list[Session]
+    deleted: list[str]
+
 
 class SessionManager:
-    """Thread-safe session manager for concurrent client handling."""
+    """Thread-safe session manager for concurrent client handling.
+
+    Keeps secondary indexes by normalized project path and by status, and a
+    monotonically increasing list version (bumped whenever a listed field of
+    any session changes) with a bounded change log for delta polling.
+    """
 
     def __init__(self):
         self._sessions: dict[str, Session] = {}
         self._lock = threading.RLock()
+        self.epoch = uuid.uuid4().hex[:8]  # Distinguishes versions across server restarts
+        self._version = 0
+        self._changes: deque[tuple[int, str, bool]] = deque()  # (version, session_id, deleted)
+        self._changes_floor = 0  # Changes at or below this version are no longer retained
+        self._by_project: dict[str, set[str]] = {}
+        self._by_status: dict[str, set[str]] = {}
+        self._index_keys: dict[str, tuple[str | None, str]] = {}  # session_id -> (project key, status)
+        self._normalized_paths: dict[str, str] = {}
+
+    def normalize_project_path(self, project_path: str) -> str:
+        """Return the resolved form of a project path (cached per distinct string)."""
+        with self._lock:
+            norm = self._normalized_paths.get(project_path)
+        if norm is None:
+            norm = str(Path(project_path).expanduser().resolve())
+            with self._lock:
+                self._normalized_paths[project_path] = norm
+        return norm
+
+    def _record_change(self, session_id: str, deleted: bool = False) -> None:
+        self._version += 1
+        self._changes.append((self._version, session_id, deleted))
+        if len(self._changes) > CHANGE_LOG_SIZE:
+            self._changes_floor = self._changes.popleft()[0]
+
+    def _reindex(self, session: Session) -> None:
+        old_project, old_status = self._index_keys.get(session.id, (None, ""))
+        project = self.normalize_project_path(session.project_path) if session.project_path else None
+        status = str(session.status)
+        if old_project != project:
+            if old_project is not None:
+                self._by_project.get(old_project, set()).discard(session.id)
+            if project is not None:
+                self._by_project.setdefault(project, set()).add(session.id)
+        if old_status != status:
+            self._by_status.get(old_status, set()).discard(session.id)
+            self._by_status.setdefault(status, set()).add(session.id)
+        self._index_keys[session.id] = (project, status)
+
+    def _on_session_change(self, session: Session, name: str) -> None:
+        with self._lock:
+            if self._sessions.get(session.id) is not session:
+                return
+            if name in ("project_path", "status"):
+                self._reindex(session)
+            self._record_change(session.id)
+
+    def _add(self, session: Session) -> None:
+        """Register a session and start tracking its changes (caller holds the lock)."""
+        self._sessions[session.id] = session
+        object.__setattr__(session, "_listener", self._on_session_change)
+        self._reindex(session)
+        self._record_change(session.id)
+
+    @property
+    def version(self) -> int:
+        """Current session list version."""
+        with self._lock:
+            return self._version
 
     def create_session(
         self,
@@ -76,7 +176,7 @@ class SessionManager:
             )
             # Default name to session ID if none provided
             session.name = name or session.id
-            self._sessions[session.id] = session
+            self._add(session)
             return session
 
     def get_session(self, session_id: str) -> Session | None:
@@ -103,21 +203,67 @@ class SessionManager:
         with self._lock:
             if session_id not in self._sessions:
                 session = Session(id=session_id, name=session_id)
-                self._sessions[session_id] = session
+                self._add(session)
             return self._sessions[session_id]
 
-    def list_sessions(self) -> list[Session]:
-        """List all sessions.
+    def list_sessions(
+        self,
+        project_path: str | None = None,
+        status: str | None = None,
+        sort: Literal["created", "activity"] = "created",
+    ) -> list[Session]:
+        """List sessions, optionally narrowed through the project/status indexes.
+
+        Args:
+            project_path: Only sessions for this project (compared after resolving)
+            status: Only sessions with this status
+            sort: Newest first by creation time ("created") or last activity ("activity")
 
         Returns:
-            List of all sessions sorted by creation time
+            Matching sessions, newest first, ties broken by ID
         """
+        norm = self.normalize_project_path(project_path) if project_path else None
         with self._lock:
-            return sorted(
-                self._sessions.values(),
-                key=lambda s: s.created_at,
-                reverse=True,
-            )
+            if norm is None and status is None:
+                candidates = list(self._sessions.values())
+            else:
+                ids: set[str] | None = None
+                if norm is not None:
+                    ids = set(self._by_project.get(norm, ()))
+                if status is not None:
+                    by_status = self._by_status.get(status, set())
+                    ids = ids & by_status if ids is not None else set(by_status)
+                candidates = [self._sessions[i] for i in ids if i in self._sessions]
+
+        if sort == "activity":
+            return sorted(candidates, key=lambda s: (s.last_activity, s.id), reverse=True)
+        return sorted(candidates, key=lambda s: (s.created_at, s.id), reverse=True)
+
+    def changes_since(self, version: int) -> SessionChanges:
+        """Return sessions changed or deleted after a list version.
+
+        If changes after ``version`` are no longer retained, ``reset`` is set and
+        all sessions are returned.
+        """
+        with self._lock:
+            current = self._version
+            if version < self._changes_floor or version > current:
+                return SessionChanges(version=current, reset=True, sessions=self.list_sessions(), deleted=[])
+
+            changed: dict[str, bool] = {}
+            for change_version, session_id, deleted in reversed(self._changes):
+                if change_version <= version:
+                    break
+                changed.setdefault(session_id, deleted)
+
+            sessions = [
+                self._sessions[sid] for sid, deleted in changed.items()
+                if not deleted and sid in self._sessions
+            ]
+            deleted_ids = [sid for sid, deleted in changed.items() if deleted]
+
+        sessions.sort(key=lambda s: (s.created_at, s.id), reverse=True)
+        return SessionChanges(version=current, reset=False, sessions=sessions, deleted=deleted_ids)
 
     def delete_session(self, session_id: str) -> bool:
         """Delete a session.
@@ -129,10 +275,16 @@ class SessionManager:
             True if deleted, False if not found
         """
         with self._lock:
-            if session_id in self._sessions:
-                del self._sessions[session_id]
-                return True
-            return False
+            session = self._sessions.pop(session_id, None)
+            if session is None:
+                return False
+            object.__setattr__(session, "_listener", None)
+            project, status = self._index_keys.pop(session_id, (None, ""))
+            if project is not None:
+                self._by_project.get(project, set()).discard(session_id)
+            self._by_status.get(status, set()).discard(session_id)
+            self._record_change(session_id, deleted=True)
+            return True
 
     def update_activity(self, session_id: str) -> None:
         """Update the last activity timestamp for a session.
@@ -219,8 +371,17 @@ class SessionManager:
         """Read the first and last non-empty lines from a JSONL file efficiently.
 
         Uses seek from end-of-file to find the last line without reading the
-        entire file, which matters for large log files.
+        entire file, which matters for large log files. Compacted cold logs
+        are read through their seq index, decompressing only two frames.
         """
+        from chad.util.event_log import COLD_LOG_SUFFIX, read_cold_log_bounds
+
+        if path.endswith(COLD_LOG_SUFFIX):
+            try:
+                return read_cold_log_bounds(Path(path))
+            except Exception:
+                return None, None
+
         try:
             with open(path, "rb") as f:
                 # Read first line
@@ -266,7 +427,7 @@ class SessionManager:
     def load_from_logs(self, max_age_days: int = 3) -> int:
         """Restore sessions from persisted event logs on disk.
 
-        Scans ~/.chad/logs/*.jsonl for previous sessions, reads the first
+        Scans ~/.chad/logs/*.jsonl (and compacted *.jsonl.gz) for previous sessions, reads the first
         event (session_started) for metadata and the last event to determine
         whether the session completed or was interrupted.
 
@@ -280,7 +441,7 @@ class SessionManager:
         Returns:
             Number of sessions restored
         """
-        from chad.util.event_log import EventLog
+        from chad.util.event_log import COLD_LOG_SUFFIX, LOG_SUFFIX, EventLog
         from chad.util.git_worktree import GitWorktreeManager
 
         log_dir = EventLog.get_log_dir()
@@ -301,15 +462,20 @@ class SessionManager:
 
         for entry in entries:
             try:
-                if not entry.name.endswith(".jsonl"):
+                if entry.name.endswith(LOG_SUFFIX):
+                    session_id = entry.name[: -len(LOG_SUFFIX)]
+                elif entry.name.endswith(COLD_LOG_SUFFIX):
+                    session_id = entry.name[: -len(COLD_LOG_SUFFIX)]
+                    # Mid-thaw: the hot log is authoritative
+                    if (log_dir / f"{session_id}{LOG_SUFFIX}").exists():
+                        continue
+                else:
                     continue
 
                 # DirEntry.stat() uses cached info when available
                 if entry.stat().st_mtime < cutoff:
                     continue
 
-                session_id = entry.name[:-6]  # strip .jsonl
-
                 # Skip if already loaded (e.g. active session)
                 with self._lock:
                     if session_id in self._sessions:
@@ -392,7 +558,7 @@ class SessionManager:
                         pass
 
                 with self._lock:
-                    self._sessions[session_id] = session
+                    self._add(session)
                 restored += 1
 
             except Exception:
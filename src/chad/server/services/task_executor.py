@@ -1,7 +1,6 @@
 """Task execution service for orchestrating AI coding tasks via PTY."""
 
 import base64
-import json
 import os
 import queue
 import re
@@ -30,12 +29,17 @@ from chad.util.prompts import (
     get_continuation_prompt,
 )
 from chad.util.installer import AIToolInstaller
+from chad.util.ndjson import NDJSONDecoder
 from chad.server.services.pty_stream import get_pty_stream_service, PTYEvent
+from chad.server.services.task_scheduler import QueuedTask, TaskScheduler
 from chad.ui.terminal_emulator import TERMINAL_COLS, TERMINAL_ROWS, TerminalEmulator
 
 
 _CLI_INSTALLER = AIToolInstaller()
 
+# Buffered PTY output that wakes the terminal snapshot worker before its interval
+TERMINAL_SNAPSHOT_MAX_BYTES = 256 * 1024
+
 
 class ClaudeStreamJsonParser:
     """Parses stream-json output from Claude Code and Qwen CLI.
@@ -51,15 +55,26 @@ class ClaudeStreamJsonParser:
     - system: Session initialization with session_id
     - message: Contains role ("assistant") and content (string)
 
-    This parser buffers incoming bytes, extracts complete JSON lines,
-    and yields human-readable text suitable for terminal display.
+    Line splitting and decoding are done by the shared NDJSONDecoder; this
+    class supplies the per-event-type rendering to human-readable text
+    suitable for terminal display.
 
     Tool calls are accumulated and displayed as a collapsed summary rather than
     individual verbose descriptions, keeping the live view focused on AI reasoning.
     """
 
     def __init__(self):
-        self._buffer = bytearray()
+        # Event type -> renderer; other event types are hidden
+        self._decoder = NDJSONDecoder(
+            {
+                "system": self._on_system,
+                "init": self._on_init,
+                "assistant": self._on_assistant,
+                "message": self._on_message,
+                "result": self._on_result,
+            },
+            on_text=self._on_text_line,
+        )
         # Tool tracking for collapsed summaries
         self._tool_counts: dict[str, int] = {}
         self._tool_details: list[str] = []
@@ -81,26 +96,7 @@ class ClaudeStreamJsonParser:
         Returns:
             List of text strings to display (may be empty if no complete lines)
         """
-        self._buffer.extend(data)
-        results = []
-
-        # Process complete lines (JSON objects are newline-delimited)
-        while b"\n" in self._buffer:
-            line_end = self._buffer.index(b"\n")
-            line = self._buffer[:line_end]
-            self._buffer = self._buffer[line_end + 1:]
-
-            if not line.strip():
-                continue
-
-            try:
-                obj = json.loads(line.decode("utf-8", errors="replace"))
-                results.extend(self._format_json_event(obj))
-            except json.JSONDecodeError:
-                # Not JSON, pass through as-is
-                results.append(line.decode("utf-8", errors="replace"))
-
-        return results
+        return [text for chunk in self._decoder.feed(data) for text in chunk]
 
     def flush(self) -> list[str]:
         """Process any remaining bytes in the buffer as a final line.
@@ -108,18 +104,7 @@ class ClaudeStreamJsonParser:
         Call this after the PTY process exits to handle the case where the
         last JSON event has no trailing newline.
         """
-        if not self._buffer or not self._buffer.strip():
-            self._buffer.clear()
-            return []
-        line = bytes(self._buffer)
-        self._buffer.clear()
-        results: list[str] = []
-        try:
-            obj = json.loads(line.decode("utf-8", errors="replace"))
-            results.extend(self._format_json_event(obj))
-        except json.JSONDecodeError:
-            results.append(line.decode("utf-8", errors="replace"))
-        return results
+        return [text for chunk in self._decoder.flush() for text in chunk]
 
     def _format_json_event(self, obj: dict) -> list[str]:
         """Convert a stream-json event to human-readable text chunks.
@@ -130,87 +115,87 @@ class ClaudeStreamJsonParser:
         Returns:
             List of human-readable text chunks (may be empty if event should be hidden)
         """
-        event_type = obj.get("type", "")
+        handler = self._decoder.handlers.get(obj.get("type", ""))
+        return handler(obj) if handler else []
+
+    @staticmethod
+    def _on_text_line(line: str) -> list[str]:
+        # Not JSON, pass through as-is
+        return [line]
+
+    def _on_system(self, obj: dict) -> list[str]:
+        # System init - don't display raw, just note session started
+        if obj.get("subtype", "") == "init":
+            # Capture model name from init event for usage tracking
+            model = obj.get("model")
+            if model:
+                self.init_model = model
+        return []  # Skip init, already shown in UI
+
+    def _on_assistant(self, obj: dict) -> list[str]:
+        # Extract content from assistant message
+        message = obj.get("message", {})
+        content = message.get("content", [])
         outputs: list[str] = []
+        parts = []
 
-        if event_type == "system":
-            # System init - don't display raw, just note session started
-            subtype = obj.get("subtype", "")
-            if subtype == "init":
-                # Capture model name from init event for usage tracking
-                model = obj.get("model")
-                if model:
-                    self.init_model = model
-                return outputs  # Skip init, already shown in UI
-            return outputs
-
-        elif event_type == "assistant":
-            # Extract content from assistant message
-            message = obj.get("message", {})
-            content = message.get("content", [])
-            parts = []
-
-            for item in content:
-                item_type = item.get("type", "")
-
-                if item_type == "text":
-                    text = item.get("text", "")
-                    if text:
-                        parts.append(text)
-
-                elif item_type == "tool_use":
-                    tool_name = item.get("name", "unknown")
-                    tool_input = item.get("input", {})
-                    tool_id = item.get("id", "")
-                    # Accumulate tool for collapsed summary instead of showing each one
-                    self._tool_counts[tool_name] = self._tool_counts.get(tool_name, 0) + 1
-                    tool_desc = self._format_tool_use(tool_name, tool_input)
-                    if tool_desc:
-                        self._tool_details.append(tool_desc)
-                    self._pending_summary = True
-                    outputs.extend(self._emit_summary_if_changed())
-                    # Record structured tool call for event logging
-                    self.pending_tool_calls.append({
-                        "id": tool_id,
-                        "name": tool_name,
-                        "input": tool_input,
-                    })
-
-            # Emit any pending summary ahead of text if counts changed during this message
-            if parts:
+        for item in content:
+            item_type = item.get("type", "")
+
+            if item_type == "text":
+                text = item.get("text", "")
+                if text:
+                    parts.append(text)
+
+            elif item_type == "tool_use":
+                tool_name = item.get("name", "unknown")
+                tool_input = item.get("input", {})
+                tool_id = item.get("id", "")
+                # Accumulate tool for collapsed summary instead of showing each one
+                self._tool_counts[tool_name] = self._tool_counts.get(tool_name, 0) + 1
+                tool_desc = self._format_tool_use(tool_name, tool_input)
+                if tool_desc:
+                    self._tool_details.append(tool_desc)
+                self._pending_summary = True
                 outputs.extend(self._emit_summary_if_changed())
-                outputs.append("\n".join(parts))
-                # Text marks the end of the current tool batch; reset tracking
-                self._reset_tool_state()
-
-            return outputs
+                # Record structured tool call for event logging
+                self.pending_tool_calls.append({
+                    "id": tool_id,
+                    "name": tool_name,
+                    "input": tool_input,
+                })
+
+        # Emit any pending summary ahead of text if counts changed during this message
+        if parts:
+            outputs.extend(self._emit_summary_if_changed())
+            outputs.append("\n".join(parts))
+            # Text marks the end of the current tool batch; reset tracking
+            self._reset_tool_state()
 
-        elif event_type == "result":
-            # Capture usage stats from result event (Gemini stream-json)
-            stats = obj.get("stats")
-            if stats and isinstance(stats, dict):
-                self.result_stats = stats
-            return outputs
-
-        elif event_type == "init":
-            # Gemini CLI format: {type: "init", model: "...", session_id: "..."}
-            model = obj.get("model")
-            if model:
-                self.init_model = model
-            return outputs
-
-        elif event_type == "message":
-            # Qwen/Gemini CLI format: {type: "message", role: "assistant", content: "..."}
-            role = obj.get("role", "")
-            if role == "assistant":
-                content = obj.get("content", "")
-                if content:
-                    outputs.append(content)
-            return outputs
-
-        # Unknown event type - skip
         return outputs
 
+    def _on_result(self, obj: dict) -> list[str]:
+        # Capture usage stats from result event (Gemini stream-json)
+        stats = obj.get("stats")
+        if stats and isinstance(stats, dict):
+            self.result_stats = stats
+        return []
+
+    def _on_init(self, obj: dict) -> list[str]:
+        # Gemini CLI format: {type: "init", model: "...", session_id: "..."}
+        model = obj.get("model")
+        if model:
+            self.init_model = model
+        return []
+
+    def _on_message(self, obj: dict) -> list[str]:
+        # Qwen/Gemini CLI format: {type: "message", role: "assistant", content: "..."}
+        if obj.get("role", "") == "assistant":
+            content = obj.get("content", "")
+            if content:
+                return [content]
+        return []
+
     def _format_tool_use(self, name: str, input_data: dict) -> str:
         """Format a tool_use event for display.
 
@@ -442,6 +427,8 @@ class Task:
     _last_terminal_snapshot: str = field(default="", repr=False)
     _mock_duration_applied: bool = field(default=False, repr=False)
     _session_event_loop: Any = field(default=None, repr=False)
+    # Event log sequence before this task logged anything (> 0 means resume)
+    _history_seq: int = field(default=0, repr=False)
 
 
 _BINARY_GARBAGE_RE = re.compile(r'[@#%*&^]{10,}')
@@ -632,6 +619,14 @@ def build_agent_command(
     return cmd, env, initial_input
 
 
+# Output rate (bytes/s) for the mock agent's long-running phase; 0 keeps the
+# one-line-per-second default. Used by the streaming benchmarks.
+MOCK_STREAM_RATE_ENV = "CHAD_MOCK_STREAM_BYTES_PER_SEC"
+
+# Size of each rate-paced mock output line, newline included
+MOCK_STREAM_LINE_BYTES = 256
+
+
 def _build_mock_agent_command(
     project_path: Path,
     task_description: str | None,
@@ -727,10 +722,19 @@ if run_duration_seconds > 0:
         "handover", "context", "quota", "switch", "token", "window",
         "stream", "analysis", "progress", "checkpoint", "fallback", "provider"
     ]
-    end_time = time.time() + run_duration_seconds
+    # Benchmarks ask for a steady byte rate; each line carries its send time
+    stream_rate = int(os.environ.get("{MOCK_STREAM_RATE_ENV}", "0") or 0)
+    start_time = time.time()
+    end_time = start_time + run_duration_seconds
     tick = 0
     while time.time() < end_time:
         tick += 1
+        if stream_rate > 0:
+            line = f"[tick {{tick:06d}}] t={{time.time():.6f}} "
+            writeln(line + "x" * max(0, {MOCK_STREAM_LINE_BYTES} - 1 - len(line)))
+            next_at = start_time + tick * {MOCK_STREAM_LINE_BYTES} / stream_rate
+            time.sleep(max(0.0, next_at - time.time()))
+            continue
         sample = " ".join(random.choice(words) for _ in range(8))
         writeln(f"{{GRAY}}[tick {{tick:03d}}] {{sample}}{{RESET}}")
         time.sleep(1)
@@ -766,6 +770,7 @@ class TaskExecutor:
         # don't ignore heavy Read/Grep usage with no terminal writes.
         self._activity_times: dict[str, float] = {}
         self._lock = threading.RLock()
+        self.scheduler = TaskScheduler(config_manager)
 
     def _idle_warning_threshold(self) -> float:
         """Seconds of silence before first idle status warning."""
@@ -807,6 +812,7 @@ class TaskExecutor:
         verification_model: str | None = None,
         verification_reasoning: str | None = None,
         is_followup: bool = False,
+        priority: int = 0,
         # Legacy kwargs for backwards compatibility
         override_exploration_prompt: str | None = None,
         override_implementation_prompt: str | None = None,
@@ -828,9 +834,11 @@ class TaskExecutor:
             verification_account: Optional account for verification
             verification_model: Optional model override for verification
             verification_reasoning: Optional reasoning level for verification
+            is_followup: Reuse the session's existing worktree
+            priority: Admission priority when the task has to queue (higher first)
 
         Returns:
-            The created Task object
+            The created Task object (PENDING while it waits for a slot)
         """
         # Handle legacy prompt overrides
         if not override_prompt and override_exploration_prompt:
@@ -856,23 +864,20 @@ class TaskExecutor:
 
         # Create task
         task = Task(session_id=session_id)
-        task.started_at = datetime.now(timezone.utc)
-        task.state = TaskState.RUNNING
 
         # Create event log
         task.event_log = EventLog(session_id)
+        task._history_seq = task.event_log.get_latest_seq()
 
-        now = time.time()
         with self._lock:
             for existing_task in self._tasks.values():
                 if existing_task.session_id != session_id:
                     continue
-                if existing_task.state == TaskState.RUNNING:
+                if existing_task.state in (TaskState.PENDING, TaskState.RUNNING):
                     raise ValueError(
                         f"Task {existing_task.id} is already running in session {session_id}"
                     )
             self._tasks[task.id] = task
-            self._activity_times[task.id] = now
 
         # Get provider info
         coding_provider = accounts[coding_account]
@@ -904,31 +909,77 @@ class TaskExecutor:
             # Runtime verification disabled – ignore any requested verification
             verification_config = None
 
-        # Start execution thread
-        thread = threading.Thread(
-            target=self._run_task,
-            args=(
-                task,
-                session,
-                path_obj,
-                git_mgr,
-                task_description,
-                coding_account,
-                coding_provider,
-                coding_model,
-                coding_reasoning,
-                on_event,
-                terminal_rows,
-                terminal_cols,
-                screenshots,
-                override_prompt,
-                verification_config,
-                is_followup,
-            ),
-            daemon=True,
-        )
-        task._thread = thread
-        thread.start()
+        def launch(account: str) -> None:
+            # Called by the scheduler once the task holds a slot
+            with self._lock:
+                cancelled = task.cancel_requested
+                if cancelled:
+                    # Cancelled between admission and launch
+                    task.state = TaskState.CANCELLED
+                    task.completed_at = datetime.now(timezone.utc)
+                else:
+                    task.state = TaskState.RUNNING
+                    task.started_at = datetime.now(timezone.utc)
+                    self._activity_times[task.id] = time.time()
+                task.progress = None
+            if cancelled:
+                self.scheduler.release(task.id)
+                return
+            if account != coding_account:
+                task._event_queue.put(StreamEvent(type="status", data={"status": f"Balanced onto account {account}"}))
+            thread = threading.Thread(
+                target=self._run_task,
+                args=(
+                    task,
+                    session,
+                    path_obj,
+                    git_mgr,
+                    task_description,
+                    account,
+                    accounts.get(account, coding_provider),
+                    coding_model,
+                    coding_reasoning,
+                    on_event,
+                    terminal_rows,
+                    terminal_cols,
+                    screenshots,
+                    override_prompt,
+                    verification_config,
+                    is_followup,
+                ),
+                daemon=True,
+            )
+            task._thread = thread
+            thread.start()
+
+        def report_position(position: int, total: int) -> None:
+            message = f"Queued: position {position} of {total}"
+            task.progress = message
+            event = StreamEvent(type="status", data={"status": message})
+            task._event_queue.put(event)
+            if task.event_log:
+                task.event_log.log(StatusEvent(status=message))
+            if on_event:
+                try:
+                    on_event(event)
+                except Exception:
+                    pass
+
+        alternates = []
+        if self.scheduler.balancing_enabled():
+            alternates = [name for name, provider in accounts.items() if provider == coding_provider]
+
+        # Admit now or queue until a slot frees up
+        self.scheduler.submit(QueuedTask(
+            task_id=task.id,
+            session_id=session_id,
+            account=coding_account,
+            provider=coding_provider,
+            start=launch,
+            priority=priority,
+            alternates=alternates,
+            on_position=report_position,
+        ))
 
         return task
 
@@ -982,7 +1033,6 @@ class TaskExecutor:
 
         last_output_time = time.time()
         last_warning_time = 0.0
-        last_log_flush = time.time()
         # Reset the activity timestamp for this task so a stale timestamp from a
         # prior phase (e.g., the coding phase before an await_reset pause) does
         # not cause the inactivity check to fire immediately when a new phase starts.
@@ -1008,26 +1058,69 @@ class TaskExecutor:
         last_logged_text = task._last_terminal_snapshot
         pty_service = get_pty_stream_service()
 
+        flush_lock = threading.Lock()
+        snapshot_wake = threading.Event()
+        snapshot_stop = threading.Event()
+
         def flush_terminal_buffer():
-            nonlocal last_logged_text, last_log_flush
+            nonlocal last_logged_text
+            with flush_lock:
+                with terminal_lock:
+                    if not terminal_buffer:
+                        return
+                    data_bytes = bytes(terminal_buffer)
+                    terminal_buffer.clear()
+
+                # Feed data to terminal emulator and extract visible text
+                log_emulator.feed(data_bytes)
+                current_text = log_emulator.get_text()
+
+                # Only log if there's meaningful new content
+                if current_text != last_logged_text and current_text.strip():
+                    if task.event_log:
+                        task.event_log.log(TerminalOutputEvent(data=current_text))
+                    last_logged_text = current_text
+                    task._last_terminal_snapshot = current_text
+
+        last_snapshot = time.monotonic()
+
+        def buffer_terminal(data: bytes):
+            """Queue output for the snapshot worker.
+
+            The worker is woken at once for large bursts and for the first
+            output after a quiet interval, so new activity shows up without
+            waiting for the next tick.
+            """
             with terminal_lock:
-                if not terminal_buffer:
-                    last_log_flush = time.time()
-                    return
-                data_bytes = bytes(terminal_buffer)
-                terminal_buffer.clear()
+                was_empty = not terminal_buffer
+                terminal_buffer.extend(data)
+                backlog = len(terminal_buffer)
+            quiet = was_empty and time.monotonic() - last_snapshot >= self.terminal_flush_interval
+            if quiet or backlog >= TERMINAL_SNAPSHOT_MAX_BYTES:
+                snapshot_wake.set()
+
+        def snapshot_loop():
+            """Feed the emulator and log screens off the PTY and task threads."""
+            nonlocal last_snapshot
+            while not snapshot_stop.is_set():
+                snapshot_wake.wait(self.terminal_flush_interval)
+                snapshot_wake.clear()
+                last_snapshot = time.monotonic()
+                try:
+                    flush_terminal_buffer()
+                except Exception:
+                    pass  # A bad screen must not stop later snapshots
 
-            # Feed data to terminal emulator and extract visible text
-            log_emulator.feed(data_bytes)
-            current_text = log_emulator.get_text()
+        def stop_snapshots():
+            snapshot_stop.set()
+            snapshot_wake.set()
+            snapshot_thread.join(timeout=5)
 
-            # Only log if there's meaningful new content
-            if current_text != last_logged_text and current_text.strip():
-                if task.event_log:
-                    task.event_log.log(TerminalOutputEvent(data=current_text))
-                last_logged_text = current_text
-                task._last_terminal_snapshot = current_text
-            last_log_flush = time.time()
+        snapshot_thread = threading.Thread(
+            target=snapshot_loop,
+            name=f"terminal-snapshot-{task.session_id}",
+            daemon=True,
+        )
 
         # Build agent command for this phase
         mock_run_duration_seconds = 0
@@ -1109,8 +1202,7 @@ class TaskExecutor:
 
                         encoded = base64.b64encode(readable_text.encode()).decode()
                         emit("stream", chunk=encoded)
-                        with terminal_lock:
-                            terminal_buffer.extend(readable_text.encode())
+                        buffer_terminal(readable_text.encode())
                         _feed_captured(readable_text)
                     else:
                         # Suppress raw stream-json chunks from reaching subscribers
@@ -1154,8 +1246,7 @@ class TaskExecutor:
                                 if pre_echo.strip():
                                     encoded = base64.b64encode(pre_echo.encode()).decode()
                                     emit("stream", chunk=encoded)
-                                    with terminal_lock:
-                                        terminal_buffer.extend(pre_echo.encode())
+                                    buffer_terminal(pre_echo.encode())
                                     _feed_captured(pre_echo)
                                 # Now in prompt echo section - update buffer
                                 codex_in_prompt_echo = True
@@ -1184,8 +1275,7 @@ class TaskExecutor:
                             if agent_output.strip():
                                 encoded = base64.b64encode(agent_output.encode()).decode()
                                 emit("stream", chunk=encoded)
-                                with terminal_lock:
-                                    terminal_buffer.extend(agent_output.encode())
+                                buffer_terminal(agent_output.encode())
                                 _feed_captured(agent_output)
                             return
 
@@ -1199,8 +1289,7 @@ class TaskExecutor:
                                 if to_emit.strip():
                                     encoded = base64.b64encode(to_emit.encode()).decode()
                                     emit("stream", chunk=encoded)
-                                    with terminal_lock:
-                                        terminal_buffer.extend(to_emit.encode())
+                                    buffer_terminal(to_emit.encode())
                                     _feed_captured(to_emit)
                         return
 
@@ -1210,8 +1299,7 @@ class TaskExecutor:
                         cleaned_bytes = cleaned.encode()
                         encoded = base64.b64encode(cleaned_bytes).decode()
                         emit("stream", chunk=encoded)
-                        with terminal_lock:
-                            terminal_buffer.extend(cleaned_bytes)
+                        buffer_terminal(cleaned_bytes)
                         _feed_captured(cleaned)
 
         # Start PTY session
@@ -1226,88 +1314,87 @@ class TaskExecutor:
             stdin_pipe=use_stdin_pipe,
         )
         task.stream_id = stream_id
-        session.active = True
-        session.status = "active"
-        session.coding_account = coding_account
-        session.task_description = task_description
-
-        # Send initial input if needed
-        if initial_input:
-            time.sleep(0.2)
-            pty_service.send_input(stream_id, initial_input.encode(), close_stdin=use_stdin_pipe)
-
-        # Wait for PTY to complete
-        pty_session = pty_service.get_session(stream_id)
-
-        while pty_session and pty_session.active:
-            # Check for cancellation
-            if task.cancel_requested:
-                pty_service.terminate(stream_id)
-                pty_service.cleanup_session(stream_id)
-                return -1, ""
+        snapshot_thread.start()
+        try:
+            session.active = True
+            session.status = "active"
+            session.coding_account = coding_account
+            session.task_description = task_description
 
-            # Inactivity timeout
-            if self.inactivity_timeout is not None:
-                now = time.time()
-                with self._lock:
-                    last_any_activity = self._activity_times.get(task.id, last_output_time)
-
-                idle_secs = now - last_any_activity
-                warn_after = self._idle_warning_threshold()
-                warn_interval = min(60.0, max(5.0, warn_after))
-                if idle_secs >= warn_after and (now - last_warning_time) >= warn_interval:
-                    emit(
-                        "status",
-                        status=(
-                            f"ℹ️ No agent output for {int(idle_secs)}s during {phase} phase "
-                            f"(timeout at {int(self.inactivity_timeout)}s)"
-                        ),
-                    )
-                    last_warning_time = now
+            # Send initial input if needed
+            if initial_input:
+                time.sleep(0.2)
+                pty_service.send_input(stream_id, initial_input.encode(), close_stdin=use_stdin_pipe)
 
-                if idle_secs > self.inactivity_timeout:
-                    flush_terminal_buffer()
+            # Wait for PTY to complete
+            pty_session = pty_service.get_session(stream_id)
+
+            while pty_session and pty_session.active:
+                # Check for cancellation
+                if task.cancel_requested:
                     pty_service.terminate(stream_id)
                     pty_service.cleanup_session(stream_id)
-                    return -2, ""  # -2 indicates timeout
-
-            # Periodically flush decoded terminal snapshots to EventLog so
-            # long-running sessions are observable before process exit.
-            if time.time() - last_log_flush >= self.terminal_flush_interval:
-                flush_terminal_buffer()
+                    return -1, ""
+
+                # Inactivity timeout
+                if self.inactivity_timeout is not None:
+                    now = time.time()
+                    with self._lock:
+                        last_any_activity = self._activity_times.get(task.id, last_output_time)
+
+                    idle_secs = now - last_any_activity
+                    warn_after = self._idle_warning_threshold()
+                    warn_interval = min(60.0, max(5.0, warn_after))
+                    if idle_secs >= warn_after and (now - last_warning_time) >= warn_interval:
+                        emit(
+                            "status",
+                            status=(
+                                f"ℹ️ No agent output for {int(idle_secs)}s during {phase} phase "
+                                f"(timeout at {int(self.inactivity_timeout)}s)"
+                            ),
+                        )
+                        last_warning_time = now
+
+                    if idle_secs > self.inactivity_timeout:
+                        flush_terminal_buffer()
+                        pty_service.terminate(stream_id)
+                        pty_service.cleanup_session(stream_id)
+                        return -2, ""  # -2 indicates timeout
 
-            time.sleep(0.1)
-            pty_session = pty_service.get_session(stream_id)
-
-        # Get final exit code.  The reader thread sets exit_code after
-        # _proc.wait(), but terminate() sets active=False first.  Wait briefly
-        # for the reader thread to populate exit_code to avoid a race.
-        exit_code = 0
-        if pty_session:
-            for _ in range(20):  # up to 2 seconds
-                if pty_session.exit_code is not None:
-                    break
                 time.sleep(0.1)
-            exit_code = pty_session.exit_code if pty_session.exit_code is not None else 0
-
-        # Flush any remaining Codex output buffer that wasn't emitted
-        if codex_output_buffer:
-            captured_output.append(codex_output_buffer)
-
-        # Flush any remaining data in the JSON parser (last event may lack trailing newline)
-        if json_parser:
-            remaining = json_parser.flush()
-            if remaining:
-                readable_text = _render_stream_json_text_chunks(remaining)
-                if not readable_text:
-                    readable_text = ""
-                # Emit final parsed output to stream and logs
-                if readable_text:
-                    emit("stream", chunk=base64.b64encode(readable_text.encode()).decode())
-                    with terminal_lock:
-                        terminal_buffer.extend(readable_text.encode())
-                    _feed_captured(readable_text)
-                    captured_output.append(readable_text)
+                pty_session = pty_service.get_session(stream_id)
+
+            # Get final exit code.  The reader thread sets exit_code after
+            # _proc.wait(), but terminate() sets active=False first.  Wait briefly
+            # for the reader thread to populate exit_code to avoid a race.
+            exit_code = 0
+            if pty_session:
+                for _ in range(20):  # up to 2 seconds
+                    if pty_session.exit_code is not None:
+                        break
+                    time.sleep(0.1)
+                exit_code = pty_session.exit_code if pty_session.exit_code is not None else 0
+
+            # Flush any remaining Codex output buffer that wasn't emitted
+            if codex_output_buffer:
+                captured_output.append(codex_output_buffer)
+
+            # Flush any remaining data in the JSON parser (last event may lack trailing newline)
+            if json_parser:
+                remaining = json_parser.flush()
+                if remaining:
+                    readable_text = _render_stream_json_text_chunks(remaining)
+                    if not readable_text:
+                        readable_text = ""
+                    # Emit final parsed output to stream and logs
+                    if readable_text:
+                        emit("stream", chunk=base64.b64encode(readable_text.encode()).decode())
+                        buffer_terminal(readable_text.encode())
+                        _feed_captured(readable_text)
+                        captured_output.append(readable_text)
+        finally:
+            # Stops the worker on every exit, including errors in the wait loop
+            stop_snapshots()
 
         flush_terminal_buffer()
         pty_service.cleanup_session(stream_id)
@@ -1390,7 +1477,7 @@ class TaskExecutor:
         try:
             # Detect resume: session has a previous event log on disk
             is_resume = False
-            if not override_prompt and task.event_log and task.event_log.get_latest_seq() > 0:
+            if not override_prompt and task.event_log and task._history_seq > 0:
                 # There are existing events — this is a restored session being resumed
                 is_resume = True
                 emit("status", status="Resuming previous session...")
@@ -1474,6 +1561,12 @@ class TaskExecutor:
                     "reasoning": self.config_manager.get_account_reasoning(account_name),
                 }
 
+            def get_session_usage():
+                # Feed the scheduler's usage cache used for account balancing
+                pct = _check_provider.get_session_usage_percentage()
+                self.scheduler.record_usage(coding_account, pct)
+                return pct
+
             # Create event loop for milestone detection
             event_loop = SessionEventLoop(
                 session_id=session.id,
@@ -1483,7 +1576,7 @@ class TaskExecutor:
                 emit_fn=emit,
                 worktree_path=worktree_path,
                 is_quota_exhausted_fn=quota_checker,
-                get_session_usage_fn=_check_provider.get_session_usage_percentage if _check_provider else None,
+                get_session_usage_fn=get_session_usage if _check_provider else None,
                 get_weekly_usage_fn=_check_provider.get_weekly_usage_percentage if _check_provider else None,
                 get_context_usage_fn=_check_provider.get_context_usage_percentage if _check_provider else None,
                 action_settings=action_settings,
@@ -1604,6 +1697,7 @@ class TaskExecutor:
                 pass
             with self._lock:
                 self._activity_times.pop(task.id, None)
+            self.scheduler.release(task.id)
 
     def get_task(self, task_id: str) -> Task | None:
         """Get a task by ID."""
@@ -1625,21 +1719,37 @@ class TaskExecutor:
         return None
 
     def get_running_task_for_session(self, session_id: str) -> Task | None:
-        """Get the most recent running task for a session."""
+        """Get the most recent running (or queued) task for a session."""
         with self._lock:
             for task in reversed(list(self._tasks.values())):
-                if task.session_id == session_id and task.state == TaskState.RUNNING:
+                if task.session_id == session_id and task.state in (TaskState.PENDING, TaskState.RUNNING):
                     return task
         return None
 
+    def _cancel_queued(self, task: Task) -> bool:
+        """Remove a task from the admission queue and mark it cancelled."""
+        if not self.scheduler.cancel(task.id):
+            return False
+        task.state = TaskState.CANCELLED
+        task.progress = None
+        task.completed_at = datetime.now(timezone.utc)
+        if task.event_log:
+            task.event_log.log(SessionEndedEvent(success=False, reason="cancelled"))
+        return True
+
     def cancel_tasks_for_session(self, session_id: str) -> int:
-        """Request cancellation for all running tasks in a session."""
+        """Request cancellation for all running or queued tasks in a session."""
         stream_ids: list[str] = []
         cancelled_count = 0
 
         with self._lock:
             for task in self._tasks.values():
-                if task.session_id != session_id or task.state != TaskState.RUNNING:
+                if task.session_id != session_id:
+                    continue
+                if task.state == TaskState.PENDING and self._cancel_queued(task):
+                    cancelled_count += 1
+                    continue
+                if task.state not in (TaskState.PENDING, TaskState.RUNNING):
                     continue
                 task.cancel_requested = True
                 cancelled_count += 1
@@ -1659,7 +1769,9 @@ class TaskExecutor:
             task = self._tasks.get(task_id)
             if not task:
                 return False
-            if task.state != TaskState.RUNNING:
+            if task.state == TaskState.PENDING and self._cancel_queued(task):
+                return True
+            if task.state not in (TaskState.PENDING, TaskState.RUNNING):
                 return False
             task.cancel_requested = True
 
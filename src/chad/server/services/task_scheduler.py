@@ -0,0 +1,236 @@
+"""Admission control for coding tasks.
+
+Every task start goes through the :class:`TaskScheduler`. A task is admitted
+at once when a global slot, a slot on its account and a slot on its provider
+are free; otherwise it waits in a priority queue (higher priority first, FIFO
+within a priority) and is admitted when a running task releases its slots.
+A queued task that is blocked only by its own account or provider does not
+hold up tasks behind it that could run. Limits are read from the config on
+every admission, so changes apply without a restart.
+
+With account balancing enabled, a task may run on another account of the
+same provider: among the accounts with a free slot, the one with the lowest
+cached session usage percentage wins.
+"""
+
+import itertools
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+from chad.util.metrics import gauge
+
+logger = logging.getLogger(__name__)
+
+# Default global limit when the config does not set one
+DEFAULT_MAX_CONCURRENT_TASKS = max(4, os.cpu_count() or 1)
+
+# Cached usage percentages older than this are ignored when balancing
+USAGE_CACHE_SECONDS = 5 * 60
+
+# Rank given to accounts with no fresh usage figure when balancing
+UNKNOWN_USAGE_PCT = 50.0
+
+TASKS_RUNNING = gauge("chad_tasks_running", "Tasks holding an admission slot")
+TASKS_QUEUED = gauge("chad_tasks_queued", "Tasks waiting for an admission slot")
+
+
+@dataclass
+class QueuedTask:
+    """A task waiting for (or holding) an admission slot."""
+
+    task_id: str
+    session_id: str
+    account: str
+    provider: str
+    # Called outside the scheduler lock with the account chosen at admission
+    start: Callable[[str], None]
+    priority: int = 0
+    # Other accounts of the same provider the task may be balanced onto
+    alternates: list[str] = field(default_factory=list)
+    # Called with (position, queue length) whenever the position changes
+    on_position: Callable[[int, int], None] | None = None
+    enqueued_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    position: int = 0
+    _seq: int = field(default=0, repr=False)
+
+
+class TaskScheduler:
+    """Limits concurrent tasks globally, per account and per provider."""
+
+    def __init__(self, config_manager=None):
+        self.config_manager = config_manager
+        self._queue: list[QueuedTask] = []
+        # task_id -> (account, provider) for admitted tasks
+        self._running: dict[str, tuple[str, str]] = {}
+        self._usage: dict[str, tuple[float, float]] = {}
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    def limits(self) -> tuple[int, int, int]:
+        """Current (global, per-account, per-provider) limits; 0 means unlimited."""
+        if self.config_manager is None:
+            return DEFAULT_MAX_CONCURRENT_TASKS, 0, 0
+        return (
+            self.config_manager.get_max_concurrent_tasks(),
+            self.config_manager.get_max_tasks_per_account(),
+            self.config_manager.get_max_tasks_per_provider(),
+        )
+
+    def balancing_enabled(self) -> bool:
+        """Whether tasks may be moved to another account of the same provider."""
+        if self.config_manager is None:
+            return False
+        return self.config_manager.get_balance_task_accounts()
+
+    def submit(self, entry: QueuedTask) -> int:
+        """Queue a task and admit whatever fits.
+
+        Returns:
+            0 if the task was admitted (its ``start`` has been called),
+            otherwise its 1-based queue position
+        """
+        with self._lock:
+            entry._seq = next(self._counter)
+            self._queue.append(entry)
+            self._queue.sort(key=lambda e: (-e.priority, e._seq))
+            admitted, moved = self._dispatch_locked()
+        self._notify(admitted, moved)
+        return entry.position
+
+    def release(self, task_id: str) -> None:
+        """Free a finished task's slots and admit queued tasks."""
+        with self._lock:
+            if self._running.pop(task_id, None) is None:
+                return
+            admitted, moved = self._dispatch_locked()
+        self._notify(admitted, moved)
+
+    def cancel(self, task_id: str) -> bool:
+        """Drop a queued task; returns False if it is not queued."""
+        with self._lock:
+            for index, entry in enumerate(self._queue):
+                if entry.task_id == task_id:
+                    del self._queue[index]
+                    break
+            else:
+                return False
+            admitted, moved = self._dispatch_locked()
+        self._notify(admitted, moved)
+        return True
+
+    def position(self, task_id: str) -> int:
+        """1-based queue position of a task (0 if it is not queued)."""
+        with self._lock:
+            for entry in self._queue:
+                if entry.task_id == task_id:
+                    return entry.position
+        return 0
+
+    def record_usage(self, account: str, percentage: float | None) -> None:
+        """Remember an account's latest session usage percentage for balancing."""
+        if percentage is None:
+            return
+        with self._lock:
+            self._usage[account] = (time.monotonic(), float(percentage))
+
+    def cached_usage(self, account: str) -> float | None:
+        """Recently recorded session usage for an account, if any."""
+        with self._lock:
+            return self._cached_usage_locked(account)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Limits, running tasks and the queue in admission order."""
+        max_concurrent, per_account, per_provider = self.limits()
+        with self._lock:
+            running = [
+                {"task_id": task_id, "account": account, "provider": provider}
+                for task_id, (account, provider) in self._running.items()
+            ]
+            queued = [
+                {
+                    "task_id": entry.task_id,
+                    "session_id": entry.session_id,
+                    "account": entry.account,
+                    "provider": entry.provider,
+                    "priority": entry.priority,
+                    "position": entry.position,
+                    "enqueued_at": entry.enqueued_at,
+                }
+                for entry in self._queue
+            ]
+        return {
+            "max_concurrent_tasks": max_concurrent,
+            "max_tasks_per_account": per_account,
+            "max_tasks_per_provider": per_provider,
+            "running": running,
+            "queued": queued,
+        }
+
+    def _cached_usage_locked(self, account: str) -> float | None:
+        cached = self._usage.get(account)
+        if cached is None or time.monotonic() - cached[0] > USAGE_CACHE_SECONDS:
+            return None
+        return cached[1]
+
+    def _pick_account_locked(self, entry: QueuedTask, per_account: int, per_provider: int) -> str | None:
+        """Account to admit ``entry`` on, or None if its slots are full."""
+        if per_provider:
+            provider_load = sum(1 for _, provider in self._running.values() if provider == entry.provider)
+            if provider_load >= per_provider:
+                return None
+        candidates = [entry.account] + [a for a in entry.alternates if a != entry.account]
+        if per_account:
+            account_load: dict[str, int] = {}
+            for account, _ in self._running.values():
+                account_load[account] = account_load.get(account, 0) + 1
+            candidates = [a for a in candidates if account_load.get(a, 0) < per_account]
+        if len(candidates) <= 1:
+            return candidates[0] if candidates else None
+
+        def rank(account: str) -> tuple[float, bool]:
+            usage = self._cached_usage_locked(account)
+            return (UNKNOWN_USAGE_PCT if usage is None else usage, account != entry.account)
+
+        return min(candidates, key=rank)
+
+    def _dispatch_locked(self) -> tuple[list[tuple[QueuedTask, str]], list[QueuedTask]]:
+        """Admit queued tasks that fit and renumber the rest."""
+        max_concurrent, per_account, per_provider = self.limits()
+        admitted: list[tuple[QueuedTask, str]] = []
+        for entry in list(self._queue):
+            if max_concurrent and len(self._running) >= max_concurrent:
+                break
+            account = self._pick_account_locked(entry, per_account, per_provider)
+            if account is None:
+                continue
+            self._queue.remove(entry)
+            self._running[entry.task_id] = (account, entry.provider)
+            entry.position = 0
+            admitted.append((entry, account))
+
+        moved = []
+        for position, entry in enumerate(self._queue, start=1):
+            if entry.position != position:
+                entry.position = position
+                moved.append(entry)
+
+        TASKS_RUNNING.set(len(self._running))
+        TASKS_QUEUED.set(len(self._queue))
+        return admitted, moved
+
+    def _notify(self, admitted: list[tuple[QueuedTask, str]], moved: list[QueuedTask]) -> None:
+        total = len(self._queue)
+        for entry in moved:
+            if entry.on_position:
+                entry.on_position(entry.position, total)
+        for entry, account in admitted:
+            try:
+                entry.start(account)
+            except Exception:
+                logger.exception("Failed to start admitted task %s", entry.task_id)
+                self.release(entry.task_id)
@@ -61,14 +61,51 @@ def _truncate_verification_output(text: str, limit: int = MAX_VERIFICATION_PROMP
     return "\n\n".join(part for part in parts if part)
 
 
+# Display names for automated verification phases in milestones
+_PHASE_LABELS = {
+    "lint": "Flake8",
+    "test": "Tests",
+    "tsc:ui": "TypeScript (ui)",
+    "tsc:client": "TypeScript (client)",
+}
+
+
+def _project_verification_config(project_path: str) -> Any:
+    """The project's saved VerificationConfig, or None."""
+    try:
+        from pathlib import Path
+        from chad.util.project_setup import _get_config_project_root, load_project_config
+
+        config = load_project_config(_get_config_project_root(Path(project_path)))
+    except Exception:
+        return None
+    return config.verification if config else None
+
+
+def _session_changed_files(git_mgr: Any, session: Any) -> list[str] | None:
+    """Files changed in the session's worktree, or None if they cannot be determined."""
+    if git_mgr is None or session is None or not getattr(session, "worktree_path", None):
+        return None
+    try:
+        files = git_mgr.get_changed_files(session.id, session.worktree_base_commit)
+    except Exception:
+        return None
+    return files if isinstance(files, list) else None
+
+
 def _run_automated_verification(
     project_path: str,
     on_activity: Callable | None = None,
     emit: Callable | None = None,
     attempt: int = 1,
+    changed_files: list[str] | None = None,
 ) -> tuple[bool, str | None]:
     """Run automated verification (flake8/linting).
 
+    When the changed files are known, only those files are linted; otherwise
+    the whole project is linted. Tests that import the changed files are run
+    as well only when the project enables ``run_tests``.
+
     Returns:
         (passed, feedback) - feedback is None on success, error string on failure
     """
@@ -77,14 +114,55 @@ def _run_automated_verification(
         if on_activity:
             on_activity("system", "Running verification (flake8)...")
 
+        config = _project_verification_config(project_path)
+        run_tests = bool(config and config.run_tests) and changed_files is not None
+        if run_tests:
+            description = f"Running lint and affected tests for {len(changed_files)} changed file(s)"
+        else:
+            description = "Running flake8 and linting checks"
         _emit_milestone(
             emit,
             "verification_automated",
-            "Running flake8 and linting checks",
+            description,
             {"attempt": attempt},
         )
 
-        verify_result = run_verify(project_root=project_path, lint_only=True)
+        def on_phase(name: str, result: dict | None) -> None:
+            # Stream each phase as it finishes rather than after the slowest one
+            if result is None:
+                if on_activity:
+                    on_activity("system", f"Verification phase started: {name}")
+                return
+            if result["passed"]:
+                status = "passed"
+            elif result["timed_out"]:
+                status = "timed out"
+            elif result["cancelled"]:
+                status = "cancelled"
+            else:
+                status = "failed"
+            output_lines = (result.get("output") or "").strip().splitlines()
+            _emit_milestone(
+                emit,
+                "verification_automated",
+                f"{_PHASE_LABELS.get(name, name)} {status} ({result['duration']:.1f}s)",
+                {
+                    "attempt": attempt,
+                    "phase": name,
+                    "status": status,
+                    "duration": result["duration"],
+                    "output": "\n".join(output_lines[-20:]),
+                },
+            )
+
+        verify_result = run_verify(
+            project_root=project_path,
+            lint_only=not run_tests,
+            changed_files=changed_files,
+            fail_fast=bool(config and config.fail_fast),
+            on_phase=on_phase,
+            test_command=config.test_command if config else None,
+        )
 
         # Treat timeout as a pass (coding agent ran their own tests)
         error_msg = verify_result.get("error") or ""
@@ -110,6 +188,11 @@ def _run_automated_verification(
                 else:
                     issues.append(f"Flake8 failed with {lint_phase.get('issue_count', 0)} errors")
 
+            tsc_phase = phases.get("tsc", {})
+            if not tsc_phase.get("success", True):
+                tsc_lines = (tsc_phase.get("output") or "").strip().splitlines()
+                issues.append("TypeScript errors:\n" + "\n".join(tsc_lines[:10]))
+
             pip_phase = phases.get("pip_check", {})
             if not pip_phase.get("success", True):
                 pip_issues = pip_phase.get("issues") or []
@@ -194,6 +277,7 @@ def run_verification(
     # Step 1: Run automated verification (flake8/linting)
     auto_passed, auto_feedback = _run_automated_verification(
         project_path, on_activity, emit=emit, attempt=attempt,
+        changed_files=_session_changed_files(git_mgr, session),
     )
     if not auto_passed:
         return False, auto_feedback or "Automated verification failed"
@@ -25,7 +25,7 @@ def enter_raw_mode():
     tty.setraw(sys.stdin.fileno())
 
 
-def poll_stdin():
-    """Non-blocking check for stdin input. Returns True if data is available."""
-    rlist, _, _ = select.select([sys.stdin], [], [], 0)
+def poll_stdin(timeout: float = 0):
+    """Check for stdin input, waiting up to ``timeout`` seconds. Returns True if data is available."""
+    rlist, _, _ = select.select([sys.stdin], [], [], timeout)
     return sys.stdin in rlist
@@ -16,10 +16,17 @@ def enter_raw_mode():
     pass
 
 
-def poll_stdin():
-    """Non-blocking check for stdin input on Windows."""
+def poll_stdin(timeout: float = 0):
+    """Check for stdin input on Windows, waiting up to ``timeout`` seconds."""
+    import time
+
     try:
         import msvcrt
-        return msvcrt.kbhit()
     except ImportError:
         return False
+    deadline = time.monotonic() + timeout
+    while not msvcrt.kbhit():
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.01)
+    return True
@@ -9,14 +9,17 @@ import sys
 import threading
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any, Callable
 
 from chad.ui.cli.terminal_io import (
     save_terminal,
     restore_terminal,
     enter_raw_mode,
+    poll_stdin,
 )
 from chad.ui.client import APIClient
-from chad.ui.client.stream_client import SyncStreamClient, decode_terminal_data
+from chad.ui.client.stream_client import SyncStreamClient, decode_terminal_data, is_remote_url
+from chad.ui.client.ws_client import TerminalInputChannel
 from chad.util.providers import is_mistral_configured
 
 
@@ -366,6 +369,7 @@ def run_settings_menu(client: APIClient) -> None:
         verification_model = client.get_preferred_verification_model()
         max_verification_attempts = client.get_max_verification_attempts()
         action_settings = client.get_action_settings()
+        task_scheduling = client.get_task_scheduling()
         try:
             slack_settings = client.get_slack_settings()
         except Exception:
@@ -379,11 +383,18 @@ def run_settings_menu(client: APIClient) -> None:
         print("Current Settings:")
         print(f"  Accounts:           {len(accounts)} configured")
         print(f"  Cleanup:            {cleanup.retention_days} days")
+        print(f"  Log Disk Budget:    {cleanup.log_quota_mb or 'unlimited'}{' MB' if cleanup.log_quota_mb else ''}")
+        print(f"  Log Retention:      {f'{cleanup.log_retention_days} days' if cleanup.log_retention_days else 'until over budget'}")
         print(f"  UI Mode:            {preferences.ui_mode}")
         print(f"  Coding Agent:       {coding_agent or '(not set)'}")
         print(f"  Verification Agent: {verification_agent_name or '(not set)'}")
         print(f"  Verification Model: {verification_model or '(auto)'}")
         print(f"  Max Verif Attempts: {max_verification_attempts}")
+        per_account = task_scheduling["max_tasks_per_account"] or "unlimited"
+        print(
+            f"  Task Slots:         {task_scheduling['max_concurrent_tasks']} total, {per_account} per account"
+            f"{', balanced' if task_scheduling['balance_accounts'] else ''}"
+        )
         print("  Action Rules:")
         print(_format_action_settings(action_settings))
         slack_status = "enabled" if slack_settings.get("enabled") else "disabled"
@@ -401,6 +412,7 @@ def run_settings_menu(client: APIClient) -> None:
         print("  [7] Slack integration")
         print("  [8] Remote access (tunnel)")
         print("  [9] Export/import config")
+        print("  [q] Task scheduling")
         print("  [b] Back to main menu")
         print()
 
@@ -430,6 +442,28 @@ def run_settings_menu(client: APIClient) -> None:
                         print("Please enter a number between 1 and 365")
             except ValueError:
                 print("Invalid number")
+            try:
+                new_quota = input("Log disk budget in MB (0 = unlimited, blank to keep): ").strip()
+                if new_quota:
+                    log_quota_mb = int(new_quota)
+                    if log_quota_mb >= 0:
+                        client.set_cleanup_settings(log_quota_mb=log_quota_mb)
+                        print(f"Log disk budget set to {log_quota_mb or 'unlimited'}{' MB' if log_quota_mb else ''}")
+                    else:
+                        print("Please enter a non-negative number")
+            except ValueError:
+                print("Invalid number")
+            try:
+                new_log_days = input("Delete session logs idle for N days (0 = never, blank to keep): ").strip()
+                if new_log_days:
+                    log_retention_days = int(new_log_days)
+                    if log_retention_days >= 0:
+                        client.set_cleanup_settings(log_retention_days=log_retention_days)
+                        print(f"Log retention set to {f'{log_retention_days} days' if log_retention_days else 'never'}")
+                    else:
+                        print("Please enter a non-negative number")
+            except ValueError:
+                print("Invalid number")
             input("Press Enter to continue...")
 
         elif choice == "3":
@@ -735,6 +769,29 @@ def run_settings_menu(client: APIClient) -> None:
                 print(f"Error: {e}")
             input("Press Enter to continue...")
 
+        elif choice == "q":
+            # Task scheduling limits
+            print()
+            print("Tasks beyond these limits wait in a queue (0 = unlimited).")
+            try:
+                new_max = input(f"Max concurrent tasks (1-64) [{task_scheduling['max_concurrent_tasks']}]: ").strip()
+                new_account = input(f"Max tasks per account [{task_scheduling['max_tasks_per_account']}]: ").strip()
+                new_provider = input(f"Max tasks per provider [{task_scheduling['max_tasks_per_provider']}]: ").strip()
+                balance = "y" if task_scheduling["balance_accounts"] else "n"
+                new_balance = input(f"Balance tasks across accounts of a provider (y/n) [{balance}]: ").strip().lower()
+                client.set_task_scheduling(
+                    max_concurrent_tasks=int(new_max) if new_max else None,
+                    max_tasks_per_account=int(new_account) if new_account else None,
+                    max_tasks_per_provider=int(new_provider) if new_provider else None,
+                    balance_accounts=(new_balance == "y") if new_balance in ("y", "n") else None,
+                )
+                print("Task scheduling updated")
+            except ValueError:
+                print("Invalid number")
+            except Exception as e:
+                print(f"Error: {e}")
+            input("Press Enter to continue...")
+
 
 def run_accounts_menu(client: APIClient) -> None:
     """Run the accounts management submenu.
@@ -862,6 +919,20 @@ def run_accounts_menu(client: APIClient) -> None:
             input("Press Enter to continue...")
 
 
+def _open_input_channel(
+    base_url: str,
+    session_id: str,
+    fallback: Callable[[bytes], Any] | None = None,
+) -> TerminalInputChannel | None:
+    """Open the WebSocket input channel for a session, or None if unavailable."""
+    channel = TerminalInputChannel(base_url, session_id, fallback=fallback)
+    try:
+        channel.connect()
+    except Exception:
+        return None
+    return channel
+
+
 def run_task_with_streaming(
     client: APIClient,
     stream_client: SyncStreamClient,
@@ -899,56 +970,41 @@ def run_task_with_streaming(
         terminal_cols=cols,
     )
 
-    milestone_since_seq = 0
-    milestone_poll_stop = threading.Event()
-
-    def _emit_milestones_once() -> None:
-        nonlocal milestone_since_seq
-        try:
-            milestones = client.get_milestones(session_id, since_seq=milestone_since_seq)
-        except Exception:
-            return
-
-        if not isinstance(milestones, list):
-            return
-
-        max_seq = milestone_since_seq
-        for milestone in milestones:
-            if not isinstance(milestone, dict):
-                continue
-
-            seq = milestone.get("seq", 0)
-            try:
-                seq_int = int(seq)
-            except (TypeError, ValueError):
-                seq_int = 0
-            if seq_int > max_seq:
-                max_seq = seq_int
-
-            summary = str(milestone.get("summary", "")).strip()
-            if not summary:
-                continue
-
-            title = str(milestone.get("title", "")).strip()
-            line = f"\r\n[MILESTONE] {title}: {summary}\r\n"
-            os.write(sys.stdout.fileno(), line.encode("utf-8", errors="replace"))
-
-        milestone_since_seq = max_seq
-
-    def _milestone_poll_loop() -> None:
-        while not milestone_poll_stop.is_set():
-            _emit_milestones_once()
-            milestone_poll_stop.wait(0.5)
-
-    _emit_milestones_once()
-    milestone_poll_thread = threading.Thread(target=_milestone_poll_loop, daemon=True)
-    milestone_poll_thread.start()
-
     # Save terminal state
     old_settings = save_terminal()
 
     exit_code = 0
 
+    # Interactive terminals forward keystrokes and resizes over one persistent
+    # WebSocket; the per-call HTTP endpoints remain the fallback.
+    input_channel = None
+    if old_settings:
+        input_channel = _open_input_channel(
+            client.base_url,
+            session_id,
+            fallback=lambda data: stream_client.send_input(session_id, data),
+        )
+    stdin_stop = threading.Event()
+
+    def forward_stdin():
+        """Relay raw keystrokes to the agent's PTY."""
+        fd = sys.stdin.fileno()
+        while not stdin_stop.is_set():
+            try:
+                if not poll_stdin(0.1):
+                    continue
+                data = os.read(fd, 1024)
+            except (OSError, ValueError):
+                return
+            if not data:
+                return
+            if input_channel is None or not input_channel.send_input(data):
+                stream_client.send_input(session_id, data)
+
+    stdin_thread = None
+    if old_settings:
+        stdin_thread = threading.Thread(target=forward_stdin, name="chad-stdin", daemon=True)
+
     # Track if we need to send resize
     resize_pending = False
 
@@ -968,17 +1024,20 @@ def run_task_with_streaming(
         # Set terminal to raw mode for passthrough
         if old_settings:
             enter_raw_mode()
+        if stdin_thread:
+            stdin_thread.start()
 
-        # Stream events and relay I/O
-        for event in stream_client.stream_events(session_id, include_terminal=True):
+        # Stream terminal output and milestones and relay I/O
+        for event in stream_client.stream_events(session_id, types="terminal,milestone"):
             # Check for pending resize
             if resize_pending:
                 resize_pending = False
                 new_rows, new_cols = get_terminal_size()
-                try:
-                    stream_client.resize_terminal(session_id, new_rows, new_cols)
-                except Exception:
-                    pass  # Best effort resize
+                if input_channel is None or not input_channel.resize(new_rows, new_cols):
+                    try:
+                        stream_client.resize_terminal(session_id, new_rows, new_cols)
+                    except Exception:
+                        pass  # Best effort resize
 
             if event.event_type == "terminal":
                 # Write terminal output
@@ -988,6 +1047,13 @@ def run_task_with_streaming(
                 )
                 os.write(sys.stdout.fileno(), data)
 
+            elif event.event_type == "event" and event.data.get("type") == "milestone":
+                summary = str(event.data.get("summary", "")).strip()
+                if summary:
+                    title = str(event.data.get("title", "")).strip()
+                    line = f"\r\n[MILESTONE] {title}: {summary}\r\n"
+                    os.write(sys.stdout.fileno(), line.encode("utf-8", errors="replace"))
+
             elif event.event_type == "complete":
                 exit_code = event.data.get("exit_code", 0)
                 break
@@ -1000,9 +1066,11 @@ def run_task_with_streaming(
                 break
 
     finally:
-        milestone_poll_stop.set()
-        milestone_poll_thread.join(timeout=1.0)
-        _emit_milestones_once()
+        stdin_stop.set()
+        if stdin_thread and stdin_thread.is_alive():
+            stdin_thread.join(timeout=1.0)
+        if input_channel:
+            input_channel.close()
 
         # Restore SIGWINCH handler
         if old_sigwinch is not None:
@@ -1023,7 +1091,7 @@ def run_cli(client: APIClient) -> None:
     Args:
         client: API client instance
     """
-    stream_client = SyncStreamClient(base_url=client.base_url)
+    stream_client = SyncStreamClient(base_url=client.base_url, compress=is_remote_url(client.base_url))
 
     try:
         while True:
@@ -1,7 +1,7 @@
 """API and WebSocket clients for Chad."""
 
 from chad.ui.client.api_client import APIClient
-from chad.ui.client.ws_client import WSClient, AsyncWSClient, StreamingTaskClient
+from chad.ui.client.ws_client import WSClient, AsyncWSClient, StreamingTaskClient, TerminalInputChannel
 from chad.ui.client.stream_client import StreamClient, SyncStreamClient, StreamEvent, decode_terminal_data
 
 __all__ = [
@@ -9,6 +9,7 @@ __all__ = [
     "WSClient",
     "AsyncWSClient",
     "StreamingTaskClient",
+    "TerminalInputChannel",
     "StreamClient",
     "SyncStreamClient",
     "StreamEvent",
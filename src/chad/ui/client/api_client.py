@@ -94,6 +94,8 @@ class CleanupSettings:
 
     retention_days: int
     auto_cleanup: bool
+    log_quota_mb: int | None = None
+    log_retention_days: int | None = None
 
 
 class APIClient:
@@ -540,12 +542,16 @@ class APIClient:
         return CleanupSettings(
             retention_days=data.get("cleanup_days", 7),
             auto_cleanup=data.get("auto_cleanup", True),
+            log_quota_mb=data.get("log_quota_mb"),
+            log_retention_days=data.get("log_retention_days"),
         )
 
     def set_cleanup_settings(
         self,
         retention_days: int | None = None,
         auto_cleanup: bool | None = None,
+        log_quota_mb: int | None = None,
+        log_retention_days: int | None = None,
     ) -> CleanupSettings:
         """Update cleanup settings."""
         data = {}
@@ -553,6 +559,10 @@ class APIClient:
             data["cleanup_days"] = retention_days
         if auto_cleanup is not None:
             data["auto_cleanup"] = auto_cleanup
+        if log_quota_mb is not None:
+            data["log_quota_mb"] = log_quota_mb
+        if log_retention_days is not None:
+            data["log_retention_days"] = log_retention_days
 
         resp = self._client.put(self._url("/config/cleanup"), json=data)
         resp.raise_for_status()
@@ -560,6 +570,8 @@ class APIClient:
         return CleanupSettings(
             retention_days=result.get("cleanup_days", 7),
             auto_cleanup=result.get("auto_cleanup", True),
+            log_quota_mb=result.get("log_quota_mb"),
+            log_retention_days=result.get("log_retention_days"),
         )
 
     def get_preferences(self) -> "Preferences":
@@ -760,6 +772,44 @@ class APIClient:
         resp.raise_for_status()
         return resp.json().get("attempts", attempts)
 
+    def get_task_scheduling(self) -> dict:
+        """Get the task admission limits.
+
+        Returns:
+            Dict with max_concurrent_tasks, max_tasks_per_account,
+            max_tasks_per_provider and balance_accounts
+        """
+        resp = self._client.get(self._url("/config/task-scheduling"))
+        resp.raise_for_status()
+        return resp.json()
+
+    def set_task_scheduling(
+        self,
+        max_concurrent_tasks: int | None = None,
+        max_tasks_per_account: int | None = None,
+        max_tasks_per_provider: int | None = None,
+        balance_accounts: bool | None = None,
+    ) -> dict:
+        """Update the task admission limits (only the given fields change)."""
+        data: dict = {}
+        if max_concurrent_tasks is not None:
+            data["max_concurrent_tasks"] = max_concurrent_tasks
+        if max_tasks_per_account is not None:
+            data["max_tasks_per_account"] = max_tasks_per_account
+        if max_tasks_per_provider is not None:
+            data["max_tasks_per_provider"] = max_tasks_per_provider
+        if balance_accounts is not None:
+            data["balance_accounts"] = balance_accounts
+        resp = self._client.put(self._url("/config/task-scheduling"), json=data)
+        resp.raise_for_status()
+        return resp.json()
+
+    def get_task_queue(self) -> dict:
+        """Get running tasks and the admission queue across all sessions."""
+        resp = self._client.get(self._url("/tasks/queue"))
+        resp.raise_for_status()
+        return resp.json()
+
     def get_slack_settings(self) -> dict:
         """Get Slack integration settings.
 
@@ -1,15 +1,41 @@
-"""Unified streaming client for SSE and WebSocket connections."""
+"""Unified streaming client for SSE and WebSocket connections.
+
+``stream_events`` reconnects on its own: the clients remember the seq of the
+last EventLog-backed message (``event`` and ``terminal``), and after a dropped
+connection they wait a jittered, exponentially growing delay and resume with
+``since_seq`` plus the ``Last-Event-ID`` header. Streams end for good on a
+``complete`` or ``error`` message or a 4xx response.
+"""
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import json
+import random
 import re
+import time
 from dataclasses import dataclass
 from typing import Any, AsyncIterator, Iterator
+from urllib.parse import urlsplit
 
 import httpx
 
+from chad.util.stream_encoding import supported_encodings
+
+# First reconnect delay; doubled per consecutive failure up to the maximum
+RECONNECT_INITIAL_DELAY = 0.5
+RECONNECT_MAX_DELAY = 15.0
+
+# Consecutive failed connection attempts before giving up (None = forever)
+MAX_RECONNECTS = 10
+
+# Message types whose seq is an EventLog position a stream can resume from
+_RESUMABLE_TYPES = {"event", "terminal"}
+
+# Message types after which the server closes the stream for good
+_FINAL_TYPES = {"complete", "error"}
+
 
 @dataclass
 class StreamEvent:
@@ -20,16 +46,131 @@ class StreamEvent:
     seq: int | None = None
 
 
+class SSEParser:
+    """Incremental parser for a ``text/event-stream`` body.
+
+    Lines are scanned with ``str.find`` from a moving offset and the unread
+    tail is kept once per chunk, so large bursts parse in linear time.
+    """
+
+    def __init__(self) -> None:
+        self._pending: list[str] = []
+        self._event = ""
+        self._data: list[str] = []
+        self._id: str | None = None
+
+    def feed(self, chunk: str) -> list[StreamEvent]:
+        """Parse a chunk of the body and return the events it completes."""
+        if "\n" not in chunk:
+            self._pending.append(chunk)
+            return []
+        if self._pending:
+            self._pending.append(chunk)
+            buffer = "".join(self._pending)
+            self._pending = []
+        else:
+            buffer = chunk
+
+        events: list[StreamEvent] = []
+        start = 0
+        while True:
+            end = buffer.find("\n", start)
+            if end < 0:
+                break
+            line = buffer[start:end]
+            start = end + 1
+            if line.endswith("\r"):
+                line = line[:-1]
+            event = self._line(line)
+            if event is not None:
+                events.append(event)
+        if start < len(buffer):
+            self._pending.append(buffer[start:])
+        return events
+
+    def _line(self, line: str) -> StreamEvent | None:
+        if not line:
+            return self._dispatch()
+        field, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+        if field == "event":
+            self._event = value
+        elif field == "data":
+            self._data.append(value)
+        elif field == "id":
+            self._id = value
+        return None
+
+    def _dispatch(self) -> StreamEvent | None:
+        event_type, data_lines, event_id = self._event, self._data, self._id
+        self._event, self._data, self._id = "", [], None
+        if not event_type or not data_lines:
+            return None
+        try:
+            data = json.loads("\n".join(data_lines))
+        except json.JSONDecodeError:
+            return None
+        seq = data.get("seq") if isinstance(data, dict) else None
+        if seq is None and event_id and event_id.isdigit():
+            seq = int(event_id)
+        return StreamEvent(event_type=event_type, data=data, seq=seq)
+
+
+def reconnect_delay(attempt: int) -> float:
+    """Delay before reconnect ``attempt`` (1-based): exponential with jitter."""
+    ceiling = min(RECONNECT_MAX_DELAY, RECONNECT_INITIAL_DELAY * (2 ** (attempt - 1)))
+    return ceiling / 2 + random.uniform(0, ceiling / 2)
+
+
+def _stream_request(
+    since_seq: int,
+    include_terminal: bool,
+    types: str | None = None,
+    compress: bool = False,
+) -> tuple[dict, dict]:
+    """Query params and headers for a (re)connect from ``since_seq``."""
+    params = {
+        "since_seq": since_seq,
+        "include_terminal": str(include_terminal).lower(),
+    }
+    if types is not None:
+        params["types"] = types
+    # httpx offers gzip by default; streams are only compressed on request
+    headers = {
+        "Accept": "text/event-stream",
+        "Accept-Encoding": ", ".join(supported_encodings()) if compress else "identity",
+    }
+    if since_seq:
+        headers["Last-Event-ID"] = str(since_seq)
+    return params, headers
+
+
+def is_remote_url(base_url: str) -> bool:
+    """Whether a server URL points off this machine (compression pays off)."""
+    host = urlsplit(str(base_url)).hostname
+    return host not in (None, "localhost", "127.0.0.1", "::1")
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Transport failures and 5xx responses are retried; 4xx are not."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code >= 500
+    return isinstance(error, httpx.TransportError)
+
+
 class StreamClient:
     """Client for streaming API endpoints (SSE and input)."""
 
-    def __init__(self, base_url: str = "http://localhost:3184"):
+    def __init__(self, base_url: str = "http://localhost:3184", compress: bool = False):
         """Initialize the stream client.
 
         Args:
             base_url: Base URL of the Chad server
+            compress: Ask for a compressed event stream (worth it over remote links)
         """
         self.base_url = base_url.rstrip("/")
+        self.compress = compress
         self._async_client: httpx.AsyncClient | None = None
 
     async def _get_async_client(self) -> httpx.AsyncClient:
@@ -53,60 +194,54 @@ class StreamClient:
         session_id: str,
         since_seq: int = 0,
         include_terminal: bool = True,
+        types: str | None = None,
+        reconnect: bool = True,
+        max_reconnects: int | None = MAX_RECONNECTS,
     ) -> AsyncIterator[StreamEvent]:
-        """Stream events from a session via SSE.
+        """Stream events from a session via SSE, reconnecting when dropped.
 
         Args:
             session_id: Session to stream from
             since_seq: Resume from this sequence number
             include_terminal: Include raw PTY output
+            types: Server-side filter such as "milestone,terminal" (overrides include_terminal)
+            reconnect: Reconnect and resume after a dropped connection
+            max_reconnects: Consecutive failed attempts before re-raising
 
         Yields:
             StreamEvent objects
         """
         client = await self._get_async_client()
         url = self._url(f"/sessions/{session_id}/stream")
-        params = {
-            "since_seq": since_seq,
-            "include_terminal": str(include_terminal).lower(),
-        }
-
-        async with client.stream("GET", url, params=params) as response:
-            response.raise_for_status()
-
-            buffer = ""
-            current_event = ""
-            current_data = ""
-
-            async for chunk in response.aiter_text():
-                buffer += chunk
-
-                while "\n" in buffer:
-                    line, buffer = buffer.split("\n", 1)
-                    line = line.strip()
-
-                    if line.startswith("event:"):
-                        current_event = line[6:].strip()
-                    elif line.startswith("data:"):
-                        current_data = line[5:].strip()
-                    elif line.startswith("id:"):
-                        # Event ID
-                        pass
-                    elif line == "" and current_event and current_data:
-                        # End of event
-                        try:
-                            data = json.loads(current_data)
-                            seq = data.get("seq")
-                            yield StreamEvent(
-                                event_type=current_event,
-                                data=data,
-                                seq=seq,
-                            )
-                        except json.JSONDecodeError:
-                            pass
-
-                        current_event = ""
-                        current_data = ""
+        last_seq = since_seq
+        failures = 0
+
+        while True:
+            params, headers = _stream_request(last_seq, include_terminal, types, self.compress)
+            try:
+                async with client.stream("GET", url, params=params, headers=headers) as response:
+                    response.raise_for_status()
+                    parser = SSEParser()
+                    async for chunk in response.aiter_text():
+                        for event in parser.feed(chunk):
+                            failures = 0
+                            if event.seq is not None and event.event_type in _RESUMABLE_TYPES:
+                                last_seq = max(last_seq, event.seq)
+                            yield event
+                            if event.event_type in _FINAL_TYPES:
+                                return
+                error: Exception | None = None
+            except (httpx.TransportError, httpx.HTTPStatusError) as e:
+                if not _is_retryable(e):
+                    raise
+                error = e
+
+            failures += 1
+            if not reconnect or (max_reconnects is not None and failures > max_reconnects):
+                if error is not None:
+                    raise error
+                return
+            await asyncio.sleep(reconnect_delay(failures))
 
     async def send_input(self, session_id: str, data: bytes) -> bool:
         """Send input to the PTY session.
@@ -159,13 +294,15 @@ class StreamClient:
 class SyncStreamClient:
     """Synchronous wrapper around StreamClient for non-async code."""
 
-    def __init__(self, base_url: str = "http://localhost:3184"):
+    def __init__(self, base_url: str = "http://localhost:3184", compress: bool = False):
         """Initialize the sync stream client.
 
         Args:
             base_url: Base URL of the Chad server
+            compress: Ask for a compressed event stream (worth it over remote links)
         """
         self.base_url = base_url.rstrip("/")
+        self.compress = compress
         self._sync_client = httpx.Client(timeout=None)
 
     def close(self):
@@ -181,57 +318,53 @@ class SyncStreamClient:
         session_id: str,
         since_seq: int = 0,
         include_terminal: bool = True,
+        types: str | None = None,
+        reconnect: bool = True,
+        max_reconnects: int | None = MAX_RECONNECTS,
     ) -> Iterator[StreamEvent]:
-        """Stream events from a session via SSE (blocking).
+        """Stream events from a session via SSE (blocking), reconnecting when dropped.
 
         Args:
             session_id: Session to stream from
             since_seq: Resume from this sequence number
             include_terminal: Include raw PTY output
+            types: Server-side filter such as "milestone,terminal" (overrides include_terminal)
+            reconnect: Reconnect and resume after a dropped connection
+            max_reconnects: Consecutive failed attempts before re-raising
 
         Yields:
             StreamEvent objects
         """
         url = self._url(f"/sessions/{session_id}/stream")
-        params = {
-            "since_seq": since_seq,
-            "include_terminal": str(include_terminal).lower(),
-        }
-
-        with self._sync_client.stream("GET", url, params=params) as response:
-            response.raise_for_status()
-
-            buffer = ""
-            current_event = ""
-            current_data = ""
-
-            for chunk in response.iter_text():
-                buffer += chunk
-
-                while "\n" in buffer:
-                    line, buffer = buffer.split("\n", 1)
-                    line = line.strip()
-
-                    if line.startswith("event:"):
-                        current_event = line[6:].strip()
-                    elif line.startswith("data:"):
-                        current_data = line[5:].strip()
-                    elif line.startswith("id:"):
-                        pass
-                    elif line == "" and current_event and current_data:
-                        try:
-                            data = json.loads(current_data)
-                            seq = data.get("seq")
-                            yield StreamEvent(
-                                event_type=current_event,
-                                data=data,
-                                seq=seq,
-                            )
-                        except json.JSONDecodeError:
-                            pass
-
-                        current_event = ""
-                        current_data = ""
+        last_seq = since_seq
+        failures = 0
+
+        while True:
+            params, headers = _stream_request(last_seq, include_terminal, types, self.compress)
+            try:
+                with self._sync_client.stream("GET", url, params=params, headers=headers) as response:
+                    response.raise_for_status()
+                    parser = SSEParser()
+                    for chunk in response.iter_text():
+                        for event in parser.feed(chunk):
+                            failures = 0
+                            if event.seq is not None and event.event_type in _RESUMABLE_TYPES:
+                                last_seq = max(last_seq, event.seq)
+                            yield event
+                            if event.event_type in _FINAL_TYPES:
+                                return
+                error: Exception | None = None
+            except (httpx.TransportError, httpx.HTTPStatusError) as e:
+                if not _is_retryable(e):
+                    raise
+                error = e
+
+            failures += 1
+            if not reconnect or (max_reconnects is not None and failures > max_reconnects):
+                if error is not None:
+                    raise error
+                return
+            time.sleep(reconnect_delay(failures))
 
     def send_input(self, session_id: str, data: bytes) -> bool:
         """Send input to the PTY session (blocking).
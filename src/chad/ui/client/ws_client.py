@@ -2,12 +2,30 @@
 
 import asyncio
 import json
+import socket
+import threading
+import time
 from dataclasses import dataclass
 from typing import Any, Callable
 
 import websockets
 from websockets.sync.client import connect as sync_connect
 
+# Keystrokes arriving within this window are sent as one frame
+INPUT_COALESCE_SECONDS = 0.004
+
+# A batch this large is sent without waiting out the coalescing window
+INPUT_MAX_BATCH_BYTES = 4096
+
+
+def _to_ws_url(base_url: str) -> str:
+    """Convert an http(s) base URL to ws(s)."""
+    if base_url.startswith("http://"):
+        base_url = "ws://" + base_url[7:]
+    elif base_url.startswith("https://"):
+        base_url = "wss://" + base_url[8:]
+    return base_url.rstrip("/")
+
 
 @dataclass
 class StreamMessage:
@@ -21,18 +39,15 @@ class StreamMessage:
 class WSClient:
     """Synchronous WebSocket client for task streaming."""
 
-    def __init__(self, base_url: str = "ws://localhost:3184"):
+    def __init__(self, base_url: str = "ws://localhost:3184", compress: bool = False):
         """Initialize the WebSocket client.
 
         Args:
             base_url: Base WebSocket URL of the Chad server
+            compress: Offer permessage-deflate (worth it over remote links)
         """
-        # Convert http:// to ws://
-        if base_url.startswith("http://"):
-            base_url = "ws://" + base_url[7:]
-        elif base_url.startswith("https://"):
-            base_url = "wss://" + base_url[8:]
-        self.base_url = base_url.rstrip("/")
+        self.base_url = _to_ws_url(base_url)
+        self.compress = compress
         self._ws = None
         self._session_id = None
 
@@ -43,7 +58,7 @@ class WSClient:
             session_id: The session ID to connect to
         """
         url = f"{self.base_url}/api/v1/ws/{session_id}"
-        self._ws = sync_connect(url)
+        self._ws = sync_connect(url, compression="deflate" if self.compress else None)
         self._session_id = session_id
 
     def disconnect(self) -> None:
@@ -124,25 +139,22 @@ class WSClient:
 class AsyncWSClient:
     """Async WebSocket client for task streaming."""
 
-    def __init__(self, base_url: str = "ws://localhost:3184"):
+    def __init__(self, base_url: str = "ws://localhost:3184", compress: bool = False):
         """Initialize the WebSocket client.
 
         Args:
             base_url: Base WebSocket URL of the Chad server
+            compress: Offer permessage-deflate (worth it over remote links)
         """
-        # Convert http:// to ws://
-        if base_url.startswith("http://"):
-            base_url = "ws://" + base_url[7:]
-        elif base_url.startswith("https://"):
-            base_url = "wss://" + base_url[8:]
-        self.base_url = base_url.rstrip("/")
+        self.base_url = _to_ws_url(base_url)
+        self.compress = compress
         self._ws = None
         self._session_id = None
 
     async def connect(self, session_id: str) -> None:
         """Connect to the WebSocket for a session."""
         url = f"{self.base_url}/api/v1/ws/{session_id}"
-        self._ws = await websockets.connect(url)
+        self._ws = await websockets.connect(url, compression="deflate" if self.compress else None)
         self._session_id = session_id
 
     async def disconnect(self) -> None:
@@ -200,6 +212,150 @@ class AsyncWSClient:
                     break
 
 
+class TerminalInputChannel:
+    """Persistent low-latency input channel to a session's PTY.
+
+    Opens ``/ws/{session_id}?stream=false`` (an input-only socket that gets no
+    events) and sends keystrokes as binary frames. Writes arriving within
+    ``coalesce_seconds`` of the first pending byte are batched into one frame,
+    Nagle-style, so typing costs one small frame per burst instead of one HTTP
+    request per keystroke. Resizes go out as JSON frames; only the latest
+    pending size is sent. If a send fails, the unsent input is handed to
+    ``fallback`` before the channel starts refusing input, so no keystrokes
+    are lost or reordered.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        session_id: str,
+        coalesce_seconds: float = INPUT_COALESCE_SECONDS,
+        max_batch_bytes: int = INPUT_MAX_BATCH_BYTES,
+        fallback: Callable[[bytes], Any] | None = None,
+    ):
+        """Initialize the input channel.
+
+        Args:
+            base_url: Base URL of the Chad server (http(s) or ws(s))
+            session_id: Session whose PTY receives the input
+            coalesce_seconds: Batching window for keystrokes
+            max_batch_bytes: Send immediately once this many bytes are pending
+            fallback: Delivers input the socket failed to send (e.g. over HTTP)
+        """
+        self.base_url = _to_ws_url(base_url)
+        self.session_id = session_id
+        self.coalesce_seconds = coalesce_seconds
+        self.max_batch_bytes = max_batch_bytes
+        self._fallback = fallback
+        self._ws = None
+        self._buffer = bytearray()
+        self._resize: tuple[int, int] | None = None
+        self._cond = threading.Condition()
+        self._closed = False
+        self._failed = False
+        self._thread: threading.Thread | None = None
+
+    def connect(self, timeout: float = 5.0) -> None:
+        """Open the socket and start the sender thread (raises on failure)."""
+        url = f"{self.base_url}/api/v1/ws/{self.session_id}?stream=false"
+        self._ws = sync_connect(url, open_timeout=timeout, compression=None)
+        try:
+            # Batching happens here; don't let the kernel delay frames further
+            self._ws.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except (AttributeError, OSError):
+            pass
+        self._thread = threading.Thread(target=self._run, name="chad-input-channel", daemon=True)
+        self._thread.start()
+
+    @property
+    def connected(self) -> bool:
+        """Whether input can still be sent over the channel."""
+        return self._ws is not None and not self._closed and not self._failed
+
+    def send_input(self, data: bytes) -> bool:
+        """Queue bytes for the PTY; returns False if the channel is unusable."""
+        with self._cond:
+            if not self.connected:
+                return False
+            self._buffer += data
+            self._cond.notify()
+        return True
+
+    def resize(self, rows: int, cols: int) -> bool:
+        """Queue a terminal resize; returns False if the channel is unusable."""
+        with self._cond:
+            if not self.connected:
+                return False
+            self._resize = (rows, cols)
+            self._cond.notify()
+        return True
+
+    def close(self) -> None:
+        """Flush pending input and close the socket."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        if self._thread:
+            self._thread.join(timeout=2)
+            self._thread = None
+        if self._ws:
+            try:
+                self._ws.close()
+            except Exception:
+                pass
+            self._ws = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _next_batch(self) -> tuple[bytes, tuple[int, int] | None] | None:
+        """Wait for pending input, let it coalesce, and take it (None when closed)."""
+        with self._cond:
+            while not self._buffer and self._resize is None:
+                if self._closed:
+                    return None
+                self._cond.wait()
+            if self._buffer and not self._closed:
+                deadline = time.monotonic() + self.coalesce_seconds
+                while len(self._buffer) < self.max_batch_bytes and not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+            data = bytes(self._buffer)
+            self._buffer.clear()
+            resize, self._resize = self._resize, None
+            return data, resize
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            data, resize = batch
+            try:
+                if resize is not None:
+                    self._ws.send(json.dumps({"type": "resize", "rows": resize[0], "cols": resize[1]}))
+                if data:
+                    self._ws.send(data)
+            except Exception:
+                with self._cond:
+                    self._failed = True
+                    unsent = data + bytes(self._buffer)
+                    self._buffer.clear()
+                    # Delivered under the lock: callers rejected by send_input
+                    # from now on wait, so their input follows this batch.
+                    if unsent and self._fallback is not None:
+                        try:
+                            self._fallback(unsent)
+                        except Exception:
+                            pass
+                return
+
+
 class StreamingTaskClient:
     """High-level client for running tasks with streaming output.
 
@@ -55,22 +55,55 @@ def cleanup_old_worktrees(project_path: Path, days: int) -> list[str]:
     return cleaned
 
 
+def cleanup_orphaned_artifacts() -> list[str]:
+    """Garbage-collect artifacts no longer referenced by any session event log.
+
+    Blobs in the shared artifact store are removed once every session that
+    referenced them has had its log deleted. Legacy per-session artifact
+    directories are removed together with their session log.
+
+    Returns:
+        List of removed artifact paths, relative to the event log directory
+    """
+    from chad.util.event_log import ArtifactStore, EventLog
+
+    event_log_dir = EventLog.get_log_dir()
+    if not event_log_dir.exists():
+        return []
+
+    live_sessions = EventLog.list_sessions(event_log_dir)
+    cleaned = ArtifactStore(event_log_dir / "blobs").collect_garbage(live_sessions)
+
+    legacy_dir = event_log_dir / "artifacts"
+    if legacy_dir.is_dir():
+        live = set(live_sessions)
+        for session_dir in legacy_dir.iterdir():
+            if session_dir.is_dir() and session_dir.name not in live:
+                shutil.rmtree(session_dir, ignore_errors=True)
+                cleaned.append(f"artifacts/{session_dir.name}/")
+
+    return cleaned
+
+
 def cleanup_old_logs(days: int) -> list[str]:
     """Remove session logs older than N days.
 
+    Also garbage-collects artifacts whose referencing sessions are all gone.
+
     Args:
         days: Number of days after which to clean up
 
     Returns:
-        List of cleaned up log filenames
+        List of cleaned up log filenames and artifact paths
     """
+    cleaned = cleanup_orphaned_artifacts()
+
     log_dir = Path(os.environ.get("CHAD_SESSION_LOG_DIR", "")) or (
         Path(tempfile.gettempdir()) / "chad"
     )
     if not log_dir.exists():
-        return []
+        return cleaned
 
-    cleaned = []
     for log_file in log_dir.glob("chad_session_*.json"):
         if _is_older_than_days(log_file, days):
             try:
@@ -24,6 +24,8 @@ CONFIG_BASE_KEYS: set[str] = {
     "verification_agent",
     "preferred_verification_model",
     "cleanup_days",
+    "log_quota_mb",  # Disk budget for ~/.chad/logs in MB (0 = unlimited)
+    "log_retention_days",  # Prune session logs idle longer than this many days (0 = never)
     "ui_mode",
     "projects",  # Per-project settings keyed by absolute project path
     "action_settings",  # List of {event, threshold, action, target_account?} for usage actions
@@ -31,6 +33,10 @@ CONFIG_BASE_KEYS: set[str] = {
     "mock_run_duration_seconds",  # Dict of account_name -> 0-3600 mock run duration for handover testing
     "mock_session_reset_time",  # Dict of account_name -> ISO 8601 datetime for mock session reset
     "max_verification_attempts",  # Maximum verification attempts before giving up (default 5)
+    "max_concurrent_tasks",  # Tasks admitted at once across all sessions; more are queued
+    "max_tasks_per_account",  # Concurrent tasks per coding account (0 = unlimited)
+    "max_tasks_per_provider",  # Concurrent tasks per provider type (0 = unlimited)
+    "balance_task_accounts",  # Let the scheduler move tasks to the least-used account of a provider
     "verification_enabled",  # Whether verification is enabled (default True)
     "slack_enabled",       # Whether Slack integration is active
     "slack_bot_token",     # Encrypted Slack bot token (xoxb-...)
@@ -793,6 +799,48 @@ class ConfigManager:
         config["cleanup_days"] = days
         self.save_config(config)
 
+    def get_log_quota_mb(self) -> int:
+        """Get the disk budget for session logs, artifacts and uploads.
+
+        Returns:
+            Budget in megabytes (default 5120, 0 means unlimited)
+        """
+        config = self.load_config()
+        return config.get("log_quota_mb", 5120)
+
+    def set_log_quota_mb(self, quota_mb: int) -> None:
+        """Set the disk budget for session logs, artifacts and uploads.
+
+        Args:
+            quota_mb: Budget in megabytes (0 disables the quota)
+        """
+        if quota_mb < 0:
+            raise ValueError("log_quota_mb must not be negative")
+        config = self.load_config()
+        config["log_quota_mb"] = quota_mb
+        self.save_config(config)
+
+    def get_log_retention_days(self) -> int:
+        """Get the idle age after which session logs are pruned.
+
+        Returns:
+            Number of days (default 0, meaning logs are only pruned by the disk budget)
+        """
+        config = self.load_config()
+        return config.get("log_retention_days", 0)
+
+    def set_log_retention_days(self, days: int) -> None:
+        """Set the idle age after which session logs are pruned.
+
+        Args:
+            days: Number of days (0 disables age-based pruning)
+        """
+        if days < 0:
+            raise ValueError("log_retention_days must not be negative")
+        config = self.load_config()
+        config["log_retention_days"] = days
+        self.save_config(config)
+
     def get_ui_mode(self) -> str:
         """Get the UI mode preference.
 
@@ -1064,6 +1112,85 @@ class ConfigManager:
         config["max_verification_attempts"] = attempts
         self.save_config(config)
 
+    def get_max_concurrent_tasks(self) -> int:
+        """Get how many tasks may run at once across all sessions.
+
+        Returns:
+            Maximum concurrent tasks (default max(4, CPU count))
+        """
+        import os
+
+        config = self.load_config()
+        return config.get("max_concurrent_tasks", max(4, os.cpu_count() or 1))
+
+    def set_max_concurrent_tasks(self, limit: int) -> None:
+        """Set how many tasks may run at once; further tasks are queued.
+
+        Args:
+            limit: Maximum concurrent tasks (1-64)
+
+        Raises:
+            ValueError: If limit is not between 1 and 64
+        """
+        if not 1 <= limit <= 64:
+            raise ValueError("max_concurrent_tasks must be between 1 and 64")
+        config = self.load_config()
+        config["max_concurrent_tasks"] = limit
+        self.save_config(config)
+
+    def get_max_tasks_per_account(self) -> int:
+        """Get how many tasks may run at once on one coding account.
+
+        Returns:
+            Per-account limit (default 0, meaning unlimited)
+        """
+        config = self.load_config()
+        return config.get("max_tasks_per_account", 0)
+
+    def set_max_tasks_per_account(self, limit: int) -> None:
+        """Set how many tasks may run at once on one coding account.
+
+        Args:
+            limit: Per-account limit (0 disables the limit)
+        """
+        if limit < 0:
+            raise ValueError("max_tasks_per_account must not be negative")
+        config = self.load_config()
+        config["max_tasks_per_account"] = limit
+        self.save_config(config)
+
+    def get_max_tasks_per_provider(self) -> int:
+        """Get how many tasks may run at once on one provider type.
+
+        Returns:
+            Per-provider limit (default 0, meaning unlimited)
+        """
+        config = self.load_config()
+        return config.get("max_tasks_per_provider", 0)
+
+    def set_max_tasks_per_provider(self, limit: int) -> None:
+        """Set how many tasks may run at once on one provider type.
+
+        Args:
+            limit: Per-provider limit (0 disables the limit)
+        """
+        if limit < 0:
+            raise ValueError("max_tasks_per_provider must not be negative")
+        config = self.load_config()
+        config["max_tasks_per_provider"] = limit
+        self.save_config(config)
+
+    def get_balance_task_accounts(self) -> bool:
+        """Get whether tasks may run on the least-used account of their provider."""
+        config = self.load_config()
+        return bool(config.get("balance_task_accounts", False))
+
+    def set_balance_task_accounts(self, enabled: bool) -> None:
+        """Set whether tasks may run on the least-used account of their provider."""
+        config = self.load_config()
+        config["balance_task_accounts"] = bool(enabled)
+        self.save_config(config)
+
     def get_slack_enabled(self) -> bool:
         """Get whether Slack integration is enabled."""
         config = self.load_config()
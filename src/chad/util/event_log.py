@@ -1,19 +1,32 @@
 """Structured event logging for session handovers.
 
 Events are stored as JSONL (one JSON object per line) in ~/.chad/logs/{session_id}.jsonl
-Large artifacts (stdout/stderr >10KB) are stored separately in ~/.chad/logs/artifacts/
+Large artifacts (stdout/stderr >10KB) are stored gzip-compressed in a content-addressed
+blob store shared by all sessions at ~/.chad/logs/blobs/
+Finished sessions are compacted into a cold tier of independently-compressed gzip
+frames ({session_id}.jsonl.gz) with a seq index ({session_id}.jsonl.idx).
 """
 
 from __future__ import annotations
 
+import bisect
+import gzip
 import hashlib
 import json
 import os
+import shutil
+import threading
+import time
 import uuid
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Literal
+from typing import IO, Any, Iterable, Iterator, Literal
+
+from filelock import FileLock, Timeout
+
+from chad.util.metrics import counter, histogram
+from chad.util.session_index import INDEXED_EVENT_TYPES, get_session_index
 
 
 # Event types
@@ -283,6 +296,155 @@ ARTIFACT_SIZE_THRESHOLD = 10 * 1024
 # Maximum artifact size (10MB)
 MAX_ARTIFACT_SIZE = 10 * 1024 * 1024
 
+# Cold-tier layout: events per gzip frame, and file suffixes
+COLD_FRAME_EVENTS = 256
+LOG_SUFFIX = ".jsonl"
+COLD_LOG_SUFFIX = ".jsonl.gz"
+COLD_INDEX_SUFFIX = ".jsonl.idx"
+
+# References younger than this are never collected, so a blob written by a
+# session that has not logged its first event yet survives a concurrent cleanup.
+ARTIFACT_REF_GRACE_SECONDS = 60 * 60
+
+EVENTS_LOGGED = counter("chad_event_log_events_total", "Events appended to session logs", ("type",))
+EVENT_LOG_WRITE_SECONDS = histogram("chad_event_log_write_seconds", "Time to append one event to a session log")
+
+
+class ArtifactStore:
+    """Content-addressed, gzip-compressed blob store shared by all sessions.
+
+    Blobs live at ``<root>/<sha[:2]>/<sha>.gz`` keyed by the full SHA-256 of the
+    uncompressed content, so identical outputs from different sessions are stored
+    once. Each referencing session leaves an empty marker file in
+    ``<root>/<sha[:2]>/<sha>.refs/``. Adding a reference and deleting an
+    unreferenced blob both hold ``<root>/.lock``, so garbage collection can never
+    remove a blob that a concurrent ``put`` has just referenced.
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self._file_lock = FileLock(str(self.root / ".lock"), timeout=30)
+
+    def blob_path(self, sha256: str) -> Path:
+        """Return the path of the compressed blob for a digest."""
+        return self.root / sha256[:2] / f"{sha256}.gz"
+
+    def _refs_dir(self, sha256: str) -> Path:
+        return self.root / sha256[:2] / f"{sha256}.refs"
+
+    def put(self, content: bytes, session_id: str) -> str:
+        """Store content (if not already present) and record a reference to it.
+
+        The blob is compressed to a temporary file before taking the store
+        lock; the lock only covers recording the reference and moving the
+        blob into place.
+
+        Returns:
+            The SHA-256 hex digest of the content
+
+        Raises:
+            filelock.Timeout: If the store lock could not be taken
+        """
+        sha256 = hashlib.sha256(content).hexdigest()
+        blob_path = self.blob_path(sha256)
+        refs_dir = self._refs_dir(sha256)
+        blob_path.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp_path: Path | None = None
+        try:
+            while True:
+                if tmp_path is None and not blob_path.exists():
+                    tmp_path = blob_path.with_name(f"{blob_path.name}.{uuid.uuid4().hex[:8]}.tmp")
+                    with gzip.open(tmp_path, "wb", compresslevel=6) as f:
+                        f.write(content)
+                with self._file_lock:
+                    # Reference first: a blob is never visible without a reference to it.
+                    refs_dir.mkdir(parents=True, exist_ok=True)
+                    (refs_dir / session_id).touch()
+                    if blob_path.exists():
+                        break
+                    if tmp_path is not None:
+                        os.replace(tmp_path, blob_path)
+                        tmp_path = None
+                        break
+                # The blob was collected between the check and the lock; compress it again
+        finally:
+            if tmp_path is not None:
+                tmp_path.unlink(missing_ok=True)
+
+        return sha256
+
+    def release_sessions(self, session_ids: Iterable[str]) -> None:
+        """Drop every reference held by the given (deleted) sessions, skipping the grace period."""
+        dead = set(session_ids)
+        if not dead or not self.root.exists():
+            return
+        for refs_dir in self.root.glob("*/*.refs"):
+            for session_id in dead:
+                try:
+                    (refs_dir / session_id).unlink()
+                except OSError:
+                    pass
+
+    def collect_garbage(self, live_sessions: Iterable[str]) -> list[str]:
+        """Remove references from dead sessions and blobs nobody references.
+
+        Args:
+            live_sessions: IDs of sessions whose logs still exist
+
+        Returns:
+            Relative paths (from the logs directory) of removed blobs
+        """
+        if not self.root.exists():
+            return []
+
+        live = set(live_sessions)
+        cutoff = time.time() - ARTIFACT_REF_GRACE_SECONDS
+        removed = []
+
+        for refs_dir in self.root.glob("*/*.refs"):
+            sha256 = refs_dir.name[: -len(".refs")]
+            remaining = 0
+            for marker in refs_dir.iterdir():
+                try:
+                    stale = marker.name not in live and marker.stat().st_mtime < cutoff
+                    if stale:
+                        marker.unlink()
+                    else:
+                        remaining += 1
+                except OSError:
+                    remaining += 1
+            if remaining:
+                continue
+
+            with self._file_lock:
+                # A put may have added a reference since the markers were listed
+                try:
+                    if any(refs_dir.iterdir()):
+                        continue
+                except FileNotFoundError:
+                    continue
+                blob_path = self.blob_path(sha256)
+                try:
+                    blob_path.unlink()
+                    removed.append(blob_path.relative_to(self.root.parent).as_posix())
+                except FileNotFoundError:
+                    pass
+                except OSError:
+                    continue
+                shutil.rmtree(refs_dir, ignore_errors=True)
+
+        return removed
+
+
+# EventLog.log and compact_session_log serialise on the stripe for a log's file
+# name, so compaction never removes a hot log after an append it did not copy
+_HOT_LOG_LOCKS = tuple(threading.Lock() for _ in range(32))
+
+
+def _hot_log_lock(log_path: Path) -> threading.Lock:
+    return _HOT_LOG_LOCKS[hash(log_path.name) % len(_HOT_LOG_LOCKS)]
+
 
 class EventLog:
     """Manages structured event logging for a session."""
@@ -307,12 +469,13 @@ class EventLog:
 
         self.base_dir.mkdir(parents=True, exist_ok=True)
 
-        # Artifacts directory
-        self.artifacts_dir = self.base_dir / "artifacts" / session_id
-        self.artifacts_dir.mkdir(parents=True, exist_ok=True)
+        # Shared content-addressed artifact store (created lazily on first write)
+        self.artifact_store = ArtifactStore(self.base_dir / "blobs")
 
-        # Log file path
-        self.log_path = self.base_dir / f"{session_id}.jsonl"
+        # Log file path, plus the cold-tier equivalents once compacted
+        self.log_path = self.base_dir / f"{session_id}{LOG_SUFFIX}"
+        self.cold_path = self.base_dir / f"{session_id}{COLD_LOG_SUFFIX}"
+        self.cold_index_path = self.base_dir / f"{session_id}{COLD_INDEX_SUFFIX}"
 
         # Seed sequence counter from existing log if present
         if self.log_path.exists():
@@ -328,6 +491,9 @@ class EventLog:
             except Exception:
                 # If log is unreadable, fall back to starting at 0
                 self._seq = 0
+        elif self.cold_path.exists():
+            index = _read_cold_index(self.cold_index_path)
+            self._seq = int(index.get("last_seq", 0)) if index else 0
 
     def _next_seq(self) -> int:
         """Get next sequence number."""
@@ -348,10 +514,25 @@ class EventLog:
             event.turn_id = self._current_turn_id
 
         # Serialize and append
+        started = time.perf_counter()
         event_dict = event.to_dict()
 
-        with open(self.log_path, "a", encoding="utf-8") as f:
-            f.write(json.dumps(event_dict) + "\n")
+        with _hot_log_lock(self.log_path):
+            # A follow-up task on a compacted session writes to a hot log again
+            if not self.log_path.exists() and self.cold_path.exists():
+                thaw_session_log(self.cold_path)
+
+            with open(self.log_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(event_dict) + "\n")
+        EVENT_LOG_WRITE_SECONDS.observe(time.perf_counter() - started)
+        EVENTS_LOGGED.labels(type=event_dict["type"]).inc()
+
+        # Feed the cross-session search index; indexing must never break logging
+        if event_dict["type"] in INDEXED_EVENT_TYPES:
+            try:
+                get_session_index(self.base_dir).add_event(event_dict)
+            except Exception:
+                pass
 
     def store_artifact(
         self,
@@ -365,7 +546,8 @@ class EventLog:
             name: Base name for the artifact file
 
         Returns:
-            ArtifactRef if stored as artifact, None if content is small
+            ArtifactRef if stored as artifact, None if content is small or the
+            blob store stayed locked
         """
         if isinstance(content, str):
             content = content.encode("utf-8")
@@ -380,16 +562,13 @@ class EventLog:
         if size < ARTIFACT_SIZE_THRESHOLD:
             return None
 
-        # Calculate hash
-        sha256 = hashlib.sha256(content).hexdigest()
-
-        # Store file
-        artifact_path = self.artifacts_dir / f"{name}_{sha256[:8]}.txt"
-        with open(artifact_path, "wb") as f:
-            f.write(content)
+        try:
+            sha256 = self.artifact_store.put(content, self.session_id)
+        except Timeout:
+            return None
 
         # Return relative path
-        rel_path = str(artifact_path.relative_to(self.base_dir))
+        rel_path = self.artifact_store.blob_path(sha256).relative_to(self.base_dir).as_posix()
         return ArtifactRef(path=rel_path, sha256=sha256, size=size)
 
     def get_events(
@@ -406,44 +585,93 @@ class EventLog:
         Returns:
             List of event dictionaries
         """
-        if not self.log_path.exists():
-            return []
+        return [event for event, _ in self.get_raw_events(since_seq, event_types)]
 
+    def get_raw_events(
+        self,
+        since_seq: int = 0,
+        event_types: list[str] | None = None,
+    ) -> list[tuple[dict[str, Any], str]]:
+        """Read events along with the JSON text they were logged as.
+
+        Streams send the original text instead of re-serializing the dict.
+
+        Returns:
+            List of (event dictionary, JSON line without the newline)
+        """
         events = []
-        with open(self.log_path, encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    event = json.loads(line)
-                    if event.get("seq", 0) > since_seq:
-                        if event_types is None or event.get("type") in event_types:
-                            events.append(event)
-                except json.JSONDecodeError:
-                    continue
+        for line in self._iter_lines(since_seq):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                event = json.loads(line)
+                if event.get("seq", 0) > since_seq:
+                    if event_types is None or event.get("type") in event_types:
+                        events.append((event, line))
+            except json.JSONDecodeError:
+                continue
 
         return events
 
-    def get_artifact(self, ref: ArtifactRef | dict[str, Any]) -> bytes | None:
-        """Read an artifact's content.
+    def _iter_lines(self, since_seq: int = 0) -> Iterator[str]:
+        """Yield raw log lines from the hot log, or from the cold tier if compacted.
+
+        For cold logs, the seq index is used to skip frames entirely before since_seq.
+        """
+        if self.log_path.exists():
+            try:
+                with open(self.log_path, encoding="utf-8") as f:
+                    yield from f
+                return
+            except FileNotFoundError:
+                # Compacted between the exists() check and open()
+                pass
+
+        if self.cold_path.exists():
+            yield from _iter_cold_lines(self.cold_path, since_seq)
+
+    def open_artifact(self, ref: ArtifactRef | dict[str, Any]) -> IO[bytes] | None:
+        """Open an artifact for streaming reads.
+
+        Blob store artifacts are decompressed on the fly; artifacts written by
+        older versions (plain files under ``artifacts/<session>/``) are read as-is.
 
         Args:
             ref: ArtifactRef or dict with path key
 
         Returns:
-            Artifact content as bytes, or None if not found
+            Binary file object (caller closes it), or None if not found
         """
         if isinstance(ref, dict):
             path = ref.get("path", "")
         else:
             path = ref.path
 
-        artifact_path = self.base_dir / path
-        if not artifact_path.exists():
+        artifact_path = (self.base_dir / path).resolve()
+        if not path or not artifact_path.is_relative_to(self.base_dir.resolve()):
+            return None
+        try:
+            if artifact_path.suffix == ".gz":
+                return gzip.open(artifact_path, "rb")
+            return open(artifact_path, "rb")
+        except (FileNotFoundError, IsADirectoryError):
             return None
 
-        with open(artifact_path, "rb") as f:
+    def get_artifact(self, ref: ArtifactRef | dict[str, Any]) -> bytes | None:
+        """Read an artifact's content.
+
+        Args:
+            ref: ArtifactRef or dict with path key
+
+        Returns:
+            Artifact content as bytes, or None if not found
+        """
+        f = self.open_artifact(ref)
+        if f is None:
+            return None
+
+        with f:
             return f.read()
 
     def get_latest_seq(self) -> int:
@@ -487,13 +715,158 @@ class EventLog:
         if not base_dir.exists():
             return []
 
-        sessions = []
-        for f in base_dir.glob("*.jsonl"):
-            sessions.append(f.stem)
+        sessions = set()
+        for f in base_dir.glob(f"*{LOG_SUFFIX}"):
+            sessions.add(f.stem)
+        for f in base_dir.glob(f"*{COLD_LOG_SUFFIX}"):
+            sessions.add(f.name[: -len(COLD_LOG_SUFFIX)])
 
         return sorted(sessions)
 
 
+def _cold_index_path(cold_path: Path) -> Path:
+    """Return the seq index path that accompanies a cold log."""
+    return cold_path.with_name(cold_path.name[: -len(COLD_LOG_SUFFIX)] + COLD_INDEX_SUFFIX)
+
+
+def _read_cold_index(index_path: Path) -> dict[str, Any] | None:
+    """Load a cold log's seq index, or None if missing or unreadable."""
+    try:
+        with open(index_path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _iter_cold_lines(cold_path: Path, since_seq: int = 0) -> Iterator[str]:
+    """Yield decoded lines from a cold log, starting at the frame holding since_seq + 1."""
+    offset = 0
+    index = _read_cold_index(_cold_index_path(cold_path))
+    if index and index.get("frames"):
+        first_seqs = [frame[0] for frame in index["frames"]]
+        pos = bisect.bisect_right(first_seqs, since_seq + 1) - 1
+        if pos > 0:
+            offset = index["frames"][pos][1]
+
+    try:
+        with open(cold_path, "rb") as raw:
+            raw.seek(offset)
+            # GzipFile reads every following member, so one seek suffices
+            with gzip.GzipFile(fileobj=raw, mode="rb") as f:
+                for line in f:
+                    yield line.decode("utf-8", errors="replace")
+    except (OSError, EOFError):
+        return
+
+
+def read_cold_log_bounds(cold_path: Path) -> tuple[str | None, str | None]:
+    """Return the first and last non-empty lines of a cold log.
+
+    Only the first and last frames are decompressed.
+    """
+    first_line = None
+    for line in _iter_cold_lines(cold_path):
+        if line.strip():
+            first_line = line.strip()
+            break
+    if first_line is None:
+        return None, None
+
+    index = _read_cold_index(_cold_index_path(cold_path))
+    since_seq = int(index["frames"][-1][0]) - 1 if index and index.get("frames") else 0
+    last_line = None
+    for line in _iter_cold_lines(cold_path, since_seq):
+        if line.strip():
+            last_line = line.strip()
+    return first_line, last_line or first_line
+
+
+def compact_session_log(log_path: Path) -> Path | None:
+    """Compact a finished session's JSONL log into the cold tier.
+
+    Events are written as independent gzip frames of COLD_FRAME_EVENTS lines so
+    readers can seek straight to a seq via the index. The hot log is removed only
+    if it did not change while compacting; that check and the removal hold the
+    lock ``EventLog.log`` appends under, so no event can land in between.
+
+    Args:
+        log_path: Path to the ``{session_id}.jsonl`` log
+
+    Returns:
+        Path of the cold log, or None if the session has not ended or the log
+        changed underneath us
+    """
+    try:
+        before = log_path.stat()
+        with open(log_path, "rb") as f:
+            lines = [line.strip() for line in f if line.strip()]
+    except OSError:
+        return None
+
+    if not lines:
+        return None
+    try:
+        last_event = json.loads(lines[-1])
+    except json.JSONDecodeError:
+        return None
+    if last_event.get("type") != "session_ended":
+        return None
+
+    cold_path = log_path.with_name(log_path.name[: -len(LOG_SUFFIX)] + COLD_LOG_SUFFIX)
+    index_path = _cold_index_path(cold_path)
+    tmp_cold = cold_path.with_name(cold_path.name + ".tmp")
+
+    frames = []
+    with open(tmp_cold, "wb") as out:
+        for start in range(0, len(lines), COLD_FRAME_EVENTS):
+            chunk = lines[start:start + COLD_FRAME_EVENTS]
+            try:
+                first_seq = int(json.loads(chunk[0]).get("seq", 0))
+            except (json.JSONDecodeError, AttributeError):
+                first_seq = frames[-1][0] if frames else 0
+            frames.append([first_seq, out.tell()])
+            out.write(gzip.compress(b"\n".join(chunk) + b"\n", compresslevel=9, mtime=0))
+
+    index = {
+        "version": 1,
+        "frame_events": COLD_FRAME_EVENTS,
+        "first_seq": frames[0][0],
+        "last_seq": int(last_event.get("seq", 0)),
+        "frames": frames,
+    }
+    with open(index_path, "w", encoding="utf-8") as f:
+        json.dump(index, f)
+
+    with _hot_log_lock(log_path):
+        try:
+            after = log_path.stat()
+        except OSError:
+            after = None
+        if after is None or (after.st_size, after.st_mtime_ns) != (before.st_size, before.st_mtime_ns):
+            tmp_cold.unlink(missing_ok=True)
+            index_path.unlink(missing_ok=True)
+            return None
+
+        os.replace(tmp_cold, cold_path)
+        # Keep the original mtime so age-based scans treat the session the same
+        os.utime(cold_path, ns=(before.st_atime_ns, before.st_mtime_ns))
+        log_path.unlink()
+    return cold_path
+
+
+def thaw_session_log(cold_path: Path) -> Path:
+    """Restore a cold log to a hot JSONL log so new events can be appended."""
+    log_path = cold_path.with_name(cold_path.name[: -len(COLD_LOG_SUFFIX)] + LOG_SUFFIX)
+    tmp_log = log_path.with_name(log_path.name + ".tmp")
+    with open(tmp_log, "w", encoding="utf-8") as out:
+        for line in _iter_cold_lines(cold_path):
+            out.write(line)
+    os.replace(tmp_log, log_path)
+    cold_path.unlink(missing_ok=True)
+    _cold_index_path(cold_path).unlink(missing_ok=True)
+    return log_path
+
+
 def compute_file_sha256(path: Path) -> str:
     """Compute SHA256 hash of a file."""
     h = hashlib.sha256()
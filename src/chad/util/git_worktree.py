@@ -6,6 +6,10 @@ import threading
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from chad.util.metrics import histogram
+
+GIT_COMMAND_SECONDS = histogram("chad_git_command_seconds", "Wall time of git subprocesses", ("command",))
+
 
 def find_main_venv(project_path: Path) -> Path | None:
     """Find the main project's virtual environment directory.
@@ -161,15 +165,16 @@ class GitWorktreeManager:
     def _run_git(self, *args: str, cwd: Path | None = None, check: bool = True) -> subprocess.CompletedProcess:
         """Run a git command and return the result."""
         cmd = ["git"] + list(args)
-        return subprocess.run(
-            cmd,
-            cwd=cwd or self.project_path,
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            errors="replace",
-            check=check,
-        )
+        with GIT_COMMAND_SECONDS.labels(command=args[0] if args else "").time():
+            return subprocess.run(
+                cmd,
+                cwd=cwd or self.project_path,
+                capture_output=True,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+                check=check,
+            )
 
     def is_git_repo(self) -> bool:
         """Check if project_path is a git repository."""
@@ -465,6 +470,28 @@ class GitWorktreeManager:
 
         return self._parse_unified_diff("\n".join(diff_texts))
 
+    def get_changed_files(
+        self,
+        task_id: str,
+        base_commit: str | None = None,
+    ) -> list[str]:
+        """Get worktree-relative paths of all files changed vs the base.
+
+        Deleted files are included under their old path.
+        """
+        worktree_path = self._worktree_path(task_id)
+        # Untracked files are diffed with --no-index against their absolute path
+        prefixes = {str(p).lstrip("/") + "/" for p in (worktree_path, worktree_path.resolve())}
+        paths = set()
+        for file_diff in self.get_parsed_diff(task_id, base_commit):
+            path = file_diff.old_path if file_diff.is_deleted else file_diff.new_path
+            for prefix in prefixes:
+                if path.startswith(prefix):
+                    path = path[len(prefix):]
+                    break
+            paths.add(path)
+        return sorted(paths)
+
     def _parse_unified_diff(self, diff_text: str) -> list[FileDiff]:
         """Parse unified diff output into structured FileDiff objects."""
         import re
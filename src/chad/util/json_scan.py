@@ -0,0 +1,89 @@
+"""Locating JSON objects embedded in free-form agent output.
+
+Agents report structured results (completion summaries, progress updates,
+verification verdicts) as JSON objects mixed into prose, code fences and
+tool output. ``iter_json_objects`` finds the balanced top-level ``{...}``
+spans in such text in linear time, starting from the end where the result
+normally is.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Iterator
+
+# Size of the first tail window scanned; doubled until the whole text is covered
+JSON_SCAN_WINDOW = 64 * 1024
+
+# A string literal (escapes honoured, raw newlines tolerated) or a brace.
+# Strings are consumed whole by the regex engine so that the Python loop
+# only visits braces and string boundaries.
+_TOKEN_RE = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[{}]', re.DOTALL)
+
+
+def _scan(text: str, start: int, end: int) -> tuple[list[tuple[int, int]], int]:
+    """Find balanced top-level objects in text[start:end].
+
+    A ``{`` that is never closed (e.g. from a code snippet in the transcript)
+    does not hide what follows it: complete objects directly inside an unclosed
+    brace are reported as top-level too.
+
+    Returns:
+        Tuple of (spans sorted by position, trusted_from). Spans before
+        ``trusted_from`` may be nested inside an object opened before ``start``.
+    """
+    spans: list[tuple[int, int]] = []
+    trusted_from = start
+    opens: list[int] = []
+    # children[i] holds the complete objects directly inside opens[i]
+    children: list[list[tuple[int, int]]] = []
+    for match in _TOKEN_RE.finditer(text, start, end):
+        pos = match.start()
+        char = text[pos]
+        if char == "{":
+            opens.append(pos)
+            children.append([])
+        elif char == "}":
+            if not opens:
+                # Closes something opened before the window (or is stray)
+                trusted_from = pos + 1
+                continue
+            children.pop()
+            span = (opens.pop(), pos + 1)
+            if children:
+                children[-1].append(span)
+            else:
+                spans.append(span)
+    if children:
+        spans.extend(span for level in children for span in level)
+        spans.sort()
+    return spans, trusted_from
+
+
+def iter_json_objects(text: str, window: int = JSON_SCAN_WINDOW) -> Iterator[str]:
+    """Yield the balanced top-level ``{...}`` substrings of text, last first.
+
+    The last ``window`` characters are scanned first, and the window doubles
+    until the whole text is covered, so a result printed at the end of a long
+    transcript is found without scanning all of it and the total work stays
+    linear. Windows start on a line boundary so scanning does not begin
+    inside a well-formed string literal. Candidates are not validated; callers
+    decode them and skip the ones they cannot use.
+    """
+    end = len(text)
+    covered = end
+    size = max(window, 1)
+    while True:
+        start = max(0, end - size)
+        if start:
+            start = text.rfind("\n", 0, start) + 1
+        spans, trusted_from = _scan(text, start, end)
+        if start == 0:
+            trusted_from = 0
+        for open_at, close_at in reversed(spans):
+            if trusted_from <= open_at < covered:
+                yield text[open_at:close_at]
+        if start == 0:
+            return
+        covered = trusted_from
+        size *= 2
@@ -0,0 +1,129 @@
+"""Incremental newline-delimited JSON decoding for provider stream output.
+
+Agent CLIs stream one JSON event per line (``stream-json`` / ``--format json``).
+``NDJSONDecoder`` buffers raw output, splits complete lines and dispatches each
+decoded event by its ``type`` through a handler table, so providers only
+supply the event-to-render mapping.
+
+orjson is used for decoding when installed; otherwise the stdlib json module.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Callable, Mapping
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+EventHandler = Callable[[dict], Any]
+TextHandler = Callable[[str], Any]
+
+
+def loads(data: bytes | bytearray | str) -> Any:
+    """Decode a JSON document with the fastest available backend.
+
+    Raises:
+        ValueError: If the data is not valid JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Fall through: the stdlib also accepts NaN/Infinity and big integers
+            pass
+    return json.loads(data)
+
+
+class NDJSONDecoder:
+    """Splits a byte stream into lines and dispatches the JSON events in it.
+
+    Incoming data is appended to a bytearray and complete lines are located
+    with ``find(b"\\n")``, so partial lines carry over between chunks without
+    re-scanning. Lines starting with ``{`` are decoded; objects are passed to
+    ``on_event`` (if given) and then to the handler registered for their
+    ``type``. Any other non-blank line is passed, surrounding whitespace
+    included, to ``on_text``.
+
+    Handler return values other than None are collected and returned from
+    :meth:`feed` / :meth:`flush` in stream order.
+    """
+
+    def __init__(
+        self,
+        handlers: Mapping[str, EventHandler] | None = None,
+        on_event: EventHandler | None = None,
+        on_text: TextHandler | None = None,
+    ) -> None:
+        self.handlers: dict[str, EventHandler] = dict(handlers or {})
+        self.on_event = on_event
+        self.on_text = on_text
+        self._buffer = bytearray()
+
+    def feed(self, data: bytes | str) -> list:
+        """Consume a chunk of output and dispatch every complete line in it.
+
+        Args:
+            data: Raw bytes from the process (str is encoded as UTF-8)
+
+        Returns:
+            Non-None handler results, in order
+        """
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        buffer = self._buffer
+        scan_from = len(buffer)
+        buffer += data
+
+        results: list = []
+        start = 0
+        end = buffer.find(b"\n", scan_from)
+        while end >= 0:
+            self._dispatch(buffer[start:end], results)
+            start = end + 1
+            end = buffer.find(b"\n", start)
+        if start:
+            del buffer[:start]
+        return results
+
+    def flush(self) -> list:
+        """Dispatch whatever is left in the buffer as a final line.
+
+        Call after the process exits in case the last event had no trailing newline.
+        """
+        results: list = []
+        if self._buffer:
+            line = bytes(self._buffer)
+            self._buffer.clear()
+            self._dispatch(line, results)
+        return results
+
+    def _dispatch(self, line: bytes | bytearray, results: list) -> None:
+        stripped = line.strip()
+        if not stripped:
+            return
+
+        if stripped[:1] == b"{":
+            try:
+                event = loads(stripped)
+            except ValueError:
+                event = None
+            if isinstance(event, dict):
+                if self.on_event is not None:
+                    result = self.on_event(event)
+                    if result is not None:
+                        results.append(result)
+                event_type = event.get("type")
+                handler = self.handlers.get(event_type) if isinstance(event_type, str) else None
+                if handler is not None:
+                    result = handler(event)
+                    if result is not None:
+                        results.append(result)
+                return
+
+        if self.on_text is not None:
+            result = self.on_text(line.decode("utf-8", errors="replace"))
+            if result is not None:
+                results.append(result)
@@ -21,6 +21,8 @@ class VerificationConfig:
     test_timeout: int = 120
     validated: bool = False
     last_validated: str | None = None
+    fail_fast: bool = False  # Stop remaining verification phases on the first failure
+    run_tests: bool = False  # Run affected tests during automated verification (lint only otherwise)
 
 
 @dataclass
@@ -75,6 +77,8 @@ class ProjectConfig:
                 "test_timeout": self.verification.test_timeout,
                 "validated": self.verification.validated,
                 "last_validated": self.verification.last_validated,
+                "fail_fast": self.verification.fail_fast,
+                "run_tests": self.verification.run_tests,
             },
             "instructions": self.instructions,
             "docs": {
@@ -98,6 +102,8 @@ class ProjectConfig:
             test_timeout=verification_data.get("test_timeout", 120),
             validated=verification_data.get("validated", False),
             last_validated=verification_data.get("last_validated"),
+            fail_fast=bool(verification_data.get("fail_fast", False)),
+            run_tests=bool(verification_data.get("run_tests", False)),
         )
         docs_data = data.get("docs", {})
         docs = DocsConfig.from_dict(docs_data)
@@ -446,6 +452,8 @@ def save_project_settings(
     preview_command: str | None = ...,
     preferred_coding_agent: str | None = ...,
     autoconfigure_agent: str | None = ...,
+    verification_fail_fast: bool | None = ...,
+    verification_run_tests: bool | None = ...,
 ) -> ProjectConfig:
     """Persist verification commands and documentation paths for a project.
 
@@ -461,6 +469,8 @@ def save_project_settings(
         preview_port: Local port for preview tunnel (None to clear, ... to leave unchanged)
         preview_command: Command to start preview (None to clear, ... to leave unchanged)
         preferred_coding_agent: Account name to use as default coding agent (None to clear, ... to leave unchanged)
+        verification_fail_fast: Stop automated verification on the first failing phase (... to leave unchanged)
+        verification_run_tests: Run affected tests in automated verification (... to leave unchanged)
 
     Returns:
         The saved ProjectConfig instance
@@ -522,6 +532,12 @@ def save_project_settings(
     if autoconfigure_agent is not ...:
         config.autoconfigure_agent = autoconfigure_agent or None
 
+    if verification_fail_fast is not ...:
+        config.verification.fail_fast = bool(verification_fail_fast)
+
+    if verification_run_tests is not ...:
+        config.verification.run_tests = bool(verification_run_tests)
+
     save_project_config(project_path, config)
     return config
 
@@ -6,6 +6,8 @@ Edit these prompts to customize agent behavior.
 from dataclasses import dataclass
 from pathlib import Path
 
+from chad.util.json_scan import iter_json_objects
+
 
 # =============================================================================
 # CODING AGENT SYSTEM PROMPT
@@ -440,81 +442,42 @@ def parse_verification_response(response: str) -> tuple[bool, str, list[str]]:
     # e.g., "*Thinking: **Ensuring valid JSON output***\n\n{..."
     cleaned = re.sub(r"^\s*\*+[Tt]hinking:.*?\*+\s*", "", response, flags=re.DOTALL)
 
-    def _extract_balanced_json_objects(text: str) -> list[str]:
-        objects: list[str] = []
-        depth = 0
-        in_string = False
-        escape_next = False
-        start_idx: int | None = None
-
-        for idx, char in enumerate(text):
-            if escape_next:
-                escape_next = False
-                continue
-
-            if in_string:
-                if char == "\\":
-                    escape_next = True
-                elif char == '"':
-                    in_string = False
-                continue
-
-            if char == '"':
-                in_string = True
-                continue
-
-            if char == "{":
-                if depth == 0:
-                    start_idx = idx
-                depth += 1
-                continue
-
-            if char == "}":
-                if depth == 0:
-                    continue
-                depth -= 1
-                if depth == 0 and start_idx is not None:
-                    objects.append(text[start_idx: idx + 1])
-                    start_idx = None
-
-        return objects
-
-    # Collect candidate JSON objects from fenced and raw content.
-    candidates: list[str] = []
-    seen: set[str] = set()
-
-    for match in re.finditer(r"```(?:json)?\s*(\{.*?\})\s*```", cleaned, re.DOTALL | re.IGNORECASE):
-        candidate = match.group(1).strip()
-        if candidate and candidate not in seen:
-            seen.add(candidate)
-            candidates.append(candidate)
-
-    for candidate in _extract_balanced_json_objects(cleaned):
-        normalized = candidate.strip()
-        if normalized and normalized not in seen:
-            seen.add(normalized)
-            candidates.append(normalized)
-
-    # If multiple JSON objects exist, prefer one that includes `passed`.
-    prioritized = sorted(candidates, key=lambda text: '"passed"' not in text)
     data = None
     parse_error = None
     missing_passed_seen = False
-    for candidate in prioritized:
+    found_candidate = False
+    deferred: list[str] = []
+
+    def _try_candidate(candidate: str) -> dict | None:
+        nonlocal parse_error, missing_passed_seen
         try:
             parsed = json.loads(candidate)
         except json.JSONDecodeError as e:
             parse_error = e
-            continue
-
+            return None
         if not isinstance(parsed, dict):
-            continue
-
+            return None
         if "passed" in parsed:
-            data = parsed
+            return parsed
+        missing_passed_seen = True
+        return None
+
+    # The verdict comes last (providers may echo the prompt's examples first),
+    # so candidates are tried from the end, preferring ones mentioning `passed`.
+    for candidate in iter_json_objects(cleaned):
+        found_candidate = True
+        if '"passed"' not in candidate:
+            deferred.append(candidate)
+            continue
+        data = _try_candidate(candidate)
+        if data is not None:
             break
 
-        missing_passed_seen = True
+    if data is None:
+        for candidate in deferred:
+            data = _try_candidate(candidate)
+            if data is not None:
+                break
 
     if data is None:
         # Fall back to provider-error matching only when the whole response
@@ -531,7 +494,7 @@ def parse_verification_response(response: str) -> tuple[bool, str, list[str]]:
                 if re.fullmatch(pattern, error_candidate, re.IGNORECASE | re.DOTALL):
                     return False, error_msg, [error_candidate[:500]]
 
-        if not candidates:
+        if not found_candidate:
             raise VerificationParseError(f"No JSON found in response: {response[:200]}")
         if missing_passed_seen:
             raise VerificationParseError("Missing required field 'passed' in JSON response")
@@ -564,32 +527,33 @@ def extract_coding_summary(response: str) -> CodingSummary | None:
     import json
     import re
 
-    # Look for JSON block with change_summary
-    json_match = re.search(r'```json\s*(\{[^`]*"change_summary"[^`]*\})\s*```', response, re.DOTALL)
-    if json_match:
+    # Look for the last JSON object with change_summary (fenced or raw)
+    for candidate in iter_json_objects(response):
+        if '"change_summary"' not in candidate:
+            continue
         try:
-            data = json.loads(json_match.group(1))
-            if "change_summary" in data:
-                # Parse files_changed - can be array or "info_only" string
-                files_changed = data.get("files_changed")
-                if isinstance(files_changed, list):
-                    files_changed = [str(f) for f in files_changed]
-                elif isinstance(files_changed, str):
-                    pass  # Keep as string (e.g., "info_only")
-                else:
-                    files_changed = None
-                return CodingSummary(
-                    change_summary=data["change_summary"],
-                    files_changed=files_changed,
-                    completion_status=data.get("completion_status"),
-                    hypothesis=data.get("hypothesis"),
-                    before_screenshot=data.get("before_screenshot"),
-                    before_description=data.get("before_description"),
-                    after_screenshot=data.get("after_screenshot"),
-                    after_description=data.get("after_description"),
-                )
+            data = json.loads(candidate)
         except json.JSONDecodeError:
-            pass
+            continue
+        if isinstance(data, dict) and "change_summary" in data:
+            # Parse files_changed - can be array or "info_only" string
+            files_changed = data.get("files_changed")
+            if isinstance(files_changed, list):
+                files_changed = [str(f) for f in files_changed]
+            elif isinstance(files_changed, str):
+                pass  # Keep as string (e.g., "info_only")
+            else:
+                files_changed = None
+            return CodingSummary(
+                change_summary=data["change_summary"],
+                files_changed=files_changed,
+                completion_status=data.get("completion_status"),
+                hypothesis=data.get("hypothesis"),
+                before_screenshot=data.get("before_screenshot"),
+                before_description=data.get("before_description"),
+                after_screenshot=data.get("after_screenshot"),
+                after_description=data.get("after_description"),
+            )
 
     # Try to find raw JSON with change_summary (fallback - only gets change_summary)
     json_match = re.search(r'\{\s*"change_summary"\s*:\s*"([^"]+)"\s*\}', response)
@@ -669,18 +633,11 @@ def extract_progress_update(response: str) -> ProgressUpdate | None:
             )
         return None
 
-    # Try JSON format first (preferred)
-    # Look for JSON block with type: "progress"
-    json_match = re.search(r'```json\s*(\{[^`]*"type"\s*:\s*"progress"[^`]*\})\s*```', response, re.DOTALL)
-    if json_match:
-        parsed = _parse_progress_json(json_match.group(1))
-        if parsed:
-            return parsed
-
-    # Try to find raw JSON with type: progress
-    raw_match = re.search(r'\{\s*"type"\s*:\s*"progress"[^}]+\}', response, re.DOTALL)
-    if raw_match:
-        parsed = _parse_progress_json(raw_match.group(0))
+    # Try JSON format first (preferred), fenced or raw; the latest update wins
+    for candidate in iter_json_objects(response):
+        if '"progress"' not in candidate:
+            continue
+        parsed = _parse_progress_json(candidate)
         if parsed:
             return parsed
 
@@ -20,6 +20,7 @@ from typing import Callable
 from chad.util.utils import platform_path, safe_home
 from .installer import AIToolInstaller
 from .installer import DEFAULT_TOOLS_DIR
+from .ndjson import NDJSONDecoder
 import json
 
 try:
@@ -126,160 +127,209 @@ def find_cli_executable(name: str) -> str:
     return name
 
 
-def parse_codex_output(raw_output: str | None) -> str:  # noqa: C901
-    """Parse Codex output to extract just thinking and response.
+# Codex text-mode lines that carry no content: banner, session metadata, token usage
+_CODEX_HEADER_RE = re.compile(r"OpenAI Codex|--------")
+_CODEX_METADATA_RE = re.compile(
+    r"workdir:|model:|provider:|approval:|sandbox:|reasoning effort:|reasoning summaries:"
+    r"|session id:|mcp startup:|tokens used"
+)
+_CODEX_TOKEN_COUNT_RE = re.compile(r"(?=[\d,]*\d)[\d,]{1,10}")
 
-    Codex output has the format:
-    - Header with version info
-    - 'thinking' sections with reasoning
-    - 'exec' sections with command outputs (skip these)
-    - 'codex' section with the final response
-    - 'tokens used' at the end
 
-    Returns just the thinking and final response.
+class CodexOutputParser:
+    """Incremental parser for Codex CLI output.
+
+    Fed raw chunks as they stream from the process, it splits them into lines
+    (carrying partial lines between chunks) and processes each line once:
+    ``--json`` event lines are decoded and returned from :meth:`feed`, with
+    agent messages and reasoning collected as they complete; plain-text lines
+    run through a section state machine (thinking / exec / codex) so the
+    formatted text-mode result is ready as soon as the process exits.
     """
-    if not raw_output:
-        return ""
 
-    lines = raw_output.split("\n")
-    result_parts = []
-    in_thinking = False
-    in_response = False
-    in_exec = False
-    current_section = []
+    def __init__(self) -> None:
+        self._pending: list[str] = []
+        # JSON mode
+        self.saw_json = False
+        self.agent_messages: list[str] = []
+        self._reasoning: list[str] = []
+        # Text mode
+        self._sections: list[tuple[str, str]] = []
+        self._current: list[str] = []
+        self._in_thinking = False
+        self._in_response = False
+        self._in_exec = False
+
+    def feed(self, chunk: str) -> list[dict]:
+        """Consume a chunk of output.
 
-    i = 0
-    while i < len(lines):
-        line = lines[i]
+        Returns:
+            JSON events decoded from the complete lines in this chunk
+        """
+        if "\n" not in chunk:
+            if chunk:
+                self._pending.append(chunk)
+            return []
+        if self._pending:
+            self._pending.append(chunk)
+            chunk = "".join(self._pending)
+            self._pending = []
+        lines = chunk.split("\n")
+        tail = lines.pop()
+        if tail:
+            self._pending.append(tail)
+
+        events = []
+        for line in lines:
+            event = self._feed_line(line)
+            if event is not None:
+                events.append(event)
+        return events
+
+    def finish(self) -> list[dict]:
+        """Process any trailing partial line once the output has ended."""
+        if not self._pending:
+            return []
+        line = "".join(self._pending)
+        self._pending = []
+        event = self._feed_line(line)
+        return [event] if event is not None else []
+
+    def _feed_line(self, line: str) -> dict | None:
         stripped = line.strip()
+        if stripped.startswith("{"):
+            try:
+                event = json.loads(stripped)
+            except json.JSONDecodeError:
+                event = None
+            if isinstance(event, dict):
+                self.saw_json = True
+                self._collect_event(event)
+                return event
+        self._feed_text_line(_strip_ansi_codes(line))
+        return None
 
-        # Skip header block (OpenAI Codex version info)
-        if line.startswith("OpenAI Codex") or line.startswith("--------"):
-            i += 1
-            continue
-
-        # Skip metadata lines
-        if any(
-            stripped.startswith(prefix)
-            for prefix in [
-                "workdir:",
-                "model:",
-                "provider:",
-                "approval:",
-                "sandbox:",
-                "reasoning effort:",
-                "reasoning summaries:",
-                "session id:",
-                "mcp startup:",
-                "tokens used",
-            ]
-        ):
-            i += 1
-            continue
-
-        # Skip standalone numbers (token counts) - including comma-separated like "4,481"
-        if stripped.replace(",", "").isdigit() and len(stripped) <= 10:
-            i += 1
-            continue
+    def _collect_event(self, event: dict) -> None:
+        if event.get("type") != "item.completed":
+            return
+        item = event.get("item", {})
+        if item.get("type") == "agent_message":
+            self.agent_messages.append(item.get("text", ""))
+        elif item.get("type") == "reasoning":
+            text = item.get("text", "")
+            if text:
+                self._reasoning.append(text)
+
+    def json_response(self) -> str:
+        """Response text assembled from JSON events (reasoning first, newest first)."""
+        parts = [f"*Thinking: {text}*\n\n" for text in reversed(self._reasoning)]
+        parts.extend(self.agent_messages)
+        return "".join(parts).strip()
+
+    def _close_section(self) -> None:
+        if self._current:
+            section_type = "response" if self._in_response else "thinking"
+            self._sections.append((section_type, "\n".join(self._current)))
+            self._current = []
+
+    def _feed_text_line(self, line: str) -> None:  # noqa: C901
+        stripped = line.strip()
 
-        # Skip 'user' marker lines
-        if stripped == "user":
-            i += 1
-            continue
+        # Skip header block, metadata, standalone token counts and 'user' markers
+        if _CODEX_HEADER_RE.match(line) or _CODEX_METADATA_RE.match(stripped):
+            return
+        if _CODEX_TOKEN_COUNT_RE.fullmatch(stripped) or stripped == "user":
+            return
 
-        # Handle exec blocks - skip until next known marker
+        # Exec blocks are skipped until the next thinking/codex marker
         if stripped.startswith("exec"):
-            in_exec = True
-            # Save current thinking section before exec
-            if in_thinking and current_section:
-                result_parts.append(("thinking", "\n".join(current_section)))
-                current_section = []
-            in_thinking = False
-            i += 1
-            continue
-
-        # End exec block on next marker
-        if in_exec:
-            if stripped in ("thinking", "codex"):
-                in_exec = False
-                # Fall through to handle the marker
-            else:
-                i += 1
-                continue
+            if self._in_thinking:
+                self._close_section()
+            self._in_exec = True
+            self._in_thinking = False
+            return
+        if self._in_exec:
+            if stripped not in ("thinking", "codex"):
+                return
+            self._in_exec = False
 
-        # Capture thinking sections
         if stripped == "thinking":
-            # Save previous section if any
-            if current_section:
-                section_type = "response" if in_response else "thinking"
-                result_parts.append((section_type, "\n".join(current_section)))
-            in_thinking = True
-            in_response = False
-            current_section = []
-            i += 1
-            continue
-
-        # Capture codex response (final answer)
+            self._close_section()
+            self._in_thinking = True
+            self._in_response = False
+            return
         if stripped == "codex":
-            # Save previous section if any
-            if current_section:
-                section_type = "response" if in_response else "thinking"
-                result_parts.append((section_type, "\n".join(current_section)))
-            in_thinking = False
-            in_response = True
-            current_section = []
-            i += 1
-            continue
+            self._close_section()
+            self._in_thinking = False
+            self._in_response = True
+            return
 
-        # Accumulate content
-        if in_thinking:
+        if self._in_thinking:
             # For thinking, just collect the core message
             if stripped:
-                current_section.append(stripped)
-        elif in_response:
+                self._current.append(stripped)
+        elif self._in_response:
             # For response, preserve original formatting (but strip trailing whitespace)
-            current_section.append(line.rstrip())
+            self._current.append(line.rstrip())
+
+    def text_result(self) -> str:
+        """Formatted thinking summary and response from text-mode output ("" if none)."""
+        sections = list(self._sections)
+        if self._current:
+            sections.append(("response" if self._in_response else "thinking", "\n".join(self._current)))
+
+        thinking_parts = []
+        response_parts = []
+        for section_type, content in sections:
+            if section_type == "thinking":
+                # Collect all thinking for a compact summary
+                thinking_parts.append(content.replace("\n", " ").strip())
+            else:
+                response_parts.append(content)
 
-        i += 1
+        formatted = []
 
-    # Add final section
-    if current_section:
-        section_type = "response" if in_response else "thinking"
-        result_parts.append((section_type, "\n".join(current_section)))
+        # Add consolidated thinking as a compact italic block
+        if thinking_parts and _thinking_enabled():
+            # Show last few thinking steps, not all
+            recent_thoughts = thinking_parts[-5:] if len(thinking_parts) > 5 else thinking_parts
+            thinking_summary = " → ".join(recent_thoughts)
+            formatted.append(f"*Thinking: {thinking_summary}*")
 
-    # Format output - consolidate thinking, preserve response formatting
-    thinking_parts = []
-    response_parts = []
+        # Add response content with preserved formatting
+        for content in response_parts:
+            # Clean up excessive blank lines but preserve structure
+            lines = content.split("\n")
+            cleaned_lines = []
+            for i, line in enumerate(lines):
+                if line.strip() or (i > 0 and lines[i - 1].strip()):
+                    cleaned_lines.append(line)
+            cleaned = "\n".join(cleaned_lines)
+            if cleaned.strip():
+                formatted.append(cleaned.strip())
 
-    for section_type, content in result_parts:
-        if section_type == "thinking":
-            # Collect all thinking for a compact summary
-            thinking_parts.append(content.replace("\n", " ").strip())
-        else:
-            response_parts.append(content)
+        return "\n\n".join(formatted)
 
-    formatted = []
 
-    # Add consolidated thinking as a compact italic block
-    if thinking_parts and _thinking_enabled():
-        # Show last few thinking steps, not all
-        recent_thoughts = thinking_parts[-5:] if len(thinking_parts) > 5 else thinking_parts
-        thinking_summary = " → ".join(recent_thoughts)
-        formatted.append(f"*Thinking: {thinking_summary}*")
+def parse_codex_output(raw_output: str | None) -> str:
+    """Parse Codex output to extract just thinking and response.
 
-    # Add response content with preserved formatting
-    for content in response_parts:
-        # Clean up excessive blank lines but preserve structure
-        lines = content.split("\n")
-        cleaned_lines = []
-        for i, line in enumerate(lines):
-            if line.strip() or (i > 0 and lines[i - 1].strip()):
-                cleaned_lines.append(line)
-        cleaned = "\n".join(cleaned_lines)
-        if cleaned.strip():
-            formatted.append(cleaned.strip())
+    Codex output has the format:
+    - Header with version info
+    - 'thinking' sections with reasoning
+    - 'exec' sections with command outputs (skip these)
+    - 'codex' section with the final response
+    - 'tokens used' at the end
+
+    Returns just the thinking and final response.
+    """
+    if not raw_output:
+        return ""
 
-    return "\n\n".join(formatted) if formatted else raw_output
+    parser = CodexOutputParser()
+    for line in raw_output.split("\n"):
+        parser._feed_text_line(line)
+    return parser.text_result() or raw_output
 
 
 @dataclass
@@ -1403,6 +1453,42 @@ class AIProvider(ABC):
         if self.activity_callback:
             self.activity_callback(activity_type, detail)
 
+    def _notify_text_line(self, line: str) -> None:
+        """Surface a non-JSON output line (warnings, etc.) as activity."""
+        line = line.strip()
+        if len(line) > 10:
+            self._notify_activity("text", line[:80])
+
+    def _stream_json_decoder(
+        self,
+        response_parts: list[str],
+        final_result: list,
+        handlers: dict | None = None,
+    ) -> NDJSONDecoder:
+        """Build a decoder for CLIs emitting Claude-style stream-json events.
+
+        Text blocks of ``assistant`` events are appended to response_parts and
+        the ``result`` event's result is stored in final_result[0]. ``message``
+        events with role=assistant are ignored as they duplicate the assistant
+        content. Extra handlers (e.g. for session ids) are merged in.
+        """
+
+        def on_assistant(event: dict) -> None:
+            for block in event.get("message", {}).get("content", []):
+                if isinstance(block, dict) and block.get("type") == "text":
+                    text = block.get("text", "")
+                    if text:
+                        response_parts.append(text)
+                        self._notify_activity("text", text[:80])
+
+        def on_result(event: dict) -> None:
+            if "result" in event:
+                final_result[0] = event["result"]
+
+        table = {"assistant": on_assistant, "result": on_result}
+        table.update(handlers or {})
+        return NDJSONDecoder(table, on_text=self._notify_text_line)
+
     @abstractmethod
     def start_session(self, project_path: str, system_prompt: str | None = None) -> bool:
         """Start an interactive session.
@@ -1908,8 +1994,6 @@ class OpenAICodexProvider(AIProvider):
             self.current_message = message
 
     def get_response(self, timeout: float = 1500.0, _is_recovery: bool = False) -> str:  # noqa: C901
-        import json
-
         if not self.current_message:
             return ""
 
@@ -1959,7 +2043,7 @@ class OpenAICodexProvider(AIProvider):
                 self.process.stdin.close()
 
             # Both initial and resume use JSON output
-            json_events = []
+            parser = CodexOutputParser()
             reconnect_seen = [False]
 
             def format_json_event_as_text(event: dict) -> str | None:
@@ -2086,91 +2170,82 @@ class OpenAICodexProvider(AIProvider):
             cmd_stats = {"total": 0, "exploration": 0, "implementation": 0, "commands": []}
             exploration_loop_detected = [False]  # Flag to detect stuck exploration loops
 
+            def handle_event(event: dict) -> None:
+                # Check for API errors (model not supported, etc.)
+                if event.get("type") == "error":
+                    msg = event.get("message", "Unknown API error")
+                    if "reconnecting" in msg.lower():
+                        reconnect_seen[0] = True
+                    else:
+                        api_error[0] = msg
+                elif event.get("type") == "turn.failed":
+                    error_info = event.get("error", {})
+                    api_error[0] = error_info.get("message", "Turn failed")
+
+                # Extract thread_id from first event
+                if event.get("type") == "thread.started" and "thread_id" in event:
+                    self.thread_id = event["thread_id"]
+
+                is_agent_message = (
+                    event.get("type") == "item.completed"
+                    and event.get("item", {}).get("type") == "agent_message"
+                )
+                if is_agent_message:
+                    reconnect_seen[0] = False
+
+                # Convert to human-readable and stream
+                readable = format_json_event_as_text(event)
+                if readable:
+                    self._notify_activity("stream", readable)
+
+                # Track last event for diagnostics and adaptive timeout
+                if event.get("type") == "item.completed":
+                    item = event.get("item", {})
+                    item_type = item.get("type", "")
+                    last_event_info["time"] = time.time()
+                    last_event_info["kind"] = item_type
+                    if item_type == "command_execution":
+                        cmd = item.get("command", "")
+                        last_event_info["command"] = cmd[:80]
+                        # Categorize command for session analysis
+                        cmd_stats["total"] += 1
+                        cmd_lower = cmd.lower()
+                        # Implementation: file writes, edits, git commits
+                        if any(x in cmd_lower for x in [
+                            "edit ", "write ", "> ", ">> ", "tee ",
+                            "git add", "git commit", "patch ", "sed -i",
+                        ]):
+                            cmd_stats["implementation"] += 1
+                        else:
+                            cmd_stats["exploration"] += 1
+                        # Keep last N commands for diagnostics
+                        cmd_stats["commands"].append(cmd[:100])
+                        if len(cmd_stats["commands"]) > 20:
+                            cmd_stats["commands"] = cmd_stats["commands"][-20:]
+
+                        # Detect exploration loop: many exploration commands, zero implementation
+                        if (cmd_stats["exploration"] >= CODEX_MAX_EXPLORATION_WITHOUT_IMPL
+                                and cmd_stats["implementation"] == 0):
+                            exploration_loop_detected[0] = True
+                    idle_diag["limit"] = (
+                        CODEX_COMMAND_IDLE_TIMEOUT
+                        if item_type == "command_execution"
+                        else CODEX_THINK_IDLE_TIMEOUT
+                    )
+                    idle_diag["kind"] = item_type
+                    # Also send activity notifications for status bar
+                    if item_type == "reasoning":
+                        self._notify_activity("thinking", item.get("text", "")[:80])
+                    elif item_type == "agent_message":
+                        self._notify_activity("text", item.get("text", "")[:80])
+                    elif item_type in ("mcp_tool_call", "command_execution"):
+                        name = item.get("tool", item.get("command", "tool"))[:50]
+                        self._notify_activity("tool", name)
+
             def process_chunk(chunk: str) -> None:
-                # Parse JSON events and convert to human-readable text
-                for line in chunk.split("\n"):
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        event = json.loads(line)
-                        if not isinstance(event, dict):
-                            continue
-                        json_events.append(event)
-
-                        # Check for API errors (model not supported, etc.)
-                        if event.get("type") == "error":
-                            msg = event.get("message", "Unknown API error")
-                            if "reconnecting" in msg.lower():
-                                reconnect_seen[0] = True
-                            else:
-                                api_error[0] = msg
-                        elif event.get("type") == "turn.failed":
-                            error_info = event.get("error", {})
-                            api_error[0] = error_info.get("message", "Turn failed")
-
-                        # Extract thread_id from first event
-                        if event.get("type") == "thread.started" and "thread_id" in event:
-                            self.thread_id = event["thread_id"]
-
-                        is_agent_message = (
-                            event.get("type") == "item.completed"
-                            and event.get("item", {}).get("type") == "agent_message"
-                        )
-                        if is_agent_message:
-                            reconnect_seen[0] = False
-
-                        # Convert to human-readable and stream
-                        readable = format_json_event_as_text(event)
-                        if readable:
-                            self._notify_activity("stream", readable)
-
-                        # Track last event for diagnostics and adaptive timeout
-                        if event.get("type") == "item.completed":
-                            item = event.get("item", {})
-                            item_type = item.get("type", "")
-                            last_event_info["time"] = time.time()
-                            last_event_info["kind"] = item_type
-                            if item_type == "command_execution":
-                                cmd = item.get("command", "")
-                                last_event_info["command"] = cmd[:80]
-                                # Categorize command for session analysis
-                                cmd_stats["total"] += 1
-                                cmd_lower = cmd.lower()
-                                # Implementation: file writes, edits, git commits
-                                if any(x in cmd_lower for x in [
-                                    "edit ", "write ", "> ", ">> ", "tee ",
-                                    "git add", "git commit", "patch ", "sed -i",
-                                ]):
-                                    cmd_stats["implementation"] += 1
-                                else:
-                                    cmd_stats["exploration"] += 1
-                                # Keep last N commands for diagnostics
-                                cmd_stats["commands"].append(cmd[:100])
-                                if len(cmd_stats["commands"]) > 20:
-                                    cmd_stats["commands"] = cmd_stats["commands"][-20:]
-
-                                # Detect exploration loop: many exploration commands, zero implementation
-                                if (cmd_stats["exploration"] >= CODEX_MAX_EXPLORATION_WITHOUT_IMPL
-                                        and cmd_stats["implementation"] == 0):
-                                    exploration_loop_detected[0] = True
-                            idle_diag["limit"] = (
-                                CODEX_COMMAND_IDLE_TIMEOUT
-                                if item_type == "command_execution"
-                                else CODEX_THINK_IDLE_TIMEOUT
-                            )
-                            idle_diag["kind"] = item_type
-                            # Also send activity notifications for status bar
-                            if item_type == "reasoning":
-                                self._notify_activity("thinking", item.get("text", "")[:80])
-                            elif item_type == "agent_message":
-                                self._notify_activity("text", item.get("text", "")[:80])
-                            elif item_type in ("mcp_tool_call", "command_execution"):
-                                name = item.get("tool", item.get("command", "tool"))[:50]
-                                self._notify_activity("tool", name)
-                    except json.JSONDecodeError:
-                        # Non-JSON line in JSON mode - might be stderr, skip
-                        pass
+                # Decode complete JSON event lines; partial lines carry over to the next chunk
+                for event in parser.feed(chunk):
+                    handle_event(event)
 
             def _idle_timeout_callback(elapsed: float) -> bool:
                 """Decide whether a silent period should be treated as a stall."""
@@ -2189,6 +2264,8 @@ class OpenAICodexProvider(AIProvider):
                 idle_timeout=CODEX_IDLE_TIMEOUT,
                 idle_timeout_callback=_idle_timeout_callback,
             )
+            for event in parser.finish():
+                handle_event(event)
 
             self.current_message = None
             self.process = None
@@ -2292,29 +2369,14 @@ class OpenAICodexProvider(AIProvider):
             if reconnect_seen[0]:
                 raise RuntimeError("Codex connection failed during reconnect attempts")
 
-            # Extract response from JSON events
-            response_parts = []
-            agent_message_parts = []  # Track agent messages separately for checkpoint detection
-            for event in json_events:
-                if event.get("type") == "item.completed":
-                    item = event.get("item", {})
-                    if item.get("type") == "agent_message":
-                        text = item.get("text", "")
-                        response_parts.append(text)
-                        agent_message_parts.append(text)
-                    elif item.get("type") == "reasoning":
-                        text = item.get("text", "")
-                        if text:
-                            response_parts.insert(0, f"*Thinking: {text}*\n\n")
-
-            if response_parts:
-                full_response = "".join(response_parts).strip()
-
+            # Response was assembled from JSON events as they streamed in
+            full_response = parser.json_response()
+            if full_response:
                 # Check for progress checkpoint: model output progress markers but no completion
                 # This indicates the model wanted to continue but exec mode terminated the session
                 # Note: This logic is primarily for direct provider usage. The task executor
                 # handles checkpoint detection separately for PTY-based execution.
-                agent_message_text = "\n".join(agent_message_parts)
+                agent_message_text = "\n".join(parser.agent_messages)
                 if self.thread_id and not _is_recovery and _codex_needs_continuation(agent_message_text):
                     self._notify_activity(
                         "stream",
@@ -2332,7 +2394,11 @@ class OpenAICodexProvider(AIProvider):
 
                 return full_response
 
-            # Fallback to raw output if no JSON events parsed
+            # Fallback to text-mode output if no JSON events were parsed
+            if not parser.saw_json:
+                text_response = parser.text_result()
+                if text_response:
+                    return text_response
             output = _strip_ansi_codes(output)
             return output.strip() if output else "No response from Codex"
 
@@ -2484,8 +2550,6 @@ class GeminiCodeAssistProvider(AIProvider):
             self.current_message = message
 
     def get_response(self, timeout: float = 1800.0) -> str:  # noqa: C901
-        import json
-
         if not self.current_message:
             return ""
 
@@ -2513,46 +2577,40 @@ class GeminiCodeAssistProvider(AIProvider):
             env = os.environ.copy()
             env["TERM"] = "xterm-256color"
 
-            json_events = []
             response_parts = []
             usage_stats = {}
             init_model = [None]  # mutable for closure
 
+            def on_init(event: dict) -> None:
+                # Extract session_id from init event
+                if "session_id" in event:
+                    self.session_id = event["session_id"]
+                if "model" in event:
+                    init_model[0] = event["model"]
+
+            def on_message(event: dict) -> None:
+                # Collect response content
+                if event.get("role") == "assistant":
+                    content = event.get("content", "")
+                    if content:
+                        response_parts.append(content)
+                        self._notify_activity("text", content[:80])
+
+            def on_result(event: dict) -> None:
+                # Capture usage stats from result event
+                stats = event.get("stats")
+                if stats and isinstance(stats, dict):
+                    usage_stats.update(stats)
+
+            decoder = NDJSONDecoder(
+                {"init": on_init, "message": on_message, "result": on_result},
+                on_text=self._notify_text_line,
+            )
+
             def handle_chunk(decoded: str) -> None:
                 # Stream raw output for live display
                 self._notify_activity("stream", decoded)
-                # Parse JSON lines
-                for line in decoded.split("\n"):
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        event = json.loads(line)
-                        if not isinstance(event, dict):
-                            continue
-                        json_events.append(event)
-                        evt_type = event.get("type")
-                        # Extract session_id from init event
-                        if evt_type == "init":
-                            if "session_id" in event:
-                                self.session_id = event["session_id"]
-                            if "model" in event:
-                                init_model[0] = event["model"]
-                        # Collect response content
-                        elif evt_type == "message" and event.get("role") == "assistant":
-                            content = event.get("content", "")
-                            if content:
-                                response_parts.append(content)
-                                self._notify_activity("text", content[:80])
-                        # Capture usage stats from result event
-                        elif evt_type == "result":
-                            stats = event.get("stats")
-                            if stats and isinstance(stats, dict):
-                                usage_stats.update(stats)
-                    except json.JSONDecodeError:
-                        # Non-JSON line (warnings, etc.) - just notify
-                        if line and len(line) > 10:
-                            self._notify_activity("text", line[:80])
+                decoder.feed(decoded)
 
             self.process, self.master_fd = _start_pty_process(cmd, cwd=self.project_path, env=env)
 
@@ -2560,6 +2618,7 @@ class GeminiCodeAssistProvider(AIProvider):
                 self.process.stdin.close()
 
             output, timed_out, idle_stalled = _stream_pty_output(self.process, self.master_fd, handle_chunk, timeout)
+            decoder.flush()
 
             # Record usage stats if we got any
             if usage_stats:
@@ -2668,8 +2727,6 @@ class QwenCodeProvider(AIProvider):
             self.current_message = message
 
     def get_response(self, timeout: float = 1800.0) -> str:  # noqa: C901
-        import json
-
         if not self.current_message:
             return ""
 
@@ -2703,46 +2760,21 @@ class QwenCodeProvider(AIProvider):
             env = os.environ.copy()
             env["TERM"] = "xterm-256color"
 
-            json_events = []
             response_parts = []
 
             final_result = [None]  # Store final result from result event
 
+            def on_system(event: dict) -> None:
+                # Extract session_id from system/init event
+                if "session_id" in event:
+                    self.session_id = event["session_id"]
+
+            decoder = self._stream_json_decoder(response_parts, final_result, {"system": on_system})
+
             def handle_chunk(decoded: str) -> None:
                 # Stream raw output for live display
                 self._notify_activity("stream", decoded)
-                # Parse JSON lines
-                for line in decoded.split("\n"):
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        event = json.loads(line)
-                        if not isinstance(event, dict):
-                            continue
-                        json_events.append(event)
-                        # Extract session_id from system/init event
-                        if event.get("type") == "system" and "session_id" in event:
-                            self.session_id = event["session_id"]
-                        # Handle assistant type with content blocks (preferred format)
-                        # Skip 'message' events with role='assistant' as they duplicate
-                        # the content from 'assistant' type events
-                        if event.get("type") == "assistant":
-                            message = event.get("message", {})
-                            content_blocks = message.get("content", [])
-                            for block in content_blocks:
-                                if isinstance(block, dict) and block.get("type") == "text":
-                                    text = block.get("text", "")
-                                    if text:
-                                        response_parts.append(text)
-                                        self._notify_activity("text", text[:80])
-                        # Capture final result from result event
-                        if event.get("type") == "result" and "result" in event:
-                            final_result[0] = event["result"]
-                    except json.JSONDecodeError:
-                        # Non-JSON line (warnings, etc.) - just notify
-                        if line and len(line) > 10:
-                            self._notify_activity("text", line[:80])
+                decoder.feed(decoded)
 
             self.process, self.master_fd = _start_pty_process(cmd, cwd=self.project_path, env=env)
 
@@ -2751,6 +2783,7 @@ class QwenCodeProvider(AIProvider):
                 self.process.stdin.close()
 
             output, timed_out, idle_stalled = _stream_pty_output(self.process, self.master_fd, handle_chunk, timeout)
+            decoder.flush()
 
             self.current_message = None
             self.process = None
@@ -2861,8 +2894,6 @@ class OpenCodeProvider(AIProvider):
             self.current_message = message
 
     def get_response(self, timeout: float = 1800.0) -> str:  # noqa: C901
-        import json
-
         if not self.current_message:
             return ""
 
@@ -2881,45 +2912,26 @@ class OpenCodeProvider(AIProvider):
             env["TERM"] = "xterm-256color"
             # No need to set XDG_DATA_HOME; OpenCode v1.1+ uses ~/.local/share/opencode
 
-            json_events = []
             response_parts = []
             final_result = [None]  # Store final result from result event
 
+            def on_system(event: dict) -> None:
+                if "session_id" in event:
+                    self.session_id = event["session_id"]
+
+            def on_session(event: dict) -> None:
+                if "id" in event:
+                    self.session_id = event["id"]
+
+            # Extract session_id from system/init event or session event
+            decoder = self._stream_json_decoder(
+                response_parts, final_result, {"system": on_system, "session": on_session}
+            )
+
             def handle_chunk(decoded: str) -> None:
                 # Stream raw output for live display
                 self._notify_activity("stream", decoded)
-                # Parse JSON lines
-                for line in decoded.split("\n"):
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        event = json.loads(line)
-                        if not isinstance(event, dict):
-                            continue
-                        json_events.append(event)
-                        # Extract session_id from system/init event or session event
-                        if event.get("type") == "system" and "session_id" in event:
-                            self.session_id = event["session_id"]
-                        elif event.get("type") == "session" and "id" in event:
-                            self.session_id = event["id"]
-                        # Handle assistant type with content blocks
-                        if event.get("type") == "assistant":
-                            message = event.get("message", {})
-                            content_blocks = message.get("content", [])
-                            for block in content_blocks:
-                                if isinstance(block, dict) and block.get("type") == "text":
-                                    text = block.get("text", "")
-                                    if text:
-                                        response_parts.append(text)
-                                        self._notify_activity("text", text[:80])
-                        # Capture final result from result event
-                        if event.get("type") == "result" and "result" in event:
-                            final_result[0] = event["result"]
-                    except json.JSONDecodeError:
-                        # Non-JSON line (warnings, etc.) - just notify
-                        if line and len(line) > 10:
-                            self._notify_activity("text", line[:80])
+                decoder.feed(decoded)
 
             self.process, self.master_fd = _start_pty_process(cmd, cwd=self.project_path, env=env)
 
@@ -2928,6 +2940,7 @@ class OpenCodeProvider(AIProvider):
                 self.process.stdin.close()
 
             output, timed_out, idle_stalled = _stream_pty_output(self.process, self.master_fd, handle_chunk, timeout)
+            decoder.flush()
 
             self.current_message = None
             self.process = None
@@ -3043,8 +3056,6 @@ class KimiCodeProvider(AIProvider):
             self.current_message = message
 
     def get_response(self, timeout: float = 1800.0) -> str:  # noqa: C901
-        import json
-
         if not self.current_message:
             return ""
 
@@ -3079,45 +3090,26 @@ class KimiCodeProvider(AIProvider):
             # Set isolated home directory for config
             env["HOME"] = str(self._get_isolated_config_dir())
 
-            json_events = []
             response_parts = []
             final_result = [None]
 
+            def on_system(event: dict) -> None:
+                if "session_id" in event:
+                    self.session_id = event["session_id"]
+
+            def on_session(event: dict) -> None:
+                if "id" in event:
+                    self.session_id = event["id"]
+
+            # Extract session_id from session/system event
+            decoder = self._stream_json_decoder(
+                response_parts, final_result, {"system": on_system, "session": on_session}
+            )
+
             def handle_chunk(decoded: str) -> None:
                 # Stream raw output for live display
                 self._notify_activity("stream", decoded)
-                # Parse JSON lines
-                for line in decoded.split("\n"):
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        event = json.loads(line)
-                        if not isinstance(event, dict):
-                            continue
-                        json_events.append(event)
-                        # Extract session_id from session/system event
-                        if event.get("type") == "session" and "id" in event:
-                            self.session_id = event["id"]
-                        elif event.get("type") == "system" and "session_id" in event:
-                            self.session_id = event["session_id"]
-                        # Handle assistant type with content blocks
-                        if event.get("type") == "assistant":
-                            message = event.get("message", {})
-                            content_blocks = message.get("content", [])
-                            for block in content_blocks:
-                                if isinstance(block, dict) and block.get("type") == "text":
-                                    text = block.get("text", "")
-                                    if text:
-                                        response_parts.append(text)
-                                        self._notify_activity("text", text[:80])
-                        # Capture final result from result event
-                        if event.get("type") == "result" and "result" in event:
-                            final_result[0] = event["result"]
-                    except json.JSONDecodeError:
-                        # Non-JSON line - just notify
-                        if line and len(line) > 10:
-                            self._notify_activity("text", line[:80])
+                decoder.feed(decoded)
 
             self.process, self.master_fd = _start_pty_process(cmd, cwd=self.project_path, env=env)
 
@@ -3126,6 +3118,7 @@ class KimiCodeProvider(AIProvider):
                 self.process.stdin.close()
 
             output, timed_out, idle_stalled = _stream_pty_output(self.process, self.master_fd, handle_chunk, timeout)
+            decoder.flush()
 
             self.current_message = None
             self.process = None
@@ -3249,12 +3242,11 @@ class MistralVibeProvider(AIProvider):
             env = os.environ.copy()
             env["TERM"] = "xterm-256color"
 
+            decoder = NDJSONDecoder(on_text=self._notify_text_line)
+
             def handle_chunk(decoded: str) -> None:
                 self._notify_activity("stream", decoded)
-                for line in decoded.split("\n"):
-                    stripped = line.strip()
-                    if stripped and len(stripped) > 10:
-                        self._notify_activity("text", stripped[:80])
+                decoder.feed(decoded)
 
             self.process, self.master_fd = _start_pty_process(cmd, cwd=self.project_path, env=env)
 
@@ -3262,6 +3254,7 @@ class MistralVibeProvider(AIProvider):
                 self.process.stdin.close()
 
             output, timed_out, idle_stalled = _stream_pty_output(self.process, self.master_fd, handle_chunk, timeout)
+            decoder.flush()
 
             self.current_message = None
             self.process = None
@@ -0,0 +1,471 @@
+"""Cross-session search index for event logs.
+
+An embedded SQLite database (``{log_dir}/index.sqlite``) fed incrementally from
+``EventLog.log``. It holds per-session metadata, an FTS5 table over task
+descriptions, user/assistant text, tool calls and milestones, and a table of
+file paths touched by tool calls (stored reversed so suffix lookups like
+"src/foo.py" use the index).
+
+Logging only queues the event; a background writer commits queued events in
+batches, and every query first writes whatever is still queued, so search
+results always include events already logged.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = "index.sqlite"
+
+# An idle writer thread exits after this long; the next event starts a new one
+WRITER_IDLE_SECONDS = 30.0
+
+# Event types that contribute to the index; everything else is ignored cheaply
+INDEXED_EVENT_TYPES = frozenset({
+    "session_started",
+    "user_message",
+    "assistant_message",
+    "tool_call_started",
+    "milestone",
+    "session_ended",
+})
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY,
+    task_description TEXT,
+    project_path TEXT,
+    coding_provider TEXT,
+    coding_account TEXT,
+    started_at TEXT,
+    last_ts TEXT,
+    last_seq INTEGER NOT NULL DEFAULT 0,
+    ended INTEGER NOT NULL DEFAULT 0,
+    end_reason TEXT,
+    source_mtime_ns INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS sessions_last_ts ON sessions(last_ts);
+CREATE INDEX IF NOT EXISTS sessions_project ON sessions(project_path);
+CREATE TABLE IF NOT EXISTS touched_files (
+    session_id TEXT NOT NULL,
+    rpath TEXT NOT NULL,
+    path TEXT NOT NULL,
+    tool TEXT,
+    seq INTEGER NOT NULL,
+    ts TEXT
+);
+CREATE INDEX IF NOT EXISTS touched_files_rpath ON touched_files(rpath, ts);
+CREATE INDEX IF NOT EXISTS touched_files_session ON touched_files(session_id);
+CREATE VIRTUAL TABLE IF NOT EXISTS docs USING fts5(
+    content,
+    path,
+    command,
+    session_id UNINDEXED,
+    seq UNINDEXED,
+    ts UNINDEXED,
+    kind UNINDEXED
+);
+"""
+
+
+@dataclass
+class SearchHit:
+    """A single full-text search match."""
+
+    session_id: str
+    seq: int
+    ts: str | None
+    kind: str
+    snippet: str
+
+
+@dataclass
+class FileTouch:
+    """The most recent touch of a file path by one session."""
+
+    session_id: str
+    path: str
+    tool: str | None
+    seq: int
+    ts: str | None
+
+
+def _fts_query(text: str) -> str:
+    """Turn free text into an FTS5 query of quoted terms (all must match).
+
+    Quoting every term keeps user input from being parsed as FTS syntax; a
+    trailing ``*`` on a term is preserved as a prefix match.
+    """
+    terms = []
+    for raw in text.split():
+        prefix = raw.endswith("*")
+        term = raw.rstrip("*").replace('"', '""')
+        if term:
+            terms.append(f'"{term}"' + ("*" if prefix else ""))
+    return " ".join(terms)
+
+
+def _assistant_text(blocks: list[dict[str, Any]]) -> str:
+    parts = []
+    for block in blocks or []:
+        if isinstance(block, dict) and block.get("kind") in ("text", "thinking", "error"):
+            content = block.get("content")
+            if content:
+                parts.append(str(content))
+    return "\n".join(parts)
+
+
+class SessionIndex:
+    """SQLite/FTS5 index over all session event logs in a log directory."""
+
+    def __init__(self, log_dir: Path):
+        self.log_dir = Path(log_dir)
+        self.db_path = self.log_dir / INDEX_FILENAME
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self.available = True
+        # Events waiting for the writer thread, guarded by _pending_lock
+        self._pending: list[dict[str, Any]] = []
+        self._pending_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._writer: threading.Thread | None = None
+
+    def _connect(self) -> sqlite3.Connection | None:
+        if self._conn is not None or not self.available:
+            return self._conn
+        try:
+            self.log_dir.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=5)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        except sqlite3.Error:
+            # e.g. SQLite built without FTS5: search is simply unavailable
+            logger.warning("Session search index unavailable", exc_info=True)
+            self.available = False
+        return self._conn
+
+    def close(self) -> None:
+        """Write queued events and close the database connection."""
+        with self._lock:
+            conn = self._connect() if self._pending else self._conn
+            if conn is not None:
+                self._write_pending(conn)
+                conn.close()
+                self._conn = None
+
+    def add_event(self, event: dict[str, Any]) -> None:
+        """Queue a logged event for indexing (non-indexed types are ignored)."""
+        if event.get("type") not in INDEXED_EVENT_TYPES or not self.available:
+            return
+        with self._pending_lock:
+            self._pending.append(event)
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._run_writer, name="chad-index-writer", daemon=True)
+                self._writer.start()
+        self._wake.set()
+
+    def flush(self) -> None:
+        """Write every queued event now."""
+        with self._lock:
+            conn = self._connect()
+            if conn is not None:
+                self._write_pending(conn)
+
+    def _run_writer(self) -> None:
+        while True:
+            self._wake.wait(WRITER_IDLE_SECONDS)
+            with self._pending_lock:
+                if not self._pending:
+                    self._writer = None
+                    return
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.warning("Failed to write session index batch", exc_info=True)
+
+    def _write_pending(self, conn: sqlite3.Connection) -> None:
+        """Commit queued events in one transaction; caller holds ``_lock``."""
+        with self._pending_lock:
+            batch, self._pending = self._pending, []
+        if batch:
+            with conn:
+                for event in batch:
+                    self._add_event(conn, event)
+
+    def _add_event(self, conn: sqlite3.Connection, event: dict[str, Any]) -> None:
+        etype = event.get("type")
+        session_id = str(event.get("session_id") or "")
+        seq = int(event.get("seq") or 0)
+        ts = event.get("ts")
+        if not session_id:
+            return
+
+        # Live logging and backfill can both see an event; index it only once
+        row = conn.execute("SELECT last_seq FROM sessions WHERE session_id = ?", (session_id,)).fetchone()
+        if row and seq <= row[0]:
+            return
+
+        conn.execute(
+            "INSERT INTO sessions (session_id, started_at, last_ts, last_seq) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(session_id) DO UPDATE SET last_ts = excluded.last_ts, "
+            "last_seq = MAX(last_seq, excluded.last_seq)",
+            (session_id, ts, ts, seq),
+        )
+
+        def add_doc(kind: str, content: str = "", path: str = "", command: str = "") -> None:
+            if content or path or command:
+                conn.execute(
+                    "INSERT INTO docs (content, path, command, session_id, seq, ts, kind) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (content, path, command, session_id, seq, ts, kind),
+                )
+
+        if etype == "session_started":
+            conn.execute(
+                "UPDATE sessions SET task_description = ?, project_path = ?, coding_provider = ?, "
+                "coding_account = ?, ended = 0, end_reason = NULL WHERE session_id = ?",
+                (
+                    event.get("task_description"),
+                    event.get("project_path"),
+                    event.get("coding_provider"),
+                    event.get("coding_account"),
+                    session_id,
+                ),
+            )
+            add_doc("task", str(event.get("task_description") or ""), path=str(event.get("project_path") or ""))
+        elif etype == "user_message":
+            add_doc("user", str(event.get("content") or ""))
+        elif etype == "assistant_message":
+            add_doc("assistant", _assistant_text(event.get("blocks") or []))
+        elif etype == "tool_call_started":
+            path = str(event.get("path") or "")
+            add_doc(
+                "tool",
+                str(event.get("tool") or ""),
+                path=path,
+                command=str(event.get("command") or ""),
+            )
+            if path:
+                conn.execute(
+                    "INSERT INTO touched_files (session_id, rpath, path, tool, seq, ts) VALUES (?, ?, ?, ?, ?, ?)",
+                    (session_id, path[::-1], path, event.get("tool"), seq, ts),
+                )
+        elif etype == "milestone":
+            add_doc("milestone", f"{event.get('title') or ''}\n{event.get('summary') or ''}".strip())
+        elif etype == "session_ended":
+            conn.execute(
+                "UPDATE sessions SET ended = 1, end_reason = ? WHERE session_id = ?",
+                (event.get("reason"), session_id),
+            )
+
+    def sync_session(self, session_id: str) -> int:
+        """Index events from a session's log that are not in the index yet.
+
+        Returns:
+            Number of events read from the log
+        """
+        from chad.util.event_log import EventLog
+
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return 0
+            self._write_pending(conn)
+            row = conn.execute(
+                "SELECT last_seq FROM sessions WHERE session_id = ?", (session_id,)
+            ).fetchone()
+        last_seq = int(row[0]) if row else 0
+
+        log = EventLog(session_id, base_dir=self.log_dir)
+        events = log.get_events(since_seq=last_seq, event_types=list(INDEXED_EVENT_TYPES))
+        with self._lock:
+            with conn:
+                for event in events:
+                    self._add_event(conn, event)
+        return len(events)
+
+    def backfill(self) -> int:
+        """Index every log in the directory whose file changed since last indexed.
+
+        Returns:
+            Number of sessions (re)indexed
+        """
+        from chad.util.event_log import COLD_LOG_SUFFIX, LOG_SUFFIX
+
+        if not self.log_dir.exists():
+            return 0
+
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return 0
+            known = dict(conn.execute("SELECT session_id, source_mtime_ns FROM sessions").fetchall())
+
+        synced = 0
+        try:
+            entries = list(os.scandir(self.log_dir))
+        except OSError:
+            return 0
+
+        for entry in entries:
+            if entry.name.endswith(LOG_SUFFIX):
+                session_id = entry.name[: -len(LOG_SUFFIX)]
+            elif entry.name.endswith(COLD_LOG_SUFFIX):
+                session_id = entry.name[: -len(COLD_LOG_SUFFIX)]
+            else:
+                continue
+            try:
+                mtime_ns = entry.stat().st_mtime_ns
+                if known.get(session_id) == mtime_ns:
+                    continue
+                self.sync_session(session_id)
+                with self._lock:
+                    with conn:
+                        conn.execute(
+                            "UPDATE sessions SET source_mtime_ns = ? WHERE session_id = ?",
+                            (mtime_ns, session_id),
+                        )
+                synced += 1
+            except Exception:
+                logger.warning("Failed to index session log %s", entry.name, exc_info=True)
+
+        return synced
+
+    def remove_session(self, session_id: str) -> None:
+        """Drop all index rows for a session."""
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            self._write_pending(conn)
+            with conn:
+                conn.execute("DELETE FROM docs WHERE session_id = ?", (session_id,))
+                conn.execute("DELETE FROM touched_files WHERE session_id = ?", (session_id,))
+                conn.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+
+    def search(
+        self,
+        query: str,
+        session_id: str | None = None,
+        kinds: list[str] | None = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> tuple[list[SearchHit], int]:
+        """Full-text search across sessions, newest matches first.
+
+        Returns:
+            (hits for the requested page, total number of matches)
+        """
+        match = _fts_query(query)
+        if not match:
+            return [], 0
+
+        where = ["docs MATCH ?"]
+        params: list[Any] = [match]
+        if session_id:
+            where.append("session_id = ?")
+            params.append(session_id)
+        if kinds:
+            where.append(f"kind IN ({', '.join('?' * len(kinds))})")
+            params.extend(kinds)
+        clause = " AND ".join(where)
+
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return [], 0
+            self._write_pending(conn)
+            try:
+                total = conn.execute(f"SELECT COUNT(*) FROM docs WHERE {clause}", params).fetchone()[0]
+                rows = conn.execute(
+                    f"SELECT session_id, seq, ts, kind, "
+                    f"snippet(docs, -1, '[', ']', '…', 12) FROM docs WHERE {clause} "
+                    f"ORDER BY ts DESC, seq DESC LIMIT ? OFFSET ?",
+                    params + [limit, offset],
+                ).fetchall()
+            except sqlite3.OperationalError:
+                return [], 0
+
+        hits = [SearchHit(session_id=r[0], seq=int(r[1]), ts=r[2], kind=r[3], snippet=r[4]) for r in rows]
+        return hits, int(total)
+
+    def matching_session_ids(self, query: str) -> list[str]:
+        """Return IDs of sessions with any document matching the query, newest first."""
+        match = _fts_query(query)
+        if not match:
+            return []
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return []
+            self._write_pending(conn)
+            try:
+                rows = conn.execute(
+                    "SELECT d.session_id FROM docs d LEFT JOIN sessions s ON s.session_id = d.session_id "
+                    "WHERE docs MATCH ? GROUP BY d.session_id ORDER BY MAX(s.last_ts) DESC",
+                    (match,),
+                ).fetchall()
+            except sqlite3.OperationalError:
+                return []
+        return [r[0] for r in rows]
+
+    def sessions_touching(self, path: str, limit: int = 50, offset: int = 0) -> list[FileTouch]:
+        """Sessions whose tool calls touched a path, most recent touch first.
+
+        ``path`` matches a logged path exactly or as a trailing path component
+        sequence, so "src/foo.py" finds "/home/me/project/src/foo.py".
+        """
+        path = path.strip()
+        if not path:
+            return []
+        exact = path[::-1]
+        suffix = ("/" + path.lstrip("/"))[::-1]
+
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return []
+            self._write_pending(conn)
+            rows = conn.execute(
+                "SELECT session_id, path, tool, seq, MAX(ts) FROM touched_files "
+                "WHERE rpath = ? OR (rpath >= ? AND rpath < ?) "
+                "GROUP BY session_id ORDER BY MAX(ts) DESC LIMIT ? OFFSET ?",
+                (exact, suffix, suffix + "\U0010ffff", limit, offset),
+            ).fetchall()
+        return [FileTouch(session_id=r[0], path=r[1], tool=r[2], seq=int(r[3]), ts=r[4]) for r in rows]
+
+
+_indexes: dict[Path, SessionIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_session_index(log_dir: Path | None = None) -> SessionIndex:
+    """Get the shared SessionIndex for a log directory."""
+    from chad.util.event_log import EventLog
+
+    log_dir = Path(EventLog.get_log_dir(log_dir))
+    with _indexes_lock:
+        index = _indexes.get(log_dir)
+        if index is None:
+            index = SessionIndex(log_dir)
+            _indexes[log_dir] = index
+        return index
+
+
+def reset_session_indexes() -> None:
+    """Close and forget all open indexes (for testing)."""
+    with _indexes_lock:
+        for index in _indexes.values():
+            index.close()
+        _indexes.clear()
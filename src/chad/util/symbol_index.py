@@ -0,0 +1,776 @@
+"""Symbol and import indexing for Python and TypeScript sources.
+
+Two views of a project are built with ``ast``:
+
+- ``SymbolIndex``: definitions and imported names per file, used by
+  ``scripts/symbol_index.py`` to answer "who defines / references X".
+- ``ImportGraph``: module-level import edges between the project's Python
+  files, used by change-aware verification to find the tests that
+  (transitively) import a changed file. The graph is cached on disk per
+  project and only files whose mtime or size changed are re-parsed.
+- ``SymbolStore``: a persistent SQLite copy of the symbol index
+  (``.chad/symbol_index.sqlite``), updated incrementally and optionally
+  served over a Unix socket by :func:`serve` so repeated lookups skip
+  start-up and indexing entirely.
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import json
+import logging
+import os
+import re
+import socket
+import sqlite3
+import tempfile
+import threading
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+logger = logging.getLogger(__name__)
+
+# Directories never indexed (dependencies, build output, Chad's own worktrees)
+SKIP_DIRS = frozenset({
+    ".git", ".hg", "node_modules", "__pycache__", ".venv", "venv", ".virtualenv",
+    "env", ".tox", ".nox", ".mypy_cache", ".pytest_cache", ".ruff_cache",
+    "build", "dist", ".chad-worktrees",
+})
+
+# Bump when the cached import graph format or extraction rules change
+IMPORT_GRAPH_VERSION = 1
+
+# Changed files with these suffixes cannot affect Python tests
+INERT_SUFFIXES = frozenset({
+    ".md", ".rst", ".ts", ".tsx", ".js", ".jsx", ".mjs", ".css", ".scss",
+    ".svg", ".png", ".jpg", ".jpeg", ".gif", ".ico", ".webp",
+})
+
+# String literals that look like dotted module paths (mock.patch targets,
+# importlib.import_module arguments) count as imports
+_DOTTED_NAME_RE = re.compile(r"^[A-Za-z_]\w*(?:\.[A-Za-z_]\w*)+$")
+
+
+@dataclass
+class SymbolRef:
+    file: str  # Relative to the index root
+    line: int
+    kind: str  # "def", "class", "import", "use"
+    context: str  # The line of code
+
+
+@dataclass
+class SymbolIndex:
+    definitions: dict[str, list[SymbolRef]] = field(
+        default_factory=lambda: defaultdict(list))
+    references: dict[str, list[SymbolRef]] = field(
+        default_factory=lambda: defaultdict(list))
+    file_exports: dict[str, set[str]] = field(
+        default_factory=lambda: defaultdict(set))
+
+    def all_symbols(self) -> set[str]:
+        return set(self.definitions.keys()) | set(self.references.keys())
+
+
+def iter_source_files(base_dir: Path, suffixes: tuple[str, ...]) -> Iterator[Path]:
+    """Yield files under base_dir with one of suffixes, skipping SKIP_DIRS."""
+    for dirpath, dirnames, filenames in os.walk(base_dir):
+        dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS)
+        for name in sorted(filenames):
+            if name.endswith(suffixes):
+                yield Path(dirpath) / name
+
+
+def _index_python_file(path: Path, rel: str, index: SymbolIndex) -> None:
+    """Index a Python file using AST parsing."""
+    try:
+        source = path.read_text(encoding="utf-8", errors="replace")
+        tree = ast.parse(source, filename=str(path))
+    except (SyntaxError, ValueError):
+        return
+
+    lines = source.splitlines()
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.FunctionDef) or isinstance(node, ast.AsyncFunctionDef):
+            name = node.name
+            ctx = lines[node.lineno - 1].strip() if node.lineno <= len(lines) else ""
+            ref = SymbolRef(file=rel, line=node.lineno, kind="def", context=ctx)
+            index.definitions[name].append(ref)
+            index.file_exports[rel].add(name)
+
+        elif isinstance(node, ast.ClassDef):
+            name = node.name
+            ctx = lines[node.lineno - 1].strip() if node.lineno <= len(lines) else ""
+            ref = SymbolRef(file=rel, line=node.lineno, kind="class", context=ctx)
+            index.definitions[name].append(ref)
+            index.file_exports[rel].add(name)
+
+        elif isinstance(node, ast.ImportFrom):
+            if node.names:
+                for alias in node.names:
+                    name = alias.name
+                    if name == "*":
+                        continue
+                    lineno = node.lineno
+                    ctx = lines[lineno - 1].strip() if lineno <= len(lines) else ""
+                    ref = SymbolRef(file=rel, line=lineno, kind="import", context=ctx)
+                    index.references[name].append(ref)
+
+        elif isinstance(node, ast.Import):
+            for alias in node.names:
+                # For "import foo.bar", index "bar" as the short name
+                name = alias.asname or alias.name.split(".")[-1]
+                lineno = node.lineno
+                ctx = lines[lineno - 1].strip() if lineno <= len(lines) else ""
+                ref = SymbolRef(file=rel, line=lineno, kind="import", context=ctx)
+                index.references[name].append(ref)
+
+
+def _index_ts_file(path: Path, rel: str, index: SymbolIndex) -> None:
+    """Index a TypeScript/TSX file using regex (no full TS parser needed)."""
+    try:
+        source = path.read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        return
+
+    lines = source.splitlines()
+
+    for i, line in enumerate(lines, 1):
+        stripped = line.strip()
+
+        # Function/const definitions
+        for m in re.finditer(
+            r'(?:export\s+)?(?:function|const|let|var)\s+(\w+)', stripped
+        ):
+            name = m.group(1)
+            # Skip common noise words
+            if name in ("if", "for", "while", "return", "true", "false", "null"):
+                continue
+            index.definitions[name].append(
+                SymbolRef(file=rel, line=i, kind="def", context=stripped))
+            index.file_exports[rel].add(name)
+
+        # Interface/type/class definitions
+        for m in re.finditer(
+            r'(?:export\s+)?(?:interface|type|class|enum)\s+(\w+)', stripped
+        ):
+            name = m.group(1)
+            index.definitions[name].append(
+                SymbolRef(file=rel, line=i, kind="class", context=stripped))
+            index.file_exports[rel].add(name)
+
+        # Imports
+        for m in re.finditer(
+            r'import\s+\{([^}]+)\}\s+from', stripped
+        ):
+            for name in m.group(1).split(","):
+                name = name.strip().split(" as ")[0].strip()
+                if name:
+                    index.references[name].append(
+                        SymbolRef(file=rel, line=i, kind="import",
+                                  context=stripped))
+
+        # Default imports
+        for m in re.finditer(
+            r'import\s+(\w+)\s+from', stripped
+        ):
+            name = m.group(1)
+            if name not in ("type", "from"):
+                index.references[name].append(
+                    SymbolRef(file=rel, line=i, kind="import",
+                              context=stripped))
+
+
+def build_index(
+    root: Path,
+    python_dirs: Iterable[str] = ("src", "tests"),
+    ts_dirs: Iterable[str] = ("ui/src", "client/src"),
+) -> SymbolIndex:
+    """Build a symbol index for the Python and TypeScript sources under root."""
+    root = Path(root)
+    index = SymbolIndex()
+
+    for base in python_dirs:
+        base_dir = root / base
+        if not base_dir.exists():
+            continue
+        for path in iter_source_files(base_dir, (".py",)):
+            _index_python_file(path, path.relative_to(root).as_posix(), index)
+
+    for base in ts_dirs:
+        base_dir = root / base
+        if not base_dir.exists():
+            continue
+        for path in iter_source_files(base_dir, (".ts", ".tsx")):
+            _index_ts_file(path, path.relative_to(root).as_posix(), index)
+
+    return index
+
+
+def find_symbol(index: SymbolIndex, name: str,
+                mode: str = "all") -> list[SymbolRef]:
+    """Find references to a symbol.
+
+    Args:
+        name: Symbol name (case-sensitive)
+        mode: "all", "define", or "callers"
+    """
+    results = []
+    if mode in ("all", "define"):
+        results.extend(index.definitions.get(name, []))
+    if mode in ("all", "callers"):
+        results.extend(index.references.get(name, []))
+    return results
+
+
+def find_impact(index: SymbolIndex, file_path: str,
+                root: Path | None = None) -> dict[str, list[SymbolRef]]:
+    """Find all files that would be affected by changing a given file.
+
+    Returns a dict of symbol_name → list of files that reference it.
+    """
+    # Normalize path
+    if root is not None and Path(file_path).is_absolute():
+        rel = str(Path(file_path).relative_to(root))
+    else:
+        rel = file_path
+    rel = rel.replace("\\", "/")
+
+    exported = index.file_exports.get(rel, set())
+    impact: dict[str, list[SymbolRef]] = {}
+
+    for symbol in exported:
+        refs = index.references.get(symbol, [])
+        # Exclude self-references
+        external = [r for r in refs if r.file != rel]
+        if external:
+            impact[symbol] = external
+
+    return impact
+
+
+def module_name_for(root: Path, rel: str) -> str:
+    """Dotted module name of a Python file, as seen from its import root.
+
+    The import root is the nearest ancestor directory without an
+    ``__init__.py``, so both ``src/`` layouts and flat layouts resolve
+    (``src/chad/util/providers.py`` → ``chad.util.providers``).
+    """
+    parts = Path(rel).with_suffix("").parts
+    if parts and parts[-1] == "__init__":
+        parts = parts[:-1]
+    package_depth = 0
+    parent = (root / rel).parent
+    while parent != root and (parent / "__init__.py").exists():
+        package_depth += 1
+        parent = parent.parent
+    keep = package_depth + (0 if rel.endswith("__init__.py") else 1)
+    return ".".join(parts[len(parts) - keep:]) if keep else ""
+
+
+def _prefixes(dotted: str) -> Iterator[str]:
+    """Yield a dotted name and its parents; importing a.b.c executes a and a.b too."""
+    while dotted:
+        yield dotted
+        dotted = dotted.rpartition(".")[0]
+
+
+def extract_imports(source: str, module: str, is_package: bool) -> list[str]:
+    """Return the module names a Python source may import.
+
+    Includes function-level imports, parent packages, ``from x import y``
+    submodule candidates and dotted string literals (``mock.patch`` targets).
+    Names outside the project are kept; callers resolve against their own
+    module table.
+
+    Raises:
+        SyntaxError: If source does not parse
+    """
+    tree = ast.parse(source)
+    package = module if is_package else module.rpartition(".")[0]
+    names: set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                names.update(_prefixes(alias.name))
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                base_parts = package.split(".") if package else []
+                if node.level > 1:
+                    base_parts = base_parts[: len(base_parts) - (node.level - 1)]
+                base = ".".join(base_parts + ([node.module] if node.module else []))
+            else:
+                base = node.module or ""
+            if not base:
+                continue
+            names.update(_prefixes(base))
+            for alias in node.names:
+                if alias.name != "*":
+                    names.add(f"{base}.{alias.name}")
+        elif isinstance(node, ast.Constant) and isinstance(node.value, str):
+            if len(node.value) < 200 and _DOTTED_NAME_RE.match(node.value):
+                names.update(_prefixes(node.value))
+    names.discard(module)
+    return sorted(names)
+
+
+def is_test_file(rel: str) -> bool:
+    """Whether a project-relative path is a pytest test module."""
+    name = rel.rsplit("/", 1)[-1]
+    return name.endswith(".py") and (name.startswith("test_") or name.endswith("_test.py"))
+
+
+def default_cache_dir() -> Path:
+    """Directory for on-disk indexes (``$CHAD_CACHE_DIR`` or ``~/.chad/cache``)."""
+    override = os.environ.get("CHAD_CACHE_DIR")
+    return Path(override) if override else Path.home() / ".chad" / "cache"
+
+
+@dataclass
+class _FileEntry:
+    mtime_ns: int
+    size: int
+    module: str
+    imports: list[str]
+    parsed: bool
+
+
+class ImportGraph:
+    """Cached module import graph of a project's Python files.
+
+    :meth:`refresh` re-parses only files whose mtime or size changed since the
+    cached copy, then :meth:`affected_tests` walks reverse import edges from a
+    set of changed files to the test modules that depend on them.
+    """
+
+    def __init__(self, root: Path, cache_path: Path | None = None) -> None:
+        self.root = Path(root).resolve()
+        if cache_path is None:
+            digest = hashlib.sha1(str(self.root).encode("utf-8")).hexdigest()[:16]
+            cache_path = default_cache_dir() / "import-graphs" / f"{digest}.json"
+        self.cache_path = cache_path
+        self._files: dict[str, _FileEntry] = {}
+        self._known: set[str] = set()
+        self._load()
+
+    def refresh(self) -> int:
+        """Bring the graph up to date with the working tree.
+
+        Returns:
+            Number of files (re-)parsed
+        """
+        seen: dict[str, _FileEntry] = {}
+        parsed = 0
+        for path in iter_source_files(self.root, (".py",)):
+            rel = path.relative_to(self.root).as_posix()
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entry = self._files.get(rel)
+            if entry is None or entry.mtime_ns != stat.st_mtime_ns or entry.size != stat.st_size:
+                entry = self._parse(path, rel, stat)
+                parsed += 1
+            seen[rel] = entry
+        # Remember deleted files so a change that removes a module is still known
+        self._known |= set(self._files) | set(seen)
+        changed = parsed or set(seen) != set(self._files)
+        self._files = seen
+        if changed:
+            self._save()
+        return parsed
+
+    def affected_tests(self, changed_files: Iterable[str]) -> list[str] | None:
+        """Test modules that import a changed file, directly or transitively.
+
+        Args:
+            changed_files: Paths relative to the project root (or absolute)
+
+        Returns:
+            Sorted test paths relative to the root, or None when the graph
+            cannot answer (unknown or unparsable Python file, build/config
+            file changed) and the full suite should run instead.
+        """
+        importers: dict[str, set[str]] = defaultdict(set)
+        for rel, entry in self._files.items():
+            for name in entry.imports:
+                importers[name].add(rel)
+
+        pending: list[str] = []
+        for changed in changed_files:
+            rel = self._relative(changed)
+            if rel is None:
+                return None
+            if not rel.endswith(".py"):
+                if Path(rel).suffix.lower() in INERT_SUFFIXES:
+                    continue
+                return None
+            entry = self._files.get(rel)
+            if entry is None and rel not in self._known:
+                return None
+            if entry is not None and not entry.parsed:
+                return None
+            pending.append(rel)
+        roots = list(pending)
+
+        affected: set[str] = set()
+        while pending:
+            rel = pending.pop()
+            if rel in affected:
+                continue
+            affected.add(rel)
+            entry = self._files.get(rel)
+            if rel.rsplit("/", 1)[-1] == "conftest.py":
+                continue
+            module = entry.module if entry else module_name_for(self.root, rel)
+            # Modules are also importable by their root-relative path when the
+            # project root is on sys.path (e.g. "scripts.symbol_index")
+            for name in {module, rel[:-3].replace("/", ".").removesuffix(".__init__")}:
+                if name:
+                    pending.extend(importers.get(name, ()))
+
+        tests = {rel for rel in affected if is_test_file(rel)}
+        for rel in roots:
+            if rel.rsplit("/", 1)[-1] == "conftest.py":
+                # Edited fixtures apply to every test module under the conftest's
+                # directory. Modules a conftest merely imports are covered by
+                # their own importers instead of fanning out to the whole suite.
+                prefix = rel[: -len("conftest.py")]
+                tests.update(r for r in self._files if r.startswith(prefix) and is_test_file(r))
+        if any(not self._files[t].parsed for t in tests if t in self._files):
+            return None
+        return sorted(t for t in tests if t in self._files)
+
+    def _relative(self, path: str) -> str | None:
+        p = Path(path)
+        if p.is_absolute():
+            try:
+                return p.resolve().relative_to(self.root).as_posix()
+            except ValueError:
+                return None
+        return p.as_posix()
+
+    def _parse(self, path: Path, rel: str, stat: os.stat_result) -> _FileEntry:
+        module = module_name_for(self.root, rel)
+        try:
+            source = path.read_text(encoding="utf-8", errors="replace")
+            imports = extract_imports(source, module, rel.endswith("__init__.py"))
+            ok = True
+        except (SyntaxError, ValueError):
+            imports, ok = [], False
+        return _FileEntry(stat.st_mtime_ns, stat.st_size, module, imports, ok)
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if data.get("version") != IMPORT_GRAPH_VERSION or data.get("root") != str(self.root):
+            return
+        try:
+            self._files = {rel: _FileEntry(*values) for rel, values in data["files"].items()}
+        except (KeyError, TypeError):
+            self._files = {}
+        self._known = set(self._files)
+
+    def _save(self) -> None:
+        data = {
+            "version": IMPORT_GRAPH_VERSION,
+            "root": str(self.root),
+            "files": {
+                rel: [e.mtime_ns, e.size, e.module, e.imports, e.parsed]
+                for rel, e in self._files.items()
+            },
+        }
+        tmp_path = self.cache_path.with_name(f"{self.cache_path.name}.{os.getpid()}.tmp")
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            logger.debug("Could not write import graph cache %s", self.cache_path, exc_info=True)
+
+
+# Persistent symbol index location, relative to the indexed root
+SYMBOL_DB_RELPATH = Path(".chad") / "symbol_index.sqlite"
+
+# Re-index in a process pool only when at least this many files changed
+PARALLEL_PARSE_THRESHOLD = 64
+
+# A query server client must send its request line within this many seconds
+SERVE_CONN_TIMEOUT_SECONDS = 5.0
+
+_SYMBOL_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    sha1 TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS symbols (
+    name TEXT NOT NULL,
+    file TEXT NOT NULL,
+    line INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    context TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS symbols_name ON symbols(name);
+CREATE INDEX IF NOT EXISTS symbols_file ON symbols(file);
+"""
+
+SymbolRow = tuple[str, str, int, str, str]  # (name, file, line, kind, context)
+
+
+def parse_symbols(path: str, rel: str) -> list[SymbolRow]:
+    """Symbol rows for one Python or TypeScript file (process-pool friendly)."""
+    index = SymbolIndex()
+    if rel.endswith(".py"):
+        _index_python_file(Path(path), rel, index)
+    else:
+        _index_ts_file(Path(path), rel, index)
+    rows: list[SymbolRow] = []
+    for table in (index.definitions, index.references):
+        for name, refs in table.items():
+            rows.extend((name, r.file, r.line, r.kind, r.context) for r in refs)
+    return rows
+
+
+def _parse_batch(batch: list[tuple[str, str]]) -> list[SymbolRow]:
+    rows: list[SymbolRow] = []
+    for path, rel in batch:
+        rows.extend(parse_symbols(path, rel))
+    return rows
+
+
+class SymbolStore:
+    """SQLite-backed symbol index that is updated incrementally.
+
+    A file is re-indexed only when its mtime or size changed *and* its content
+    hash differs from the stored one, so checkouts and ``touch`` do not cost
+    a re-parse. Large batches (the first build) are parsed in a process pool.
+    Queries mirror :func:`find_symbol` / :func:`find_impact` over the stored rows.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        db_path: Path | None = None,
+        python_dirs: Iterable[str] = ("src", "tests"),
+        ts_dirs: Iterable[str] = ("ui/src", "client/src"),
+    ) -> None:
+        self.root = Path(root).resolve()
+        self.db_path = db_path or self.root / SYMBOL_DB_RELPATH
+        self.python_dirs = tuple(python_dirs)
+        self.ts_dirs = tuple(ts_dirs)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=5)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SYMBOL_SCHEMA)
+        self._lock = threading.Lock()
+
+    def _source_files(self) -> Iterator[tuple[str, Path]]:
+        for dirs, suffixes in ((self.python_dirs, (".py",)), (self.ts_dirs, (".ts", ".tsx"))):
+            for base in dirs:
+                base_dir = self.root / base
+                if base_dir.exists():
+                    for path in iter_source_files(base_dir, suffixes):
+                        yield path.relative_to(self.root).as_posix(), path
+
+    def update(self, workers: int | None = None) -> tuple[int, int]:
+        """Re-index files that changed since the last update.
+
+        Args:
+            workers: Process pool size for large batches (1 parses in-process)
+
+        Returns:
+            Tuple of (files re-indexed, files removed)
+        """
+        with self._lock:
+            known = {
+                path: (mtime_ns, size, sha1)
+                for path, mtime_ns, size, sha1 in self._conn.execute(
+                    "SELECT path, mtime_ns, size, sha1 FROM files")
+            }
+            seen: set[str] = set()
+            touched: list[tuple[int, int, str]] = []
+            changed: list[tuple[str, Path, int, int, str]] = []
+            for rel, path in self._source_files():
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                seen.add(rel)
+                old = known.get(rel)
+                if old and old[0] == stat.st_mtime_ns and old[1] == stat.st_size:
+                    continue
+                try:
+                    digest = hashlib.sha1(path.read_bytes()).hexdigest()
+                except OSError:
+                    continue
+                if old and old[2] == digest:
+                    touched.append((stat.st_mtime_ns, stat.st_size, rel))
+                else:
+                    changed.append((rel, path, stat.st_mtime_ns, stat.st_size, digest))
+            removed = [rel for rel in known if rel not in seen]
+
+            rows = self._parse([(str(path), rel) for rel, path, *_ in changed], workers)
+            with self._conn:
+                stale = [(rel,) for rel in removed] + [(c[0],) for c in changed]
+                self._conn.executemany("DELETE FROM symbols WHERE file = ?", stale)
+                self._conn.executemany("DELETE FROM files WHERE path = ?", [(rel,) for rel in removed])
+                self._conn.executemany("INSERT INTO symbols VALUES (?, ?, ?, ?, ?)", rows)
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)",
+                    [(rel, mtime_ns, size, digest) for rel, _, mtime_ns, size, digest in changed],
+                )
+                self._conn.executemany("UPDATE files SET mtime_ns = ?, size = ? WHERE path = ?", touched)
+            return len(changed), len(removed)
+
+    @staticmethod
+    def _parse(files: list[tuple[str, str]], workers: int | None) -> list[SymbolRow]:
+        if len(files) < PARALLEL_PARSE_THRESHOLD or workers == 1:
+            return _parse_batch(files)
+        workers = workers or os.cpu_count() or 1
+        batch_size = max(8, len(files) // (workers * 4))
+        batches = [files[i:i + batch_size] for i in range(0, len(files), batch_size)]
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                return [row for rows in pool.map(_parse_batch, batches) for row in rows]
+        except (OSError, BrokenProcessPool):
+            logger.debug("Process pool unavailable, indexing in-process", exc_info=True)
+            return _parse_batch(files)
+
+    def _refs(self, sql: str, params: tuple) -> list[SymbolRef]:
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [SymbolRef(file=f, line=line, kind=kind, context=ctx) for f, line, kind, ctx in rows]
+
+    def find_symbol(self, name: str, mode: str = "all") -> list[SymbolRef]:
+        """Stored equivalent of :func:`find_symbol`."""
+        results = []
+        if mode in ("all", "define"):
+            results.extend(self._refs(
+                "SELECT file, line, kind, context FROM symbols"
+                " WHERE name = ? AND kind IN ('def', 'class') ORDER BY file, line", (name,)))
+        if mode in ("all", "callers"):
+            results.extend(self._refs(
+                "SELECT file, line, kind, context FROM symbols"
+                " WHERE name = ? AND kind NOT IN ('def', 'class') ORDER BY file, line", (name,)))
+        return results
+
+    def find_impact(self, file_path: str) -> dict[str, list[SymbolRef]]:
+        """Stored equivalent of :func:`find_impact`."""
+        if Path(file_path).is_absolute():
+            rel = Path(file_path).resolve().relative_to(self.root).as_posix()
+        else:
+            rel = file_path.replace("\\", "/")
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT r.name, r.file, r.line, r.kind, r.context FROM symbols r"
+                " WHERE r.kind NOT IN ('def', 'class') AND r.file != ? AND r.name IN"
+                " (SELECT name FROM symbols WHERE file = ? AND kind IN ('def', 'class'))"
+                " ORDER BY r.name, r.file, r.line",
+                (rel, rel),
+            ).fetchall()
+        impact: dict[str, list[SymbolRef]] = defaultdict(list)
+        for name, f, line, kind, ctx in rows:
+            impact[name].append(SymbolRef(file=f, line=line, kind=kind, context=ctx))
+        return dict(impact)
+
+    def all_symbols(self) -> set[str]:
+        with self._lock:
+            return {name for (name,) in self._conn.execute("SELECT DISTINCT name FROM symbols")}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def default_socket_path(root: Path) -> Path:
+    """Unix socket path for a root's query server.
+
+    Lives next to the database unless that would exceed the ~104 byte
+    AF_UNIX path limit, in which case a per-root name in the temp dir is used.
+    """
+    root = Path(root).resolve()
+    path = root / SYMBOL_DB_RELPATH.with_suffix(".sock")
+    if len(str(path)) < 100:
+        return path
+    digest = hashlib.sha1(str(root).encode("utf-8")).hexdigest()[:16]
+    return Path(tempfile.gettempdir()) / f"chad-symbols-{digest}.sock"
+
+
+def query_server(socket_path: Path, request: dict, timeout: float = 5.0) -> dict | None:
+    """Send one request to a running query server.
+
+    Returns:
+        The decoded response, or None if no server is listening
+    """
+    if not hasattr(socket, "AF_UNIX") or not Path(socket_path).exists():
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(str(socket_path))
+            sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as reader:
+                line = reader.readline()
+    except OSError:
+        return None
+    try:
+        return json.loads(line)
+    except ValueError:
+        return None
+
+
+def serve(socket_path: Path, handler: Callable[[dict], dict], stop: threading.Event | None = None) -> None:
+    """Answer one-line JSON requests on a Unix socket until stop is set.
+
+    Each connection carries one request line and gets one response line from
+    ``handler``. Connections are served one at a time, so a client that sends
+    nothing is dropped after ``SERVE_CONN_TIMEOUT_SECONDS``. A stale socket
+    file from a dead server is replaced.
+
+    Raises:
+        OSError: If another server is already listening on socket_path
+    """
+    socket_path = Path(socket_path)
+    if query_server(socket_path, {"ping": True}, timeout=1.0) is not None:
+        raise OSError(f"Symbol index server already running on {socket_path}")
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    socket_path.unlink(missing_ok=True)
+    stop = stop or threading.Event()
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(str(socket_path))
+        server.listen()
+        server.settimeout(0.2)
+        try:
+            while not stop.is_set():
+                try:
+                    conn, _ = server.accept()
+                except socket.timeout:
+                    continue
+                conn.settimeout(SERVE_CONN_TIMEOUT_SECONDS)
+                with conn, conn.makefile("rb") as reader:
+                    try:
+                        line = reader.readline()
+                    except OSError:
+                        continue
+                    try:
+                        request = json.loads(line or b"{}")
+                        response = {"ok": True} if request.get("ping") else handler(request)
+                    except Exception as e:
+                        response = {"error": str(e)}
+                    try:
+                        conn.sendall(json.dumps(response).encode("utf-8") + b"\n")
+                    except OSError:
+                        pass
+        finally:
+            socket_path.unlink(missing_ok=True)
@@ -49,10 +49,11 @@ class _NoOpTunnelService:
 
 @pytest.fixture(autouse=True)
 def _isolate_session_logs(tmp_path_factory, monkeypatch):
-    """Keep session logs isolated and Slack disabled per test run."""
+    """Keep session logs and caches isolated and Slack disabled per test run."""
     log_dir = tmp_path_factory.mktemp("session_logs")
     monkeypatch.setenv("CHAD_SESSION_LOG_DIR", str(log_dir))
     monkeypatch.setenv("CHAD_SESSION_LOG_MAX_FILES", "200")
+    monkeypatch.setenv("CHAD_CACHE_DIR", str(tmp_path_factory.mktemp("cache")))
 
     # Prevent any test from sending real Slack notifications.
     noop = _NoOpSlackService()
@@ -1,6 +1,8 @@
 """Tests for Chad server API endpoints."""
 
 import json
+import threading
+import time
 from datetime import datetime, timezone
 from importlib import resources
 from pathlib import Path
@@ -8,6 +10,7 @@ from pathlib import Path
 import pytest
 from fastapi.testclient import TestClient
 
+from chad.server.api.routes.providers import reset_usage_probes
 from chad.server.main import create_app, _resolve_ui_paths
 from chad.server.services import reset_session_manager, reset_task_executor
 from chad.server.state import get_config_manager, reset_state
@@ -26,6 +29,7 @@ def client(tmp_path, monkeypatch):
     reset_session_manager()
     reset_task_executor()
     reset_state()
+    reset_usage_probes()
 
     app = create_app()
     with TestClient(app) as client:
@@ -85,6 +89,71 @@ class TestSessionEndpoints:
         assert data["total"] == 2
         assert len(data["sessions"]) == 2
 
+    def test_list_sessions_cursor_pagination(self, client):
+        """Keyset cursors page through sessions without repeats."""
+        for i in range(5):
+            client.post("/api/v1/sessions", json={"name": f"Session {i}"})
+
+        seen = []
+        cursor = None
+        while True:
+            params = {"limit": 2, "sort": "activity"}
+            if cursor:
+                params["cursor"] = cursor
+            data = client.get("/api/v1/sessions", params=params).json()
+            assert data["total"] == 5
+            seen.extend(s["id"] for s in data["sessions"])
+            cursor = data["next_cursor"]
+            if not cursor:
+                break
+
+        assert len(seen) == 5
+        assert len(set(seen)) == 5
+
+        bad = client.get("/api/v1/sessions", params={"cursor": "not-a-cursor"})
+        assert bad.status_code == 400
+
+    def test_list_sessions_status_filter(self, client):
+        """Sessions can be filtered by status."""
+        client.post("/api/v1/sessions", json={"name": "Session"})
+
+        assert client.get("/api/v1/sessions", params={"status": "active"}).json()["total"] == 1
+        assert client.get("/api/v1/sessions", params={"status": "completed"}).json()["total"] == 0
+
+    def test_list_sessions_etag(self, client):
+        """If-None-Match with the current ETag returns 304 until the list changes."""
+        client.post("/api/v1/sessions", json={"name": "Session"})
+        response = client.get("/api/v1/sessions")
+        etag = response.headers["ETag"]
+
+        cached = client.get("/api/v1/sessions", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+
+        client.post("/api/v1/sessions", json={"name": "Another"})
+        refreshed = client.get("/api/v1/sessions", headers={"If-None-Match": etag})
+        assert refreshed.status_code == 200
+        assert refreshed.json()["total"] == 2
+
+    def test_session_changes_feed(self, client):
+        """The changes feed returns sessions created or deleted since a version."""
+        first = client.post("/api/v1/sessions", json={"name": "First"}).json()
+        listing = client.get("/api/v1/sessions").json()
+
+        second = client.post("/api/v1/sessions", json={"name": "Second"}).json()
+        client.delete(f"/api/v1/sessions/{first['id']}")
+
+        data = client.get(
+            "/api/v1/sessions/changes",
+            params={"since_version": listing["version"], "epoch": listing["epoch"]},
+        ).json()
+        assert data["reset"] is False
+        assert [s["id"] for s in data["sessions"]] == [second["id"]]
+        assert data["deleted"] == [first["id"]]
+
+        stale = client.get("/api/v1/sessions/changes", params={"since_version": 0, "epoch": "other"}).json()
+        assert stale["reset"] is True
+        assert [s["id"] for s in stale["sessions"]] == [second["id"]]
+
     def test_startup_always_restores_historical_sessions(self, tmp_path, monkeypatch):
         """Startup always restores prior sessions from event logs."""
         temp_config = tmp_path / "test_chad.conf"
@@ -179,6 +248,104 @@ class TestSessionEndpoints:
         assert response.status_code == 404
 
 
+class TestSearchEndpoints:
+    """Tests for cross-session search and filtered session listing."""
+
+    def _log_task(self, log_dir, session_id, task, path):
+        from chad.util.event_log import EventLog, SessionStartedEvent, ToolCallStartedEvent
+
+        log = EventLog(session_id, base_dir=log_dir)
+        log.log(SessionStartedEvent(task_description=task, project_path="/tmp/project"))
+        log.log(ToolCallStartedEvent(tool="edit", path=path))
+
+    def test_search_returns_paginated_hits(self, client, tmp_path):
+        """GET /search finds matches across sessions with pagination."""
+        for i in range(3):
+            self._log_task(tmp_path / "logs", f"sess{i}", f"Improve caching layer {i}", f"/p/src/cache{i}.py")
+
+        first = client.get("/api/v1/search", params={"q": "caching", "limit": 2}).json()
+        second = client.get("/api/v1/search", params={"q": "caching", "limit": 2, "offset": 2}).json()
+
+        assert first["total"] == 3
+        assert len(first["hits"]) == 2
+        assert first["next_offset"] == 2
+        assert len(second["hits"]) == 1
+        assert second["next_offset"] is None
+
+    def test_search_files_finds_last_session(self, client, tmp_path):
+        """GET /search/files answers which session last touched a file."""
+        self._log_task(tmp_path / "logs", "first", "Task one", "/p/src/app.py")
+        self._log_task(tmp_path / "logs", "second", "Task two", "/p/src/app.py")
+
+        data = client.get("/api/v1/search/files", params={"path": "src/app.py"}).json()
+
+        assert [t["session_id"] for t in data["touches"]] == ["second", "first"]
+
+    def test_list_sessions_filter(self, client, tmp_path):
+        """GET /sessions?filter= returns only sessions matching the search text."""
+        wanted = client.post("/api/v1/sessions", json={"name": "Wanted"}).json()["id"]
+        client.post("/api/v1/sessions", json={"name": "Other"})
+        self._log_task(tmp_path / "logs", wanted, "Migrate billing webhooks", "/p/billing.py")
+
+        data = client.get("/api/v1/sessions", params={"filter": "billing"}).json()
+
+        assert data["total"] == 1
+        assert data["sessions"][0]["id"] == wanted
+
+    def test_list_sessions_limit_offset(self, client):
+        """GET /sessions supports limit/offset while reporting the full total."""
+        for i in range(3):
+            client.post("/api/v1/sessions", json={"name": f"Session {i}"})
+
+        data = client.get("/api/v1/sessions", params={"limit": 2, "offset": 2}).json()
+
+        assert data["total"] == 3
+        assert len(data["sessions"]) == 1
+
+
+class TestMetricsEndpoints:
+    """Tests for the Prometheus metrics and sampling profiler endpoints."""
+
+    def test_metrics_report_event_log_writes(self, client, tmp_path):
+        """GET /metrics exposes hot-path counters in Prometheus text format."""
+        from chad.util.event_log import EventLog, SessionStartedEvent
+
+        before = client.get("/api/v1/metrics").text
+        EventLog("metrics-session", base_dir=tmp_path / "logs").log(SessionStartedEvent(task_description="t"))
+        response = client.get("/api/v1/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert "# TYPE chad_event_log_events_total counter" in response.text
+        assert "# TYPE chad_git_command_seconds histogram" in response.text
+
+        def started(text):
+            for line in text.splitlines():
+                if line.startswith('chad_event_log_events_total{type="session_started"}'):
+                    return float(line.split()[-1])
+            return 0.0
+
+        assert started(response.text) == started(before) + 1
+
+    def test_profile_is_opt_in(self, client, monkeypatch):
+        """GET /debug/profile is off by default and samples stacks when enabled."""
+        import threading
+
+        assert client.get("/api/v1/debug/profile", params={"seconds": 0.1}).status_code == 404
+
+        monkeypatch.setenv("CHAD_ENABLE_PROFILER", "1")
+        stop = threading.Event()
+        worker = threading.Thread(target=stop.wait, name="pty-read-busy-session", daemon=True)
+        worker.start()
+        try:
+            response = client.get("/api/v1/debug/profile", params={"seconds": 0.2})
+        finally:
+            stop.set()
+
+        assert response.status_code == 200
+        assert any(line.startswith("pty-read-busy-session;") for line in response.text.splitlines())
+
+
 class TestProviderEndpoints:
     """Tests for provider management endpoints."""
 
@@ -226,6 +393,96 @@ class TestProviderEndpoints:
         assert data["total"] == 0
         assert data["accounts"] == []
 
+    def _add_usage_accounts(self, monkeypatch, slow: set[str] = frozenset()):
+        """Configure mock accounts and a fake provider whose probes are instant unless slow."""
+        get_config_manager().save_config({
+            "password_hash": "",
+            "encryption_salt": "dGVzdHNhbHQ=",
+            "accounts": {"fast-a": {"provider": "mock"}, "slow-b": {"provider": "mock"}, "fast-c": {"provider": "mock"}},
+        })
+
+        class FakeProvider:
+            def __init__(self, name):
+                self.name = name
+
+            def get_session_usage_percentage(self):
+                if self.name in slow:
+                    time.sleep(2.0)
+                return 42.0
+
+            def get_weekly_usage_percentage(self):
+                return 7.0
+
+        monkeypatch.setattr(
+            "chad.util.providers.create_provider",
+            lambda config: FakeProvider(config.account_name),
+        )
+
+    def test_all_account_usage(self, client, monkeypatch):
+        """Usage for every account is returned from one request."""
+        self._add_usage_accounts(monkeypatch)
+
+        response = client.get("/api/v1/accounts/usage")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 3
+        assert [a["account_name"] for a in data["accounts"]] == ["fast-a", "slow-b", "fast-c"]
+        assert all(a["session_usage_pct"] == 42.0 and a["error"] is None for a in data["accounts"])
+
+    def test_all_account_usage_partial_on_timeout(self, client, monkeypatch):
+        """A probe exceeding the timeout is reported as an error without blocking the rest."""
+        self._add_usage_accounts(monkeypatch, slow={"slow-b"})
+
+        started = time.monotonic()
+        data = client.get("/api/v1/accounts/usage", params={"timeout": 0.5}).json()
+        assert time.monotonic() - started < 1.8
+
+        by_name = {a["account_name"]: a for a in data["accounts"]}
+        assert by_name["fast-a"]["session_usage_pct"] == 42.0
+        assert by_name["slow-b"]["session_usage_pct"] is None
+        assert "timed out" in by_name["slow-b"]["error"]
+
+    def test_timed_out_probe_is_reused_not_restarted(self, client, monkeypatch):
+        """While an account's probe is still running, later requests wait on it."""
+        self._add_usage_accounts(monkeypatch)
+        release = threading.Event()
+        started = []
+
+        class HangingProvider:
+            def get_session_usage_percentage(self):
+                started.append(1)
+                release.wait(5)
+                return 55.0
+
+            def get_weekly_usage_percentage(self):
+                return 7.0
+
+        monkeypatch.setattr("chad.util.providers.create_provider", lambda config: HangingProvider())
+
+        for _ in range(3):
+            data = client.get("/api/v1/accounts/usage", params={"timeout": 0.2}).json()
+            assert all("timed out" in a["error"] for a in data["accounts"])
+        assert len(started) == 3  # one probe per account, not one per request
+
+        release.set()
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            data = client.get("/api/v1/accounts/usage", params={"timeout": 1}).json()
+            if all(a["session_usage_pct"] == 55.0 for a in data["accounts"]):
+                break
+        assert all(a["session_usage_pct"] == 55.0 for a in data["accounts"])
+
+    def test_all_account_usage_streams_ndjson(self, client, monkeypatch):
+        """Streamed usage arrives as NDJSON in completion order."""
+        self._add_usage_accounts(monkeypatch, slow={"slow-b"})
+
+        response = client.get("/api/v1/accounts/usage", params={"stream": "true"})
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines() if line]
+        assert [line["account_name"] for line in lines][-1] == "slow-b"
+        assert len(lines) == 3
+
 
 class TestConfigEndpoints:
     """Tests for config management endpoints."""
@@ -238,6 +495,44 @@ class TestConfigEndpoints:
         assert "cleanup_days" in data
         assert data["cleanup_days"] >= 1
 
+    def test_update_log_quota_keeps_cleanup_days(self, client):
+        """Setting the log disk budget leaves the retention days unchanged."""
+        client.put("/api/v1/config/cleanup", json={"cleanup_days": 12})
+        response = client.put("/api/v1/config/cleanup", json={"log_quota_mb": 256})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["log_quota_mb"] == 256
+        assert data["cleanup_days"] == 12
+
+    def test_task_scheduling_partial_update(self, client):
+        """Task scheduling limits update independently and round-trip."""
+        response = client.put("/api/v1/config/task-scheduling", json={"max_concurrent_tasks": 3})
+        assert response.status_code == 200
+        response = client.put("/api/v1/config/task-scheduling", json={"max_tasks_per_account": 1})
+        data = response.json()
+        assert data["max_concurrent_tasks"] == 3
+        assert data["max_tasks_per_account"] == 1
+        assert data["balance_accounts"] is False
+        assert client.put("/api/v1/config/task-scheduling", json={"max_concurrent_tasks": 0}).status_code == 422
+
+    def test_task_queue_reports_limits(self, client):
+        """GET /tasks/queue returns the limits and an empty queue when idle."""
+        client.put("/api/v1/config/task-scheduling", json={"max_concurrent_tasks": 2})
+        response = client.get("/api/v1/tasks/queue")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["max_concurrent_tasks"] == 2
+        assert data["running"] == []
+        assert data["queued"] == []
+
+    def test_log_retention_days_defaults_to_never(self, client):
+        """Age-based log pruning is off until a retention age is set."""
+        assert client.get("/api/v1/config/cleanup").json()["log_retention_days"] == 0
+        response = client.put("/api/v1/config/cleanup", json={"log_retention_days": 90})
+        assert response.status_code == 200
+        assert response.json()["log_retention_days"] == 90
+        assert response.json()["cleanup_days"] >= 1
+
     def test_get_preferences(self, client):
         """Can get user preferences."""
         response = client.get("/api/v1/config/preferences")
@@ -970,6 +1265,25 @@ class TestHistoricalSessionEvents:
         assert len(terminal_events) == 1
         assert terminal_events[0]["data"] == "Hello from terminal"
 
+    def test_artifact_endpoint_streams_session_artifacts(self, client, tmp_path, monkeypatch):
+        """Artifacts referenced by the session are streamed decompressed; others are 404."""
+        from chad.util.event_log import EventLog
+
+        log_dir = tmp_path / "logs"
+        monkeypatch.setenv("CHAD_LOG_DIR", str(log_dir))
+        session_id = client.post("/api/v1/sessions", json={"name": "Artifacts"}).json()["id"]
+        ref = EventLog(session_id, base_dir=log_dir).store_artifact("out\n" * 5000, "stdout")
+
+        response = client.get(f"/api/v1/sessions/{session_id}/artifact", params={"path": ref.path})
+        assert response.status_code == 200
+        assert response.text == "out\n" * 5000
+
+        other_id = client.post("/api/v1/sessions", json={"name": "Other"}).json()["id"]
+        assert client.get(f"/api/v1/sessions/{other_id}/artifact", params={"path": ref.path}).status_code == 404
+        assert client.get(
+            f"/api/v1/sessions/{session_id}/artifact", params={"path": f"{session_id}.jsonl"}
+        ).status_code == 404
+
     def test_events_endpoint_filters_by_type_for_historical(self, client, tmp_path, monkeypatch):
         """Events endpoint should support filtering by type for historical events."""
         from chad.util.event_log import (
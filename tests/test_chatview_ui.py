@@ -16,6 +16,7 @@ UI_DIR = Path(__file__).parent.parent / "ui" / "src"
 CHATVIEW_FILE = UI_DIR / "components" / "ChatView.tsx"
 CSS_FILE = UI_DIR / "styles" / "main.css"
 TYPES_FILE = Path(__file__).parent.parent / "client" / "src" / "types.ts"
+USE_STREAM_FILE = UI_DIR / "hooks" / "useStream.ts"
 
 
 class TestFollowUpPreservesConversation:
@@ -308,3 +309,22 @@ class TestVerificationAgentPicker:
         assert disabled_match is None, (
             "Verification picker should not have disabled prop - it should always be enabled"
         )
+
+
+class TestStreamSnapshot:
+    """Verify that joining a running session catches up from a snapshot."""
+
+    def test_use_stream_connects_in_snapshot_mode(self):
+        """useStream should request a snapshot and show its screen instead of appending replays."""
+        content = USE_STREAM_FILE.read_text()
+
+        assert "snapshot: true" in content
+        assert 'msg.type === "snapshot"' in content
+        assert "setTerminalOutput(decodeTerminal(state.screen" in content
+
+    def test_chatview_merges_snapshot_conversation(self):
+        """ChatView should append snapshot conversation items past the seen sequence."""
+        content = CHATVIEW_FILE.read_text()
+
+        assert "snapshot.conversation.filter((item) => item.seq > sinceSeq)" in content
+        assert "snapshot.latest_seq" in content
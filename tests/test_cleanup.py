@@ -11,11 +11,19 @@ from chad.util.cleanup import (
     _is_older_than_days,
     cleanup_old_worktrees,
     cleanup_old_logs,
+    cleanup_orphaned_artifacts,
     cleanup_old_screenshots,
     cleanup_temp_files,
     cleanup_on_startup,
     cleanup_on_shutdown,
 )
+from chad.util.event_log import TerminalOutputEvent
+
+
+@pytest.fixture(autouse=True)
+def _isolate_event_logs(tmp_path, monkeypatch):
+    """Keep artifact garbage collection away from the real ~/.chad/logs."""
+    monkeypatch.setenv("CHAD_LOG_DIR", str(tmp_path / "event_logs"))
 
 
 class TestIsOlderThanDays:
@@ -136,6 +144,93 @@ class TestCleanupOldLogs:
         assert other_file.exists()
 
 
+class TestCleanupOrphanedArtifacts:
+    """Tests for cleanup_orphaned_artifacts."""
+
+    def test_collects_blobs_without_live_sessions(self, tmp_path):
+        """Blobs are kept while any referencing session log exists."""
+        from chad.util.event_log import EventLog
+
+        event_log_dir = tmp_path / "event_logs"
+        shared = "shared\n" * 5000
+        first = EventLog("session-a", base_dir=event_log_dir)
+        second = EventLog("session-b", base_dir=event_log_dir)
+        first.log(TerminalOutputEvent(data="a"))
+        second.log(TerminalOutputEvent(data="b"))
+        shared_ref = first.store_artifact(shared, "stdout")
+        second.store_artifact(shared, "stdout")
+        only_ref = first.store_artifact("only-a\n" * 5000, "stdout")
+
+        # Age the references past the grace period, then delete session-a's log
+        old_time = time.time() - (5 * 24 * 60 * 60)
+        for marker in (event_log_dir / "blobs").glob("*/*.refs/*"):
+            os.utime(marker, (old_time, old_time))
+        first.log_path.unlink()
+
+        result = cleanup_orphaned_artifacts()
+
+        assert result == [only_ref.path]
+        assert not (event_log_dir / only_ref.path).exists()
+        assert (event_log_dir / shared_ref.path).exists()
+
+    def test_keeps_recent_references(self, tmp_path):
+        """References inside the grace period survive a missing session log."""
+        from chad.util.event_log import EventLog
+
+        event_log_dir = tmp_path / "event_logs"
+        log = EventLog("session-a", base_dir=event_log_dir)
+        ref = log.store_artifact("x" * 20000, "stdout")
+
+        assert cleanup_orphaned_artifacts() == []
+        assert (event_log_dir / ref.path).exists()
+
+    def test_put_racing_collection_keeps_blob(self, tmp_path):
+        """A reference added after the markers were scanned keeps its blob."""
+        from chad.util.event_log import ArtifactStore
+
+        store = ArtifactStore(tmp_path / "blobs")
+        content = b"z" * 20000
+        sha256 = store.put(content, "dead-session")
+        old_time = time.time() - (5 * 24 * 60 * 60)
+        for marker in store.root.glob("*/*.refs/*"):
+            os.utime(marker, (old_time, old_time))
+
+        real_lock = store._file_lock
+
+        class PutBeforeLock:
+            """Lands a put between the marker scan and the removal."""
+
+            def __enter__(self):
+                store._file_lock = real_lock
+                store.put(content, "new-session")
+                return real_lock.__enter__()
+
+            def __exit__(self, *exc):
+                return real_lock.__exit__(*exc)
+
+        store._file_lock = PutBeforeLock()
+
+        assert store.collect_garbage([]) == []
+        assert store.blob_path(sha256).exists()
+        assert (store.root / sha256[:2] / f"{sha256}.refs" / "new-session").exists()
+
+    def test_removes_legacy_artifact_dirs_of_deleted_sessions(self, tmp_path):
+        """Per-session artifact dirs from older versions go with their log."""
+        event_log_dir = tmp_path / "event_logs"
+        legacy = event_log_dir / "artifacts" / "gone-session"
+        legacy.mkdir(parents=True)
+        (legacy / "stdout_deadbeef.txt").write_text("old")
+        kept = event_log_dir / "artifacts" / "live-session"
+        kept.mkdir(parents=True)
+        (event_log_dir / "live-session.jsonl").write_text("")
+
+        result = cleanup_orphaned_artifacts()
+
+        assert result == ["artifacts/gone-session/"]
+        assert not legacy.exists()
+        assert kept.exists()
+
+
 class TestCleanupOldScreenshots:
     """Tests for cleanup_old_screenshots."""
 
@@ -300,3 +395,114 @@ class TestConfigManagerCleanupDays:
             mgr.set_cleanup_days(0)
         with pytest.raises(ValueError):
             mgr.set_cleanup_days(-1)
+
+
+class TestRetentionManager:
+    """Tests for the log/artifact/upload retention manager."""
+
+    def _make_session(self, log_dir, session_id, age_days=0.0, upload=None, payload_size=0):
+        from chad.util.event_log import EventLog, SessionStartedEvent
+
+        screenshots = []
+        if upload:
+            upload_path = log_dir / "uploads" / upload
+            upload_path.parent.mkdir(parents=True, exist_ok=True)
+            upload_path.write_bytes(b"png")
+            screenshots.append(str(upload_path))
+        log = EventLog(session_id, base_dir=log_dir)
+        log.log(SessionStartedEvent(task_description="t", screenshots=screenshots))
+        if payload_size:
+            log.log(TerminalOutputEvent(data="x" * payload_size))
+        if age_days:
+            old_time = time.time() - age_days * 86400
+            os.utime(log.log_path, (old_time, old_time))
+        return log
+
+    def _manager(self, log_dir, days=3, quota=0, protected=()):
+        from chad.server.services.retention import RetentionManager
+
+        return RetentionManager(
+            log_dir=log_dir,
+            max_age_days=lambda: days,
+            quota_bytes=lambda: quota,
+            protected_sessions=lambda: protected,
+        )
+
+    def test_removes_expired_session_bundles(self, tmp_path):
+        """Sessions past the age limit go with their uploads and artifacts."""
+        log_dir = tmp_path / "event_logs"
+        old = self._make_session(log_dir, "old-session", age_days=10, upload="old.png")
+        ref = old.store_artifact("y" * 20000, "stdout")
+        os.utime(old.log_path, (time.time() - 10 * 86400,) * 2)
+        fresh = self._make_session(log_dir, "fresh-session", upload="fresh.png")
+
+        result = self._manager(log_dir).run_once()
+
+        assert result.sessions == ["old-session"]
+        assert result.uploads == ["old.png"]
+        assert result.blobs == [ref.path]
+        assert not old.log_path.exists()
+        assert not (log_dir / "uploads" / "old.png").exists()
+        assert fresh.log_path.exists()
+        assert (log_dir / "uploads" / "fresh.png").exists()
+
+    def test_age_pruning_is_off_by_default(self, tmp_path):
+        """Without a retention age, old sessions and uploads are kept while under quota."""
+        from chad.server.services.retention import RetentionManager
+
+        log_dir = tmp_path / "event_logs"
+        old = self._make_session(log_dir, "old-session", age_days=400, upload="old.png")
+
+        result = RetentionManager(log_dir=log_dir).run_once()
+
+        assert result.sessions == []
+        assert result.uploads == []
+        assert old.log_path.exists()
+        assert (log_dir / "uploads" / "old.png").exists()
+
+    def test_zero_days_only_prunes_for_quota(self, tmp_path):
+        """A retention age of 0 leaves pruning to the disk budget."""
+        log_dir = tmp_path / "event_logs"
+        for i, age in enumerate([400.0, 200.0]):
+            self._make_session(log_dir, f"s{i}", age_days=age, payload_size=4000)
+
+        assert self._manager(log_dir, days=0).run_once().sessions == []
+        assert self._manager(log_dir, days=0, quota=6000).run_once().sessions == ["s0"]
+
+    def test_enforces_quota_oldest_first(self, tmp_path):
+        """Over quota, the least recently active idle sessions are pruned first."""
+        log_dir = tmp_path / "event_logs"
+        for i, age in enumerate([2.0, 1.0, 0.5]):
+            self._make_session(log_dir, f"s{i}", age_days=age, payload_size=4000)
+
+        result = self._manager(log_dir, days=30, quota=10000).run_once()
+
+        assert result.sessions == ["s0"]
+        assert sorted(p.name for p in log_dir.glob("*.jsonl")) == ["s1.jsonl", "s2.jsonl"]
+
+    def test_protected_sessions_are_kept(self, tmp_path):
+        """Active sessions are never pruned, however old."""
+        log_dir = tmp_path / "event_logs"
+        log = self._make_session(log_dir, "busy", age_days=10)
+
+        result = self._manager(log_dir, protected=("busy",)).run_once()
+
+        assert result.sessions == []
+        assert log.log_path.exists()
+
+    def test_manifest_avoids_rereading_logs(self, tmp_path):
+        """Known sessions are taken from the manifest instead of re-reading their logs."""
+        from chad.server.services.retention import MANIFEST_NAME
+        from chad.server.services.session_manager import SessionManager
+
+        log_dir = tmp_path / "event_logs"
+        self._make_session(log_dir, "kept", upload="kept.png")
+        manager = self._manager(log_dir)
+        manager.run_once()
+        assert (log_dir / MANIFEST_NAME).exists()
+
+        with patch.object(SessionManager, "_read_first_last_lines") as read_lines:
+            manifest = manager.refresh_manifest()
+
+        read_lines.assert_not_called()
+        assert manifest["sessions"]["kept"]["uploads"] == ["kept.png"]
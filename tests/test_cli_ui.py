@@ -303,28 +303,29 @@ class TestDisconnectedCLI:
 class TestCLIStreamingMilestones:
     """Tests for milestone delivery in CLI task streaming."""
 
-    def test_run_task_with_streaming_emits_milestones_from_api_endpoint(self, monkeypatch):
-        """CLI should fetch milestones from the dedicated milestones API endpoint."""
+    def test_run_task_with_streaming_renders_streamed_milestones(self, monkeypatch):
+        """CLI should render milestones pushed over the stream instead of polling for them."""
         from unittest.mock import Mock
         from chad.ui.client.stream_client import StreamEvent
         from chad.ui.cli.app import run_task_with_streaming
 
         client = Mock()
-        client.get_milestones.side_effect = [
-            [
-                {
-                    "seq": 1,
-                    "milestone_type": "exploration",
-                    "title": "Discovery",
-                    "summary": "Found auth flow in src/auth.py",
-                }
-            ],
-            [],
-        ]
-
         stream_client = Mock()
         stream_client.stream_events.return_value = iter(
-            [StreamEvent(event_type="complete", data={"exit_code": 0})]
+            [
+                StreamEvent(
+                    event_type="event",
+                    data={
+                        "type": "milestone",
+                        "seq": 1,
+                        "milestone_type": "exploration",
+                        "title": "Discovery",
+                        "summary": "Found auth flow in src/auth.py",
+                    },
+                    seq=1,
+                ),
+                StreamEvent(event_type="complete", data={"exit_code": 0}),
+            ]
         )
 
         writes: list[bytes] = []
@@ -348,6 +349,7 @@ class TestCLIStreamingMilestones:
         )
 
         assert exit_code == 0
-        client.get_milestones.assert_any_call("sess-1", since_seq=0)
+        client.get_milestones.assert_not_called()
+        stream_client.stream_events.assert_called_once_with("sess-1", types="terminal,milestone")
         rendered = b"".join(writes).decode("utf-8", errors="replace")
         assert "[MILESTONE] Discovery: Found auth flow in src/auth.py" in rendered
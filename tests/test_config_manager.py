@@ -1218,8 +1218,14 @@ class TestConfigUIParity:
         "verification_agent",
         "preferred_verification_model",
         "cleanup_days",
+        "log_quota_mb",
+        "log_retention_days",
         "action_settings",
         "max_verification_attempts",
+        "max_concurrent_tasks",
+        "max_tasks_per_account",
+        "max_tasks_per_provider",
+        "balance_task_accounts",
         "slack_enabled",
         "slack_bot_token",
         "slack_channel",
@@ -1263,8 +1269,14 @@ class TestConfigUIParity:
         "verification_agent": ["verification_agent", "verification_pref"],
         "preferred_verification_model": ["verification_model", "preferred_verification_model"],
         "cleanup_days": ["cleanup_days", "retention_days", "cleanup_settings", "retention_input"],
+        "log_quota_mb": ["log_quota_mb", "log disk budget"],
+        "log_retention_days": ["log_retention_days", "log retention"],
         "action_settings": ["action_settings", "action_setting", "action_rule"],
         "max_verification_attempts": ["max_verification_attempts", "verification_attempts"],
+        "max_concurrent_tasks": ["max_concurrent_tasks"],
+        "max_tasks_per_account": ["max_tasks_per_account"],
+        "max_tasks_per_provider": ["max_tasks_per_provider"],
+        "balance_task_accounts": ["balance_accounts", "task_scheduling"],
         "ui_mode": ["ui_mode"],
         "slack_enabled": ["slack_enabled", "slack_enable", "slack_settings", "slack integration"],
         "slack_bot_token": ["slack_bot_token", "slack_token", "bot_token", "slack_settings"],
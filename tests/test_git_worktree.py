@@ -421,6 +421,21 @@ class TestGitWorktreeManager:
         assert "uncommitted.txt" in names
         assert "committed.txt" in names
 
+    def test_changed_files_are_worktree_relative(self, git_repo):
+        """Changed files include committed, untracked and deleted paths relative to the worktree."""
+        mgr = GitWorktreeManager(git_repo)
+        task_id = "test-task-7d"
+
+        worktree_path, _ = mgr.create_worktree(task_id)
+        (worktree_path / "pkg").mkdir()
+        (worktree_path / "pkg" / "committed.py").write_text("x = 1\n")
+        subprocess.run(["git", "add", "."], cwd=worktree_path, check=True, capture_output=True)
+        subprocess.run(["git", "commit", "-m", "Commit file"], cwd=worktree_path, check=True, capture_output=True)
+        (worktree_path / "pkg" / "untracked.py").write_text("y = 2\n")
+        (worktree_path / "README.md").unlink()
+
+        assert mgr.get_changed_files(task_id) == ["README.md", "pkg/committed.py", "pkg/untracked.py"]
+
     def test_parsed_diff_can_compare_against_target_branch_tip(self, git_repo):
         """Comparing against a target branch should only show worktree-side changes."""
         mgr = GitWorktreeManager(git_repo)
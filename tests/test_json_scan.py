@@ -0,0 +1,33 @@
+"""Tests for locating JSON objects in agent output."""
+
+import json
+
+from chad.util.json_scan import iter_json_objects
+
+
+class TestIterJsonObjects:
+    """Tests for iter_json_objects."""
+
+    def test_yields_top_level_objects_last_first(self):
+        text = 'intro {"a": 1} prose {"b": {"c": 2}} ```json\n{"d": "}{"}\n```'
+        assert list(iter_json_objects(text)) == ['{"d": "}{"}', '{"b": {"c": 2}}', '{"a": 1}']
+
+    def test_braces_and_escapes_inside_strings_are_ignored(self):
+        text = r'{"s": "a \"quoted\" {brace"} trailing }'
+        assert [json.loads(obj) for obj in iter_json_objects(text)] == [{"s": 'a "quoted" {brace'}]
+
+    def test_small_window_matches_full_scan(self):
+        lines = [json.dumps({"i": i, "nested": {"x": "{"}}) for i in range(50)]
+        text = "\n".join(f"line {i} }} stray\n{line}" for i, line in enumerate(lines))
+        full = list(iter_json_objects(text, window=len(text)))
+        assert list(iter_json_objects(text, window=16)) == full
+        assert [json.loads(obj)["i"] for obj in full] == list(range(49, -1, -1))
+
+    def test_object_straddling_window_is_not_split(self):
+        text = '{"outer": [\n{"inner": 1}\n]}'
+        assert list(iter_json_objects(text, window=5)) == [text]
+
+    def test_unclosed_braces_do_not_hide_later_objects(self):
+        text = "{" * 200_000 + "\n" + '{"passed": true}'
+        assert list(iter_json_objects(text)) == ['{"passed": true}']
+        assert list(iter_json_objects(text, window=4)) == ['{"passed": true}']
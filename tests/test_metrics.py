@@ -0,0 +1,86 @@
+"""Tests for the in-process metrics registry and stack sampler."""
+
+import threading
+
+import pytest
+
+from chad.util.metrics import Counter, Gauge, Histogram, MetricsRegistry
+from chad.util.profiler import format_collapsed, sample_stacks
+
+
+class TestMetricsRegistry:
+    """Tests for MetricsRegistry rendering."""
+
+    def test_counter_and_gauge_render_with_labels(self):
+        """Labelled series render sorted, with escaped label values."""
+        registry = MetricsRegistry()
+        reads = registry.register(Counter("bytes_total", "Bytes read", ("session_id",)))
+        depth = registry.register(Gauge("queue_depth", "Queue depth"))
+
+        reads.labels(session_id="b").inc(10)
+        reads.labels(session_id='a"1').inc(2.5)
+        depth.set(3)
+
+        text = registry.render()
+        assert "# TYPE bytes_total counter" in text
+        assert 'bytes_total{session_id="a\\"1"} 2.5\nbytes_total{session_id="b"} 10\n' in text
+        assert "queue_depth 3\n" in text
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Histogram output has cumulative buckets, +Inf, sum and count."""
+        registry = MetricsRegistry()
+        latency = registry.register(Histogram("op_seconds", "Op time", buckets=(0.1, 1.0)))
+        for value in (0.05, 0.1, 0.5, 3.0):
+            latency.observe(value)
+
+        lines = registry.render().splitlines()
+        assert 'op_seconds_bucket{le="0.1"} 2' in lines
+        assert 'op_seconds_bucket{le="1"} 3' in lines
+        assert 'op_seconds_bucket{le="+Inf"} 4' in lines
+        assert "op_seconds_sum 3.65" in lines
+        assert "op_seconds_count 4" in lines
+
+    def test_register_returns_existing_metric(self):
+        """Re-registering a name reuses the metric; a different shape is rejected."""
+        registry = MetricsRegistry()
+        first = registry.register(Counter("events_total", "Events", ("type",)))
+
+        assert registry.register(Counter("events_total", "Events", ("type",))) is first
+        with pytest.raises(ValueError):
+            registry.register(Gauge("events_total", "Events", ("type",)))
+
+    def test_concurrent_increments_are_not_lost(self):
+        """Counter updates from many threads all land."""
+        total = Counter("hits_total", "Hits")
+
+        def work():
+            for _ in range(10000):
+                total.inc()
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert total.labels().value == 40000
+
+
+class TestStackSampler:
+    """Tests for the pure-Python sampling profiler."""
+
+    def test_samples_are_rooted_at_thread_name(self):
+        """Collapsed stacks start with the thread name and end with a count."""
+        stop = threading.Event()
+        worker = threading.Thread(target=stop.wait, name="session-loop-abc", daemon=True)
+        worker.start()
+        try:
+            stacks = sample_stacks(0.1, interval=0.01)
+        finally:
+            stop.set()
+
+        lines = format_collapsed(stacks).splitlines()
+        ours = [line for line in lines if line.startswith("session-loop-abc;")]
+        assert ours
+        stack, count = ours[0].rsplit(" ", 1)
+        assert "threading:wait" in stack and int(count) > 0
@@ -0,0 +1,65 @@
+"""Tests for the shared NDJSON stream decoder."""
+
+import json
+
+from chad.util import ndjson
+from chad.util.ndjson import NDJSONDecoder
+
+
+class TestNDJSONDecoder:
+    """Tests for NDJSONDecoder."""
+
+    def test_event_split_across_chunks_is_decoded_once(self):
+        seen = []
+        decoder = NDJSONDecoder({"assistant": seen.append})
+        line = json.dumps({"type": "assistant", "message": {"content": "hello"}}) + "\n"
+
+        assert decoder.feed(line[:7].encode()) == []
+        assert decoder.feed(line[7:20].encode()) == []
+        decoder.feed(line[20:].encode() + b'{"type": "assistant", "n": 2}\n{"type"')
+
+        assert [e.get("n") for e in seen] == [None, 2]
+        assert seen[0]["message"]["content"] == "hello"
+
+    def test_dispatches_by_type_and_collects_results(self):
+        decoder = NDJSONDecoder(
+            {"a": lambda e: "A", "b": lambda e: None},
+            on_text=lambda line: f"text:{line}",
+        )
+
+        results = decoder.feed(b'{"type": "a"}\n{"type": "b"}\n{"type": "c"}\nplain warning\n\n[1, 2]\n')
+
+        assert results == ["A", "text:plain warning", "text:[1, 2]"]
+
+    def test_on_event_sees_every_object(self):
+        events = []
+        decoder = NDJSONDecoder(on_event=events.append)
+
+        decoder.feed('{"type": "x"}\n{"no_type": 1}\n{"type": 5}\n')
+
+        assert events == [{"type": "x"}, {"no_type": 1}, {"type": 5}]
+
+    def test_invalid_json_falls_back_to_text(self):
+        texts = []
+        decoder = NDJSONDecoder(on_text=texts.append)
+
+        decoder.feed(b"{not json}\r\n")
+
+        assert texts == ["{not json}\r"]
+
+    def test_flush_handles_unterminated_last_line(self):
+        decoder = NDJSONDecoder({"result": lambda e: e["result"]})
+
+        assert decoder.feed(b'{"type": "result", "result": "done"}') == []
+        assert decoder.flush() == ["done"]
+        assert decoder.flush() == []
+
+    def test_flush_ignores_whitespace(self):
+        decoder = NDJSONDecoder(on_text=lambda line: line)
+        decoder.feed(b"  \n   ")
+        assert decoder.flush() == []
+
+    def test_loads_uses_stdlib_without_orjson(self, monkeypatch):
+        monkeypatch.setattr(ndjson, "orjson", None)
+        assert ndjson.loads(b'{"a": NaN}')["a"] != 0
+        assert ndjson.loads('{"a": 1}') == {"a": 1}
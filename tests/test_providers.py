@@ -22,6 +22,7 @@ from chad.util.providers import (
     KimiCodeProvider,
     MockProvider,
     MockProviderQuotaError,
+    CodexOutputParser,
     parse_codex_output,
 )
 
@@ -217,6 +218,60 @@ Second thought
         assert "codex" not in result
 
 
+class TestCodexOutputParser:
+    """Test cases for the incremental CodexOutputParser."""
+
+    def test_json_line_split_across_chunks(self):
+        """A JSON event split over several chunks is decoded once the line completes."""
+        line = json.dumps({"type": "item.completed", "item": {"type": "agent_message", "text": "Done"}})
+        parser = CodexOutputParser()
+
+        assert parser.feed(line[:10]) == []
+        assert parser.feed(line[10:30]) == []
+        events = parser.feed(line[30:] + "\n")
+
+        assert [e["item"]["text"] for e in events] == ["Done"]
+        assert parser.agent_messages == ["Done"]
+
+    def test_json_response_puts_reasoning_first(self):
+        """Reasoning precedes agent messages, most recent reasoning first."""
+        parser = CodexOutputParser()
+        for item in (
+            {"type": "reasoning", "text": "first"},
+            {"type": "agent_message", "text": "Hello "},
+            {"type": "reasoning", "text": "second"},
+            {"type": "agent_message", "text": "world"},
+        ):
+            parser.feed(json.dumps({"type": "item.completed", "item": item}) + "\n")
+
+        assert parser.json_response() == "*Thinking: second*\n\n*Thinking: first*\n\nHello world"
+
+    def test_text_mode_matches_parse_codex_output(self):
+        """Feeding text output chunk by chunk gives the same result as parsing it whole."""
+        raw_output = """OpenAI Codex v0.65.0
+--------
+model: gpt-5
+thinking
+Planning
+
+exec
+/bin/bash -lc ls succeeded in 26ms:
+file1.py
+
+codex
+Final answer
+tokens used
+1,234"""
+        parser = CodexOutputParser()
+        for i in range(0, len(raw_output), 7):
+            parser.feed(raw_output[i:i + 7])
+        parser.finish()
+
+        assert not parser.saw_json
+        assert parser.text_result() == parse_codex_output(raw_output)
+        assert "file1.py" not in parser.text_result()
+
+
 def test_strip_ansi_codes_helper():
     """Ensure ANSI stripping helper removes escape sequences."""
     from chad.util.providers import _strip_ansi_codes
@@ -2103,6 +2158,38 @@ class TestGeminiCodeAssistProvider:
         assert "hello" in cmd[cmd.index("-p") + 1]
         assert provider.current_message is None
 
+    @pytest.mark.skipif(sys.platform == "win32", reason="PTY not available on Windows")
+    @patch("chad.util.providers.select.select")
+    @patch("chad.util.providers.os.read")
+    @patch("chad.util.providers.os.close")
+    @patch("chad.util.providers.pty.openpty")
+    @patch("subprocess.Popen")
+    def test_get_response_reassembles_events_split_across_reads(
+        self, mock_popen, mock_openpty, mock_close, mock_read, mock_select
+    ):
+        mock_openpty.return_value = (10, 11)
+
+        mock_process = Mock()
+        mock_process.stdin = Mock()
+        mock_process.poll.side_effect = [None, None, None, 0, 0, 0]
+        mock_popen.return_value = mock_process
+
+        mock_select.side_effect = [([10], [], []), ([10], [], []), ([10], [], []), ([], [], [])]
+        mock_read.side_effect = [
+            b'{"type": "init", "session_id": "ses',
+            b'-1"}\n{"type": "message", "role": "assistant", "con',
+            b'tent": "split answer"}',
+            b"",
+        ]
+
+        provider = GeminiCodeAssistProvider(ModelConfig(provider="gemini", model_name="default"))
+        provider.project_path = "/tmp/test"
+        provider.send_message("hello")
+
+        response = provider.get_response(timeout=5.0)
+        assert response == "split answer"
+        assert provider.session_id == "ses-1"
+
     @pytest.mark.skipif(sys.platform == "win32", reason="PTY not available on Windows")
     @patch("chad.util.providers.select.select")
     @patch("chad.util.providers.os.read")
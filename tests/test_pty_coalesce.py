@@ -0,0 +1,75 @@
+"""Tests for adaptive PTY output coalescing."""
+
+import base64
+import queue
+
+import anyio
+
+from chad.server.services import pty_coalesce
+from chad.server.services.pty_coalesce import OutputCoalescer, coalesce_events, merge_output_events
+from chad.server.services.pty_stream import PTYEvent
+
+
+def _output(data: bytes, has_ansi: bool = False) -> PTYEvent:
+    return PTYEvent(type="output", stream_id="s", data=base64.b64encode(data).decode("ascii"), has_ansi=has_ansi)
+
+
+def _queue(*events: PTYEvent) -> queue.Queue:
+    q: queue.Queue = queue.Queue()
+    for event in events:
+        q.put_nowait(event)
+    return q
+
+
+class TestMergeOutputEvents:
+    """Tests for merge_output_events and coalesce_events."""
+
+    def test_base64_chunks_merge_to_joined_bytes(self):
+        """Chunks whose lengths are not multiples of 3 still decode to the joined output."""
+        merged = merge_output_events([_output(b"ab"), _output(b"cde", has_ansi=True), _output(b"f")])
+        assert base64.b64decode(merged.data) == b"abcdef"
+        assert merged.has_ansi is True
+
+    def test_replay_keeps_exit_in_place(self):
+        """Buffered runs are merged but exit events are neither merged nor moved."""
+        exit_event = PTYEvent(type="exit", stream_id="s", exit_code=0)
+        merged = coalesce_events([_output(b"a"), _output(b"b"), exit_event])
+        assert [e.type for e in merged] == ["output", "exit"]
+        assert base64.b64decode(merged[0].data) == b"ab"
+
+
+class TestOutputCoalescer:
+    """Tests for OutputCoalescer."""
+
+    def test_merges_queued_run_and_holds_exit(self):
+        """Queued output becomes one event; the exit after it is delivered next."""
+        exit_event = PTYEvent(type="exit", stream_id="s", exit_code=0)
+        coalescer = OutputCoalescer(_queue(*[_output(b"x" * 100) for _ in range(10)], exit_event))
+
+        async def drain():
+            return [await coalescer.get(), await coalescer.get()]
+
+        first, second = anyio.run(drain)
+        assert base64.b64decode(first.data) == b"x" * 1000
+        assert second is exit_event
+
+    def test_lone_chunk_is_not_delayed(self, monkeypatch):
+        """Interactive output is returned without waiting for the burst window."""
+        monkeypatch.setattr(pty_coalesce, "COALESCE_WINDOW_SECONDS", 10.0)
+        coalescer = OutputCoalescer(_queue(_output(b"k")))
+
+        event = anyio.run(coalescer.get)
+        assert base64.b64decode(event.data) == b"k"
+
+    def test_budget_grows_with_lag(self, monkeypatch):
+        """A lagging subscriber gets larger batches than one that keeps up."""
+        monkeypatch.setattr(pty_coalesce, "COALESCE_MIN_BYTES", 300)
+        monkeypatch.setattr(pty_coalesce, "COALESCE_MAX_BYTES", 3000)
+        monkeypatch.setattr(pty_coalesce, "LAG_EVENTS", 20)
+
+        async def first_batch(count):
+            coalescer = OutputCoalescer(_queue(*[_output(b"y" * 99) for _ in range(count)]))
+            return len(base64.b64decode((await coalescer.get()).data))
+
+        assert anyio.run(first_batch, 5) == 99 * 4
+        assert anyio.run(first_batch, 40) == 99 * 31
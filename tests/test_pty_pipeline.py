@@ -0,0 +1,63 @@
+"""Tests for the PTY reader/dispatch hand-off."""
+
+import threading
+import time
+
+from chad.server.services import pty_pipeline
+from chad.server.services.pty_pipeline import ReadPipeline
+
+
+class TestReadPipeline:
+    """Tests for ReadPipeline."""
+
+    def test_slow_dispatch_does_not_block_reads(self):
+        """Reads are queued at once while the worker is still busy."""
+        release = threading.Event()
+        dispatched = []
+
+        def dispatch(data):
+            release.wait(timeout=5)
+            dispatched.append(data)
+
+        pipeline = ReadPipeline("s", dispatch)
+        started = time.monotonic()
+        for i in range(100):
+            pipeline.put(f"{i},".encode())
+        assert time.monotonic() - started < 0.5
+
+        release.set()
+        pipeline.close(timeout=5)
+        assert dispatched == [f"{i},".encode() for i in range(100)]
+
+    def test_full_ring_applies_backpressure(self):
+        """The reader waits (and counts a stall) only when the ring is full."""
+        stalls = pty_pipeline.PTY_READER_STALLS.labels(session_id="full-ring")
+        before = stalls.value
+        release = threading.Event()
+        pipeline = ReadPipeline("full-ring", lambda data: release.wait(timeout=5), maxsize=2)
+
+        reader = threading.Thread(target=lambda: [pipeline.put(b"x") for _ in range(5)])
+        reader.start()
+        reader.join(timeout=0.3)
+        assert reader.is_alive()
+        assert stalls.value > before
+
+        release.set()
+        reader.join(timeout=5)
+        pipeline.close(timeout=5)
+        assert not reader.is_alive()
+
+    def test_dispatch_errors_do_not_stop_worker(self):
+        """A failing dispatch is logged and later reads still go out."""
+        dispatched = []
+
+        def dispatch(data):
+            if data == b"bad":
+                raise RuntimeError("boom")
+            dispatched.append(data)
+
+        pipeline = ReadPipeline("s", dispatch)
+        pipeline.put(b"bad")
+        pipeline.put(b"good")
+        pipeline.close(timeout=5)
+        assert dispatched == [b"good"]
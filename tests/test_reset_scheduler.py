@@ -0,0 +1,92 @@
+"""Tests for the usage-reset wake-up scheduler."""
+
+import time
+
+import pytest
+
+from chad.server.services.reset_scheduler import ResetScheduler, eta_to_seconds
+
+
+@pytest.fixture
+def scheduler():
+    sched = ResetScheduler(lead_seconds=0, initial_backoff=0.01, max_backoff=0.04, probe_cache_seconds=0)
+    yield sched
+    sched.stop()
+
+
+class TestEtaToSeconds:
+    """Tests for parsing provider ETA strings."""
+
+    @pytest.mark.parametrize(
+        "eta, expected",
+        [("2h 15m", 8100), ("45m", 2700), ("1d 2h", 93600), ("0m", 0), ("", None), ("soon", None), (None, None)],
+    )
+    def test_parses_provider_formats(self, eta, expected):
+        """Hours/minutes (and days/seconds) are summed; anything else is unknown."""
+        assert eta_to_seconds(eta) == expected
+
+
+class TestResetScheduler:
+    """Tests for ResetScheduler."""
+
+    def test_first_probe_waits_for_eta(self, scheduler):
+        """No probe runs before the ETA; one probe after it resolves the wait."""
+        probes = []
+
+        def probe():
+            probes.append(time.monotonic())
+            return 0.0
+
+        started = time.monotonic()
+        wait = scheduler.schedule("acct", probe, threshold=90, eta_seconds=0.2)
+
+        assert wait.wait(timeout=2)
+        assert wait.reason == "reset"
+        assert len(probes) == 1
+        assert probes[0] - started >= 0.2
+
+    def test_backs_off_until_usage_drops(self, scheduler):
+        """Usage still above threshold is re-probed with growing delays."""
+        probes = []
+
+        def probe():
+            probes.append(time.monotonic())
+            return 100.0 if len(probes) < 5 else 10.0
+
+        wait = scheduler.schedule("acct", probe, threshold=90, eta_seconds=0)
+
+        assert wait.wait(timeout=2)
+        gaps = [b - a for a, b in zip(probes, probes[1:])]
+        assert len(probes) == 5
+        assert gaps[0] >= 0.01 and gaps[2] >= 0.04
+        assert scheduler.pending_count() == 0
+
+    def test_waits_on_same_key_share_one_probe(self):
+        """Paused sessions on the same account cost one usage call per check."""
+        sched = ResetScheduler(lead_seconds=0, initial_backoff=0.01, probe_cache_seconds=60)
+        calls = []
+
+        def probe():
+            calls.append(1)
+            return 0.0
+
+        try:
+            waits = [sched.schedule(("acct", "session_usage"), probe, 90, eta_seconds=0.05) for _ in range(5)]
+            assert all(w.wait(timeout=2) for w in waits)
+        finally:
+            sched.stop()
+
+        assert len(calls) == 1
+
+    def test_cancel_and_wake(self, scheduler):
+        """Cancelled waits are never probed; wake resolves with the given reason."""
+        calls = []
+        cancelled = scheduler.schedule("a", lambda: calls.append(1) or 0.0, 90, eta_seconds=0.05)
+        scheduler.cancel(cancelled)
+        woken = scheduler.schedule("b", lambda: 100.0, 90, eta_seconds=60)
+        scheduler.wake(woken, "user requested resume")
+
+        time.sleep(0.15)
+        assert calls == []
+        assert woken.done and woken.reason == "user requested resume"
+        assert scheduler.pending_count() == 0
@@ -1,6 +1,7 @@
 """Tests for SessionEventLoop milestone detection."""
 
 import chad.server.services.session_event_loop as session_event_loop
+from chad.server.services.reset_scheduler import ResetScheduler
 from chad.server.services.session_event_loop import SessionEventLoop
 from chad.util.handoff import is_quota_exhaustion_error
 
@@ -15,6 +16,15 @@ class FakeEventLog:
         self.events.append(event)
 
 
+def _use_fast_reset_scheduler(monkeypatch) -> ResetScheduler:
+    """Route await_reset waits through a scheduler that probes immediately, whatever the ETA."""
+    scheduler = ResetScheduler(
+        lead_seconds=float("inf"), initial_backoff=0.001, max_backoff=0.001, probe_cache_seconds=0
+    )
+    monkeypatch.setattr(session_event_loop, "get_reset_scheduler", lambda: scheduler)
+    return scheduler
+
+
 def _default_quota_checker(output_tail: str) -> str | None:
     """Default quota checker for tests - mimics Claude provider behavior."""
     import re
@@ -1667,9 +1677,7 @@ class TestAwaitResetPollingLoop:
             phases_run.append(kwargs.get("phase"))
             return 0, "done"
 
-        # Patch time.sleep to not actually sleep
-        sleeps = []
-        monkeypatch.setattr("chad.server.services.session_event_loop.time.sleep", lambda s: sleeps.append(s))
+        scheduler = _use_fast_reset_scheduler(monkeypatch)
 
         loop = SessionEventLoop(
             session_id="test",
@@ -1711,8 +1719,9 @@ class TestAwaitResetPollingLoop:
         assert len(phases_run) == 1
         assert phases_run[0] == "continuation"
 
-        # Verify we actually polled (slept at least twice at 10s each)
-        assert len(sleeps) >= 2
+        # Usage was re-probed until it dropped, and the wait was released
+        assert call_count[0] == 3
+        assert scheduler.pending_count() == 0
 
     def test_await_reset_with_eta(self, monkeypatch):
         """ETA from provider is included in the paused milestone."""
@@ -1726,7 +1735,7 @@ class TestAwaitResetPollingLoop:
                 return 100.0
             return 50.0
 
-        monkeypatch.setattr("chad.server.services.session_event_loop.time.sleep", lambda s: None)
+        _use_fast_reset_scheduler(monkeypatch)
 
         loop = SessionEventLoop(
             session_id="test",
@@ -1768,7 +1777,7 @@ class TestAwaitResetPollingLoop:
                 return 100.0
             return 50.0
 
-        monkeypatch.setattr("chad.server.services.session_event_loop.time.sleep", lambda s: None)
+        _use_fast_reset_scheduler(monkeypatch)
 
         loop = SessionEventLoop(
             session_id="test",
@@ -1887,10 +1896,7 @@ class TestNegativeExitCodeWithPendingAction:
                 return -15, "partial output"
             return 0, "continuation done"
 
-        monkeypatch.setattr(
-            "chad.server.services.session_event_loop.time.sleep",
-            lambda s: None,
-        )
+        _use_fast_reset_scheduler(monkeypatch)
 
         task = type("Task", (), {
             "cancel_requested": False,
@@ -1998,10 +2004,7 @@ class TestNegativeExitCodeWithPendingAction:
                 return 0, "second continuation output"
             return 0, "initial output"
 
-        monkeypatch.setattr(
-            "chad.server.services.session_event_loop.time.sleep",
-            lambda s: None,
-        )
+        _use_fast_reset_scheduler(monkeypatch)
 
         task = type("Task", (), {"cancel_requested": False})()
 
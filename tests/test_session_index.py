@@ -0,0 +1,116 @@
+"""Tests for the cross-session SQLite search index."""
+
+import sqlite3
+import time
+
+from chad.util.event_log import (
+    AssistantMessageEvent,
+    EventLog,
+    MilestoneEvent,
+    SessionEndedEvent,
+    SessionStartedEvent,
+    TerminalOutputEvent,
+    ToolCallStartedEvent,
+)
+from chad.util.session_index import SessionIndex, _fts_query, get_session_index
+
+
+def _log_session(base_dir, session_id, task, path=None, command=None):
+    log = EventLog(session_id, base_dir=base_dir)
+    log.log(SessionStartedEvent(task_description=task, project_path="/proj", coding_provider="mock"))
+    log.log(TerminalOutputEvent(data="noise that is never indexed"))
+    if path:
+        log.log(ToolCallStartedEvent(tool="edit", path=path))
+    if command:
+        log.log(ToolCallStartedEvent(tool="bash", command=command))
+    log.log(AssistantMessageEvent(blocks=[{"kind": "text", "content": f"Finished work on {task}"}]))
+    log.log(MilestoneEvent(milestone_type="coding_complete", title="Coding Complete", summary="all good"))
+    log.log(SessionEndedEvent(success=True, reason="completed"))
+    return log
+
+
+class TestSessionIndex:
+    """Tests for SessionIndex."""
+
+    def test_event_log_feeds_index(self, tmp_path):
+        """Events logged through EventLog are searchable immediately."""
+        _log_session(tmp_path, "s1", "Fix login redirect")
+        _log_session(tmp_path, "s2", "Add dark mode")
+
+        index = get_session_index(tmp_path)
+        hits, total = index.search("login")
+
+        assert total == 2  # task description and assistant text
+        assert {h.session_id for h in hits} == {"s1"}
+        assert {h.kind for h in hits} == {"task", "assistant"}
+        assert index.search("noise")[1] == 0
+
+    def test_search_filters_and_paginates(self, tmp_path):
+        """Search supports kind filters plus limit/offset."""
+        for i in range(5):
+            _log_session(tmp_path, f"s{i}", f"Refactor module {i}")
+
+        index = get_session_index(tmp_path)
+        first, total = index.search("refactor", kinds=["task"], limit=2)
+        second, _ = index.search("refactor", kinds=["task"], limit=2, offset=2)
+
+        assert total == 5
+        assert len(first) == 2 and len(second) == 2
+        assert not {h.session_id for h in first} & {h.session_id for h in second}
+
+    def test_sessions_touching_matches_path_suffix(self, tmp_path):
+        """A trailing path finds sessions that logged the absolute path."""
+        _log_session(tmp_path, "old", "First edit", path="/home/me/proj/src/app.py")
+        _log_session(tmp_path, "new", "Second edit", path="/home/me/proj/src/app.py")
+        _log_session(tmp_path, "other", "Unrelated", path="/home/me/proj/src/myapp.py")
+
+        touches = get_session_index(tmp_path).sessions_touching("src/app.py")
+
+        assert [t.session_id for t in touches] == ["new", "old"]
+        assert touches[0].path == "/home/me/proj/src/app.py"
+
+    def test_commands_are_searchable(self, tmp_path):
+        """Bash commands from tool calls are indexed."""
+        _log_session(tmp_path, "s1", "Run tests", command="pytest -k flaky_widget")
+
+        hits, _ = get_session_index(tmp_path).search("flaky_widget", kinds=["tool"])
+
+        assert [h.session_id for h in hits] == ["s1"]
+
+    def test_backfill_indexes_existing_logs(self, tmp_path):
+        """Logs written before the index existed are picked up by backfill."""
+        _log_session(tmp_path, "s1", "Legacy session")
+        get_session_index(tmp_path).close()
+        (tmp_path / "index.sqlite").unlink()
+        for suffix in ("-wal", "-shm"):
+            (tmp_path / f"index.sqlite{suffix}").unlink(missing_ok=True)
+
+        index = SessionIndex(tmp_path)
+        assert index.backfill() == 1
+        assert index.matching_session_ids("legacy") == ["s1"]
+        # Unchanged logs are skipped on the next pass
+        assert index.backfill() == 0
+        index.close()
+
+    def test_writer_commits_queued_events_in_background(self, tmp_path):
+        """Logging only queues events; the writer thread commits them without a query."""
+        _log_session(tmp_path, "s1", "Background indexing")
+        index = get_session_index(tmp_path)
+
+        deadline = time.monotonic() + 5
+        while index._pending and time.monotonic() < deadline:
+            time.sleep(0.01)
+        # Let the writer finish its transaction, then read with a separate connection
+        with index._lock:
+            pass
+        conn = sqlite3.connect(str(tmp_path / "index.sqlite"))
+        try:
+            count = conn.execute("SELECT COUNT(*) FROM docs WHERE session_id = 's1'").fetchone()[0]
+        finally:
+            conn.close()
+        assert count > 0
+
+    def test_fts_query_quotes_user_input(self):
+        """Free text never reaches FTS5 as query syntax."""
+        assert _fts_query('foo AND "bar"') == '"foo" "AND" """bar"""'
+        assert _fts_query("pars*") == '"pars"*'
@@ -235,3 +235,93 @@ class TestLoadFromLogs:
         assert restored == 5
         sessions = manager.list_sessions()
         assert len(sessions) == 5
+
+    def test_restores_compacted_session(self, tmp_path, monkeypatch):
+        """A session compacted into the cold tier is restored like a hot one."""
+        from chad.util.event_log import compact_session_log
+
+        log_dir = tmp_path / "logs"
+        log_dir.mkdir()
+        monkeypatch.setenv("CHAD_LOG_DIR", str(log_dir))
+
+        now = datetime.now(timezone.utc).isoformat()
+        events = [
+            {"type": "session_started", "seq": 1, "ts": now,
+             "task_description": "Refactor the parser",
+             "project_path": "/tmp/myproject",
+             "coding_account": "claude-main",
+             "coding_provider": "anthropic"},
+        ]
+        events += [{"type": "status", "seq": i, "ts": now, "status": "running"} for i in range(2, 600)]
+        events.append({"type": "session_ended", "seq": 600, "ts": now, "success": True, "reason": "completed"})
+        log_file = self._write_log(log_dir, "cold01", events)
+        assert compact_session_log(log_file) is not None
+
+        manager = SessionManager()
+        restored = manager.load_from_logs(max_age_days=7)
+
+        assert restored == 1
+        session = manager.get_session("cold01")
+        assert session.task_description == "Refactor the parser"
+        assert session.status == "completed"
+
+
+class TestSessionListIndexes:
+    """Tests for indexed session listing and the change feed."""
+
+    def test_filters_by_project_and_status(self, tmp_path, monkeypatch):
+        """Project and status filters use the secondary indexes and track updates."""
+        monkeypatch.setenv("CHAD_CONFIG", str(tmp_path / "chad.conf"))
+        manager = SessionManager()
+        a = manager.create_session(project_path=str(tmp_path / "proj"))
+        b = manager.create_session(project_path=str(tmp_path / "proj" / ".." / "proj"))
+        manager.create_session(project_path=str(tmp_path / "other"))
+
+        ids = {s.id for s in manager.list_sessions(project_path=str(tmp_path / "proj"))}
+        assert ids == {a.id, b.id}
+
+        b.status = "completed"
+        assert [s.id for s in manager.list_sessions(status="completed")] == [b.id]
+        assert [s.id for s in manager.list_sessions(project_path=str(tmp_path / "proj"), status="active")] == [a.id]
+
+        manager.delete_session(b.id)
+        assert manager.list_sessions(status="completed") == []
+
+    def test_sort_by_activity(self, tmp_path, monkeypatch):
+        """Activity sort orders by last_activity, newest first."""
+        monkeypatch.setenv("CHAD_CONFIG", str(tmp_path / "chad.conf"))
+        manager = SessionManager()
+        first = manager.create_session()
+        second = manager.create_session()
+        first.last_activity = second.last_activity + timedelta(seconds=5)
+
+        assert [s.id for s in manager.list_sessions(sort="activity")][0] == first.id
+
+    def test_changes_since(self, tmp_path, monkeypatch):
+        """The change feed reports changed and deleted sessions after a version."""
+        monkeypatch.setenv("CHAD_CONFIG", str(tmp_path / "chad.conf"))
+        manager = SessionManager()
+        a = manager.create_session()
+        b = manager.create_session()
+        version = manager.version
+
+        a.name = "renamed"
+        manager.delete_session(b.id)
+        a.cancel_requested = True  # Not a listed field
+
+        changes = manager.changes_since(version)
+        assert not changes.reset
+        assert [s.id for s in changes.sessions] == [a.id]
+        assert changes.deleted == [b.id]
+        assert changes.version == version + 2
+        assert manager.changes_since(changes.version).sessions == []
+
+    def test_changes_since_unknown_version_resets(self, tmp_path, monkeypatch):
+        """A version ahead of the manager (e.g. after restart) returns a full reset."""
+        monkeypatch.setenv("CHAD_CONFIG", str(tmp_path / "chad.conf"))
+        manager = SessionManager()
+        session = manager.create_session()
+
+        changes = manager.changes_since(manager.version + 10)
+        assert changes.reset
+        assert [s.id for s in changes.sessions] == [session.id]
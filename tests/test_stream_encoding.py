@@ -0,0 +1,73 @@
+"""Tests for per-event stream compression."""
+
+import zlib
+
+import anyio
+import pytest
+
+from chad.util import stream_encoding
+from chad.util.stream_encoding import StreamEncoder, encode_stream, negotiate_encoding
+
+
+class TestNegotiateEncoding:
+    """Tests for Accept-Encoding negotiation."""
+
+    @pytest.mark.parametrize(
+        "header, expected",
+        [
+            (None, None),
+            ("", None),
+            ("identity", None),
+            ("gzip, deflate", "gzip"),
+            ("GZIP;q=0.5", "gzip"),
+            ("gzip;q=0", None),
+            ("*", "gzip"),
+            ("*, gzip;q=0", None),
+        ],
+    )
+    def test_gzip_without_brotli(self, monkeypatch, header, expected):
+        """gzip is chosen when accepted; q=0 and identity-only disable compression."""
+        monkeypatch.setattr(stream_encoding, "brotli", None)
+        assert negotiate_encoding(header) == expected
+
+    def test_prefers_brotli_when_installed(self, monkeypatch):
+        """br wins over gzip when the brotli module is available and accepted."""
+        monkeypatch.setattr(stream_encoding, "brotli", object())
+        assert negotiate_encoding("gzip, br") == "br"
+        assert negotiate_encoding("gzip, br;q=0") == "gzip"
+
+
+class TestStreamEncoder:
+    """Tests for StreamEncoder."""
+
+    def test_each_chunk_decodes_on_arrival(self):
+        """A sync flush per chunk lets the client decode every event without waiting."""
+        encoder = StreamEncoder("gzip")
+        decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        events = [f"event: terminal\ndata: {{\"data\": \"line {i} {'x' * 200}\"}}\nid: {i}\n\n" for i in range(20)]
+
+        sent = 0
+        for event in events:
+            frame = encoder.encode(event.encode())
+            sent += len(frame)
+            assert decoder.decompress(frame) == event.encode()
+        decoder.decompress(encoder.finish())
+
+        assert decoder.eof
+        assert sent < sum(len(e) for e in events) / 4
+
+    def test_encode_stream_produces_valid_gzip(self):
+        """encode_stream accepts str chunks and ends the gzip member."""
+        async def chunks():
+            for text in ("a" * 100, "b" * 100):
+                yield text
+
+        async def collect():
+            return b"".join([frame async for frame in encode_stream(chunks(), "gzip")])
+
+        assert zlib.decompress(anyio.run(collect), 16 + zlib.MAX_WBITS) == b"a" * 100 + b"b" * 100
+
+    def test_unknown_encoding_rejected(self):
+        """Only encodings this module produces are accepted."""
+        with pytest.raises(ValueError):
+            StreamEncoder("zstd")
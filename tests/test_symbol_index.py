@@ -225,3 +225,213 @@ class TestFullIndex:
             for ref in refs:
                 all_files.add(ref.file)
         assert any("test_providers" in f for f in all_files)
+
+
+class TestImportGraph:
+    """Test the cached import graph used for change-aware test selection."""
+
+    @staticmethod
+    def _project(tmp_path):
+        files = {
+            "src/pkg/__init__.py": "",
+            "src/pkg/core.py": "VALUE = 1\n",
+            "src/pkg/api.py": "from .core import VALUE\n",
+            "src/pkg/cli.py": "def main():\n    from pkg import api\n",
+            "src/pkg/other.py": "X = 2\n",
+            "tests/conftest.py": "import pkg.other\n",
+            "tests/test_api.py": "from pkg.api import VALUE\n",
+            "tests/test_cli.py": "from unittest.mock import patch\npatch('pkg.cli.main')\n",
+            "tests/test_other.py": "import pkg.other\n",
+        }
+        for rel, text in files.items():
+            path = tmp_path / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(text)
+        return tmp_path
+
+    def test_module_names_follow_package_roots(self, tmp_path):
+        from chad.util.symbol_index import module_name_for
+
+        root = self._project(tmp_path)
+        assert module_name_for(root, "src/pkg/core.py") == "pkg.core"
+        assert module_name_for(root, "src/pkg/__init__.py") == "pkg"
+        assert module_name_for(root, "tests/test_api.py") == "test_api"
+
+    def test_selects_transitive_importers(self, tmp_path):
+        from chad.util.symbol_index import ImportGraph
+
+        root = self._project(tmp_path)
+        graph = ImportGraph(root, cache_path=tmp_path / "graph.json")
+        graph.refresh()
+
+        # core <- api (relative import) <- cli (lazy import) <- test_cli (patch target)
+        assert graph.affected_tests(["src/pkg/core.py"]) == ["tests/test_api.py", "tests/test_cli.py"]
+        # Imported by conftest, but only test_other imports it itself
+        assert graph.affected_tests(["src/pkg/other.py"]) == ["tests/test_other.py"]
+        # The package __init__ runs for every importer
+        assert len(graph.affected_tests(["src/pkg/__init__.py"])) == 3
+
+    def test_edited_conftest_selects_its_directory(self, tmp_path):
+        from chad.util.symbol_index import ImportGraph
+
+        root = self._project(tmp_path)
+        graph = ImportGraph(root, cache_path=tmp_path / "graph.json")
+        graph.refresh()
+
+        assert graph.affected_tests(["tests/conftest.py"]) == [
+            "tests/test_api.py", "tests/test_cli.py", "tests/test_other.py",
+        ]
+
+    def test_unknown_or_unparsable_changes_fall_back(self, tmp_path):
+        from chad.util.symbol_index import ImportGraph
+
+        root = self._project(tmp_path)
+        (root / "src/pkg/broken.py").write_text("def (:\n")
+        graph = ImportGraph(root, cache_path=tmp_path / "graph.json")
+        graph.refresh()
+
+        assert graph.affected_tests(["src/pkg/missing.py"]) is None
+        assert graph.affected_tests(["src/pkg/broken.py"]) is None
+        assert graph.affected_tests(["setup.cfg"]) is None
+        assert graph.affected_tests(["docs/guide.md"]) == []
+
+    def test_refresh_reparses_only_changed_files(self, tmp_path):
+        import os
+        from chad.util.symbol_index import ImportGraph
+
+        root = self._project(tmp_path)
+        cache = tmp_path / "graph.json"
+        assert ImportGraph(root, cache_path=cache).refresh() == 9
+
+        graph = ImportGraph(root, cache_path=cache)
+        assert graph.refresh() == 0
+
+        api = root / "src/pkg/api.py"
+        api.write_text("VALUE = 3\n")
+        os.utime(api, ns=(api.stat().st_atime_ns, api.stat().st_mtime_ns + 10**9))
+        assert graph.refresh() == 1
+        assert graph.affected_tests(["src/pkg/core.py"]) == []
+
+    def test_deleted_module_still_selects_importers(self, tmp_path):
+        from chad.util.symbol_index import ImportGraph
+
+        root = self._project(tmp_path)
+        graph = ImportGraph(root, cache_path=tmp_path / "graph.json")
+        graph.refresh()
+        (root / "src/pkg/other.py").unlink()
+        graph.refresh()
+
+        assert graph.affected_tests(["src/pkg/other.py"]) == ["tests/test_other.py"]
+
+
+class TestSymbolStore:
+    """Test the persistent, incrementally updated symbol index."""
+
+    @staticmethod
+    def _write(root, rel, text):
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+        return path
+
+    def test_queries_match_in_memory_index(self, tmp_path):
+        from chad.util.symbol_index import SymbolStore, build_index, find_impact, find_symbol
+
+        self._write(tmp_path, "src/defn.py", "class Foo:\n    pass\ndef bar():\n    pass\n")
+        self._write(tmp_path, "src/user.py", "from defn import Foo, bar\n")
+        self._write(tmp_path, "ui/src/App.tsx", "import { Foo } from './x';\nexport function App() {}\n")
+
+        store = SymbolStore(tmp_path, db_path=tmp_path / "idx.sqlite")
+        assert store.update() == (3, 0)
+        index = build_index(tmp_path)
+
+        for name in ("Foo", "bar", "App"):
+            for mode in ("all", "define", "callers"):
+                expected = sorted((r.file, r.line, r.kind) for r in find_symbol(index, name, mode))
+                assert sorted((r.file, r.line, r.kind) for r in store.find_symbol(name, mode)) == expected
+        impact = store.find_impact("src/defn.py")
+        assert {name: [r.file for r in refs] for name, refs in impact.items()} == {
+            name: [r.file for r in refs] for name, refs in find_impact(index, "src/defn.py").items()
+        }
+        store.close()
+
+    def test_update_reindexes_only_changed_content(self, tmp_path):
+        import os
+        from chad.util.symbol_index import SymbolStore
+
+        defn = self._write(tmp_path, "src/defn.py", "class Foo:\n    pass\n")
+        self._write(tmp_path, "src/other.py", "def helper():\n    pass\n")
+        db = tmp_path / "idx.sqlite"
+        store = SymbolStore(tmp_path, db_path=db)
+        assert store.update() == (2, 0)
+        assert store.update() == (0, 0)
+
+        # Touched but identical content: hash matches, nothing re-parsed
+        os.utime(defn, ns=(defn.stat().st_atime_ns, defn.stat().st_mtime_ns + 10**9))
+        assert store.update() == (0, 0)
+
+        defn.write_text("class Bar:\n    pass\n")
+        (tmp_path / "src/other.py").unlink()
+        assert store.update() == (1, 1)
+        assert store.find_symbol("Foo") == []
+        assert store.find_symbol("helper") == []
+        store.close()
+
+        # The index persists across processes
+        reopened = SymbolStore(tmp_path, db_path=db)
+        assert reopened.update() == (0, 0)
+        assert [r.file for r in reopened.find_symbol("Bar")] == ["src/defn.py"]
+        reopened.close()
+
+    def test_parallel_build_matches_serial(self, tmp_path, monkeypatch):
+        from chad.util import symbol_index
+        from chad.util.symbol_index import SymbolStore
+
+        for i in range(12):
+            self._write(tmp_path, f"src/mod{i}.py", f"def func{i}():\n    pass\n")
+        monkeypatch.setattr(symbol_index, "PARALLEL_PARSE_THRESHOLD", 4)
+
+        store = SymbolStore(tmp_path, db_path=tmp_path / "idx.sqlite")
+        assert store.update(workers=2) == (12, 0)
+        assert len([s for s in store.all_symbols() if s.startswith("func")]) == 12
+        store.close()
+
+    def test_query_server_round_trip(self, monkeypatch):
+        import socket
+        import tempfile
+        import threading
+        import time
+        from pathlib import Path
+
+        import pytest
+        from chad.util.symbol_index import query_server, serve
+
+        if not hasattr(socket, "AF_UNIX"):
+            pytest.skip("Unix sockets not available")
+
+        # Short path: AF_UNIX socket paths are limited to ~104 bytes
+        sock_path = Path(tempfile.mkdtemp(prefix="chad-")) / "idx.sock"
+        assert query_server(sock_path, {"symbol": "Foo"}) is None
+
+        stop = threading.Event()
+        thread = threading.Thread(
+            target=serve, args=(sock_path, lambda req: {"echo": req["symbol"]}, stop), daemon=True,
+        )
+        thread.start()
+        deadline = time.monotonic() + 5
+        while not sock_path.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert query_server(sock_path, {"symbol": "Foo"}) == {"echo": "Foo"}
+        assert query_server(sock_path, {}) == {"error": "'symbol'"}
+
+        # A client that never sends its request is dropped instead of blocking the server
+        monkeypatch.setattr("chad.util.symbol_index.SERVE_CONN_TIMEOUT_SECONDS", 0.2)
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as silent:
+            silent.connect(str(sock_path))
+            assert query_server(sock_path, {"symbol": "Bar"}, timeout=5.0) == {"echo": "Bar"}
+
+        stop.set()
+        thread.join(timeout=5)
+        assert not sock_path.exists()
+        sock_path.parent.rmdir()
@@ -2,6 +2,7 @@ import json
 import re
 import subprocess
 import sys
+import threading
 from pathlib import Path
 
 from chad.server.services.session_manager import SessionManager
@@ -704,6 +705,43 @@ def test_terminal_output_is_periodically_flushed_and_decoded(tmp_path, monkeypat
     assert len(terminal_events) >= 1, "Expected at least one terminal_output snapshot"
 
 
+def test_snapshot_worker_stops_when_wait_loop_raises(tmp_path, monkeypatch):
+    """An error while waiting on the PTY still stops the terminal snapshot thread."""
+    repo_path = tmp_path / "repo"
+    _init_git_repo(repo_path)
+
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({"accounts": {"idle": {"provider": "mock"}}}), encoding="utf-8")
+    monkeypatch.setenv("CHAD_CONFIG", str(config_path))
+    monkeypatch.setenv("CHAD_LOG_DIR", str(tmp_path / "logs"))
+
+    session_manager = SessionManager()
+    session = session_manager.create_session(project_path=str(repo_path), name="snapshot-stop")
+    executor = TaskExecutor(ConfigManager(), session_manager, inactivity_timeout=10.0)
+
+    import chad.server.services.task_executor as te
+
+    def sleepy_command(provider, account_name, project_path, task_description=None, screenshots=None, phase="combined", exploration_output=None, **kwargs):
+        return ["bash", "-c", "sleep 2"], {}, None
+
+    def broken_threshold():
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(te, "build_agent_command", sleepy_command)
+    monkeypatch.setattr(executor, "_idle_warning_threshold", broken_threshold)
+
+    task = executor.start_task(
+        session_id=session.id,
+        project_path=str(repo_path),
+        task_description="snapshot cleanup",
+        coding_account="idle",
+    )
+    task._thread.join(timeout=10)
+
+    assert task.state == TaskState.FAILED
+    assert not [t for t in threading.enumerate() if t.name == f"terminal-snapshot-{session.id}"]
+
+
 def test_stream_json_terminal_output_keeps_message_line_breaks(tmp_path, monkeypatch):
     """Stream-json providers should not collapse adjacent assistant messages onto one line."""
     repo_path = tmp_path / "repo"
@@ -842,6 +880,100 @@ def test_coding_status_events_are_logged_for_streaming(tmp_path, monkeypatch):
     assert "session_ended" in types
 
 
+def test_tasks_beyond_concurrency_limit_queue_until_a_slot_frees(tmp_path, monkeypatch):
+    """A second task waits PENDING with its queue position, then runs normally."""
+    repo_path = tmp_path / "repo"
+    _init_git_repo(repo_path)
+
+    config_path = tmp_path / "config.json"
+    config_path.write_text(
+        json.dumps({"accounts": {"mock-acct": {"provider": "mock"}}, "max_concurrent_tasks": 1}),
+        encoding="utf-8",
+    )
+    monkeypatch.setenv("CHAD_CONFIG", str(config_path))
+    monkeypatch.setenv("CHAD_LOG_DIR", str(tmp_path / "logs"))
+
+    session_manager = SessionManager()
+    first_session = session_manager.create_session(project_path=str(repo_path), name="first")
+    second_session = session_manager.create_session(project_path=str(repo_path), name="second")
+    executor = TaskExecutor(ConfigManager(), session_manager, inactivity_timeout=30.0)
+
+    import chad.server.services.task_executor as te
+
+    def scripted_command(provider, account_name, project_path, task_description=None,
+                         screenshots=None, phase="combined", exploration_output=None, **kwargs):
+        script = "sleep 0.5; echo '```json'; echo '{\"change_summary\":\"Done\",\"files_changed\":[],\"completion_status\":\"success\"}'; echo '```'"
+        return ["bash", "-c", script], {}, None
+
+    monkeypatch.setattr(te, "build_agent_command", scripted_command)
+
+    first = executor.start_task(
+        session_id=first_session.id,
+        project_path=str(repo_path),
+        task_description="First task",
+        coding_account="mock-acct",
+    )
+    second = executor.start_task(
+        session_id=second_session.id,
+        project_path=str(repo_path),
+        task_description="Second task",
+        coding_account="mock-acct",
+    )
+
+    assert first.state == TaskState.RUNNING
+    assert second.state == TaskState.PENDING
+    assert second.progress == "Queued: position 1 of 1"
+    assert executor.get_running_task_for_session(second_session.id) is second
+
+    first._thread.join(timeout=15)
+    assert second._thread is not None
+    second._thread.join(timeout=15)
+
+    assert second.state == TaskState.COMPLETED
+    statuses = [e.get("status") for e in second.event_log.get_events() if e.get("type") == "status"]
+    assert "Queued: position 1 of 1" in statuses
+    # The queued status must not make a fresh session look like a resume
+    queued_statuses = [e.data.get("status") for e in executor.get_events(second.id) if e.type == "status"]
+    assert "Resuming previous session..." not in queued_statuses
+    assert executor.scheduler.snapshot()["running"] == []
+
+
+def test_cancelling_a_queued_task_removes_it_from_the_queue(tmp_path, monkeypatch):
+    """Cancelling a PENDING task marks it cancelled without ever starting it."""
+    repo_path = tmp_path / "repo"
+    _init_git_repo(repo_path)
+
+    config_path = tmp_path / "config.json"
+    config_path.write_text(
+        json.dumps({"accounts": {"mock-acct": {"provider": "mock"}}, "max_concurrent_tasks": 1}),
+        encoding="utf-8",
+    )
+    monkeypatch.setenv("CHAD_CONFIG", str(config_path))
+    monkeypatch.setenv("CHAD_LOG_DIR", str(tmp_path / "logs"))
+
+    session_manager = SessionManager()
+    executor = TaskExecutor(ConfigManager(), session_manager, inactivity_timeout=30.0)
+    started = []
+    monkeypatch.setattr(executor, "_run_task", lambda task, *args: started.append(task.id))
+
+    tasks = [
+        executor.start_task(
+            session_id=session_manager.create_session(project_path=str(repo_path), name=name).id,
+            project_path=str(repo_path),
+            task_description=name,
+            coding_account="mock-acct",
+        )
+        for name in ("holder", "waiter")
+    ]
+    tasks[0]._thread.join(timeout=5)
+
+    assert executor.cancel_task(tasks[1].id)
+    assert tasks[1].state == TaskState.CANCELLED
+    assert tasks[1]._thread is None
+    assert started == [tasks[0].id]
+    assert executor.scheduler.snapshot()["queued"] == []
+
+
 def test_continuation_loop_waits_for_completion_json(tmp_path, monkeypatch):
     """Task executor continues running until completion JSON is found."""
     repo_path = tmp_path / "repo"
@@ -0,0 +1,118 @@
+"""Tests for the task admission scheduler."""
+
+from chad.server.services.task_scheduler import QueuedTask, TaskScheduler
+
+
+class _Limits:
+    """Minimal stand-in for the ConfigManager scheduling getters."""
+
+    def __init__(self, total=2, per_account=0, per_provider=0, balance=False):
+        self.total = total
+        self.per_account = per_account
+        self.per_provider = per_provider
+        self.balance = balance
+
+    def get_max_concurrent_tasks(self):
+        return self.total
+
+    def get_max_tasks_per_account(self):
+        return self.per_account
+
+    def get_max_tasks_per_provider(self):
+        return self.per_provider
+
+    def get_balance_task_accounts(self):
+        return self.balance
+
+
+def _entry(task_id, started, account="a", provider="mock", positions=None, **kwargs):
+    def on_position(position, total):
+        if positions is not None:
+            positions.append((task_id, position, total))
+
+    return QueuedTask(
+        task_id=task_id,
+        session_id=f"s-{task_id}",
+        account=account,
+        provider=provider,
+        start=lambda chosen: started.append((task_id, chosen)),
+        on_position=on_position,
+        **kwargs,
+    )
+
+
+class TestTaskScheduler:
+    """Tests for TaskScheduler admission and queueing."""
+
+    def test_queues_beyond_global_limit_and_admits_on_release(self):
+        """Tasks past the global limit wait and start as slots free up."""
+        scheduler = TaskScheduler(_Limits(total=2))
+        started, positions = [], []
+
+        assert scheduler.submit(_entry("t1", started)) == 0
+        assert scheduler.submit(_entry("t2", started)) == 0
+        assert scheduler.submit(_entry("t3", started, positions=positions)) == 1
+        assert started == [("t1", "a"), ("t2", "a")]
+        assert positions == [("t3", 1, 1)]
+
+        scheduler.release("t1")
+        assert started[-1] == ("t3", "a")
+        assert scheduler.snapshot()["queued"] == []
+
+    def test_priority_then_fifo_order(self):
+        """Higher priority is admitted first; equal priorities keep arrival order."""
+        scheduler = TaskScheduler(_Limits(total=1))
+        started = []
+        scheduler.submit(_entry("run", started))
+        for task_id, priority in [("low", 0), ("high", 5), ("low2", 0)]:
+            scheduler.submit(_entry(task_id, started, priority=priority))
+
+        assert [q["task_id"] for q in scheduler.snapshot()["queued"]] == ["high", "low", "low2"]
+        for task_id in ("run", "high", "low"):
+            scheduler.release(task_id)
+        assert [t for t, _ in started] == ["run", "high", "low", "low2"]
+
+    def test_account_limit_does_not_block_other_accounts(self):
+        """A task waiting on a busy account lets tasks for free accounts through."""
+        scheduler = TaskScheduler(_Limits(total=4, per_account=1))
+        started = []
+        scheduler.submit(_entry("a1", started, account="a"))
+        assert scheduler.submit(_entry("a2", started, account="a")) == 1
+        assert scheduler.submit(_entry("b1", started, account="b")) == 0
+
+        assert [t for t, _ in started] == ["a1", "b1"]
+
+    def test_provider_limit(self):
+        """Per-provider slots cap tasks across that provider's accounts."""
+        scheduler = TaskScheduler(_Limits(total=4, per_provider=1))
+        started = []
+        scheduler.submit(_entry("x", started, account="a", provider="anthropic"))
+        assert scheduler.submit(_entry("y", started, account="b", provider="anthropic")) == 1
+        assert scheduler.submit(_entry("z", started, account="c", provider="openai")) == 0
+
+    def test_balancing_picks_least_used_free_account(self):
+        """With alternates, the free account with the lowest cached usage wins."""
+        scheduler = TaskScheduler(_Limits(total=4, per_account=1))
+        started = []
+        scheduler.record_usage("a", 80.0)
+        scheduler.record_usage("b", 60.0)
+        scheduler.record_usage("c", 10.0)
+
+        scheduler.submit(_entry("t1", started, account="a", alternates=["a", "b", "c"]))
+        scheduler.submit(_entry("t2", started, account="a", alternates=["a", "b", "c"]))
+        scheduler.submit(_entry("t3", started, account="a", alternates=["a", "b", "c"]))
+
+        assert started == [("t1", "c"), ("t2", "b"), ("t3", "a")]
+
+    def test_cancel_removes_queued_task_and_renumbers(self):
+        """Cancelling a queued task shifts the ones behind it forward."""
+        scheduler = TaskScheduler(_Limits(total=1))
+        started, positions = [], []
+        scheduler.submit(_entry("run", started))
+        scheduler.submit(_entry("q1", started, positions=positions))
+        scheduler.submit(_entry("q2", started, positions=positions))
+
+        assert scheduler.cancel("q1")
+        assert not scheduler.cancel("run")
+        assert scheduler.position("q2") == 1
+        assert positions[-1] == ("q2", 1, 1)
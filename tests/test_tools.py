@@ -13,7 +13,7 @@ class TestVerify:
         """verify(lint_only=True) should run only flake8."""
         from chad.util.verification.tools import verify
 
-        with patch("chad.util.verification.tools.subprocess.run") as mock_run:
+        with patch("chad.util.verification.tools._run_command") as mock_run:
             mock_run.return_value.returncode = 0
             mock_run.return_value.stdout = ""
             mock_run.return_value.stderr = ""
@@ -28,7 +28,7 @@ class TestVerify:
         """verify should report lint failures."""
         from chad.util.verification.tools import verify
 
-        with patch("chad.util.verification.tools.subprocess.run") as mock_run:
+        with patch("chad.util.verification.tools._run_command") as mock_run:
             mock_run.return_value.returncode = 1
             mock_run.return_value.stdout = "file.py:1:1: E001 error"
             mock_run.return_value.stderr = ""
@@ -65,7 +65,7 @@ class TestVerify:
             # pytest failure
             return type("Proc", (), {"returncode": 1, "stdout": "FAILED", "stderr": "ERROR"})()
 
-        with patch("chad.util.verification.tools.subprocess.run", fake_run):
+        with patch("chad.util.verification.tools._run_command", fake_run):
             result = verify()
 
         assert result["success"] is False
@@ -81,7 +81,7 @@ class TestVerify:
             commands.append(cmd)
             return type("Proc", (), {"returncode": 0, "stdout": "ok", "stderr": ""})()
 
-        with patch("chad.util.verification.tools.subprocess.run", fake_run):
+        with patch("chad.util.verification.tools._run_command", fake_run):
             result = verify()
 
         assert result["success"] is True
@@ -108,7 +108,7 @@ class TestVerify:
             commands.append(cmd)
             return type("Proc", (), {"returncode": 0, "stdout": "ok", "stderr": ""})()
 
-        with patch("chad.util.verification.tools.subprocess.run", fake_run):
+        with patch("chad.util.verification.tools._run_command", fake_run):
             result = verify(
                 changed_files=["src/chad/util/providers.py"]
             )
@@ -120,6 +120,24 @@ class TestVerify:
         cmd_str = " ".join(str(x) for x in pytest_cmd[0])
         assert "test_providers.py" in cmd_str
 
+    def test_verify_with_no_changed_files_is_lint_only(self):
+        """verify(changed_files=[]) lints the whole project and runs no tests."""
+        from chad.util.verification.tools import verify
+
+        commands = []
+
+        def fake_run(cmd, **kwargs):
+            commands.append(cmd)
+            return type("Proc", (), {"returncode": 0, "stdout": "", "stderr": ""})()
+
+        with patch("chad.util.verification.tools._run_command", fake_run):
+            result = verify(changed_files=[])
+
+        assert result["success"] is True
+        assert result["test"] is None
+        assert len(commands) == 1
+        assert commands[0][-2:] == ["flake8", "."]
+
     def test_verify_with_changed_files_fallback_to_full(self):
         """verify(changed_files=...) with unmapped files falls back to full suite."""
         from chad.util.verification.tools import verify
@@ -130,7 +148,7 @@ class TestVerify:
             commands.append(cmd)
             return type("Proc", (), {"returncode": 0, "stdout": "ok", "stderr": ""})()
 
-        with patch("chad.util.verification.tools.subprocess.run", fake_run):
+        with patch("chad.util.verification.tools._run_command", fake_run):
             result = verify(
                 changed_files=["some/unknown/file.py"]
             )
@@ -141,6 +159,40 @@ class TestVerify:
         cmd_str = " ".join(str(x) for x in pytest_cmd[0])
         assert "tests/" in cmd_str
 
+    def test_verify_without_tests_dir_skips_full_suite(self, tmp_path):
+        """A project with no tests/ dir and no test command is not failed by a missing pytest path."""
+        from chad.util.verification.tools import verify
+
+        (tmp_path / "package.json").write_text("{}")
+        (tmp_path / "index.js").write_text("console.log(1)\n")
+        commands = []
+
+        def fake_run(cmd, **kwargs):
+            commands.append(cmd)
+            return type("Proc", (), {"returncode": 0, "stdout": "ok", "stderr": ""})()
+
+        with patch("chad.util.verification.tools._run_command", fake_run):
+            result = verify(project_root=tmp_path, changed_files=["package.json", "index.js"])
+
+        assert result["success"] is True
+        assert result["test"]["passed"] is True
+        assert not any("pytest" in str(x) for cmd in commands for x in cmd)
+
+    def test_verify_full_suite_uses_project_test_command(self, tmp_path):
+        """The configured test command replaces pytest tests/ for the full suite."""
+        from chad.util.verification.tools import verify
+
+        commands = []
+
+        def fake_run(cmd, **kwargs):
+            commands.append(cmd)
+            return type("Proc", (), {"returncode": 0, "stdout": "ok", "stderr": ""})()
+
+        with patch("chad.util.verification.tools._run_command", fake_run):
+            verify(project_root=tmp_path, changed_files=["package.json"], test_command="npm test")
+
+        assert ["npm", "test"] in commands
+
     def test_verify_with_ts_files_runs_tsc(self):
         """verify(changed_files=...) with TS files should run tsc."""
         from chad.util.verification.tools import verify
@@ -151,7 +203,7 @@ class TestVerify:
             commands.append(cmd)
             return type("Proc", (), {"returncode": 0, "stdout": "ok", "stderr": ""})()
 
-        with patch("chad.util.verification.tools.subprocess.run", fake_run):
+        with patch("chad.util.verification.tools._run_command", fake_run):
             with patch("chad.util.verification.tools.shutil.which", return_value="/usr/bin/npx"):
                 result = verify(
                     changed_files=["ui/src/components/ChatView.tsx"]
@@ -161,50 +213,122 @@ class TestVerify:
         assert result["tsc"]["passed"] is True
 
 
+class TestRunPhases:
+    """Test the concurrent verification phase runner."""
+
+    @staticmethod
+    def _phase(name, code, tmp_path, timeout=None):
+        import sys
+        from chad.util.verification.tools import VerificationPhase
+
+        return VerificationPhase(name, [sys.executable, "-c", code], tmp_path, timeout)
+
+    def test_phases_run_concurrently(self, tmp_path):
+        import time
+        from chad.util.verification.tools import run_phases
+
+        phases = [self._phase(f"p{i}", "import time; time.sleep(0.5)", tmp_path) for i in range(3)]
+        started = time.monotonic()
+        results = run_phases(phases, max_workers=3)
+
+        assert time.monotonic() - started < 1.4
+        assert all(r["passed"] for r in results.values())
+
+    def test_timeout_and_callbacks(self, tmp_path):
+        from chad.util.verification.tools import run_phases
+
+        seen = []
+        results = run_phases(
+            [
+                self._phase("slow", "import time; time.sleep(10)", tmp_path, timeout=0.3),
+                self._phase("ok", "print('fine')", tmp_path),
+            ],
+            on_phase=lambda name, result: seen.append((name, result is None)),
+        )
+
+        assert results["slow"]["timed_out"] is True
+        assert results["slow"]["passed"] is False
+        assert results["ok"]["passed"] is True
+        assert "fine" in results["ok"]["output"]
+        assert sorted(seen) == [("ok", False), ("ok", True), ("slow", False), ("slow", True)]
+
+    def test_fail_fast_stops_running_phases(self, tmp_path):
+        import time
+        from chad.util.verification.tools import run_phases
+
+        started = time.monotonic()
+        results = run_phases(
+            [
+                self._phase("bad", "import sys; sys.exit(2)", tmp_path),
+                self._phase("long", "import time; time.sleep(10)", tmp_path),
+            ],
+            max_workers=2,
+            fail_fast=True,
+        )
+
+        assert time.monotonic() - started < 5
+        assert results["bad"]["returncode"] == 2
+        assert results["long"]["cancelled"] is True
+
+    def test_verify_reports_phase_summaries(self):
+        from chad.util.verification.tools import verify
+
+        def fake_run(cmd, **kwargs):
+            if "flake8" in cmd:
+                out = "./a.py:1:1: F401 'os' imported but unused\n./b.py:2:5: E225 missing whitespace\n"
+                return type("Proc", (), {"returncode": 1, "stdout": out, "stderr": ""})()
+            return type("Proc", (), {"returncode": 1, "stdout": "=== 2 failed, 5 passed in 1.0s ===", "stderr": ""})()
+
+        with patch("chad.util.verification.tools._run_command", fake_run):
+            result = verify()
+
+        assert result["phases"]["lint"]["issue_count"] == 2
+        assert result["phases"]["tests"]["failed"] == 2
+        assert result["phases"]["tests"]["passed"] == 5
+        assert set(result["durations"]) == {"lint", "test"}
+        assert "error" not in result
+
+
 class TestFileToTestMapping:
-    """Test the source-file-to-test-file mapping."""
+    """Test selecting tests for changed files through the import graph."""
 
     def test_maps_provider_source_to_test(self):
         from chad.util.verification.tools import find_tests_for_files
         tests = find_tests_for_files(["src/chad/util/providers.py"])
-        assert "test_providers.py" in tests
+        assert "tests/test_providers.py" in tests
 
     def test_maps_task_executor_to_multiple_tests(self):
         from chad.util.verification.tools import find_tests_for_files
         tests = find_tests_for_files(
             ["src/chad/server/services/task_executor.py"]
         )
-        assert "test_task_executor.py" in tests
-        assert "test_unified_streaming.py" in tests
+        assert "tests/test_task_executor.py" in tests
+        assert "tests/test_unified_streaming.py" in tests
 
     def test_maps_multiple_files(self):
         from chad.util.verification.tools import find_tests_for_files
         tests = find_tests_for_files([
-            "src/chad/util/providers.py",
+            "src/chad/util/json_scan.py",
             "src/chad/util/config_manager.py",
         ])
-        assert "test_providers.py" in tests
-        assert "test_config_manager.py" in tests
+        assert "tests/test_json_scan.py" in tests
+        assert "tests/test_config_manager.py" in tests
 
-    def test_unknown_file_returns_empty(self):
+    def test_leaf_module_selects_only_its_importers(self):
         from chad.util.verification.tools import find_tests_for_files
-        tests = find_tests_for_files(["src/chad/nonexistent_module.py"])
-        assert tests == []
+        tests = find_tests_for_files(["src/chad/util/verification/ui_runner.py"])
+        assert tests == ["tests/test_release_screenshots.py"]
+
+    def test_unknown_file_falls_back_to_full_suite(self):
+        from chad.util.verification.tools import find_tests_for_files
+        assert find_tests_for_files(["src/chad/nonexistent_module.py"]) is None
+        assert find_tests_for_files(["pyproject.toml"]) is None
 
     def test_non_python_file_ignored(self):
         from chad.util.verification.tools import find_tests_for_files
         tests = find_tests_for_files(["ui/src/App.tsx", "README.md"])
         assert tests == []
 
-    def test_source_path_to_module(self):
-        from chad.util.verification.tools import _source_path_to_module
-        assert _source_path_to_module("src/chad/util/providers.py") == "util.providers"
-        assert _source_path_to_module("src/chad/__main__.py") == "__main__"
-        assert _source_path_to_module(
-            "src/chad/server/services/task_executor.py"
-        ) == "server.services.task_executor"
-        assert _source_path_to_module("ui/src/App.tsx") is None
-
     def test_has_ts_files(self):
         from chad.util.verification.tools import _has_ts_files
         assert _has_ts_files(["ui/src/components/ChatView.tsx"]) is True
@@ -306,3 +430,39 @@ class TestParseVerificationResponse:
 
         with pytest.raises(VerificationParseError):
             parse_verification_response(response)
+
+    def test_parse_prefers_last_verdict_over_echoed_examples(self):
+        """An echoed prompt example earlier in the output should not win over the final verdict."""
+        from chad.util.prompts import parse_verification_response
+
+        response = (
+            'Example:\n```json\n{"passed": true, "summary": "example"}\n```\n'
+            "def handler() {\n"
+            '{"passed": false, "summary": "Tests fail", "issues": ["B"]}'
+        )
+
+        passed, summary, issues = parse_verification_response(response)
+
+        assert passed is False
+        assert summary == "Tests fail"
+        assert issues == ["B"]
+
+
+class TestExtractCodingSummary:
+    """Test extract_coding_summary with various inputs."""
+
+    def test_last_summary_wins_and_keeps_all_fields(self):
+        from chad.util.prompts import extract_coding_summary
+
+        response = (
+            '```json\n{"change_summary": "One sentence describing what was changed"}\n```\n'
+            "patched `if (x) {` in parser.c\n"
+            '{"change_summary": "Fixed parser", "files_changed": ["parser.c"], "completion_status": "success"}'
+        )
+
+        summary = extract_coding_summary(response)
+
+        assert summary is not None
+        assert summary.change_summary == "Fixed parser"
+        assert summary.files_changed == ["parser.c"]
+        assert summary.completion_status == "success"
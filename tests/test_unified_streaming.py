@@ -209,6 +209,129 @@ class TestEventLog:
         content = log.get_artifact(ref)
         assert content.decode() == large_content
 
+    def test_artifacts_are_deduplicated_across_sessions(self, tmp_path):
+        """Identical content from different sessions is stored once, compressed."""
+        first = EventLog("session-a", base_dir=tmp_path)
+        second = EventLog("session-b", base_dir=tmp_path)
+        large_content = "same output\n" * 2000
+
+        ref_a = first.store_artifact(large_content, "stdout")
+        ref_b = second.store_artifact(large_content, "stdout")
+
+        assert ref_a.path == ref_b.path
+        assert ref_a.path.endswith(".gz")
+        blobs = list((tmp_path / "blobs").glob("*/*.gz"))
+        assert len(blobs) == 1
+        assert blobs[0].stat().st_size < len(large_content)
+        assert second.get_artifact(ref_a).decode() == large_content
+
+    def test_open_artifact_streams_content(self, tmp_path):
+        """open_artifact returns a readable stream of the decompressed content."""
+        log = EventLog("test-session", base_dir=tmp_path)
+        ref = log.store_artifact(b"y" * 20000, "stdout")
+
+        with log.open_artifact(ref) as f:
+            assert f.read(5) == b"yyyyy"
+            assert len(f.read()) == 19995
+        assert log.open_artifact({"path": "../outside.txt"}) is None
+
+    def test_store_artifact_gives_up_when_store_stays_locked(self, tmp_path):
+        """A store locked elsewhere yields no ref instead of raising, and leaves no temp files."""
+        from filelock import FileLock
+
+        log = EventLog("test-session", base_dir=tmp_path)
+        log.artifact_store._file_lock = FileLock(str(tmp_path / "blobs" / ".lock"), timeout=0.05)
+        (tmp_path / "blobs").mkdir()
+
+        with FileLock(str(tmp_path / "blobs" / ".lock")):
+            assert log.store_artifact("z" * 20000, "stdout") is None
+
+        assert not list((tmp_path / "blobs").glob("*/*.tmp"))
+        assert log.store_artifact("z" * 20000, "stdout") is not None
+
+    def test_legacy_artifact_paths_still_readable(self, tmp_path):
+        """Uncompressed artifacts written by older versions can still be read."""
+        log = EventLog("test-session", base_dir=tmp_path)
+        legacy = tmp_path / "artifacts" / "test-session" / "stdout_deadbeef.txt"
+        legacy.parent.mkdir(parents=True)
+        legacy.write_bytes(b"legacy content")
+
+        assert log.get_artifact({"path": "artifacts/test-session/stdout_deadbeef.txt"}) == b"legacy content"
+
+    def test_compacted_log_reads_transparently(self, tmp_path):
+        """Finished logs compacted to the cold tier read back identically."""
+        from chad.util.event_log import COLD_FRAME_EVENTS, compact_session_log
+
+        log = EventLog("cold-session", base_dir=tmp_path)
+        for i in range(COLD_FRAME_EVENTS * 2 + 10):
+            log.log(TerminalOutputEvent(data=f"event-{i}"))
+        log.log(SessionEndedEvent(success=True, reason="completed"))
+        expected = log.get_events()
+
+        assert compact_session_log(log.log_path) == log.cold_path
+        assert not log.log_path.exists()
+        assert log.cold_path.stat().st_size < sum(len(json.dumps(e)) for e in expected)
+
+        reader = EventLog("cold-session", base_dir=tmp_path)
+        assert reader.get_latest_seq() == expected[-1]["seq"]
+        assert reader.get_events() == expected
+        assert reader.get_events(since_seq=COLD_FRAME_EVENTS + 5) == expected[COLD_FRAME_EVENTS + 5:]
+        assert EventLog.list_sessions(tmp_path) == ["cold-session"]
+
+    def test_unfinished_log_is_not_compacted(self, tmp_path):
+        """Logs without a trailing session_ended event stay hot."""
+        from chad.util.event_log import compact_session_log
+
+        log = EventLog("hot-session", base_dir=tmp_path)
+        log.log(StatusEvent(status="running"))
+
+        assert compact_session_log(log.log_path) is None
+        assert log.log_path.exists()
+        assert not log.cold_path.exists()
+
+    def test_compaction_keeps_log_appended_before_removal(self, tmp_path):
+        """An append that races the final check of compaction keeps the hot log."""
+        import threading
+
+        from chad.util.event_log import _hot_log_lock, compact_session_log
+
+        log = EventLog("racing-session", base_dir=tmp_path)
+        log.log(SessionEndedEvent(success=True, reason="completed"))
+        index_path = tmp_path / "racing-session.jsonl.idx"
+        result = []
+
+        with _hot_log_lock(log.log_path):
+            compactor = threading.Thread(target=lambda: result.append(compact_session_log(log.log_path)))
+            compactor.start()
+            deadline = time.monotonic() + 5
+            while not index_path.exists() and time.monotonic() < deadline:
+                time.sleep(0.01)
+            # A writer holding the lock appends while compaction waits to remove the log
+            with open(log.log_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps({"seq": 2, "type": "status", "status": "running"}) + "\n")
+        compactor.join(timeout=5)
+
+        assert result == [None]
+        assert log.log_path.exists()
+        assert not log.cold_path.exists()
+        assert len(log.log_path.read_text().splitlines()) == 2
+
+    def test_logging_to_compacted_session_thaws_it(self, tmp_path):
+        """A follow-up task appends to a compacted session's log."""
+        from chad.util.event_log import compact_session_log
+
+        log = EventLog("followup-session", base_dir=tmp_path)
+        log.log(StatusEvent(status="running"))
+        log.log(SessionEndedEvent(success=True, reason="completed"))
+        compact_session_log(log.log_path)
+
+        followup = EventLog("followup-session", base_dir=tmp_path)
+        followup.log(StatusEvent(status="running"))
+
+        assert followup.log_path.exists()
+        assert not followup.cold_path.exists()
+        assert [e["seq"] for e in followup.get_events()] == [1, 2, 3]
+
     def test_small_content_not_stored_as_artifact(self, tmp_path):
         """Small content returns None (should be inline)."""
         log = EventLog("test-session", base_dir=tmp_path)
@@ -415,6 +538,25 @@ class TestPTYStreamService:
 
         service.cleanup_session(stream_id)
 
+    @_skip_windows
+    def test_cleanup_drops_session_metrics(self, tmp_path):
+        """Per-session metric series are removed with the session."""
+        from chad.server.services import pty_stream_unix
+        from chad.server.services.pty_stream import PTYStreamService
+
+        service = PTYStreamService()
+        stream_id = service.start_pty_session(
+            session_id="metrics-cleanup",
+            cmd=["echo", "hello"],
+            cwd=tmp_path,
+        )
+        time.sleep(0.5)
+        assert ("metrics-cleanup",) in pty_stream_unix.PTY_BYTES_READ._children
+
+        service.cleanup_session(stream_id)
+        assert ("metrics-cleanup",) not in pty_stream_unix.PTY_BYTES_READ._children
+        assert ("metrics-cleanup",) not in pty_stream_unix.PTY_QUEUE_DEPTH._children
+
 
 class TestMockProviderThroughAPI:
     """Tests for mock provider through the full API stack."""
@@ -455,6 +597,28 @@ class TestMockProviderThroughAPI:
         assert b"\x1b[" in result.stdout
         assert result.returncode == 0
 
+    @_skip_windows
+    def test_mock_agent_streams_at_requested_rate(self, tmp_path, monkeypatch):
+        """Benchmark rate knob makes the mock emit fixed-size, time-stamped lines."""
+        from chad.server.services.task_executor import (
+            MOCK_STREAM_LINE_BYTES,
+            MOCK_STREAM_RATE_ENV,
+            _build_mock_agent_command,
+        )
+        import subprocess
+
+        monkeypatch.setenv(MOCK_STREAM_RATE_ENV, str(MOCK_STREAM_LINE_BYTES * 20))
+        cmd = _build_mock_agent_command(tmp_path, "test task", run_duration_seconds=1)
+
+        started = time.time()
+        result = subprocess.run(cmd, capture_output=True, timeout=10)
+        lines = [line for line in result.stdout.split(b"\n") if b" t=" in line]
+
+        assert 15 <= len(lines) <= 21
+        assert all(len(line) + 1 == MOCK_STREAM_LINE_BYTES for line in lines)
+        first_sent = float(lines[0].split(b"t=")[1].split()[0])
+        assert started <= first_sent <= time.time()
+
 
 class TestCliStreamAlignment:
     """Ensure CLI-style streaming keeps output aligned."""
@@ -627,6 +791,28 @@ class TestWebSocketEndpoint:
             response = websocket.receive_json()
             assert response["type"] == "pong"
 
+    def test_input_only_channel_forwards_binary_frames(self, client, monkeypatch):
+        """stream=false sockets get no events and pass binary frames to the PTY verbatim."""
+        from types import SimpleNamespace
+        from chad.server.services.pty_stream import get_pty_stream_service
+
+        session_id = client.post("/api/v1/sessions", json={"name": "Input"}).json()["id"]
+        pty_service = get_pty_stream_service()
+        sent = []
+        monkeypatch.setattr(
+            pty_service,
+            "get_session_by_session_id",
+            lambda sid: SimpleNamespace(active=True, stream_id="pty-1"),
+        )
+        monkeypatch.setattr(pty_service, "send_input", lambda stream_id, data: sent.append((stream_id, data)))
+
+        with client.websocket_connect(f"/api/v1/ws/{session_id}?stream=false") as websocket:
+            websocket.send_bytes(b"ls\r\x1b[A")
+            websocket.send_json({"type": "ping"})
+            assert websocket.receive_json()["type"] == "pong"
+
+        assert sent == [("pty-1", b"ls\r\x1b[A")]
+
     def test_websocket_streams_mock_task_events(self, client, git_repo):
         """WebSocket should stream events from a running mock task."""
         import time
@@ -667,6 +853,88 @@ class TestWebSocketEndpoint:
         assert "complete" in types or "terminal" in types or len(received) > 0
 
 
+class TestTerminalInputChannel:
+    """Tests for the CLI's WebSocket input channel."""
+
+    class FakeSocket:
+        def __init__(self):
+            self.frames = []
+            self.socket = None
+
+        def send(self, frame):
+            self.frames.append(frame)
+
+        def close(self):
+            pass
+
+    def test_coalesces_keystrokes_and_latest_resize(self, monkeypatch):
+        """Bursts of writes become one binary frame; only the last pending resize is sent."""
+        from chad.ui.client import ws_client
+
+        fake = self.FakeSocket()
+        urls = []
+        monkeypatch.setattr(ws_client, "sync_connect", lambda url, **kwargs: urls.append(url) or fake)
+
+        channel = ws_client.TerminalInputChannel("http://localhost:3184", "sess", coalesce_seconds=0.05)
+        channel.connect()
+        channel.resize(30, 100)
+        channel.resize(40, 120)
+        for key in (b"a", b"b", b"c"):
+            assert channel.send_input(key)
+        channel.close()
+
+        assert urls == ["ws://localhost:3184/api/v1/ws/sess?stream=false"]
+        assert fake.frames == [json.dumps({"type": "resize", "rows": 40, "cols": 120}), b"abc"]
+        assert not channel.send_input(b"x")
+
+    def test_reports_failure_so_callers_fall_back(self, monkeypatch):
+        """After a send error the channel refuses input instead of dropping it silently."""
+        from chad.ui.client import ws_client
+
+        fake = self.FakeSocket()
+
+        def broken_send(frame):
+            raise ConnectionError("gone")
+
+        fake.send = broken_send
+        monkeypatch.setattr(ws_client, "sync_connect", lambda url, **kwargs: fake)
+
+        channel = ws_client.TerminalInputChannel("http://localhost:3184", "sess", coalesce_seconds=0)
+        channel.connect()
+        channel.send_input(b"a")
+        deadline = time.time() + 2
+        while channel.connected and time.time() < deadline:
+            time.sleep(0.01)
+
+        assert not channel.send_input(b"b")
+        channel.close()
+
+    def test_failed_batch_goes_to_fallback(self, monkeypatch):
+        """Input taken for a failed send is delivered through the fallback, in order."""
+        from chad.ui.client import ws_client
+
+        fake = self.FakeSocket()
+
+        def broken_send(frame):
+            raise ConnectionError("gone")
+
+        fake.send = broken_send
+        monkeypatch.setattr(ws_client, "sync_connect", lambda url, **kwargs: fake)
+        delivered = []
+
+        channel = ws_client.TerminalInputChannel(
+            "http://localhost:3184", "sess", coalesce_seconds=0, fallback=delivered.append
+        )
+        channel.connect()
+        channel.send_input(b"ab")
+        deadline = time.time() + 2
+        while channel.connected and time.time() < deadline:
+            time.sleep(0.01)
+        channel.close()
+
+        assert delivered == [b"ab"]
+
+
 class TestCancelSession:
     """Tests for session cancellation."""
 
@@ -1329,10 +1597,9 @@ class TestEndToEndSSEStreaming:
         service.cleanup_session(stream_id)
 
     def test_stream_client_parses_sse_format(self):
-        """Verify StreamClient correctly parses SSE event format."""
-        from chad.ui.client.stream_client import StreamEvent
+        """SSEParser yields one StreamEvent per blank-line-terminated block."""
+        from chad.ui.client.stream_client import SSEParser
 
-        # Test SSE parsing logic manually
         sse_data = """event: terminal
 data: {"data": "SGVsbG8=", "seq": 1}
 
@@ -1340,27 +1607,7 @@ event: complete
 data: {"exit_code": 0, "seq": 2}
 
 """
-        # Parse it
-        events = []
-        buffer = sse_data
-        current_event = ""
-        current_data = ""
-
-        for line in buffer.split("\n"):
-            line = line.strip()
-            if line.startswith("event:"):
-                current_event = line[6:].strip()
-            elif line.startswith("data:"):
-                current_data = line[5:].strip()
-            elif line == "" and current_event and current_data:
-                data = json.loads(current_data)
-                events.append(StreamEvent(
-                    event_type=current_event,
-                    data=data,
-                    seq=data.get("seq"),
-                ))
-                current_event = ""
-                current_data = ""
+        events = SSEParser().feed(sse_data)
 
         assert len(events) == 2
         assert events[0].event_type == "terminal"
@@ -1368,6 +1615,133 @@ data: {"exit_code": 0, "seq": 2}
         assert events[1].event_type == "complete"
         assert events[1].data["exit_code"] == 0
 
+    def test_sse_parser_handles_split_chunks_crlf_and_ids(self):
+        """Events split across chunks, CRLF line ends and id-only seqs all parse."""
+        from chad.ui.client.stream_client import SSEParser
+
+        body = 'event: event\r\ndata: {"type": "status"}\r\nid: 7\r\n\r\nevent: ping\ndata: {"seq": 8}\n\n'
+        parser = SSEParser()
+        events = []
+        for i in range(0, len(body), 5):
+            events.extend(parser.feed(body[i:i + 5]))
+
+        assert [(e.event_type, e.seq) for e in events] == [("event", 7), ("ping", 8)]
+        assert events[0].data == {"type": "status"}
+
+
+class TestStreamReconnect:
+    """Tests for StreamClient reconnect and Last-Event-ID resume."""
+
+    @staticmethod
+    def _sse(*events: tuple[str, dict]) -> bytes:
+        return "".join(
+            f"event: {name}\ndata: {json.dumps(data)}\nid: {data.get('seq', '')}\n\n" for name, data in events
+        ).encode()
+
+    def test_sync_client_resumes_after_dropped_connection(self, monkeypatch):
+        """A stream that ends without complete reconnects from the last EventLog seq."""
+        import chad.ui.client.stream_client as sc
+
+        monkeypatch.setattr(sc, "reconnect_delay", lambda attempt: 0)
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if len(requests) == 1:
+                body = self._sse(("event", {"type": "status", "seq": 3}), ("ping", {"seq": 3}))
+            elif len(requests) == 2:
+                raise httpx.ConnectError("tunnel down", request=request)
+            else:
+                body = self._sse(("event", {"type": "session_ended", "seq": 4}), ("complete", {"seq": 5}))
+            return httpx.Response(200, content=body, headers={"content-type": "text/event-stream"})
+
+        client = sc.SyncStreamClient("http://chad.test")
+        client._sync_client = httpx.Client(transport=httpx.MockTransport(handler))
+        events = list(client.stream_events("s1", since_seq=1))
+        client.close()
+
+        assert [e.seq for e in events] == [3, 3, 4, 5]
+        assert len(requests) == 3
+        assert requests[0].headers["last-event-id"] == "1"
+        assert requests[2].url.params["since_seq"] == "3"
+        assert requests[2].headers["last-event-id"] == "3"
+
+    def test_async_client_does_not_retry_client_errors(self, monkeypatch):
+        """A 404 (session gone) is raised instead of retried."""
+        import chad.ui.client.stream_client as sc
+
+        monkeypatch.setattr(sc, "reconnect_delay", lambda attempt: 0)
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(404, json={"detail": "not found"})
+
+        async def consume():
+            client = StreamClient("http://chad.test")
+            client._async_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            try:
+                async for _ in client.stream_events("missing"):
+                    pass
+            finally:
+                await client.close()
+
+        with pytest.raises(httpx.HTTPStatusError):
+            anyio.run(consume)
+        assert len(calls) == 1
+
+    def test_stream_route_honours_last_event_id(self, client, tmp_path, monkeypatch):
+        """The SSE route skips EventLog events at or before Last-Event-ID."""
+        from chad.server.services import Task, get_task_executor
+
+        session_id = client.post("/api/v1/sessions", json={"name": "resume"}).json()["id"]
+        log = EventLog(session_id, base_dir=tmp_path / "resume-logs")
+        log.log(SessionStartedEvent(
+            task_description="t", project_path="/tmp", coding_provider="mock", coding_account="m",
+        ))
+        log.log(StatusEvent(status="one"))
+        log.log(StatusEvent(status="two"))
+        log.log(SessionEndedEvent(success=True, reason="completed"))
+        task = Task(session_id=session_id, event_log=log)
+        monkeypatch.setattr(get_task_executor(), "get_latest_task_for_session", lambda sid: task)
+
+        response = client.get(
+            f"/api/v1/sessions/{session_id}/stream",
+            params={"include_terminal": "false"},
+            headers={"Last-Event-ID": "2"},
+        )
+
+        from chad.ui.client.stream_client import SSEParser
+
+        events = SSEParser().feed(response.text)
+        logged = [e.data.get("status") or e.data.get("type") for e in events if e.event_type == "event"]
+        assert logged == ["two", "session_ended"]
+        assert events[-1].event_type == "complete"
+
+    def test_stream_route_compresses_when_accepted(self, client, tmp_path, monkeypatch):
+        """The SSE route gzips the stream for clients that send Accept-Encoding."""
+        import chad.util.stream_encoding as stream_encoding
+        from chad.server.services import Task, get_task_executor
+        from chad.ui.client.stream_client import SSEParser
+
+        monkeypatch.setattr(stream_encoding, "brotli", None)
+        session_id = client.post("/api/v1/sessions", json={"name": "gzip"}).json()["id"]
+        log = EventLog(session_id, base_dir=tmp_path / "gzip-logs")
+        log.log(StatusEvent(status="compressed"))
+        log.log(SessionEndedEvent(success=True, reason="completed"))
+        task = Task(session_id=session_id, event_log=log)
+        monkeypatch.setattr(get_task_executor(), "get_latest_task_for_session", lambda sid: task)
+
+        url = f"/api/v1/sessions/{session_id}/stream"
+        response = client.get(url, params={"include_terminal": "false"}, headers={"Accept-Encoding": "gzip"})
+        plain = client.get(url, params={"include_terminal": "false"}, headers={"Accept-Encoding": "identity"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-encoding" not in plain.headers
+        events = SSEParser().feed(response.text)
+        assert [e.data.get("status") for e in events if e.event_type == "event"][0] == "compressed"
+        assert events[-1].event_type == "complete"
+
 
 class TestEventLogAPI:
     """Tests for the EventLog API endpoint."""
@@ -2020,6 +2394,105 @@ class TestEventMultiplexer:
         assert len(events3) == 1
         assert events3[0].seq == 2
 
+    @pytest.mark.parametrize(
+        "types, expected",
+        [
+            (None, (True, True, None)),
+            ("milestone,terminal", (True, True, frozenset({"milestone"}))),
+            ("terminal", (True, False, frozenset())),
+            ("event, status", (False, True, None)),
+        ],
+    )
+    def test_parse_stream_types(self, types, expected):
+        """A types filter splits into terminal, structured events and EventLog types."""
+        from chad.server.services.event_mux import parse_stream_types
+
+        assert parse_stream_types(types) == expected
+
+    @pytest.mark.asyncio
+    async def test_mux_event_types_filter(self, tmp_path):
+        """Only subscribed event types (plus session_ended) reach the stream."""
+        from chad.server.services.event_mux import EventMultiplexer
+        from chad.util.event_log import MilestoneEvent
+
+        log = EventLog("mux-filter", base_dir=tmp_path)
+        log.log(SessionStartedEvent(
+            task_description="Test",
+            project_path="/tmp",
+            coding_provider="mock",
+            coding_account="test",
+        ))
+        log.log(StatusEvent(status="Working"))
+        log.log(MilestoneEvent(milestone_type="exploration", title="Discovery", summary="Found it"))
+        log.log(TerminalOutputEvent(data="output"))
+        log.log(SessionEndedEvent(success=True, reason="completed"))
+
+        mux = EventMultiplexer("mux-filter", log, event_types=frozenset({"milestone"}))
+
+        class DummyPTY:
+            @staticmethod
+            def get_session_by_session_id(session_id):
+                return None
+
+        async def collect():
+            return [
+                event
+                async for event in mux.stream_with_since(
+                    DummyPTY(), since_seq=0, include_terminal=True, include_events=True
+                )
+            ]
+
+        collected = await asyncio.wait_for(collect(), timeout=5.0)
+
+        assert [(e.type, e.data.get("type")) for e in collected] == [
+            ("event", "milestone"),
+            ("terminal", None),
+            ("event", "session_ended"),
+            ("complete", None),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_mux_snapshot_replaces_replay(self, tmp_path):
+        """snapshot=True sends one compact catch-up event with the latest screen and task."""
+        from chad.server.services.event_mux import EventMultiplexer
+        from chad.util.event_log import MilestoneEvent, UserMessageEvent
+
+        log = EventLog("mux-snapshot", base_dir=tmp_path)
+        log.log(SessionStartedEvent(
+            task_description="First", project_path="/tmp", coding_provider="mock", coding_account="test",
+        ))
+        log.log(TerminalOutputEvent(data="old screen"))
+        log.log(MilestoneEvent(milestone_type="exploration", title="Discovery", summary="first"))
+        log.log(SessionEndedEvent(success=True, reason="completed"))
+        log.log(SessionStartedEvent(
+            task_description="Second", project_path="/tmp", coding_provider="mock", coding_account="test",
+        ))
+        log.log(UserMessageEvent(content="follow up"))
+        for i in range(50):
+            log.log(TerminalOutputEvent(data=f"screen {i}"))
+        log.log(SessionEndedEvent(success=True, reason="completed"))
+
+        mux = EventMultiplexer("mux-snapshot", log)
+
+        class DummyPTY:
+            @staticmethod
+            def get_session_by_session_id(session_id):
+                return None
+
+        async def collect():
+            return [event async for event in mux.stream_with_since(DummyPTY(), since_seq=0, snapshot=True)]
+
+        collected = await asyncio.wait_for(collect(), timeout=5.0)
+
+        assert [e.type for e in collected] == ["snapshot", "complete"]
+        state = collected[0].data
+        assert state["screen"] == "screen 49"
+        assert state["task"]["task_description"] == "Second"
+        assert [(item["type"], item["content"]) for item in state["conversation"]] == [("user", "follow up")]
+        assert [m["summary"] for m in state["milestones"]] == ["first"]
+        assert state["ended"] is True
+        assert collected[0].seq == state["latest_seq"] == log.get_latest_seq()
+
     @_skip_windows
     @pytest.mark.asyncio
     async def test_mux_replays_terminal_from_log_with_since(self, tmp_path):
@@ -2245,6 +2718,21 @@ class TestEventMultiplexer:
         assert '"seq": 42' in sse
         assert sse.endswith("\n\n")
 
+    def test_logged_events_are_sent_as_logged_json(self, tmp_path):
+        """EventLog events go out as their logged JSON, without re-serializing."""
+        from chad.server.services.event_mux import EventMultiplexer, format_sse_event, format_ws_message
+
+        log = EventLog("frames", base_dir=tmp_path)
+        log.log(StatusEvent(status="one"))
+        log.log(StatusEvent(status="two"))
+        events = EventMultiplexer("frames", log)._drain_event_log()
+
+        logged = log.log_path.read_text().splitlines()
+        assert [e.raw for e in events] == logged
+        assert format_sse_event(events[1]) == f"event: event\ndata: {logged[1]}\nid: 2\n\n"
+        message = json.loads(format_ws_message(events[0], "frames"))
+        assert message == {"type": "event", "session_id": "frames", "data": {**events[0].data, "seq": 1}}
+
     def test_mux_ping_interval(self):
         """EventMultiplexer sends pings at the configured interval."""
         from chad.server.services.event_mux import EventMultiplexer
@@ -126,6 +126,94 @@ class TestVerificationMilestones:
         ]
         assert len(automated_milestones) >= 1
 
+    def test_emits_milestone_per_finished_phase(self, monkeypatch):
+        """Each automated phase is reported as it finishes, with its failure output."""
+        from chad.server.services import verification
+        from chad.util.verification import tools as verify_tools
+
+        emitted = []
+
+        def fake_verify(**kwargs):
+            kwargs["on_phase"]("lint", None)
+            kwargs["on_phase"]("lint", {
+                "passed": False, "timed_out": False, "cancelled": False,
+                "duration": 1.25, "output": "./a.py:1:1: F401 unused",
+            })
+            return {
+                "success": False,
+                "phases": {"lint": {"success": False, "issues": ["./a.py:1:1: F401 unused"], "issue_count": 1}},
+            }
+
+        monkeypatch.setattr(verify_tools, "verify", fake_verify)
+
+        passed, feedback = verification._run_automated_verification(
+            "/tmp/test", emit=lambda event_type, **kw: emitted.append(kw), attempt=2,
+        )
+
+        assert passed is False
+        assert "F401" in feedback
+        phase_milestones = [m for m in emitted if m.get("details", {}).get("phase") == "lint"]
+        assert len(phase_milestones) == 1
+        assert phase_milestones[0]["details"]["status"] == "failed"
+        assert phase_milestones[0]["details"]["attempt"] == 2
+        assert "F401" in phase_milestones[0]["details"]["output"]
+
+    def test_uses_worktree_diff_for_change_aware_verification(self, monkeypatch):
+        """run_verification lints only what the worktree diff touched, without tests by default."""
+        from types import SimpleNamespace
+
+        from chad.server.services import verification
+        from chad.util.verification import tools as verify_tools
+
+        calls = []
+
+        def fake_verify(**kwargs):
+            calls.append(kwargs)
+            return {"success": True}
+
+        monkeypatch.setattr(verify_tools, "verify", fake_verify)
+        git_mgr = MagicMock()
+        git_mgr.get_changed_files.return_value = ["src/app.py"]
+        session = SimpleNamespace(id="abc", worktree_path="/tmp/test", worktree_base_commit="deadbeef")
+
+        verification.run_verification(
+            project_path="/tmp/test",
+            coding_output="some output with changes",
+            task_description="Test task",
+            verification_account="test-account",
+            run_phase_fn=lambda **kwargs: (0, '{"passed": true, "summary": "ok"}'),
+            task=MagicMock(),
+            session=session,
+            worktree_path="/tmp/test",
+            git_mgr=git_mgr,
+        )
+
+        git_mgr.get_changed_files.assert_called_once_with("abc", "deadbeef")
+        assert calls[0]["changed_files"] == ["src/app.py"]
+        assert calls[0]["lint_only"] is True
+
+    def test_project_run_tests_enables_affected_tests(self, monkeypatch):
+        """Tests run during automated verification only when the project opts in."""
+        from types import SimpleNamespace
+
+        from chad.server.services import verification
+        from chad.util.verification import tools as verify_tools
+
+        calls = []
+        monkeypatch.setattr(verify_tools, "verify", lambda **kwargs: calls.append(kwargs) or {"success": True})
+        monkeypatch.setattr(
+            verification,
+            "_project_verification_config",
+            lambda path: SimpleNamespace(run_tests=True, fail_fast=False, test_command="make test"),
+        )
+
+        verification._run_automated_verification("/tmp/test", changed_files=["src/app.py"])
+        verification._run_automated_verification("/tmp/test", changed_files=None)
+
+        assert calls[0]["lint_only"] is False
+        assert calls[0]["test_command"] == "make test"
+        assert calls[1]["lint_only"] is True
+
     def test_no_milestones_when_emit_not_provided(self, monkeypatch):
         """When emit callback is not provided, verification still works."""
         from chad.server.services import verification
@@ -108,7 +108,7 @@ export function ChatView({
   // stream skips old milestones/events from previous tasks in the same session.
   const streamSinceSeqRef = useRef<number | undefined>(undefined);
 
-  const { terminalOutput, events, completed, error, reset } = useStream(
+  const { terminalOutput, events, snapshot, completed, error, reset } = useStream(
     taskActive ? sessionId : null,
     streamSinceSeqRef.current,
     apiBaseUrl,
@@ -341,6 +341,24 @@ export function ChatView({
     return () => { cancelled = true; };
   }, [sessionActive]); // eslint-disable-line react-hooks/exhaustive-deps
 
+  // Merge the catch-up snapshot sent when the stream connects
+  useEffect(() => {
+    if (!snapshot) return;
+
+    if (snapshot.task) {
+      setTaskDescription(snapshot.task.task_description || null);
+      setVerificationAgent(snapshot.task.verification_account ?? null);
+      setTaskScreenshots(snapshot.task.screenshots ?? []);
+      setHasRunTask(true);
+    }
+    const sinceSeq = conversationSeqRef.current;
+    const fresh = snapshot.conversation.filter((item) => item.seq > sinceSeq);
+    conversationSeqRef.current = Math.max(sinceSeq, snapshot.latest_seq);
+    if (fresh.length > 0) {
+      setConversation((prev) => [...prev, ...fresh]);
+    }
+  }, [snapshot]);
+
   // Append conversation items from streaming events
   useEffect(() => {
     if (events.length === 0) return;
@@ -10,6 +10,7 @@ export function ProvidersPanel({ api, connected }: Props) {
   const [accounts, setAccounts] = useState<Account[]>([]);
   const [providers, setProviders] = useState<ProviderInfo[]>([]);
   const [usageData, setUsageData] = useState<Record<string, AccountUsage>>({});
+  const [usageErrors, setUsageErrors] = useState<Record<string, string>>({});
   const [newName, setNewName] = useState("");
   const [newType, setNewType] = useState("anthropic");
   const [newApiKey, setNewApiKey] = useState("");
@@ -23,23 +24,21 @@ export function ProvidersPanel({ api, connected }: Props) {
     setTimeout(() => setStatus(null), 3000);
   }, []);
 
-  const refreshUsage = useCallback(async (accountNames: string[]) => {
-    const usagePromises = accountNames.map(async (name) => {
-      try {
-        const usage = await api.getAccountUsage(name);
-        return { name, usage };
-      } catch {
-        return null;
-      }
-    });
-    const results = await Promise.all(usagePromises);
-    const newUsageData: Record<string, AccountUsage> = {};
-    for (const result of results) {
-      if (result) {
-        newUsageData[result.name] = result.usage;
-      }
-    }
-    setUsageData(prev => ({...prev, ...newUsageData}));
+  const refreshUsage = useCallback(async () => {
+    try {
+      await api.streamAccountUsage((usage) => {
+        const { account_name: name, error } = usage;
+        setUsageErrors(prev => {
+          if (!error && !(name in prev)) return prev;
+          const next = { ...prev };
+          if (error) next[name] = error;
+          else delete next[name];
+          return next;
+        });
+        if (error) return;
+        setUsageData(prev => ({...prev, [name]: usage}));
+      });
+    } catch { /* */ }
   }, [api]);
 
   const refresh = useCallback(async () => {
@@ -47,8 +46,8 @@ export function ProvidersPanel({ api, connected }: Props) {
       const [a, p] = await Promise.all([api.listAccounts(), api.listProviders()]);
       setAccounts(a.accounts);
       setProviders(p.providers);
-      // Refresh usage for all accounts
-      await refreshUsage(a.accounts.map((acc) => acc.name));
+      // Refresh usage for all accounts (streamed as each provider responds)
+      await refreshUsage();
     } catch { /* */ }
   }, [api, refreshUsage]);
 
@@ -149,6 +148,7 @@ export function ProvidersPanel({ api, connected }: Props) {
       <div className="account-list">
         {accounts.map((a) => {
           const usage = usageData[a.name];
+          const usageError = usageErrors[a.name];
           return (
             <div key={a.name} className={`account-card ${a.ready ? "" : "not-ready"}`}>
               <div className="account-header">
@@ -225,6 +225,12 @@ export function ProvidersPanel({ api, connected }: Props) {
                     )}
                   </div>
                 )}
+                {usageError && (
+                  <div className="usage-row">
+                    <span className="field-label">Usage:</span>
+                    <span className="error-text">{usageError}</span>
+                  </div>
+                )}
               </div>
             </div>
           );
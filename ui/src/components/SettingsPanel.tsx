@@ -1,5 +1,5 @@
 import { useState, useEffect, useCallback } from "react";
-import type { ChadAPI, VerificationSettings, Account } from "chad-client";
+import type { ChadAPI, VerificationSettings, Account, TaskSchedulingSettings } from "chad-client";
 import { ActionRules } from "./ActionRules.tsx";
 import { QRScanner } from "./QRScanner.tsx";
 import { parseConnectionInput } from "../App.tsx";
@@ -24,6 +24,9 @@ export function SettingsPanel({
   const [verificationAgent, setVerificationAgent] = useState<string | null>(null);
   const [accounts, setAccounts] = useState<Account[]>([]);
   const [retentionDays, setRetentionDays] = useState<number>(7);
+  const [logQuotaMb, setLogQuotaMb] = useState<number>(5120);
+  const [logRetentionDays, setLogRetentionDays] = useState<number>(0);
+  const [scheduling, setScheduling] = useState<TaskSchedulingSettings | null>(null);
   const [slackEnabled, setSlackEnabled] = useState(false);
   const [slackChannel, setSlackChannel] = useState("");
   const [slackHasToken, setSlackHasToken] = useState(false);
@@ -48,7 +51,12 @@ export function SettingsPanel({
     api.getMaxVerificationAttempts().then((r) => setMaxAttempts(r.attempts)).catch(() => {});
     api.getVerificationAgent().then((r) => setVerificationAgent(r.account_name)).catch(() => {});
     api.listAccounts().then((r) => setAccounts(r.accounts)).catch(() => {});
-    api.getCleanupSettings().then((r) => setRetentionDays(r.cleanup_days)).catch(() => {});
+    api.getCleanupSettings().then((r) => {
+      setRetentionDays(r.cleanup_days);
+      if (r.log_quota_mb != null) setLogQuotaMb(r.log_quota_mb);
+      if (r.log_retention_days != null) setLogRetentionDays(r.log_retention_days);
+    }).catch(() => {});
+    api.getTaskScheduling().then(setScheduling).catch(() => {});
     api.getSlackSettings().then((r) => {
       setSlackEnabled(r.enabled);
       setSlackChannel(r.channel ?? "");
@@ -106,6 +114,35 @@ export function SettingsPanel({
     } catch { /* */ }
   }, [api, flash]);
 
+  const saveLogQuota = useCallback(async (quotaMb: number) => {
+    if (!Number.isFinite(quotaMb) || quotaMb < 0) return;
+    setLogQuotaMb(quotaMb);
+    try {
+      await api.setCleanupSettings({ log_quota_mb: quotaMb });
+      flash("Saved");
+    } catch { /* */ }
+  }, [api, flash]);
+
+  const saveLogRetention = useCallback(async (days: number) => {
+    if (!Number.isFinite(days) || days < 0) return;
+    setLogRetentionDays(days);
+    try {
+      await api.setCleanupSettings({ log_retention_days: days });
+      flash("Saved");
+    } catch { /* */ }
+  }, [api, flash]);
+
+  // ── Task scheduling ──
+
+  const saveScheduling = useCallback(async (update: Partial<TaskSchedulingSettings>) => {
+    const values = Object.values(update).filter((v) => typeof v === "number");
+    if (values.some((v) => !Number.isFinite(v) || v < 0)) return;
+    try {
+      setScheduling(await api.setTaskScheduling(update));
+      flash("Saved");
+    } catch { /* */ }
+  }, [api, flash]);
+
   // ── Slack ──
 
   const saveSlack = useCallback(async (update: Record<string, unknown>) => {
@@ -263,6 +300,45 @@ export function SettingsPanel({
           <input type="number" min={1} value={retentionDays}
             onChange={(e) => saveRetention(Number(e.target.value))} disabled={dis} />
         </label>
+        <label>
+          Log disk budget (MB, 0 = unlimited)
+          <input type="number" min={0} value={logQuotaMb}
+            onChange={(e) => saveLogQuota(Number(e.target.value))} disabled={dis} />
+        </label>
+        <label>
+          Delete logs idle for (days, 0 = never)
+          <input type="number" min={0} value={logRetentionDays}
+            onChange={(e) => saveLogRetention(Number(e.target.value))} disabled={dis} />
+        </label>
+      </section>
+
+      {/* ── Task Scheduling ── */}
+      <section>
+        <h3>Task Scheduling</h3>
+        {scheduling && (
+          <>
+            <label>
+              Max concurrent tasks
+              <input type="number" min={1} max={64} value={scheduling.max_concurrent_tasks}
+                onChange={(e) => saveScheduling({ max_concurrent_tasks: Number(e.target.value) })} disabled={dis} />
+            </label>
+            <label>
+              Max tasks per account (0 = unlimited)
+              <input type="number" min={0} value={scheduling.max_tasks_per_account}
+                onChange={(e) => saveScheduling({ max_tasks_per_account: Number(e.target.value) })} disabled={dis} />
+            </label>
+            <label>
+              Max tasks per provider (0 = unlimited)
+              <input type="number" min={0} value={scheduling.max_tasks_per_provider}
+                onChange={(e) => saveScheduling({ max_tasks_per_provider: Number(e.target.value) })} disabled={dis} />
+            </label>
+            <label className="toggle-label">
+              <input type="checkbox" checked={scheduling.balance_accounts}
+                onChange={() => saveScheduling({ balance_accounts: !scheduling.balance_accounts })} disabled={dis} />
+              Balance tasks across accounts of the same provider
+            </label>
+          </>
+        )}
       </section>
 
       {/* ── Remote Access (Tunnel) ── */}
@@ -1,6 +1,6 @@
 import { useEffect, useRef, useState, useCallback } from "react";
 import { ChadAPI, ChadWebSocket } from "chad-client";
-import type { StreamEvent, WSMessage } from "chad-client";
+import type { SessionSnapshot, StreamEvent, WSMessage } from "chad-client";
 
 export interface TerminalChunk {
   text: string;
@@ -12,6 +12,8 @@ export interface TerminalChunk {
  * Decodes base64 terminal output and collects structured events.
  *
  * Uses WebSocket instead of SSE so streaming works through Cloudflare tunnels.
+ * Connects in snapshot mode: the backlog before `sinceSeq`'s live tail arrives
+ * as one snapshot (current screen plus conversation) rather than a replay.
  *
  * @param sessionId   - Session to stream from (null = disconnected)
  * @param sinceSeq    - Skip events before this sequence number.
@@ -27,6 +29,7 @@ export function useStream(
   const wsRef = useRef<ChadWebSocket | null>(null);
   const [terminalOutput, setTerminalOutput] = useState("");
   const [events, setEvents] = useState<StreamEvent[]>([]);
+  const [snapshot, setSnapshot] = useState<SessionSnapshot | null>(null);
   const [completed, setCompleted] = useState(false);
   const [error, setError] = useState<string | null>(null);
   const utf8Decoder = useRef<TextDecoder | null>(null);
@@ -54,6 +57,7 @@ export function useStream(
   const reset = useCallback(() => {
     setTerminalOutput("");
     setEvents([]);
+    setSnapshot(null);
     setCompleted(false);
     setError(null);
     completedRef.current = false;
@@ -76,6 +80,10 @@ export function useStream(
         if (!raw) return;
         const decoded = decodeTerminal(raw, isText);
         setTerminalOutput((prev) => prev + decoded);
+      } else if (msg.type === "snapshot") {
+        const state = msg.data as unknown as SessionSnapshot;
+        setTerminalOutput(decodeTerminal(state.screen ?? "", true));
+        setSnapshot(state);
       } else if (msg.type === "event") {
         const event: StreamEvent = { event_type: "event", data: msg.data, seq };
         setEvents((prev) => [...prev, event]);
@@ -100,7 +108,7 @@ export function useStream(
 
       if (cancelled) return;
       wsRef.current = ws;
-      ws.connect(sessionId, { sinceSeq: sinceSeqRef.current, ticket });
+      ws.connect(sessionId, { sinceSeq: sinceSeqRef.current, ticket, snapshot: true });
     };
 
     connect().catch(() => {
@@ -114,5 +122,5 @@ export function useStream(
     };
   }, [sessionId, apiBaseUrl, token, reset, decodeTerminal]);
 
-  return { terminalOutput, events, completed, error, reset };
+  return { terminalOutput, events, snapshot, completed, error, reset };
 }